@@ -1,3 +1,5 @@
+from .pagination import InvalidCursorError
+
 from .plan import (
     DuplicatePlanError,
     PlanNotFoundError,
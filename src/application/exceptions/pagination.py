@@ -0,0 +1,4 @@
+class InvalidCursorError(Exception):
+    """
+    Exception raised when a pagination cursor cannot be decoded.
+    """
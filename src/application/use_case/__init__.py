@@ -1,22 +1,72 @@
-from .cancel_subscription import CancelSubscriptionInputDTO, CancelSubscriptionUseCase
-from .create_plan import CreatePlanInputDTO, CreatePlanOutputDTO, CreatePlanUseCase
+from .cancel_subscription import (
+    AsyncCancelSubscriptionUseCase,
+    CancelSubscriptionInputDTO,
+    CancelSubscriptionUseCase,
+)
+from .create_plan import (
+    AsyncCreatePlanUseCase,
+    CreatePlanInputDTO,
+    CreatePlanOutputDTO,
+    CreatePlanUseCase,
+)
 from .create_user_account import (
+    AsyncCreateUserAccountUseCase,
     CreateUserAccountInputDTO,
     CreateUserAccountOutputDTO,
     CreateUserAccountUseCase,
 )
+from .get_entitlement import (
+    AsyncGetEntitlementUseCase,
+    GetEntitlementInputDTO,
+    GetEntitlementOutputDTO,
+    GetEntitlementUseCase,
+)
+from .list_plans import (
+    AsyncListPlansUseCase,
+    ListPlansInputDTO,
+    ListPlansOutputDTO,
+    ListPlansUseCase,
+)
+from .list_subscriptions import (
+    AsyncListSubscriptionsUseCase,
+    ListSubscriptionsInputDTO,
+    ListSubscriptionsOutputDTO,
+    ListSubscriptionsUseCase,
+)
+from .list_user_accounts import (
+    AsyncListUserAccountsUseCase,
+    ListUserAccountsInputDTO,
+    ListUserAccountsOutputDTO,
+    ListUserAccountsUseCase,
+)
+from .renew_due_subscriptions import (
+    RenewDueSubscriptionsInputDTO,
+    RenewDueSubscriptionsOutputDTO,
+    RenewDueSubscriptionsUseCase,
+)
 from .renew_subscription import (
+    AsyncRenewSubscriptionUseCase,
     RenewSubscriptionInputDTO,
     RenewSubscriptionOutputDTO,
     RenewSubscriptionUseCase,
 )
 from .subscribe_to_plan import (
+    AsyncSubscribeToPlanUseCase,
     SubscribeToPlanInputDTO,
     SubscribeToPlanOutputDTO,
     SubscribeToPlanUseCase,
 )
 
 __all__ = [
+    "AsyncCancelSubscriptionUseCase",
+    "AsyncCreatePlanUseCase",
+    "AsyncCreateUserAccountUseCase",
+    "AsyncGetEntitlementUseCase",
+    "AsyncListPlansUseCase",
+    "AsyncListSubscriptionsUseCase",
+    "AsyncListUserAccountsUseCase",
+    "AsyncRenewSubscriptionUseCase",
+    "AsyncSubscribeToPlanUseCase",
     "CancelSubscriptionInputDTO",
     "CancelSubscriptionUseCase",
     "CreatePlanInputDTO",
@@ -25,6 +75,21 @@ __all__ = [
     "CreateUserAccountInputDTO",
     "CreateUserAccountOutputDTO",
     "CreateUserAccountUseCase",
+    "GetEntitlementInputDTO",
+    "GetEntitlementOutputDTO",
+    "GetEntitlementUseCase",
+    "ListPlansInputDTO",
+    "ListPlansOutputDTO",
+    "ListPlansUseCase",
+    "ListSubscriptionsInputDTO",
+    "ListSubscriptionsOutputDTO",
+    "ListSubscriptionsUseCase",
+    "ListUserAccountsInputDTO",
+    "ListUserAccountsOutputDTO",
+    "ListUserAccountsUseCase",
+    "RenewDueSubscriptionsInputDTO",
+    "RenewDueSubscriptionsOutputDTO",
+    "RenewDueSubscriptionsUseCase",
     "RenewSubscriptionInputDTO",
     "RenewSubscriptionOutputDTO",
     "RenewSubscriptionUseCase",
@@ -1,9 +1,18 @@
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel
 
 from src.application.exceptions import SubscriptionNotFoundError
-from src.domain.repository import SubscriptionRepository
+from src.domain.entity import Subscription
+from src.domain.repository import (
+    AsyncSubscriptionRepository,
+    AsyncUnitOfWork,
+    SubscriptionRepository,
+    UnitOfWork,
+)
+from src.infra.cache import EntitlementCache
+from src.infra.metrics import instrument_use_case
 
 
 class CancelSubscriptionInputDTO(BaseModel):
@@ -14,26 +23,81 @@ class CancelSubscriptionInputDTO(BaseModel):
     id: UUID
 
 
+def _cancel(subscription: Optional[Subscription]) -> Subscription:
+    """
+    Cancel the subscription, and return it.
+    """
+
+    if not subscription:
+        raise SubscriptionNotFoundError("Subscription not found")
+
+    subscription.cancel()
+    return subscription
+
+
+@instrument_use_case
 class CancelSubscriptionUseCase:
     """
     Use case for canceling a subscription.
     """
 
-    def __init__(self, repository: SubscriptionRepository) -> None:
+    def __init__(
+        self,
+        repository: SubscriptionRepository,
+        unit_of_work: UnitOfWork,
+        entitlement_cache: Optional[EntitlementCache] = None,
+    ) -> None:
         """
         Initialize the use case.
         """
 
         self._repository = repository
+        self._unit_of_work = unit_of_work
+        self._entitlement_cache = entitlement_cache
 
     def execute(self, input_dto: CancelSubscriptionInputDTO) -> None:
         """
         Execute the use case.
         """
 
-        subscription = self._repository.get_by_id(input_dto.id)
-        if not subscription:
-            raise SubscriptionNotFoundError("Subscription not found")
+        with self._unit_of_work:
+            subscription = _cancel(self._repository.get_by_id(input_dto.id))
+            self._repository.update(subscription)
+            self._unit_of_work.commit()
+
+        if self._entitlement_cache:
+            self._entitlement_cache.invalidate(subscription.user_id)
+
+
+@instrument_use_case
+class AsyncCancelSubscriptionUseCase:
+    """
+    Asynchronous use case for canceling a subscription.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncSubscriptionRepository,
+        unit_of_work: AsyncUnitOfWork,
+        entitlement_cache: Optional[EntitlementCache] = None,
+    ) -> None:
+        """
+        Initialize the use case.
+        """
+
+        self._repository = repository
+        self._unit_of_work = unit_of_work
+        self._entitlement_cache = entitlement_cache
+
+    async def execute(self, input_dto: CancelSubscriptionInputDTO) -> None:
+        """
+        Execute the use case.
+        """
+
+        async with self._unit_of_work:
+            subscription = _cancel(await self._repository.get_by_id(input_dto.id))
+            await self._repository.update(subscription)
+            await self._unit_of_work.commit()
 
-        subscription.cancel()
-        self._repository.update(subscription)
+        if self._entitlement_cache:
+            self._entitlement_cache.invalidate(subscription.user_id)
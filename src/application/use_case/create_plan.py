@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -6,7 +7,13 @@ from pydantic import BaseModel, Field
 from src.application.exceptions import DuplicatePlanError
 from src.domain._shared.value_objects import MonetaryValue
 from src.domain.entity import Plan
-from src.domain.repository import PlanRepository
+from src.domain.repository import (
+    AsyncPlanRepository,
+    AsyncUnitOfWork,
+    PlanRepository,
+    UnitOfWork,
+)
+from src.infra.metrics import instrument_use_case
 
 
 class CreatePlanInputDTO(BaseModel):
@@ -31,37 +38,93 @@ class CreatePlanOutputDTO(BaseModel):
     is_active: bool
 
 
+def _check_name_is_free(existing_plan: Optional[Plan], name: str) -> None:
+    """
+    Check that no plan already uses the name.
+    """
+
+    if existing_plan:
+        raise DuplicatePlanError(f"Plan with name '{name}' already exists.")
+
+
+def _to_output(plan: Plan) -> CreatePlanOutputDTO:
+    """
+    Build the output DTO of a created plan.
+    """
+
+    return CreatePlanOutputDTO(
+        id=plan.id,
+        name=plan.name,
+        price=plan.price,
+        created_at=plan.created_at,
+        updated_at=plan.updated_at,
+        is_active=plan.is_active,
+    )
+
+
+@instrument_use_case
 class CreatePlanUseCase:
     """
     Use case for creating a plan.
     """
 
-    def __init__(self, repository: PlanRepository) -> None:
+    def __init__(
+        self,
+        repository: PlanRepository,
+        unit_of_work: UnitOfWork,
+    ) -> None:
         """
         Initialize the use case.
         """
 
         self._repository = repository
+        self._unit_of_work = unit_of_work
 
     def execute(self, input_dto: CreatePlanInputDTO) -> CreatePlanOutputDTO:
         """
         Execute the use case.
         """
 
-        existing_plan = self._repository.get_by_name(input_dto.name)
-        if existing_plan:
-            raise DuplicatePlanError(
-                f"Plan with name '{input_dto.name}' already exists."
+        with self._unit_of_work:
+            _check_name_is_free(
+                self._repository.get_by_name(input_dto.name), input_dto.name
+            )
+            plan = Plan(name=input_dto.name, price=input_dto.price)
+            self._repository.save(plan)
+            self._unit_of_work.commit()
+
+        return _to_output(plan)
+
+
+@instrument_use_case
+class AsyncCreatePlanUseCase:
+    """
+    Asynchronous use case for creating a plan.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncPlanRepository,
+        unit_of_work: AsyncUnitOfWork,
+    ) -> None:
+        """
+        Initialize the use case.
+        """
+
+        self._repository = repository
+        self._unit_of_work = unit_of_work
+
+    async def execute(self, input_dto: CreatePlanInputDTO) -> CreatePlanOutputDTO:
+        """
+        Execute the use case.
+        """
+
+        async with self._unit_of_work:
+            _check_name_is_free(
+                await self._repository.get_by_name(input_dto.name), input_dto.name
             )
+            plan = Plan(name=input_dto.name, price=input_dto.price)
+            await self._repository.save(plan)
+            await self._unit_of_work.commit()
 
-        plan = Plan(name=input_dto.name, price=input_dto.price)
-        self._repository.save(plan)
-
-        return CreatePlanOutputDTO(
-            id=plan.id,
-            name=plan.name,
-            price=plan.price,
-            created_at=plan.created_at,
-            updated_at=plan.updated_at,
-            is_active=plan.is_active,
-        )
+        return _to_output(plan)
@@ -1,12 +1,20 @@
+import asyncio
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, SecretStr
 
 from src.application.exceptions import UserAlreadyExistsError
 from src.domain.entity import Address, UserAccount
-from src.domain.repository.user_account import UserAccountRepository
+from src.domain.repository import (
+    AsyncUnitOfWork,
+    AsyncUserAccountRepository,
+    UnitOfWork,
+    UserAccountRepository,
+)
 from src.infra.auth.auth_service import AuthService
+from src.infra.metrics import instrument_use_case
 
 
 class CreateUserAccountInputDTO(BaseModel):
@@ -35,18 +43,66 @@ class CreateUserAccountOutputDTO(BaseModel):
     is_active: bool
 
 
+def _check_email_is_free(iam_user: Optional[str]) -> None:
+    """
+    Check that the email is not registered with the auth service yet.
+    """
+
+    if iam_user:
+        raise UserAlreadyExistsError("Email is already registered")
+
+
+def _new_user_account(
+    input_dto: CreateUserAccountInputDTO, iam_user_id: str
+) -> UserAccount:
+    """
+    Build the user account of a user just created in the auth service.
+    """
+
+    return UserAccount(
+        name=input_dto.name,
+        email=input_dto.email,
+        iam_user_id=iam_user_id,
+        billing_address=input_dto.billing_address,
+    )
+
+
+def _to_output(user_account: UserAccount) -> CreateUserAccountOutputDTO:
+    """
+    Build the output DTO of a created user account.
+    """
+
+    return CreateUserAccountOutputDTO(
+        user_id=user_account.id,
+        iam_user_id=user_account.iam_user_id,
+        name=user_account.name,
+        email=user_account.email,
+        billing_address=user_account.billing_address,
+        created_at=user_account.created_at,
+        updated_at=user_account.updated_at,
+        is_active=user_account.is_active,
+    )
+
+
+@instrument_use_case
 class CreateUserAccountUseCase:
     """
     Use case for creating a user account.
     """
 
-    def __init__(self, auth_service: AuthService, repository: UserAccountRepository):
+    def __init__(
+        self,
+        auth_service: AuthService,
+        repository: UserAccountRepository,
+        unit_of_work: UnitOfWork,
+    ):
         """
         Initialize the use case.
         """
 
         self._auth_service = auth_service
         self._repository = repository
+        self._unit_of_work = unit_of_work
 
     def execute(
         self, input_dto: CreateUserAccountInputDTO
@@ -56,29 +112,64 @@ class CreateUserAccountUseCase:
         """
 
         iam_user = self._auth_service.find_by_email(input_dto.email)
-        if iam_user:
-            raise UserAlreadyExistsError("Email is already registered")
+        _check_email_is_free(iam_user)
 
         iam_user_id = self._auth_service.create_user(
             email=input_dto.email,
             password=input_dto.password.get_secret_value(),
         )
 
-        user_account = UserAccount(
-            name=input_dto.name,
-            email=input_dto.email,
-            iam_user_id=iam_user_id,
-            billing_address=input_dto.billing_address,
+        with self._unit_of_work:
+            user_account = _new_user_account(input_dto, iam_user_id)
+            self._repository.save(user_account)
+            self._unit_of_work.commit()
+
+        return _to_output(user_account)
+
+
+@instrument_use_case
+class AsyncCreateUserAccountUseCase:
+    """
+    Asynchronous use case for creating a user account.
+
+    The auth service client is blocking, so its calls run in a worker thread.
+    """
+
+    def __init__(
+        self,
+        auth_service: AuthService,
+        repository: AsyncUserAccountRepository,
+        unit_of_work: AsyncUnitOfWork,
+    ):
+        """
+        Initialize the use case.
+        """
+
+        self._auth_service = auth_service
+        self._repository = repository
+        self._unit_of_work = unit_of_work
+
+    async def execute(
+        self, input_dto: CreateUserAccountInputDTO
+    ) -> CreateUserAccountOutputDTO:
+        """
+        Execute the use case.
+        """
+
+        iam_user = await asyncio.to_thread(
+            self._auth_service.find_by_email, input_dto.email
         )
-        self._repository.save(user_account)
-
-        return CreateUserAccountOutputDTO(
-            user_id=user_account.id,
-            iam_user_id=user_account.iam_user_id,
-            name=user_account.name,
-            email=user_account.email,
-            billing_address=user_account.billing_address,
-            created_at=user_account.created_at,
-            updated_at=user_account.updated_at,
-            is_active=user_account.is_active,
+        _check_email_is_free(iam_user)
+
+        iam_user_id = await asyncio.to_thread(
+            self._auth_service.create_user,
+            email=input_dto.email,
+            password=input_dto.password.get_secret_value(),
         )
+
+        async with self._unit_of_work:
+            user_account = _new_user_account(input_dto, iam_user_id)
+            await self._repository.save(user_account)
+            await self._unit_of_work.commit()
+
+        return _to_output(user_account)
@@ -0,0 +1,143 @@
+from datetime import datetime, time, timedelta
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.domain.entity import Subscription
+from src.domain.repository import AsyncSubscriptionRepository, SubscriptionRepository
+from src.infra.cache import EntitlementCache
+from src.infra.metrics import instrument_use_case
+
+
+class GetEntitlementInputDTO(BaseModel):
+    """
+    Input DTO for checking if a user is entitled to stream.
+    """
+
+    user_id: UUID
+
+
+class GetEntitlementOutputDTO(BaseModel):
+    """
+    Output DTO for checking if a user is entitled to stream.
+
+    `entitled_until` is the moment the entitlement ends, and is only set when
+    the user is entitled.
+    """
+
+    user_id: UUID
+    entitled: bool
+    subscription_id: Optional[UUID] = None
+    plan_id: Optional[UUID] = None
+    is_trial: Optional[bool] = None
+    entitled_until: Optional[datetime] = None
+
+
+def _to_output(
+    user_id: UUID,
+    subscription: Optional[Subscription],
+) -> GetEntitlementOutputDTO:
+    """
+    Build the entitlement of a user from their subscription.
+
+    A subscription stays valid through the whole day of its end date, so the
+    entitlement ends at the following midnight.
+    """
+
+    if not subscription:
+        return GetEntitlementOutputDTO(user_id=user_id, entitled=False)
+
+    entitled = not subscription.is_expired and not subscription.is_cancelled
+    return GetEntitlementOutputDTO(
+        user_id=user_id,
+        entitled=entitled,
+        subscription_id=subscription.id,
+        plan_id=subscription.plan_id,
+        is_trial=subscription.is_trial,
+        entitled_until=(
+            datetime.combine(subscription.end_date.date() + timedelta(days=1), time())
+            if entitled
+            else None
+        ),
+    )
+
+
+@instrument_use_case
+class GetEntitlementUseCase:
+    """
+    Use case for checking if a user is entitled to stream.
+    """
+
+    def __init__(
+        self,
+        repository: SubscriptionRepository,
+        cache: Optional[EntitlementCache] = None,
+    ) -> None:
+        """
+        Initialize the use case.
+        """
+
+        self._repository = repository
+        self._cache = cache
+
+    def execute(self, input_dto: GetEntitlementInputDTO) -> GetEntitlementOutputDTO:
+        """
+        Execute the use case.
+        """
+
+        if self._cache is None:
+            subscription = self._repository.get_active_by_user_id(input_dto.user_id)
+            return _to_output(input_dto.user_id, subscription)
+
+        output = self._cache.get(input_dto.user_id)
+        if output is not None:
+            return output  # type: ignore
+
+        generation = self._cache.generation
+        subscription = self._repository.get_active_by_user_id(input_dto.user_id)
+        output = _to_output(input_dto.user_id, subscription)
+        self._cache.put(input_dto.user_id, output, output.entitled_until, generation)
+        return output
+
+
+@instrument_use_case
+class AsyncGetEntitlementUseCase:
+    """
+    Asynchronous use case for checking if a user is entitled to stream.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncSubscriptionRepository,
+        cache: Optional[EntitlementCache] = None,
+    ) -> None:
+        """
+        Initialize the use case.
+        """
+
+        self._repository = repository
+        self._cache = cache
+
+    async def execute(
+        self, input_dto: GetEntitlementInputDTO
+    ) -> GetEntitlementOutputDTO:
+        """
+        Execute the use case.
+        """
+
+        if self._cache is None:
+            subscription = await self._repository.get_active_by_user_id(
+                input_dto.user_id
+            )
+            return _to_output(input_dto.user_id, subscription)
+
+        output = self._cache.get(input_dto.user_id)
+        if output is not None:
+            return output  # type: ignore
+
+        generation = self._cache.generation
+        subscription = await self._repository.get_active_by_user_id(input_dto.user_id)
+        output = _to_output(input_dto.user_id, subscription)
+        self._cache.put(input_dto.user_id, output, output.entitled_until, generation)
+        return output
@@ -0,0 +1,115 @@
+from datetime import datetime
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.application.use_case.pagination import (
+    PageInputDTO,
+    PageOutputDTO,
+    decode_cursor,
+    split_page,
+)
+from src.domain._shared.value_objects import MonetaryValue
+from src.domain.entity import Plan
+from src.domain.repository import AsyncPlanRepository, PlanRepository
+from src.infra.metrics import instrument_use_case
+
+
+class ListPlansInputDTO(PageInputDTO):
+    """
+    Input DTO for listing plans.
+    """
+
+
+class PlanItemDTO(BaseModel):
+    """
+    A plan in a listing.
+    """
+
+    id: UUID
+    name: str
+    price: MonetaryValue
+    created_at: datetime
+    updated_at: datetime
+    is_active: bool
+
+
+class ListPlansOutputDTO(PageOutputDTO[PlanItemDTO]):
+    """
+    Output DTO for listing plans.
+    """
+
+
+def _to_output(plans: List[Plan], limit: int) -> ListPlansOutputDTO:
+    """
+    Build the output DTO from the plans fetched for a page.
+    """
+
+    page, next_cursor = split_page(plans, limit)
+    return ListPlansOutputDTO(
+        items=[
+            PlanItemDTO(
+                id=plan.id,
+                name=plan.name,
+                price=plan.price,
+                created_at=plan.created_at,
+                updated_at=plan.updated_at,
+                is_active=plan.is_active,
+            )
+            for plan in page
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+@instrument_use_case
+class ListPlansUseCase:
+    """
+    Use case for listing plans, a page at a time.
+    """
+
+    def __init__(self, repository: PlanRepository) -> None:
+        """
+        Initialize the use case.
+        """
+
+        self._repository = repository
+
+    def execute(self, input_dto: ListPlansInputDTO) -> ListPlansOutputDTO:
+        """
+        Execute the use case.
+        """
+
+        plans = self._repository.list_page(
+            limit=input_dto.limit + 1,
+            after=decode_cursor(input_dto.cursor),
+        )
+
+        return _to_output(plans, input_dto.limit)
+
+
+@instrument_use_case
+class AsyncListPlansUseCase:
+    """
+    Asynchronous use case for listing plans, a page at a time.
+    """
+
+    def __init__(self, repository: AsyncPlanRepository) -> None:
+        """
+        Initialize the use case.
+        """
+
+        self._repository = repository
+
+    async def execute(self, input_dto: ListPlansInputDTO) -> ListPlansOutputDTO:
+        """
+        Execute the use case.
+        """
+
+        plans = await self._repository.list_page(
+            limit=input_dto.limit + 1,
+            after=decode_cursor(input_dto.cursor),
+        )
+
+        return _to_output(plans, input_dto.limit)
@@ -0,0 +1,138 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.application.use_case.pagination import (
+    PageInputDTO,
+    PageOutputDTO,
+    decode_cursor,
+    split_page,
+)
+from src.domain.entity import Subscription, SubscriptionStatus
+from src.domain.repository import AsyncSubscriptionRepository, SubscriptionRepository
+from src.infra.metrics import instrument_use_case
+
+
+class ListSubscriptionsInputDTO(PageInputDTO):
+    """
+    Input DTO for listing subscriptions, optionally filtered by user, plan and
+    status.
+    """
+
+    user_id: Optional[UUID] = None
+    plan_id: Optional[UUID] = None
+    status: Optional[SubscriptionStatus] = None
+
+
+class SubscriptionItemDTO(BaseModel):
+    """
+    A subscription in a listing.
+    """
+
+    id: UUID
+    user_id: UUID
+    plan_id: UUID
+    start_date: datetime
+    end_date: datetime
+    status: SubscriptionStatus
+    is_trial: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+class ListSubscriptionsOutputDTO(PageOutputDTO[SubscriptionItemDTO]):
+    """
+    Output DTO for listing subscriptions.
+    """
+
+
+def _to_output(
+    subscriptions: List[Subscription],
+    limit: int,
+) -> ListSubscriptionsOutputDTO:
+    """
+    Build the output DTO from the subscriptions fetched for a page.
+    """
+
+    page, next_cursor = split_page(subscriptions, limit)
+    return ListSubscriptionsOutputDTO(
+        items=[
+            SubscriptionItemDTO(
+                id=subscription.id,
+                user_id=subscription.user_id,
+                plan_id=subscription.plan_id,
+                start_date=subscription.start_date,
+                end_date=subscription.end_date,
+                status=subscription.status,
+                is_trial=subscription.is_trial,
+                created_at=subscription.created_at,
+                updated_at=subscription.updated_at,
+            )
+            for subscription in page
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+@instrument_use_case
+class ListSubscriptionsUseCase:
+    """
+    Use case for listing subscriptions, a page at a time.
+    """
+
+    def __init__(self, repository: SubscriptionRepository) -> None:
+        """
+        Initialize the use case.
+        """
+
+        self._repository = repository
+
+    def execute(
+        self, input_dto: ListSubscriptionsInputDTO
+    ) -> ListSubscriptionsOutputDTO:
+        """
+        Execute the use case.
+        """
+
+        subscriptions = self._repository.list_page(
+            limit=input_dto.limit + 1,
+            after=decode_cursor(input_dto.cursor),
+            user_id=input_dto.user_id,
+            plan_id=input_dto.plan_id,
+            status=input_dto.status,
+        )
+
+        return _to_output(subscriptions, input_dto.limit)
+
+
+@instrument_use_case
+class AsyncListSubscriptionsUseCase:
+    """
+    Asynchronous use case for listing subscriptions, a page at a time.
+    """
+
+    def __init__(self, repository: AsyncSubscriptionRepository) -> None:
+        """
+        Initialize the use case.
+        """
+
+        self._repository = repository
+
+    async def execute(
+        self, input_dto: ListSubscriptionsInputDTO
+    ) -> ListSubscriptionsOutputDTO:
+        """
+        Execute the use case.
+        """
+
+        subscriptions = await self._repository.list_page(
+            limit=input_dto.limit + 1,
+            after=decode_cursor(input_dto.cursor),
+            user_id=input_dto.user_id,
+            plan_id=input_dto.plan_id,
+            status=input_dto.status,
+        )
+
+        return _to_output(subscriptions, input_dto.limit)
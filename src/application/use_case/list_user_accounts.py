@@ -0,0 +1,123 @@
+from datetime import datetime
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel, EmailStr
+
+from src.application.use_case.pagination import (
+    PageInputDTO,
+    PageOutputDTO,
+    decode_cursor,
+    split_page,
+)
+from src.domain.entity import Address, UserAccount
+from src.domain.repository import AsyncUserAccountRepository, UserAccountRepository
+from src.infra.metrics import instrument_use_case
+
+
+class ListUserAccountsInputDTO(PageInputDTO):
+    """
+    Input DTO for listing user accounts.
+    """
+
+
+class UserAccountItemDTO(BaseModel):
+    """
+    A user account in a listing.
+    """
+
+    user_id: UUID
+    iam_user_id: str
+    name: str
+    email: EmailStr
+    billing_address: Address
+    created_at: datetime
+    updated_at: datetime
+    is_active: bool
+
+
+class ListUserAccountsOutputDTO(PageOutputDTO[UserAccountItemDTO]):
+    """
+    Output DTO for listing user accounts.
+    """
+
+
+def _to_output(
+    user_accounts: List[UserAccount],
+    limit: int,
+) -> ListUserAccountsOutputDTO:
+    """
+    Build the output DTO from the user accounts fetched for a page.
+    """
+
+    page, next_cursor = split_page(user_accounts, limit)
+    return ListUserAccountsOutputDTO(
+        items=[
+            UserAccountItemDTO(
+                user_id=user_account.id,
+                iam_user_id=user_account.iam_user_id,
+                name=user_account.name,
+                email=user_account.email,
+                billing_address=user_account.billing_address,
+                created_at=user_account.created_at,
+                updated_at=user_account.updated_at,
+                is_active=user_account.is_active,
+            )
+            for user_account in page
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+@instrument_use_case
+class ListUserAccountsUseCase:
+    """
+    Use case for listing user accounts, a page at a time.
+    """
+
+    def __init__(self, repository: UserAccountRepository) -> None:
+        """
+        Initialize the use case.
+        """
+
+        self._repository = repository
+
+    def execute(self, input_dto: ListUserAccountsInputDTO) -> ListUserAccountsOutputDTO:
+        """
+        Execute the use case.
+        """
+
+        user_accounts = self._repository.list_page(
+            limit=input_dto.limit + 1,
+            after=decode_cursor(input_dto.cursor),
+        )
+
+        return _to_output(user_accounts, input_dto.limit)
+
+
+@instrument_use_case
+class AsyncListUserAccountsUseCase:
+    """
+    Asynchronous use case for listing user accounts, a page at a time.
+    """
+
+    def __init__(self, repository: AsyncUserAccountRepository) -> None:
+        """
+        Initialize the use case.
+        """
+
+        self._repository = repository
+
+    async def execute(
+        self, input_dto: ListUserAccountsInputDTO
+    ) -> ListUserAccountsOutputDTO:
+        """
+        Execute the use case.
+        """
+
+        user_accounts = await self._repository.list_page(
+            limit=input_dto.limit + 1,
+            after=decode_cursor(input_dto.cursor),
+        )
+
+        return _to_output(user_accounts, input_dto.limit)
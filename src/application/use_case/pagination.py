@@ -0,0 +1,75 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Generic, List, Optional, Sequence, Tuple, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from src.application.exceptions import InvalidCursorError
+from src.domain._shared import Entity
+
+ItemType = TypeVar("ItemType")
+
+
+class PageInputDTO(BaseModel):
+    """
+    Input DTO for requesting a page of a listing.
+
+    `cursor` is the `next_cursor` of the previous page, or None for the first.
+    """
+
+    limit: int = Field(default=50, gt=0, le=500)
+    cursor: Optional[str] = None
+
+
+class PageOutputDTO(BaseModel, Generic[ItemType]):
+    """
+    Output DTO for a page of a listing.
+
+    `next_cursor` is None on the last page.
+    """
+
+    items: List[ItemType]
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(entity: Entity) -> str:
+    """
+    Encode the (created_at, id) key of an entity as an opaque cursor.
+    """
+
+    key = f"{entity.created_at.isoformat()}|{entity.id}"
+    return base64.urlsafe_b64encode(key.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, UUID]]:
+    """
+    Decode a cursor back into the (created_at, id) key it was built from.
+    """
+
+    if cursor is None:
+        return None
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id_ = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(id_)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor '{cursor}'.") from e
+
+
+def split_page(
+    entities: Sequence[Entity],
+    limit: int,
+) -> Tuple[Sequence[Entity], Optional[str]]:
+    """
+    Split the entities fetched for a page, one more than the limit, into the
+    page itself and the cursor of the next page.
+    """
+
+    if len(entities) <= limit:
+        return entities, None
+
+    entities = entities[:limit]
+    return entities, encode_cursor(entities[-1])
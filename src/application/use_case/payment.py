@@ -0,0 +1,29 @@
+import asyncio
+from typing import Union
+
+from src.domain.entity import Address
+from src.infra.payment import AsyncPaymentGateway, Payment, PaymentGateway
+
+
+async def process_payment(
+    payment_gateway: Union[PaymentGateway, AsyncPaymentGateway],
+    payment_token: str,
+    billing_address: Address,
+) -> Payment:
+    """
+    Process a payment without blocking the event loop: payments through an
+    AsyncPaymentGateway are awaited, a blocking PaymentGateway runs in a
+    worker thread instead.
+    """
+
+    if isinstance(payment_gateway, AsyncPaymentGateway):
+        return await payment_gateway.process_payment(
+            payment_token=payment_token,
+            billing_address=billing_address,
+        )
+
+    return await asyncio.to_thread(
+        payment_gateway.process_payment,
+        payment_token=payment_token,
+        billing_address=billing_address,
+    )
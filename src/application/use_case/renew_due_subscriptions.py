@@ -0,0 +1,185 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from src.application.use_case.renew_subscription import (
+    apply_payment,
+    notify_payment_failed,
+)
+from src.domain.entity import Subscription, UserAccount
+from src.domain.repository import (
+    SubscriptionRepository,
+    UnitOfWork,
+    UserAccountRepository,
+)
+from src.infra.cache import EntitlementCache
+from src.infra.metrics import instrument_use_case
+from src.infra.notification import NotificationService
+from src.infra.payment import Payment, PaymentGateway, PaymentTokenProvider
+
+
+class RenewDueSubscriptionsInputDTO(BaseModel):
+    """
+    Input DTO for renewing every subscription due before a given date.
+    """
+
+    before: datetime
+    page_size: int = Field(default=500, gt=0)
+    max_concurrency: int = Field(default=16, gt=0)
+
+
+class RenewDueSubscriptionsOutputDTO(BaseModel):
+    """
+    Output DTO for a batch renewal run.
+    """
+
+    processed: int
+    renewed: int
+    payment_failed: int
+    failed: int
+    elapsed_seconds: float
+    throughput: float
+
+
+@instrument_use_case
+class RenewDueSubscriptionsUseCase:
+    """
+    Use case for renewing every subscription due before a given date.
+
+    Due subscriptions are read in pages, the owning user accounts of a page and
+    their stored payment tokens are fetched in bulk, payments run concurrently
+    on a thread pool and the results of a page are written back with a single
+    bulk update committed in its own transaction. The renewal rules themselves
+    are the ones of RenewSubscriptionUseCase. A subscription whose user account
+    or payment token is missing is counted as failed and left unchanged.
+    """
+
+    def __init__(
+        self,
+        subscription_repository: SubscriptionRepository,
+        user_account_repository: UserAccountRepository,
+        payment_gateway: PaymentGateway,
+        payment_token_provider: PaymentTokenProvider,
+        notification_service: NotificationService,
+        unit_of_work: UnitOfWork,
+        entitlement_cache: Optional[EntitlementCache] = None,
+    ) -> None:
+        """
+        Initialize the use case.
+        """
+
+        self._subscription_repository = subscription_repository
+        self._user_account_repository = user_account_repository
+        self._payment_gateway = payment_gateway
+        self._payment_token_provider = payment_token_provider
+        self._notification_service = notification_service
+        self._unit_of_work = unit_of_work
+        self._entitlement_cache = entitlement_cache
+
+    def execute(
+        self, input_dto: RenewDueSubscriptionsInputDTO
+    ) -> RenewDueSubscriptionsOutputDTO:
+        """
+        Execute the use case.
+        """
+
+        started_at = time.perf_counter()
+        processed = renewed = payment_failed = failed = 0
+        after: Optional[Tuple[datetime, UUID]] = None
+        # Subscriptions that are still due after being processed (e.g. overdue
+        # for more than one period) would show up again further down the index.
+        still_due: Set[UUID] = set()
+
+        with ThreadPoolExecutor(max_workers=input_dto.max_concurrency) as executor:
+            while True:
+                page = list(
+                    self._subscription_repository.iter_due(
+                        before=input_dto.before,
+                        limit=input_dto.page_size,
+                        after=after,
+                    )
+                )
+                if not page:
+                    break
+
+                after = (page[-1].end_date, page[-1].id)
+                page = [s for s in page if s.id not in still_due]
+
+                user_accounts = self._get_user_accounts(page)
+                payment_tokens = self._payment_token_provider.get_payment_tokens(
+                    user_accounts.values()
+                )
+                payments: List[Tuple[Subscription, UserAccount, Future[Payment]]] = []
+                for subscription in page:
+                    user_account = user_accounts.get(subscription.user_id)
+                    payment_token = payment_tokens.get(subscription.user_id)
+                    if not user_account or not payment_token:
+                        failed += 1
+                        continue
+
+                    future = executor.submit(
+                        self._payment_gateway.process_payment,
+                        payment_token=payment_token,
+                        billing_address=user_account.billing_address,
+                    )
+                    payments.append((subscription, user_account, future))
+
+                updated: List[Subscription] = []
+                unpaid: List[Tuple[Subscription, UserAccount]] = []
+                for subscription, user_account, future in payments:
+                    try:
+                        payment = future.result()
+                        apply_payment(subscription, payment)
+                    except Exception:
+                        failed += 1
+                        continue
+
+                    if payment.success:
+                        renewed += 1
+                    else:
+                        payment_failed += 1
+                        unpaid.append((subscription, user_account))
+                    updated.append(subscription)
+                    if not subscription.is_cancelled and (
+                        subscription.end_date < input_dto.before
+                    ):
+                        still_due.add(subscription.id)
+
+                with self._unit_of_work:
+                    self._subscription_repository.update_many(updated)
+                    for subscription, user_account in unpaid:
+                        notify_payment_failed(
+                            self._notification_service, subscription, user_account
+                        )
+                    self._unit_of_work.commit()
+                if self._entitlement_cache:
+                    for subscription in updated:
+                        self._entitlement_cache.invalidate(subscription.user_id)
+                processed += len(page)
+
+        elapsed_seconds = time.perf_counter() - started_at
+        return RenewDueSubscriptionsOutputDTO(
+            processed=processed,
+            renewed=renewed,
+            payment_failed=payment_failed,
+            failed=failed,
+            elapsed_seconds=elapsed_seconds,
+            throughput=processed / elapsed_seconds if elapsed_seconds else 0.0,
+        )
+
+    def _get_user_accounts(
+        self, subscriptions: List[Subscription]
+    ) -> Dict[UUID, UserAccount]:
+        """
+        Fetch the owning user accounts of the given subscriptions in bulk.
+        """
+
+        user_ids = {subscription.user_id for subscription in subscriptions}
+        return {
+            user_account.id: user_account
+            for user_account in self._user_account_repository.get_many_by_ids(user_ids)
+        }
@@ -1,11 +1,22 @@
-from typing import Optional
+from typing import Optional, Union
 from uuid import UUID
 
 from pydantic import BaseModel
 
-from src.domain.repository import SubscriptionRepository, UserAccountRepository
+from src.application.use_case.payment import process_payment
+from src.domain.entity import Subscription, UserAccount
+from src.domain.repository import (
+    AsyncSubscriptionRepository,
+    AsyncUnitOfWork,
+    AsyncUserAccountRepository,
+    SubscriptionRepository,
+    UnitOfWork,
+    UserAccountRepository,
+)
+from src.infra.cache import EntitlementCache
+from src.infra.metrics import instrument_use_case
 from src.infra.notification import NotificationService
-from src.infra.payment import PaymentGateway
+from src.infra.payment import AsyncPaymentGateway, Payment, PaymentGateway
 
 
 class RenewSubscriptionInputDTO(BaseModel):
@@ -25,6 +36,49 @@ class RenewSubscriptionOutputDTO(BaseModel):
     subscription_id: UUID
 
 
+def apply_payment(subscription: Subscription, payment: Payment) -> None:
+    """
+    Renew the subscription if the payment succeeded, otherwise downgrade the
+    subscription to trial (or cancel an existing trial).
+    """
+
+    if payment.success:
+        subscription.renew()
+    elif subscription.is_trial:
+        subscription.cancel()
+    else:
+        subscription.convert_to_trial()
+
+
+def notify_payment_failed(
+    notification_service: NotificationService,
+    subscription: Subscription,
+    user_account: UserAccount,
+) -> None:
+    """
+    Tell the user the renewal payment failed. Called within the unit of work,
+    once the subscription change is staged, so the notification is only sent
+    if that change is committed.
+    """
+
+    notification_service.notify(
+        message=f"Payment failed for subscription {subscription.id}",
+        recipient=user_account.email,
+    )
+
+
+def _notify_not_found(notification_service: NotificationService) -> None:
+    """
+    Report a renewal of a subscription that does not exist.
+    """
+
+    notification_service.notify(
+        message="Subscription not found",
+        recipient=None,
+    )
+
+
+@instrument_use_case
 class RenewSubscriptionUseCase:
     """
     Use case for renewing a subscription.
@@ -36,6 +90,8 @@ class RenewSubscriptionUseCase:
         user_account_repository: UserAccountRepository,
         payment_gateway: PaymentGateway,
         notification_service: NotificationService,
+        unit_of_work: UnitOfWork,
+        entitlement_cache: Optional[EntitlementCache] = None,
     ) -> None:
         """
         Initialize the use case.
@@ -45,6 +101,8 @@ class RenewSubscriptionUseCase:
         self._user_account_repository = user_account_repository
         self._payment_gateway = payment_gateway
         self._notification_service = notification_service
+        self._unit_of_work = unit_of_work
+        self._entitlement_cache = entitlement_cache
 
     def execute(
         self, input_dto: RenewSubscriptionInputDTO
@@ -57,10 +115,9 @@ class RenewSubscriptionUseCase:
             input_dto.subscription_id
         )
         if not subscription:
-            self._notification_service.notify(
-                message="Subscription not found",
-                recipient=None,
-            )
+            with self._unit_of_work:
+                _notify_not_found(self._notification_service)
+                self._unit_of_work.commit()
             return None
 
         user_account = self._user_account_repository.get_by_id(subscription.user_id)
@@ -70,18 +127,90 @@ class RenewSubscriptionUseCase:
             billing_address=user_account.billing_address,  # type: ignore
         )
 
-        if payment.success:
-            subscription.renew()
-        else:
-            self._notification_service.notify(
-                message=f"Payment failed for subscription {input_dto.subscription_id}",
-                recipient=user_account.email,  # type: ignore
-            )
-            if subscription.is_trial:
-                subscription.cancel()
-            else:
-                subscription.convert_to_trial()
-
-        self._subscription_repository.update(subscription)
+        with self._unit_of_work:
+            apply_payment(subscription, payment)
+            self._subscription_repository.update(subscription)
+            if not payment.success:
+                notify_payment_failed(
+                    self._notification_service,
+                    subscription,
+                    user_account,  # type: ignore
+                )
+            self._unit_of_work.commit()
+
+        if self._entitlement_cache:
+            self._entitlement_cache.invalidate(subscription.user_id)
+
+        return RenewSubscriptionOutputDTO(subscription_id=subscription.id)
+
+
+@instrument_use_case
+class AsyncRenewSubscriptionUseCase:
+    """
+    Asynchronous use case for renewing a subscription.
+
+    Payments through an AsyncPaymentGateway are awaited; a blocking
+    PaymentGateway runs in a worker thread instead.
+    """
+
+    def __init__(
+        self,
+        subscription_repository: AsyncSubscriptionRepository,
+        user_account_repository: AsyncUserAccountRepository,
+        payment_gateway: Union[PaymentGateway, AsyncPaymentGateway],
+        notification_service: NotificationService,
+        unit_of_work: AsyncUnitOfWork,
+        entitlement_cache: Optional[EntitlementCache] = None,
+    ) -> None:
+        """
+        Initialize the use case.
+        """
+
+        self._subscription_repository = subscription_repository
+        self._user_account_repository = user_account_repository
+        self._payment_gateway = payment_gateway
+        self._notification_service = notification_service
+        self._unit_of_work = unit_of_work
+        self._entitlement_cache = entitlement_cache
+
+    async def execute(
+        self, input_dto: RenewSubscriptionInputDTO
+    ) -> Optional[RenewSubscriptionOutputDTO]:
+        """
+        Execute the use case.
+        """
+
+        subscription = await self._subscription_repository.get_by_id(
+            input_dto.subscription_id
+        )
+        if not subscription:
+            async with self._unit_of_work:
+                _notify_not_found(self._notification_service)
+                await self._unit_of_work.commit()
+            return None
+
+        user_account = await self._user_account_repository.get_by_id(
+            subscription.user_id
+        )
+
+        payment = await process_payment(
+            self._payment_gateway,
+            payment_token=input_dto.payment_token,
+            billing_address=user_account.billing_address,  # type: ignore
+        )
+
+        async with self._unit_of_work:
+            apply_payment(subscription, payment)
+            await self._subscription_repository.update(subscription)
+            if not payment.success:
+                notify_payment_failed(
+                    self._notification_service,
+                    subscription,
+                    user_account,  # type: ignore
+                )
+            await self._unit_of_work.commit()
+
+        if self._entitlement_cache:
+            self._entitlement_cache.invalidate(subscription.user_id)
 
         return RenewSubscriptionOutputDTO(subscription_id=subscription.id)
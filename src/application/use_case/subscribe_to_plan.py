@@ -1,3 +1,4 @@
+from typing import Optional, Union
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -7,14 +8,25 @@ from src.application.exceptions import (
     SubscriptionConflictError,
     UserNotFoundError,
 )
-from src.domain.entity import Subscription
+from src.application.use_case.payment import process_payment
+from src.domain.entity import Subscription, UserAccount
 from src.domain.repository import (
+    AsyncPlanRepository,
+    AsyncSubscribeContextLoader,
+    AsyncSubscriptionRepository,
+    AsyncUnitOfWork,
+    AsyncUserAccountRepository,
     PlanRepository,
+    SubscribeContext,
+    SubscribeContextLoader,
     SubscriptionRepository,
+    UnitOfWork,
     UserAccountRepository,
 )
+from src.infra.cache import EntitlementCache
+from src.infra.metrics import instrument_use_case
 from src.infra.notification import NotificationService
-from src.infra.payment import PaymentGateway
+from src.infra.payment import AsyncPaymentGateway, Payment, PaymentGateway
 
 
 class SubscribeToPlanInputDTO(BaseModel):
@@ -35,9 +47,64 @@ class SubscribeToPlanOutputDTO(BaseModel):
     subscription_id: UUID
 
 
+def _check_context(context: SubscribeContext) -> UserAccount:
+    """
+    Check that the user can subscribe to the plan, and return the user.
+    """
+
+    if not context.user:
+        raise UserNotFoundError("User does not exists")
+
+    if not context.plan:
+        raise PlanNotFoundError("Plan not found")
+
+    if context.active_subscription:
+        raise SubscriptionConflictError("User already has active subscription")
+
+    return context.user
+
+
+def _new_subscription(
+    input_dto: SubscribeToPlanInputDTO, payment: Payment
+) -> Subscription:
+    """
+    Build the subscription: a regular one if the payment succeeded, otherwise a
+    trial.
+    """
+
+    if payment.success:
+        return Subscription.create_regular(
+            user_id=input_dto.user_id,
+            plan_id=input_dto.plan_id,
+        )
+
+    return Subscription.create_trial(
+        user_id=input_dto.user_id,
+        plan_id=input_dto.plan_id,
+    )
+
+
+def _notify_payment_failed(
+    notification_service: NotificationService, user: UserAccount
+) -> None:
+    """
+    Tell the user the payment failed and they got a trial instead.
+    """
+
+    notification_service.notify(
+        message="Payment failed",
+        recipient=user.email,
+    )
+
+
+@instrument_use_case
 class SubscribeToPlanUseCase:
     """
     Use case for subscribing to a plan.
+
+    When the subscription repository is also a SubscribeContextLoader, the
+    user and active subscription are read with a single query. The plan always
+    comes from the plan repository, so a cached catalog is used.
     """
 
     def __init__(
@@ -47,6 +114,8 @@ class SubscribeToPlanUseCase:
         plan_repository: PlanRepository,
         payment_gateway: PaymentGateway,
         notification_service: NotificationService,
+        unit_of_work: UnitOfWork,
+        entitlement_cache: Optional[EntitlementCache] = None,
     ) -> None:
         """
         Initialize the use case.
@@ -57,44 +126,139 @@ class SubscribeToPlanUseCase:
         self._plan_repository = plan_repository
         self._payment_gateway = payment_gateway
         self._notification_service = notification_service
+        self._unit_of_work = unit_of_work
+        self._entitlement_cache = entitlement_cache
 
     def execute(self, input_dto: SubscribeToPlanInputDTO) -> SubscribeToPlanOutputDTO:
         """
         Execute the use case.
         """
 
-        user = self._user_repository.get_by_id(input_dto.user_id)
-        if not user:
-            raise UserNotFoundError("User does not exists")
-
-        plan = self._plan_repository.get_by_id(input_dto.plan_id)
-        if not plan:
-            raise PlanNotFoundError("Plan not found")
-
-        subscription = self._subscription_repository.get_by_user_id(
-            user_id=input_dto.user_id
-        )
-        if subscription and subscription.is_active:
-            raise SubscriptionConflictError("User already has active subscription")
+        context = self._load_context(input_dto.user_id, input_dto.plan_id)
+        user = _check_context(context)
 
         payment = self._payment_gateway.process_payment(
             payment_token=input_dto.payment_token,
             billing_address=user.billing_address,
         )
-        if payment.success:
-            subscription = Subscription.create_regular(
-                user_id=input_dto.user_id,
-                plan_id=input_dto.plan_id,
+        subscription = _new_subscription(input_dto, payment)
+        with self._unit_of_work:
+            self._subscription_repository.save(subscription)
+            if not payment.success:
+                _notify_payment_failed(self._notification_service, user)
+            self._unit_of_work.commit()
+
+        if self._entitlement_cache:
+            self._entitlement_cache.invalidate(subscription.user_id)
+
+        return SubscribeToPlanOutputDTO(subscription_id=subscription.id)
+
+    def _load_context(self, user_id: UUID, plan_id: UUID) -> SubscribeContext:
+        """
+        Read the user, the plan and the user's active subscription, stopping at
+        the first one that rules the subscription out.
+        """
+
+        if isinstance(self._subscription_repository, SubscribeContextLoader):
+            context = self._subscription_repository.load_subscribe_context(user_id)
+            if context.user:
+                context.plan = self._plan_repository.get_by_id(plan_id)
+            return context
+
+        context = SubscribeContext(user=self._user_repository.get_by_id(user_id))
+        if context.user:
+            context.plan = self._plan_repository.get_by_id(plan_id)
+        if context.plan:
+            context.active_subscription = (
+                self._subscription_repository.get_active_by_user_id(user_id=user_id)
             )
-        else:
-            self._notification_service.notify(
-                message="Payment failed",
-                recipient=user.email,
+
+        return context
+
+
+@instrument_use_case
+class AsyncSubscribeToPlanUseCase:
+    """
+    Asynchronous use case for subscribing to a plan.
+
+    Payments through an AsyncPaymentGateway are awaited; a blocking
+    PaymentGateway runs in a worker thread instead.
+    When the subscription repository is also an AsyncSubscribeContextLoader, the
+    user and active subscription are read with a single query, and the plan
+    comes from the plan repository.
+    """
+
+    def __init__(
+        self,
+        subscription_repository: AsyncSubscriptionRepository,
+        user_repository: AsyncUserAccountRepository,
+        plan_repository: AsyncPlanRepository,
+        payment_gateway: Union[PaymentGateway, AsyncPaymentGateway],
+        notification_service: NotificationService,
+        unit_of_work: AsyncUnitOfWork,
+        entitlement_cache: Optional[EntitlementCache] = None,
+    ) -> None:
+        """
+        Initialize the use case.
+        """
+
+        self._subscription_repository = subscription_repository
+        self._user_repository = user_repository
+        self._plan_repository = plan_repository
+        self._payment_gateway = payment_gateway
+        self._notification_service = notification_service
+        self._unit_of_work = unit_of_work
+        self._entitlement_cache = entitlement_cache
+
+    async def execute(
+        self, input_dto: SubscribeToPlanInputDTO
+    ) -> SubscribeToPlanOutputDTO:
+        """
+        Execute the use case.
+        """
+
+        context = await self._load_context(input_dto.user_id, input_dto.plan_id)
+        user = _check_context(context)
+
+        payment = await process_payment(
+            self._payment_gateway,
+            payment_token=input_dto.payment_token,
+            billing_address=user.billing_address,
+        )
+        subscription = _new_subscription(input_dto, payment)
+        async with self._unit_of_work:
+            await self._subscription_repository.save(subscription)
+            if not payment.success:
+                _notify_payment_failed(self._notification_service, user)
+            await self._unit_of_work.commit()
+
+        if self._entitlement_cache:
+            self._entitlement_cache.invalidate(subscription.user_id)
+
+        return SubscribeToPlanOutputDTO(subscription_id=subscription.id)
+
+    async def _load_context(self, user_id: UUID, plan_id: UUID) -> SubscribeContext:
+        """
+        Read the user, the plan and the user's active subscription, stopping at
+        the first one that rules the subscription out.
+        """
+
+        if isinstance(self._subscription_repository, AsyncSubscribeContextLoader):
+            context = await self._subscription_repository.load_subscribe_context(
+                user_id
             )
-            subscription = Subscription.create_trial(
-                user_id=input_dto.user_id,
-                plan_id=input_dto.plan_id,
+            if context.user:
+                context.plan = await self._plan_repository.get_by_id(plan_id)
+            return context
+
+        context = SubscribeContext(user=await self._user_repository.get_by_id(user_id))
+        if context.user:
+            context.plan = await self._plan_repository.get_by_id(plan_id)
+        if context.plan:
+            context.active_subscription = (
+                await self._subscription_repository.get_active_by_user_id(
+                    user_id=user_id
+                )
             )
 
-        self._subscription_repository.save(subscription)
-        return SubscribeToPlanOutputDTO(subscription_id=subscription.id)
+        return context
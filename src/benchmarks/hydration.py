@@ -0,0 +1,167 @@
+"""
+Benchmark of the mapping from database rows to domain entities.
+
+Compares the validated constructors with the trusted `hydrate` path used by
+the `to_entity` methods of the SQLModel models.
+
+Usage:
+    python -m src.benchmarks.hydration --rows 50000
+"""
+
+import argparse
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Callable, Dict, List
+from uuid import uuid4
+
+from src.domain._shared import Currency, MonetaryValue
+from src.domain.entity import (
+    Address,
+    Plan,
+    Subscription,
+    SubscriptionStatus,
+    UserAccount,
+)
+from src.infra.db.models import PlanModel, SubscriptionModel, UserAccountModel
+
+
+def validated_plan(model: PlanModel) -> Plan:
+    """
+    Map a plan row with full validation.
+    """
+
+    return Plan(
+        id=model.id,
+        name=model.name,
+        price=MonetaryValue(
+            amount=model.price_amount,
+            currency=Currency(model.price_currency),
+        ),
+        created_at=model.created_at,
+        updated_at=model.updated_at,
+        is_active=model.is_active,
+    )
+
+
+def validated_user_account(model: UserAccountModel) -> UserAccount:
+    """
+    Map a user account row with full validation.
+    """
+
+    return UserAccount(
+        id=model.id,
+        iam_user_id=model.iam_user_id,
+        name=model.name,
+        email=model.email,
+        billing_address=Address(
+            street=model.billing_address_street,
+            city=model.billing_address_city,
+            state=model.billing_address_state,
+            zip_code=model.billing_address_zip_code,
+            country=model.billing_address_country,
+        ),
+        created_at=model.created_at,
+        updated_at=model.updated_at,
+        is_active=model.is_active,
+    )
+
+
+def validated_subscription(model: SubscriptionModel) -> Subscription:
+    """
+    Map a subscription row with full validation.
+    """
+
+    return Subscription(
+        id=model.id,
+        user_id=model.user_id,
+        plan_id=model.plan_id,
+        start_date=model.start_date,
+        end_date=model.end_date,
+        status=SubscriptionStatus(model.status),
+        is_trial=model.is_trial,
+        created_at=model.created_at,
+        updated_at=model.updated_at,
+    )
+
+
+def make_rows(rows: int) -> Dict[str, List]:
+    """
+    Build in-memory rows for every model.
+    """
+
+    now = datetime.now()
+    return {
+        "plan": [
+            PlanModel(
+                id=uuid4(),
+                name=f"Plan {i}",
+                price_amount=Decimal("29.90"),
+                price_currency=Currency.BRL,
+            )
+            for i in range(rows)
+        ],
+        "user_account": [
+            UserAccountModel(
+                id=uuid4(),
+                iam_user_id=f"iam_{i}",
+                name=f"User {i}",
+                email=f"user{i}@example.com",
+                billing_address_street="123 Main St",
+                billing_address_city="Anytown",
+                billing_address_state="CA",
+                billing_address_zip_code="12345",
+                billing_address_country="USA",
+            )
+            for i in range(rows)
+        ],
+        "subscription": [
+            SubscriptionModel(
+                id=uuid4(),
+                user_id=uuid4(),
+                plan_id=uuid4(),
+                start_date=now,
+                end_date=now,
+                status=SubscriptionStatus.ACTIVE,
+            )
+            for _ in range(rows)
+        ],
+    }
+
+
+def measure(mapper: Callable, rows: List) -> float:
+    """
+    Return the entities per second produced by a mapper.
+    """
+
+    started_at = time.perf_counter()
+    for row in rows:
+        mapper(row)
+    return len(rows) / (time.perf_counter() - started_at)
+
+
+def main(argv=None) -> None:
+    """
+    Run the benchmark and print entities per second for each mapping.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=50_000)
+    args = parser.parse_args(argv)
+
+    rows = make_rows(args.rows)
+    mappers = {
+        "plan": (validated_plan, PlanModel.to_entity),
+        "user_account": (validated_user_account, UserAccountModel.to_entity),
+        "subscription": (validated_subscription, SubscriptionModel.to_entity),
+    }
+
+    print(f"{'entity':<14}{'validated/s':>14}{'hydrated/s':>14}{'speedup':>10}")
+    for name, (validated, hydrated) in mappers.items():
+        before = measure(validated, rows[name])
+        after = measure(hydrated, rows[name])
+        print(f"{name:<14}{before:>14,.0f}{after:>14,.0f}{after / before:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark suite of the repositories, use cases, entities and HTTP API.
+
+Reports throughput and latency percentiles for:
+    entities      construction, validation and serialization of each entity
+    repositories  every in-memory and SQLModel repository method, per table size
+    use_cases     every use case, with in-memory and SQLite backends
+    api           HTTP calls through the ASGI app
+
+Everything runs offline against temporary SQLite files. Results are written as
+JSON sorted by benchmark, so the files of two releases can be diffed, or
+compared directly with --baseline.
+
+Usage:
+    python -m src.benchmarks.suite --output results.json
+    python -m src.benchmarks.suite --groups repositories --sizes 1000,100000 \\
+        --baseline previous.json
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from src.benchmarks.suite import api, entities, repositories, use_cases
+from src.benchmarks.suite.harness import (
+    BenchmarkResult,
+    BenchmarkSettings,
+    compare,
+    write_results,
+)
+
+GROUPS = ("entities", "repositories", "use_cases", "api")
+
+
+def main(argv=None) -> None:
+    """
+    Run the selected benchmark groups, print their results and write them.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--groups", default=",".join(GROUPS))
+    parser.add_argument("--sizes", default="1000,100000,1000000")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--iterations", type=int, default=1_000)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--max-seconds", type=float, default=2.0)
+    parser.add_argument("--output", type=Path, default=Path("benchmark_results.json"))
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--workdir", type=Path)
+    args = parser.parse_args(argv)
+
+    groups = args.groups.split(",")
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        parser.error(f"unknown groups: {', '.join(sorted(unknown))}")
+
+    settings = BenchmarkSettings(
+        iterations=args.iterations,
+        warmup=args.warmup,
+        max_seconds=args.max_seconds,
+    )
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    with tempfile.TemporaryDirectory() as directory:
+        workdir = args.workdir or Path(directory)
+        workdir.mkdir(parents=True, exist_ok=True)
+
+        results: List[BenchmarkResult] = []
+        for group in groups:
+            started_at = time.perf_counter()
+            if group == "entities":
+                group_results = entities.run(settings)
+            elif group == "repositories":
+                group_results = repositories.run(settings, sizes, workdir)
+            elif group == "use_cases":
+                group_results = use_cases.run(settings, args.rows, workdir)
+            else:
+                group_results = api.run(settings, args.rows, workdir)
+
+            print(f"\n{group} ({time.perf_counter() - started_at:.0f}s)")
+            print(f"{'benchmark':<70}{'ops/s':>12}{'p50 us':>11}{'p99 us':>11}")
+            for result in group_results:
+                print(
+                    f"{result.key:<70}{result.ops_per_sec:>12,.0f}"
+                    f"{result.p50_us:>11,.1f}{result.p99_us:>11,.1f}"
+                )
+            results += group_results
+
+    write_results(args.output, results, settings)
+    print(f"\nWrote {len(results)} results to {args.output}")
+
+    if args.baseline:
+        print(f"\nCompared with {args.baseline}")
+        for line in compare(args.baseline, results):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
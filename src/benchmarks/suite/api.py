@@ -0,0 +1,180 @@
+import asyncio
+from functools import partial
+from itertools import count, cycle
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List
+
+import httpx
+from sqlmodel import Session, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.benchmarks.suite import data
+from src.benchmarks.suite.harness import (
+    BenchmarkResult,
+    BenchmarkSettings,
+    measure_async,
+    summarize,
+)
+from src.domain.entity import SubscriptionStatus
+from src.infra.api import app
+from src.infra.api.container import Container
+from src.infra.auth import InMemoryAuthService
+from src.infra.db import (
+    DatabaseSettings,
+    build_async_engine,
+    build_engine,
+    get_async_session,
+    get_session,
+    get_session_factory,
+)
+from src.infra.db.repository import (
+    SQLModelPlanRepository,
+    SQLModelSubscriptionRepository,
+    SQLModelUserAccountRepository,
+)
+from src.infra.notification import ConsoleNotificationService
+from src.infra.payment import FakePaymentGateway
+
+GROUP = "api"
+
+
+def run(
+    settings: BenchmarkSettings,
+    rows: int,
+    directory: Path,
+) -> List[BenchmarkResult]:
+    """
+    Benchmark HTTP calls through the whole ASGI app, middleware included, on a
+    SQLite database holding `rows` plans, user accounts and subscriptions.
+
+    Requests go through an in-process transport, so no socket is involved.
+    The app is wired the way its lifespan does it, without the background
+    outbox dispatcher.
+    """
+
+    database = DatabaseSettings(
+        url=f"sqlite:///{directory / f'api_{rows}.db'}",
+        slow_query_threshold=float("inf"),
+    )
+    engine = build_engine(database)
+    async_engine = build_async_engine(database)
+    SQLModel.metadata.create_all(engine)
+    data.load(engine, SQLModelPlanRepository, data.plans(rows))
+    data.load(engine, SQLModelUserAccountRepository, data.user_accounts(rows))
+    data.load(engine, SQLModelSubscriptionRepository, data.subscriptions(rows))
+
+    pool_size = settings.warmup + settings.iterations
+    spare_users = list(data.user_accounts(pool_size, seed=1))
+    data.load(engine, SQLModelUserAccountRepository, spare_users)
+
+    def get_session_override():
+        with Session(engine) as session:
+            yield session
+
+    async def get_async_session_override():
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_session_override
+    app.dependency_overrides[get_async_session] = get_async_session_override
+    app.dependency_overrides[get_session_factory] = lambda: partial(Session, engine)
+    app.state.container = Container(
+        auth_service=InMemoryAuthService(),
+        payment_gateway=FakePaymentGateway(),
+        notification_service=ConsoleNotificationService(),
+        session_factory=partial(Session, engine),
+    )
+
+    async def scenario() -> List[BenchmarkResult]:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://benchmark"
+        ) as client:
+            return [
+                summarize(
+                    await measure_async(call, settings), GROUP, name, "sqlite", rows
+                )
+                for name, call in _calls(client, rows, spare_users).items()
+            ]
+
+    try:
+        return asyncio.run(scenario())
+    finally:
+        app.dependency_overrides.clear()
+        del app.state.container
+        engine.dispose()
+        asyncio.run(async_engine.dispose())
+
+
+def _calls(
+    client: httpx.AsyncClient,
+    rows: int,
+    spare_users: List,
+) -> Dict[str, Callable[[], Awaitable]]:
+    """
+    Return the benchmarked HTTP calls.
+    """
+
+    subscriptions = list(data.subscriptions(rows))
+    user_ids = cycle([str(s.user_id) for s in subscriptions])
+    plan_ids = cycle(
+        [str(plan_id) for plan_id in data.ids(data.PLAN_COUNT, 0, "plans")]
+    )
+    spare_user_ids = iter([str(user_account.id) for user_account in spare_users])
+    serial = count()
+
+    async def call(method: str, url: str, expected: int, **kwargs):
+        response = await client.request(method, url, **kwargs)
+        if response.status_code != expected:
+            raise RuntimeError(
+                f"{method} {url} returned {response.status_code}: {response.text}"
+            )
+
+    return {
+        "POST /plans": lambda: call(
+            "POST",
+            "/plans",
+            201,
+            json={
+                "name": f"Benchmark plan {next(serial)}",
+                "price": {"amount": "29.90", "currency": "BRL"},
+            },
+        ),
+        "GET /plans": lambda: call("GET", "/plans", 200),
+        "POST /accounts": lambda: call(
+            "POST",
+            "/accounts",
+            201,
+            json={
+                "name": "Benchmark User",
+                "email": f"benchmark{next(serial)}@example.com",
+                "password": "secret",
+                "billing_address": {
+                    "street": "123 Main St",
+                    "city": "Anytown",
+                    "state": "CA",
+                    "zip_code": "12345",
+                    "country": "USA",
+                },
+            },
+        ),
+        "GET /accounts": lambda: call("GET", "/accounts", 200),
+        "GET /accounts/{user_id}/entitlement": lambda: call(
+            "GET", f"/accounts/{next(user_ids)}/entitlement", 200
+        ),
+        "POST /subscriptions": lambda: call(
+            "POST",
+            "/subscriptions",
+            201,
+            json={
+                "user_id": next(spare_user_ids),
+                "plan_id": next(plan_ids),
+                "payment_token": "tok_visa",
+            },
+        ),
+        "GET /subscriptions": lambda: call(
+            "GET",
+            "/subscriptions",
+            200,
+            params={"plan_id": next(plan_ids), "status": SubscriptionStatus.ACTIVE},
+        ),
+    }
@@ -0,0 +1,142 @@
+import random
+from datetime import datetime, timedelta
+from decimal import Decimal
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, TypeVar
+from uuid import UUID
+
+from sqlalchemy import Engine
+from sqlmodel import Session
+
+from src.domain._shared import Currency, MonetaryValue
+from src.domain.entity import (
+    Address,
+    Plan,
+    Subscription,
+    SubscriptionStatus,
+    UserAccount,
+)
+
+T = TypeVar("T")
+
+NOW = datetime(2026, 1, 1)
+PLAN_COUNT = 20
+
+
+def ids(rows: int, seed: int, namespace: str) -> Iterator[UUID]:
+    """
+    Yield the same sequence of random IDs for the same seed and namespace.
+    """
+
+    rng = random.Random(f"{namespace}:{seed}")
+    for _ in range(rows):
+        yield UUID(int=rng.getrandbits(128), version=4)
+
+
+def plans(rows: int, seed: int = 0) -> Iterator[Plan]:
+    """
+    Yield plans with names distinct across seeds.
+    """
+
+    rng = random.Random(f"plans:{seed}")
+    for i, plan_id in enumerate(ids(rows, seed, "plans")):
+        created_at = NOW - timedelta(seconds=rng.randrange(730 * 86_400))
+        yield Plan.hydrate(
+            id=plan_id,
+            name=f"Plan {seed}-{i:07d}",
+            price=MonetaryValue.hydrate(
+                amount=Decimal(rng.choice(("19.90", "29.90", "39.90", "59.90"))),
+                currency=Currency.BRL,
+            ),
+            created_at=created_at,
+            updated_at=created_at,
+            is_active=True,
+        )
+
+
+def user_accounts(rows: int, seed: int = 0) -> Iterator[UserAccount]:
+    """
+    Yield user accounts with IAM user IDs and emails distinct across seeds.
+    """
+
+    rng = random.Random(f"user_accounts:{seed}")
+    for i, user_id in enumerate(ids(rows, seed, "user_accounts")):
+        created_at = NOW - timedelta(seconds=rng.randrange(730 * 86_400))
+        yield UserAccount.hydrate(
+            id=user_id,
+            iam_user_id=f"iam_{seed}_{i:07d}",
+            name=f"User {i:07d}",
+            email=f"user{i:07d}.{seed}@example.com",
+            billing_address=Address.hydrate(
+                street=f"{rng.randrange(1, 9999)} Main St",
+                city="Anytown",
+                state="CA",
+                zip_code=f"{rng.randrange(100_000):05d}",
+                country="USA",
+            ),
+            created_at=created_at,
+            updated_at=created_at,
+            is_active=True,
+        )
+
+
+def subscriptions(rows: int, seed: int = 0) -> Iterator[Subscription]:
+    """
+    Yield one subscription per user account of `user_accounts(rows, seed)`,
+    spread over the plans of `plans(PLAN_COUNT, seed)`.
+
+    Most are active, ending within a month either side of NOW, so some are due
+    for renewal; the rest are cancelled.
+    """
+
+    rng = random.Random(f"subscriptions:{seed}")
+    plan_ids = list(ids(PLAN_COUNT, seed, "plans"))
+    subscription_ids = ids(rows, seed, "subscriptions")
+    for user_id, subscription_id in zip(
+        ids(rows, seed, "user_accounts"), subscription_ids
+    ):
+        start_date = NOW - timedelta(seconds=rng.randrange(60 * 86_400))
+        yield Subscription.hydrate(
+            id=subscription_id,
+            user_id=user_id,
+            plan_id=rng.choice(plan_ids),
+            start_date=start_date,
+            end_date=start_date + timedelta(days=30),
+            status=(
+                SubscriptionStatus.ACTIVE
+                if rng.random() < 0.9
+                else SubscriptionStatus.CANCELLED
+            ),
+            is_trial=rng.random() < 0.1,
+            created_at=start_date,
+            updated_at=start_date,
+            is_active=True,
+        )
+
+
+def every(items: Iterable[T], rows: int, count: int) -> List[T]:
+    """
+    Return about `count` items spread evenly over the first `rows` items.
+    """
+
+    step = max(1, rows // count)
+    return list(islice(items, 0, rows, step))
+
+
+def load(
+    engine: Engine,
+    repository_factory: Callable[[Session], object],
+    entities: Iterable,
+    batch_size: int = 5_000,
+) -> None:
+    """
+    Insert entities with the `save_many` method of a SQLModel repository, one
+    committed batch at a time.
+    """
+
+    entities = iter(entities)
+    with Session(engine) as session:
+        repository = repository_factory(session)
+        while batch := list(islice(entities, batch_size)):
+            repository.save_many(batch)  # type: ignore[attr-defined]
+            session.commit()
@@ -0,0 +1,64 @@
+from typing import Callable, Dict, List
+
+from src.benchmarks.suite import data
+from src.benchmarks.suite.harness import (
+    BenchmarkResult,
+    BenchmarkSettings,
+    measure,
+    summarize,
+)
+from src.domain.entity import Subscription
+from src.infra.db.models import PlanModel, SubscriptionModel, UserAccountModel
+
+GROUP = "entities"
+
+
+def run(settings: BenchmarkSettings) -> List[BenchmarkResult]:
+    """
+    Benchmark the construction and serialization of every entity.
+    """
+
+    plan = next(data.plans(1))
+    user_account = next(data.user_accounts(1))
+    subscription = next(data.subscriptions(1))
+
+    operations: Dict[str, Callable[[], object]] = {}
+    for name, entity, model in (
+        ("plan", plan, PlanModel),
+        ("user_account", user_account, UserAccountModel),
+        ("subscription", subscription, SubscriptionModel),
+    ):
+        entity_cls = type(entity)
+        fields = dict(entity)
+        dumped = entity.model_dump()
+        as_json = entity.model_dump_json()
+        row = model.from_entity(entity)
+        operations.update(
+            {
+                f"{name}.construct": lambda c=entity_cls, f=fields: c(**f),
+                f"{name}.hydrate": lambda c=entity_cls, f=fields: c.hydrate(**f),
+                f"{name}.model_validate": lambda c=entity_cls, d=dumped: (
+                    c.model_validate(d)
+                ),
+                f"{name}.model_validate_json": lambda c=entity_cls, j=as_json: (
+                    c.model_validate_json(j)
+                ),
+                f"{name}.model_dump": entity.model_dump,
+                f"{name}.model_dump_json": entity.model_dump_json,
+                f"{name}.from_entity": lambda m=model, e=entity: m.from_entity(e),
+                f"{name}.to_entity": lambda m=model, r=row: m.to_entity(r),
+            }
+        )
+
+    operations["subscription.create_regular"] = lambda: Subscription.create_regular(
+        user_id=subscription.user_id, plan_id=subscription.plan_id
+    )
+    operations["subscription.create_trial"] = lambda: Subscription.create_trial(
+        user_id=subscription.user_id, plan_id=subscription.plan_id
+    )
+    operations["subscription.renew"] = subscription.model_copy().renew
+
+    return [
+        summarize(measure(operation, settings), GROUP, name)
+        for name, operation in operations.items()
+    ]
@@ -0,0 +1,208 @@
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter, perf_counter_ns
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class BenchmarkSettings(BaseModel):
+    """
+    How long each benchmark runs.
+
+    Attributes:
+        iterations (int): Timed calls per benchmark, unless the time budget
+            runs out first.
+        warmup (int): Untimed calls made before measuring.
+        max_seconds (float): Time budget of a benchmark, so slow operations on
+            large data sets still finish.
+        min_iterations (int): Timed calls made even over the time budget.
+    """
+
+    iterations: int = Field(default=1_000, gt=0)
+    warmup: int = Field(default=10, ge=0)
+    max_seconds: float = Field(default=2.0, gt=0)
+    min_iterations: int = Field(default=5, gt=0)
+
+
+class BenchmarkResult(BaseModel):
+    """
+    Throughput and latency percentiles of a benchmarked operation.
+
+    Latencies are in microseconds. `ops_per_sec` is derived from the mean
+    latency of the timed calls.
+    """
+
+    group: str
+    name: str
+    backend: Optional[str] = None
+    rows: Optional[int] = None
+    iterations: int
+    ops_per_sec: float
+    mean_us: float
+    p50_us: float
+    p90_us: float
+    p99_us: float
+    max_us: float
+
+    @property
+    def key(self) -> str:
+        """
+        Return the identity of the benchmark, stable across runs.
+        """
+
+        parts = [self.group, self.name, self.backend, self.rows]
+        return "/".join(str(part) for part in parts if part is not None)
+
+
+def percentile(samples: List[int], fraction: float) -> int:
+    """
+    Return the nearest-rank percentile of sorted samples.
+    """
+
+    index = min(len(samples) - 1, max(0, round(fraction * len(samples)) - 1))
+    return samples[index]
+
+
+def summarize(
+    samples: List[int],
+    group: str,
+    name: str,
+    backend: Optional[str] = None,
+    rows: Optional[int] = None,
+) -> BenchmarkResult:
+    """
+    Build the result of a benchmark from its latencies, in nanoseconds.
+    """
+
+    samples = sorted(samples)
+    mean = sum(samples) / len(samples)
+    return BenchmarkResult(
+        group=group,
+        name=name,
+        backend=backend,
+        rows=rows,
+        iterations=len(samples),
+        ops_per_sec=1e9 / mean if mean else 0.0,
+        mean_us=mean / 1e3,
+        p50_us=percentile(samples, 0.50) / 1e3,
+        p90_us=percentile(samples, 0.90) / 1e3,
+        p99_us=percentile(samples, 0.99) / 1e3,
+        max_us=samples[-1] / 1e3,
+    )
+
+
+def measure(func: Callable[[], Any], settings: BenchmarkSettings) -> List[int]:
+    """
+    Call a function repeatedly and return the latency of every timed call,
+    in nanoseconds.
+    """
+
+    for _ in range(settings.warmup):
+        func()
+
+    samples: List[int] = []
+    deadline = perf_counter() + settings.max_seconds
+    while len(samples) < settings.iterations:
+        started_at = perf_counter_ns()
+        func()
+        samples.append(perf_counter_ns() - started_at)
+        if len(samples) >= settings.min_iterations and perf_counter() > deadline:
+            break
+
+    return samples
+
+
+async def measure_async(
+    func: Callable[[], Awaitable[Any]],
+    settings: BenchmarkSettings,
+) -> List[int]:
+    """
+    Await a coroutine function repeatedly and return the latency of every
+    timed call, in nanoseconds.
+    """
+
+    for _ in range(settings.warmup):
+        await func()
+
+    samples: List[int] = []
+    deadline = perf_counter() + settings.max_seconds
+    while len(samples) < settings.iterations:
+        started_at = perf_counter_ns()
+        await func()
+        samples.append(perf_counter_ns() - started_at)
+        if len(samples) >= settings.min_iterations and perf_counter() > deadline:
+            break
+
+    return samples
+
+
+def environment() -> Dict[str, Any]:
+    """
+    Describe the machine and revision the benchmarks ran on.
+    """
+
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "revision": revision,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
+
+
+def write_results(
+    path: Path,
+    results: List[BenchmarkResult],
+    settings: BenchmarkSettings,
+) -> None:
+    """
+    Write the results as JSON, sorted by benchmark, so two runs diff cleanly.
+    """
+
+    document = {
+        "environment": environment(),
+        "settings": settings.model_dump(),
+        "results": [
+            result.model_dump() for result in sorted(results, key=lambda r: r.key)
+        ],
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def compare(baseline_path: Path, results: List[BenchmarkResult]) -> List[str]:
+    """
+    Return one line per benchmark also found in a previous results file, with
+    the change in throughput and median latency.
+    """
+
+    baseline = {
+        BenchmarkResult(**result).key: BenchmarkResult(**result)
+        for result in json.loads(baseline_path.read_text(encoding="utf-8"))["results"]
+    }
+
+    lines = []
+    for result in sorted(results, key=lambda r: r.key):
+        before = baseline.get(result.key)
+        if before is None:
+            continue
+        throughput = result.ops_per_sec / before.ops_per_sec - 1
+        median = result.p50_us / before.p50_us - 1
+        lines.append(f"{result.key:<70}{throughput:>+10.1%} ops/s{median:>+10.1%} p50")
+
+    return lines
@@ -0,0 +1,322 @@
+import gc
+from datetime import timedelta
+from itertools import cycle, islice
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+from sqlalchemy import Engine
+from sqlmodel import Session, SQLModel
+
+from src.benchmarks.suite import data
+from src.benchmarks.suite.harness import (
+    BenchmarkResult,
+    BenchmarkSettings,
+    measure,
+    summarize,
+)
+from src.domain._shared import Entity
+from src.infra.db import DatabaseSettings, build_engine
+from src.infra.db.repository import (
+    SQLModelPlanRepository,
+    SQLModelSubscriptionRepository,
+    SQLModelUserAccountRepository,
+)
+from src.infra.repository import (
+    InMemoryPlanRepository,
+    InMemorySubscriptionRepository,
+    InMemoryUserAccountRepository,
+)
+
+GROUP = "repositories"
+SAMPLE_SIZE = 1_000
+BATCH_SIZE = 100
+PAGE_SIZE = 50
+
+Operations = Dict[str, Callable[[], object]]
+
+
+def run(
+    settings: BenchmarkSettings,
+    sizes: Iterable[int],
+    directory: Path,
+) -> List[BenchmarkResult]:
+    """
+    Benchmark every method of the in-memory and SQLModel repositories, on
+    tables of each of the given sizes.
+
+    Writes made through a SQLModel repository are committed as part of the
+    timed call. Data sets are generated once per size and, for SQLite, loaded
+    into a database file under `directory`.
+    """
+
+    results: List[BenchmarkResult] = []
+    for rows in sizes:
+        engine = build_engine(
+            DatabaseSettings(
+                url=f"sqlite:///{directory / f'repositories_{rows}.db'}",
+                slow_query_threshold=float("inf"),
+            )
+        )
+        SQLModel.metadata.create_all(engine)
+        data.load(engine, SQLModelPlanRepository, data.plans(rows))
+        data.load(engine, SQLModelUserAccountRepository, data.user_accounts(rows))
+        data.load(engine, SQLModelSubscriptionRepository, data.subscriptions(rows))
+
+        for name, benchmark in (
+            ("plan", plan_operations),
+            ("user_account", user_account_operations),
+            ("subscription", subscription_operations),
+        ):
+            results += _run_in_memory(settings, name, benchmark, rows)
+            results += _run_sqlite(settings, name, benchmark, rows, engine)
+
+        engine.dispose()
+
+    return results
+
+
+def _run_in_memory(
+    settings: BenchmarkSettings,
+    name: str,
+    benchmark: Callable,
+    rows: int,
+) -> List[BenchmarkResult]:
+    """
+    Benchmark an in-memory repository filled with `rows` entities.
+    """
+
+    entities = list(getattr(data, f"{name}s")(rows))
+    repository = IN_MEMORY[name](entities)
+    sample = data.every(entities, rows, SAMPLE_SIZE)
+    del entities
+
+    operations = benchmark(repository, lambda: None, sample)
+    results = _measure(settings, operations, name, "in_memory", rows)
+    del repository, operations
+    gc.collect()
+    return results
+
+
+def _run_sqlite(
+    settings: BenchmarkSettings,
+    name: str,
+    benchmark: Callable,
+    rows: int,
+    engine: Engine,
+) -> List[BenchmarkResult]:
+    """
+    Benchmark a SQLModel repository on a SQLite table holding `rows` rows.
+    """
+
+    with Session(engine) as session:
+        repository = SQL_MODEL[name](session)
+        sample = repository.get_many_by_ids(
+            data.every(data.ids(rows, 0, f"{name}s"), rows, SAMPLE_SIZE)
+        )
+        operations = benchmark(repository, session.commit, sample)
+        return _measure(settings, operations, name, "sqlite", rows)
+
+
+def _measure(
+    settings: BenchmarkSettings,
+    operations: Operations,
+    name: str,
+    backend: str,
+    rows: int,
+) -> List[BenchmarkResult]:
+    """
+    Measure each operation of a repository.
+    """
+
+    batch_settings = settings.model_copy(
+        update={"iterations": max(settings.min_iterations, settings.iterations // 10)}
+    )
+    return [
+        summarize(
+            measure(
+                operation,
+                batch_settings if method.endswith("_many") else settings,
+            ),
+            GROUP,
+            f"{name}.{method}",
+            backend,
+            rows,
+        )
+        for method, operation in operations.items()
+    ]
+
+
+def _fresh(factory: Callable[..., Iterator], seed: int = 1) -> Iterator:
+    """
+    Return an endless supply of new entities, distinct from the loaded ones,
+    which all come from seed 0.
+    """
+
+    while True:
+        yield from factory(10_000, seed=seed)
+        seed += 1
+
+
+def _batches(entities: Iterator, size: int = BATCH_SIZE) -> Iterator[List]:
+    """
+    Group entities in lists of `size`.
+    """
+
+    while True:
+        yield list(islice(entities, size))
+
+
+def _cursors(sample: List[Entity]) -> Iterator[Tuple]:
+    """
+    Cycle over keyset cursors pointing into the middle of a listing.
+    """
+
+    return cycle([(entity.created_at, entity.id) for entity in sample])
+
+
+def plan_operations(repository, commit: Callable, sample: List) -> Operations:
+    """
+    Return the benchmarked calls of a plan repository.
+    """
+
+    ids = cycle([plan.id for plan in sample])
+    names = cycle([plan.name for plan in sample])
+    fresh = _fresh(data.plans)
+    batches = _batches(_fresh(data.plans, 1_000_000))
+    updates = _batches(cycle(sample))
+    cursors = _cursors(sample)
+
+    def save():
+        repository.save(next(fresh))
+        commit()
+
+    def save_many():
+        repository.save_many(next(batches))
+        commit()
+
+    def update_many():
+        repository.update_many(next(updates))
+        commit()
+
+    return {
+        "get_by_id": lambda: repository.get_by_id(next(ids)),
+        "get_by_name": lambda: repository.get_by_name(next(names)),
+        "get_many_by_ids": lambda: repository.get_many_by_ids(islice(ids, BATCH_SIZE)),
+        "list_page": lambda: repository.list_page(PAGE_SIZE, next(cursors)),
+        "save": save,
+        "save_many": save_many,
+        "update_many": update_many,
+    }
+
+
+def user_account_operations(repository, commit: Callable, sample: List) -> Operations:
+    """
+    Return the benchmarked calls of a user account repository.
+    """
+
+    ids = cycle([user_account.id for user_account in sample])
+    fresh = _fresh(data.user_accounts)
+    batches = _batches(_fresh(data.user_accounts, 1_000_000))
+    updates = _batches(cycle(sample))
+    cursors = _cursors(sample)
+
+    def save():
+        repository.save(next(fresh))
+        commit()
+
+    def save_many():
+        repository.save_many(next(batches))
+        commit()
+
+    def update_many():
+        repository.update_many(next(updates))
+        commit()
+
+    return {
+        "get_by_id": lambda: repository.get_by_id(next(ids)),
+        "get_many_by_ids": lambda: repository.get_many_by_ids(islice(ids, BATCH_SIZE)),
+        "list_page": lambda: repository.list_page(PAGE_SIZE, next(cursors)),
+        "save": save,
+        "save_many": save_many,
+        "update_many": update_many,
+    }
+
+
+def subscription_operations(repository, commit: Callable, sample: List) -> Operations:
+    """
+    Return the benchmarked calls of a subscription repository.
+    """
+
+    subscriptions = cycle(sample)
+    ids = cycle([subscription.id for subscription in sample])
+    user_ids = cycle([subscription.user_id for subscription in sample])
+    keys = cycle([(s.user_id, s.plan_id) for s in sample])
+    plan_ids = cycle({subscription.plan_id for subscription in sample})
+    fresh = _fresh(data.subscriptions)
+    batches = _batches(_fresh(data.subscriptions, 1_000_000))
+    updates = _batches(subscriptions)
+    cursors = _cursors(sample)
+
+    def save():
+        repository.save(next(fresh))
+        commit()
+
+    def save_many():
+        repository.save_many(next(batches))
+        commit()
+
+    def update():
+        subscription = next(subscriptions)
+        subscription.end_date += timedelta(seconds=1)
+        repository.update(subscription)
+        commit()
+
+    def update_many():
+        batch = next(updates)
+        for subscription in batch:
+            subscription.end_date += timedelta(seconds=1)
+        repository.update_many(batch)
+        commit()
+
+    operations = {
+        "get_by_id": lambda: repository.get_by_id(next(ids)),
+        "get_many_by_ids": lambda: repository.get_many_by_ids(islice(ids, BATCH_SIZE)),
+        "get_by_user_id": lambda: repository.get_by_user_id(next(user_ids)),
+        "get_active_by_user_id": lambda: repository.get_active_by_user_id(
+            next(user_ids)
+        ),
+        "get_by_user_id_and_plan_id": lambda: repository.get_by_user_id_and_plan_id(
+            *next(keys)
+        ),
+        "get_by_plan_id": lambda: repository.get_by_plan_id(next(plan_ids)),
+        "iter_due": lambda: list(
+            repository.iter_due(before=data.NOW, limit=BATCH_SIZE)
+        ),
+        "list_page": lambda: repository.list_page(PAGE_SIZE, next(cursors)),
+        "list_page.by_plan": lambda: repository.list_page(
+            PAGE_SIZE, next(cursors), plan_id=next(plan_ids)
+        ),
+        "save": save,
+        "save_many": save_many,
+        "update": update,
+        "update_many": update_many,
+    }
+    if hasattr(repository, "load_subscribe_context"):
+        operations["load_subscribe_context"] = lambda: (
+            repository.load_subscribe_context(next(keys)[0])
+        )
+
+    return operations
+
+
+IN_MEMORY = {
+    "plan": InMemoryPlanRepository,
+    "user_account": InMemoryUserAccountRepository,
+    "subscription": InMemorySubscriptionRepository,
+}
+
+SQL_MODEL = {
+    "plan": SQLModelPlanRepository,
+    "user_account": SQLModelUserAccountRepository,
+    "subscription": SQLModelSubscriptionRepository,
+}
@@ -0,0 +1,278 @@
+from contextlib import contextmanager
+from decimal import Decimal
+from itertools import count, cycle
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+
+from sqlmodel import Session, SQLModel
+
+from src.application.use_case import (
+    CancelSubscriptionInputDTO,
+    CancelSubscriptionUseCase,
+    CreatePlanInputDTO,
+    CreatePlanUseCase,
+    CreateUserAccountInputDTO,
+    CreateUserAccountUseCase,
+    GetEntitlementInputDTO,
+    GetEntitlementUseCase,
+    ListPlansInputDTO,
+    ListPlansUseCase,
+    ListSubscriptionsInputDTO,
+    ListSubscriptionsUseCase,
+    ListUserAccountsInputDTO,
+    ListUserAccountsUseCase,
+    RenewSubscriptionInputDTO,
+    RenewSubscriptionUseCase,
+    SubscribeToPlanInputDTO,
+    SubscribeToPlanUseCase,
+)
+from src.benchmarks.suite import data
+from src.benchmarks.suite.harness import (
+    BenchmarkResult,
+    BenchmarkSettings,
+    measure,
+    summarize,
+)
+from src.domain._shared import Currency, MonetaryValue
+from src.domain.entity import Address, SubscriptionStatus
+from src.domain.repository import (
+    PlanRepository,
+    SubscriptionRepository,
+    UnitOfWork,
+    UserAccountRepository,
+)
+from src.infra.auth import InMemoryAuthService
+from src.infra.db import DatabaseSettings, build_engine
+from src.infra.db.repository import (
+    SQLModelPlanRepository,
+    SQLModelSubscriptionRepository,
+    SQLModelUnitOfWork,
+    SQLModelUserAccountRepository,
+)
+from src.infra.notification import NotificationService, OutboxNotificationService
+from src.infra.payment import FakePaymentGateway
+from src.infra.repository import (
+    InMemoryPlanRepository,
+    InMemorySubscriptionRepository,
+    InMemoryUnitOfWork,
+    InMemoryUserAccountRepository,
+)
+
+GROUP = "use_cases"
+
+
+class Request(NamedTuple):
+    """
+    What a use case needs from its backend to serve a request.
+    """
+
+    plans: PlanRepository
+    user_accounts: UserAccountRepository
+    subscriptions: SubscriptionRepository
+    unit_of_work: UnitOfWork
+    notifications: NotificationService
+
+
+class DiscardNotificationService(NotificationService):
+    """
+    Drops notifications, so the in-memory backend does not print them.
+    """
+
+    def notify(self, message: str, recipient: Optional[str] = None) -> None:
+        """
+        Do nothing.
+        """
+
+
+def run(
+    settings: BenchmarkSettings,
+    rows: int,
+    directory: Path,
+) -> List[BenchmarkResult]:
+    """
+    Benchmark every use case against the in-memory repositories and against
+    the SQLModel repositories on SQLite, both holding `rows` plans, user
+    accounts and subscriptions.
+
+    The SQLite backend opens a new session per call, as the API does per
+    request, and records notifications in the outbox.
+    """
+
+    pool_size = settings.warmup + settings.iterations
+    if pool_size > rows * 0.4:
+        raise ValueError(
+            f"{rows} rows are too few for {pool_size} calls: every call to "
+            "cancel_subscription needs its own active subscription."
+        )
+
+    spare_users = list(data.user_accounts(pool_size, seed=1))
+
+    plans = InMemoryPlanRepository(list(data.plans(rows)))
+    user_accounts = InMemoryUserAccountRepository(
+        [*data.user_accounts(rows), *spare_users]
+    )
+    subscriptions = InMemorySubscriptionRepository(list(data.subscriptions(rows)))
+    in_memory_request = Request(
+        plans,
+        user_accounts,
+        subscriptions,
+        InMemoryUnitOfWork(),
+        DiscardNotificationService(),
+    )
+
+    @contextmanager
+    def in_memory() -> Iterator[Request]:
+        yield in_memory_request
+
+    engine = build_engine(
+        DatabaseSettings(
+            url=f"sqlite:///{directory / f'use_cases_{rows}.db'}",
+            slow_query_threshold=float("inf"),
+        )
+    )
+    SQLModel.metadata.create_all(engine)
+    data.load(engine, SQLModelPlanRepository, data.plans(rows))
+    data.load(engine, SQLModelUserAccountRepository, data.user_accounts(rows))
+    data.load(engine, SQLModelUserAccountRepository, spare_users)
+    data.load(engine, SQLModelSubscriptionRepository, data.subscriptions(rows))
+
+    @contextmanager
+    def sqlite() -> Iterator[Request]:
+        with Session(engine) as session:
+            yield Request(
+                SQLModelPlanRepository(session),
+                SQLModelUserAccountRepository(session),
+                SQLModelSubscriptionRepository(session),
+                SQLModelUnitOfWork(session),
+                OutboxNotificationService(session),
+            )
+
+    results = []
+    for backend, open_request in (("in_memory", in_memory), ("sqlite", sqlite)):
+        for name, operation in _operations(open_request, rows, spare_users).items():
+            results.append(
+                summarize(measure(operation, settings), GROUP, name, backend, rows)
+            )
+
+    engine.dispose()
+    return results
+
+
+def _operations(
+    open_request: Callable,
+    rows: int,
+    spare_users: List,
+) -> Dict[str, Callable[[], object]]:
+    """
+    Return the benchmarked executions of every use case.
+    """
+
+    subscriptions = list(data.subscriptions(rows))
+    active = [s for s in subscriptions if s.status == SubscriptionStatus.ACTIVE]
+    to_cancel = iter(active[: len(active) // 2])
+    to_renew = cycle([s.id for s in active[len(active) // 2 :]])
+    user_ids = cycle([s.user_id for s in subscriptions])
+    plan_ids = cycle(list(data.ids(data.PLAN_COUNT, 0, "plans")))
+    spare_user_ids = iter([user_account.id for user_account in spare_users])
+    serial = count()
+    auth_service = InMemoryAuthService()
+    payment_gateway = FakePaymentGateway()
+
+    def create_plan():
+        with open_request() as request:
+            CreatePlanUseCase(request.plans, request.unit_of_work).execute(
+                CreatePlanInputDTO(
+                    name=f"Benchmark plan {next(serial)}",
+                    price=MonetaryValue(amount=Decimal("29.90"), currency=Currency.BRL),
+                )
+            )
+
+    def create_user_account():
+        with open_request() as request:
+            CreateUserAccountUseCase(
+                auth_service, request.user_accounts, request.unit_of_work
+            ).execute(
+                CreateUserAccountInputDTO(
+                    name="Benchmark User",
+                    email=f"benchmark{next(serial)}@example.com",
+                    password="secret",  # type: ignore
+                    billing_address=Address(
+                        street="123 Main St",
+                        city="Anytown",
+                        state="CA",
+                        zip_code="12345",
+                        country="USA",
+                    ),
+                )
+            )
+
+    def subscribe_to_plan():
+        with open_request() as request:
+            SubscribeToPlanUseCase(
+                subscription_repository=request.subscriptions,
+                user_repository=request.user_accounts,
+                plan_repository=request.plans,
+                payment_gateway=payment_gateway,
+                notification_service=request.notifications,
+                unit_of_work=request.unit_of_work,
+            ).execute(
+                SubscribeToPlanInputDTO(
+                    user_id=next(spare_user_ids),
+                    plan_id=next(plan_ids),
+                    payment_token="tok_visa",
+                )
+            )
+
+    def cancel_subscription():
+        with open_request() as request:
+            CancelSubscriptionUseCase(
+                request.subscriptions, request.unit_of_work
+            ).execute(CancelSubscriptionInputDTO(id=next(to_cancel).id))
+
+    def renew_subscription():
+        with open_request() as request:
+            RenewSubscriptionUseCase(
+                subscription_repository=request.subscriptions,
+                user_account_repository=request.user_accounts,
+                payment_gateway=payment_gateway,
+                notification_service=request.notifications,
+                unit_of_work=request.unit_of_work,
+            ).execute(
+                RenewSubscriptionInputDTO(
+                    subscription_id=next(to_renew), payment_token="tok_visa"
+                )
+            )
+
+    def get_entitlement():
+        with open_request() as request:
+            GetEntitlementUseCase(request.subscriptions).execute(
+                GetEntitlementInputDTO(user_id=next(user_ids))
+            )
+
+    def list_plans():
+        with open_request() as request:
+            ListPlansUseCase(request.plans).execute(ListPlansInputDTO())
+
+    def list_user_accounts():
+        with open_request() as request:
+            ListUserAccountsUseCase(request.user_accounts).execute(
+                ListUserAccountsInputDTO()
+            )
+
+    def list_subscriptions():
+        with open_request() as request:
+            ListSubscriptionsUseCase(request.subscriptions).execute(
+                ListSubscriptionsInputDTO(plan_id=next(plan_ids))
+            )
+
+    return {
+        "create_plan": create_plan,
+        "create_user_account": create_user_account,
+        "subscribe_to_plan": subscribe_to_plan,
+        "cancel_subscription": cancel_subscription,
+        "renew_subscription": renew_subscription,
+        "get_entitlement": get_entitlement,
+        "list_plans": list_plans,
+        "list_user_accounts": list_user_accounts,
+        "list_subscriptions": list_subscriptions,
+    }
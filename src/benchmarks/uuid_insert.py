@@ -0,0 +1,137 @@
+"""
+Benchmark of bulk subscription inserts into SQLite with random (v4) and
+time-ordered (v7) primary keys.
+
+Each run loads the same number of subscriptions into a fresh database file
+with the executemany INSERT used by save_many, one committed batch at a time,
+and reports insert throughput plus the size of the primary-key index and
+of the whole file. The page cache is kept small, so that the indexes outgrow
+it the way they do on a long-lived production table.
+
+Usage:
+    python -m src.benchmarks.uuid_insert --rows 500000 --cache-size-kib 2048
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+from uuid import UUID, uuid4
+
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel
+
+from src.domain._shared import uuid7
+from src.domain.entity import Subscription, SubscriptionStatus
+from src.infra.db import DatabaseSettings, build_engine
+from src.infra.db.models import SubscriptionModel
+
+
+def make_batch(id_factory: Callable[[], UUID], size: int) -> List[Dict]:
+    """
+    Build a batch of subscription rows with IDs from the given factory.
+    """
+
+    now = datetime.now()
+    subscriptions = (
+        Subscription.hydrate(
+            id=id_factory(),
+            user_id=uuid4(),
+            plan_id=uuid4(),
+            start_date=now,
+            end_date=now + timedelta(days=30),
+            status=SubscriptionStatus.ACTIVE,
+            is_trial=False,
+            created_at=now,
+            updated_at=now,
+            is_active=True,
+        )
+        for _ in range(size)
+    )
+    return [
+        SubscriptionModel.from_entity(subscription).model_dump()
+        for subscription in subscriptions
+    ]
+
+
+def load(
+    path: str,
+    id_factory: Callable[[], UUID],
+    rows: int,
+    batch_size: int,
+    cache_size_kib: int,
+) -> float:
+    """
+    Insert subscriptions in committed batches and return rows per second.
+
+    Only the inserts and commits are timed, not building the rows.
+    """
+
+    engine = build_engine(
+        DatabaseSettings(url=f"sqlite:///{path}", sqlite_cache_size=-cache_size_kib)
+    )
+    SQLModel.metadata.create_all(engine)
+
+    elapsed = 0.0
+    with Session(engine) as session:
+        for start in range(0, rows, batch_size):
+            batch = make_batch(id_factory, min(batch_size, rows - start))
+            started_at = time.perf_counter()
+            session.exec(insert(SubscriptionModel), params=batch)  # type: ignore
+            session.commit()
+            elapsed += time.perf_counter() - started_at
+    engine.dispose()
+
+    return rows / elapsed
+
+
+def sizes(path: str) -> Dict[str, int]:
+    """
+    Return the bytes used by the primary-key index and by the database file.
+    """
+
+    connection = sqlite3.connect(path)
+    try:
+        index_bytes = connection.execute(
+            "SELECT SUM(pgsize) FROM dbstat WHERE name = ?",
+            ("sqlite_autoindex_subscriptions_1",),
+        ).fetchone()[0]
+    except sqlite3.OperationalError:
+        index_bytes = None
+    finally:
+        connection.close()
+
+    return {"index": index_bytes, "file": os.path.getsize(path)}
+
+
+def main(argv=None) -> None:
+    """
+    Run the benchmark and print throughput and sizes for each ID strategy.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    parser.add_argument("--cache-size-kib", type=int, default=2_048)
+    args = parser.parse_args(argv)
+
+    print(f"{'ids':<8}{'rows/s':>12}{'pk index MiB':>15}{'file MiB':>11}")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, id_factory in (("uuid4", uuid4), ("uuid7", uuid7)):
+            path = os.path.join(directory, f"{name}.db")
+            throughput = load(
+                path, id_factory, args.rows, args.batch_size, args.cache_size_kib
+            )
+            size = sizes(path)
+            index = f"{size['index'] / 2**20:.1f}" if size["index"] else "n/a"
+            print(
+                f"{name:<8}{throughput:>12,.0f}{index:>15}"
+                f"{size['file'] / 2**20:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
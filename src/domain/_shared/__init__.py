@@ -1,2 +1,3 @@
 from .entity import Entity
-from .value_objects import Currency, MonetaryValue, ValueObject
\ No newline at end of file
+from .identifiers import uuid7
+from .value_objects import Currency, MonetaryValue, ValueObject
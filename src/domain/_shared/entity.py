@@ -1,7 +1,10 @@
 from datetime import datetime
+from typing import Any, Callable, ClassVar
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from src.domain._shared.hydration import hydrate
 
 
 class Entity(BaseModel):
@@ -9,7 +12,8 @@ class Entity(BaseModel):
     Base entity model with common fields.
 
     Attributes:
-        id (UUID): Unique identifier for the entity.
+        id (UUID): Unique identifier for the entity, generated by `id_factory`
+            when not given.
         created_at (datetime): Timestamp indicating when the entity was created.
         updated_at (datetime): Timestamp indicating when the entity was last updated.
         is_active (bool): Flag indicating whether the entity is active.
@@ -26,13 +30,39 @@ class Entity(BaseModel):
         )
     """
 
-    id: UUID = Field(default_factory=uuid4)
+    id_factory: ClassVar[Callable[[], UUID]] = staticmethod(uuid4)
+
+    id: UUID
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
     is_active: bool = True
 
     model_config = ConfigDict(extra="forbid", validate_assignment=True)
 
+    @model_validator(mode="before")
+    @classmethod
+    def _generate_id(cls, data: Any) -> Any:
+        """
+        Generate the ID with the entity type's `id_factory` when it is missing.
+        """
+
+        if isinstance(data, dict) and "id" not in data:
+            data = {**data, "id": cls.id_factory()}
+
+        return data
+
+    @classmethod
+    def model_construct(cls, _fields_set=None, **values: Any):
+        """
+        Build an entity without validation, generating the ID with the entity
+        type's `id_factory` when it is missing.
+        """
+
+        if "id" not in values:
+            values["id"] = cls.id_factory()
+
+        return super().model_construct(_fields_set, **values)
+
     def __eq__(self, other):
         """
         Test for equality between two entities.
@@ -48,3 +78,15 @@ class Entity(BaseModel):
             return False
 
         return self.id == other.id
+
+    @classmethod
+    def hydrate(cls, **data: Any):
+        """
+        Build an entity from trusted data, skipping validation.
+
+        Only use it for data that was validated before being stored, such as
+        rows read from our own database. User input must go through the
+        regular constructor.
+        """
+
+        return hydrate(cls, data)
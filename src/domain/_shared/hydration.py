@@ -0,0 +1,26 @@
+from typing import Any, Dict, Type, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def hydrate(model_cls: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+    """
+    Build a model instance from trusted data without validating it.
+
+    When exactly the declared fields are given, the instance state is set
+    directly, which is cheaper than both validation and `model_construct`.
+    Otherwise missing fields are filled with their defaults by
+    `model_construct`, which also leaves out unknown keys.
+    """
+
+    if data.keys() != model_cls.__pydantic_fields__.keys():
+        return model_cls.model_construct(**data)
+
+    instance = model_cls.__new__(model_cls)
+    object.__setattr__(instance, "__dict__", data)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(data))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
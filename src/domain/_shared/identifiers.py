@@ -0,0 +1,47 @@
+import os
+import threading
+import time
+from uuid import UUID
+
+_lock = threading.Lock()
+_last_timestamp = 0
+_last_counter = 0
+
+_COUNTER_BITS = 12
+_COUNTER_MAX = (1 << _COUNTER_BITS) - 1
+
+
+def uuid7() -> UUID:
+    """
+    Generate a time-ordered UUID version 7 (RFC 9562).
+
+    The 48 most significant bits hold the Unix timestamp in milliseconds, so
+    IDs generated later sort after earlier ones and land at the right edge of
+    primary-key indexes. The 12 bits that follow are a counter seeded at random
+    every millisecond, which keeps IDs generated by this process strictly
+    increasing even within the same millisecond. The remaining 62 bits are
+    random.
+    """
+
+    global _last_timestamp, _last_counter
+
+    random_bits = int.from_bytes(os.urandom(10), "big")
+    with _lock:
+        timestamp = time.time_ns() // 1_000_000
+        if timestamp > _last_timestamp:
+            counter = random_bits >> 68
+        else:
+            timestamp = _last_timestamp
+            counter = _last_counter + 1
+            if counter > _COUNTER_MAX:
+                timestamp += 1
+                counter = 0
+
+        _last_timestamp, _last_counter = timestamp, counter
+
+    value = (timestamp & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76
+    value |= counter << 64
+    value |= 0b10 << 62
+    value |= random_bits & 0x3FFF_FFFF_FFFF_FFFF
+    return UUID(int=value)
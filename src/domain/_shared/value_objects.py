@@ -1,8 +1,11 @@
 from decimal import Decimal
 from enum import StrEnum
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from src.domain._shared.hydration import hydrate
+
 
 class Currency(StrEnum):
     """
@@ -24,6 +27,14 @@ class ValueObject(BaseModel):
 
     model_config = ConfigDict(frozen=True)
 
+    @classmethod
+    def hydrate(cls, **data: Any):
+        """
+        Build a value object from trusted data, skipping validation.
+        """
+
+        return hydrate(cls, data)
+
 
 class MonetaryValue(ValueObject):
     """
@@ -1,3 +1,3 @@
 from .plan import Plan
 from .subscription import Subscription, SubscriptionStatus
-from .user_account import UserAccount, Address
\ No newline at end of file
+from .user_account import UserAccount, Address
@@ -4,7 +4,7 @@ from uuid import UUID
 
 from dateutil.relativedelta import relativedelta
 
-from src.domain._shared import Entity
+from src.domain._shared import Entity, uuid7
 
 
 class SubscriptionStatus(StrEnum):
@@ -33,6 +33,8 @@ class Subscription(Entity):
         is_trial (bool): Indicates if the subscription is a trial.
     """
 
+    id_factory = staticmethod(uuid7)
+
     user_id: UUID
     plan_id: UUID
     start_date: datetime
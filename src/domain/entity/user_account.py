@@ -1,6 +1,6 @@
 from pydantic import EmailStr
 
-from src.domain._shared import Entity, ValueObject
+from src.domain._shared import Entity, ValueObject, uuid7
 
 
 class Address(ValueObject):
@@ -33,6 +33,8 @@ class UserAccount(Entity):
         billing_address (Address): The user's billing address.
     """
 
+    id_factory = staticmethod(uuid7)
+
     iam_user_id: str
     name: str
     email: EmailStr
@@ -1,3 +1,9 @@
-from .plan import PlanRepository
-from .subscription import SubscriptionRepository
-from .user_account import UserAccountRepository
\ No newline at end of file
+from .plan import AsyncPlanRepository, PlanRepository
+from .subscribe_context import (
+    AsyncSubscribeContextLoader,
+    SubscribeContext,
+    SubscribeContextLoader,
+)
+from .subscription import AsyncSubscriptionRepository, SubscriptionRepository
+from .unit_of_work import AsyncUnitOfWork, UnitOfWork
+from .user_account import AsyncUserAccountRepository, UserAccountRepository
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
 from uuid import UUID
 
 from src.domain.entity import Plan
@@ -33,3 +34,87 @@ class PlanRepository(ABC):
         """
 
         raise NotImplementedError
+
+    @abstractmethod
+    def save_many(self, plans: Iterable[Plan]) -> None:
+        """
+        Save several plans at once
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_many_by_ids(self, plan_ids: Iterable[UUID]) -> List[Plan]:
+        """
+        Get the plans matching the given IDs
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_many(self, plans: Iterable[Plan]) -> None:
+        """
+        Update several plans at once
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Plan]:
+        """
+        List plans ordered by creation date and ID.
+
+        When `after` is given, only plans whose (created_at, ID) key comes after
+        it are returned, which allows keyset pagination.
+        """
+
+        raise NotImplementedError
+
+
+class AsyncPlanRepository(ABC):
+    """
+    Abstract class for an asynchronous Plan Repository.
+    """
+
+    @abstractmethod
+    async def get_by_id(self, plan_id: UUID) -> Optional[Plan]:
+        """
+        Get a plan by ID
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_name(self, plan_name: str) -> Optional[Plan]:
+        """
+        Get a plan by name
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save(self, plan: Plan) -> None:
+        """
+        Save an Plan
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Plan]:
+        """
+        List plans ordered by creation date and ID.
+
+        When `after` is given, only plans whose (created_at, ID) key comes after
+        it are returned, which allows keyset pagination.
+        """
+
+        raise NotImplementedError
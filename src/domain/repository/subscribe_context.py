@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.domain.entity import Plan, Subscription, UserAccount
+
+
+class SubscribeContext(BaseModel):
+    """
+    Everything subscribing a user to a plan has to read first.
+
+    Attributes:
+        user (Optional[UserAccount]): The user account, if it exists.
+        plan (Optional[Plan]): The plan, if it exists.
+        active_subscription (Optional[Subscription]): The active subscription of
+            the user, if any.
+    """
+
+    user: Optional[UserAccount] = None
+    plan: Optional[Plan] = None
+    active_subscription: Optional[Subscription] = None
+
+
+class SubscribeContextLoader(ABC):
+    """
+    Abstract class for repositories that can read the user part of a
+    SubscribeContext in a single round trip. The plan is left to the plan
+    repository, which may answer it from its cache.
+    """
+
+    @abstractmethod
+    def load_subscribe_context(self, user_id: UUID) -> SubscribeContext:
+        """
+        Load the user and the user's active subscription.
+        """
+
+        raise NotImplementedError
+
+
+class AsyncSubscribeContextLoader(ABC):
+    """
+    Abstract class for asynchronous repositories that can read the user part
+    of a SubscribeContext in a single round trip.
+    """
+
+    @abstractmethod
+    async def load_subscribe_context(self, user_id: UUID) -> SubscribeContext:
+        """
+        Load the user and the user's active subscription.
+        """
+
+        raise NotImplementedError
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Tuple
 from uuid import UUID
 
-from src.domain.entity import Subscription
+from src.domain.entity import Subscription, SubscriptionStatus
 
 
 class SubscriptionRepository(ABC):
@@ -26,6 +27,22 @@ class SubscriptionRepository(ABC):
 
         raise NotImplementedError
 
+    @abstractmethod
+    def save_many(self, subscriptions: Iterable[Subscription]) -> None:
+        """
+        Save several subscriptions at once.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_many_by_ids(self, subscription_ids: Iterable[UUID]) -> List[Subscription]:
+        """
+        Get the subscriptions matching the given IDs.
+        """
+
+        raise NotImplementedError
+
     @abstractmethod
     def update(self, subscription: Subscription):
         """
@@ -34,6 +51,14 @@ class SubscriptionRepository(ABC):
 
         raise NotImplementedError
 
+    @abstractmethod
+    def update_many(self, subscriptions: Iterable[Subscription]) -> None:
+        """
+        Update several subscriptions at once.
+        """
+
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_user_id_and_plan_id(
         self,
@@ -54,6 +79,16 @@ class SubscriptionRepository(ABC):
 
         raise NotImplementedError
 
+    @abstractmethod
+    def get_active_by_user_id(self, user_id: UUID) -> Optional[Subscription]:
+        """
+        Get the active subscription of a user, if any.
+
+        A user has at most one active subscription.
+        """
+
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_plan_id(self, plan_id: UUID) -> Optional[Subscription]:
         """
@@ -61,3 +96,126 @@ class SubscriptionRepository(ABC):
         """
 
         raise NotImplementedError
+
+    @abstractmethod
+    def iter_due(
+        self,
+        before: datetime,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> Iterator[Subscription]:
+        """
+        Iterate over active subscriptions ending before the given date,
+        ordered by end date and ID.
+
+        When `after` is given, only subscriptions whose (end date, ID) key comes
+        after it are returned, which allows keyset pagination.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        user_id: Optional[UUID] = None,
+        plan_id: Optional[UUID] = None,
+        status: Optional[SubscriptionStatus] = None,
+    ) -> List[Subscription]:
+        """
+        List subscriptions ordered by creation date and ID, optionally filtered
+        by user, plan and status.
+
+        When `after` is given, only subscriptions whose (created_at, ID) key
+        comes after it are returned, which allows keyset pagination.
+        """
+
+        raise NotImplementedError
+
+
+class AsyncSubscriptionRepository(ABC):
+    """
+    Abstract class for an asynchronous Subscription Repository.
+    """
+
+    @abstractmethod
+    async def get_by_id(self, subscription_id: UUID) -> Optional[Subscription]:
+        """
+        Get a subscription by its ID.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save(self, subscription: Subscription):
+        """
+        Save a subscription.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(self, subscription: Subscription):
+        """
+        Update a subscription.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_user_id_and_plan_id(
+        self,
+        user_id: UUID,
+        plan_id: UUID,
+    ) -> Optional[Subscription]:
+        """
+        Get a subscription by user ID and plan ID.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_user_id(self, user_id: UUID) -> Optional[Subscription]:
+        """
+        Get all subscriptions by user ID.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_active_by_user_id(self, user_id: UUID) -> Optional[Subscription]:
+        """
+        Get the active subscription of a user, if any.
+
+        A user has at most one active subscription.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_plan_id(self, plan_id: UUID) -> Optional[Subscription]:
+        """
+        Get all subscriptions by plan ID.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        user_id: Optional[UUID] = None,
+        plan_id: Optional[UUID] = None,
+        status: Optional[SubscriptionStatus] = None,
+    ) -> List[Subscription]:
+        """
+        List subscriptions ordered by creation date and ID, optionally filtered
+        by user, plan and status.
+
+        When `after` is given, only subscriptions whose (created_at, ID) key
+        comes after it are returned, which allows keyset pagination.
+        """
+
+        raise NotImplementedError
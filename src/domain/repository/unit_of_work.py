@@ -0,0 +1,121 @@
+from abc import ABC, abstractmethod
+from typing import Callable, List
+
+CommitCallback = Callable[[], None]
+
+
+class _CommitCallbacks:
+    """
+    Callbacks registered on a unit of work, run once its changes are committed.
+    """
+
+    def __init__(self) -> None:
+        """
+        Start without callbacks.
+        """
+
+        self._commit_callbacks: List[CommitCallback] = []
+
+    def on_commit(self, callback: CommitCallback) -> None:
+        """
+        Run a callback, such as a cache invalidation, once the staged changes
+        are committed. It is dropped if they are rolled back instead.
+        """
+
+        self._commit_callbacks.append(callback)
+
+    def _committed(self) -> None:
+        """
+        Run the callbacks registered since the last commit or rollback.
+        """
+
+        callbacks, self._commit_callbacks = self._commit_callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def _rolled_back(self) -> None:
+        """
+        Drop the callbacks registered since the last commit or rollback.
+        """
+
+        self._commit_callbacks = []
+
+
+class UnitOfWork(_CommitCallbacks, ABC):
+    """
+    Abstract class for a Unit of Work.
+
+    Repositories only stage their changes; they are persisted together, in a
+    single transaction, when the unit of work is committed. Leaving the context
+    manager because of an exception rolls back the staged changes.
+    Implementations call `_committed` and `_rolled_back` once the transaction
+    ends, so callbacks registered with `on_commit` only run after a commit.
+    """
+
+    def __enter__(self) -> "UnitOfWork":
+        """
+        Open the unit of work.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Close the unit of work, rolling back if an exception was raised.
+        """
+
+        if exc_type is not None:
+            self.rollback()
+
+    @abstractmethod
+    def commit(self) -> None:
+        """
+        Persist every staged change.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """
+        Discard every staged change.
+        """
+
+        raise NotImplementedError
+
+
+class AsyncUnitOfWork(_CommitCallbacks, ABC):
+    """
+    Abstract class for an asynchronous Unit of Work.
+    """
+
+    async def __aenter__(self) -> "AsyncUnitOfWork":
+        """
+        Open the unit of work.
+        """
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Close the unit of work, rolling back if an exception was raised.
+        """
+
+        if exc_type is not None:
+            await self.rollback()
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """
+        Persist every staged change.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """
+        Discard every staged change.
+        """
+
+        raise NotImplementedError
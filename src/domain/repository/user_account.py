@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
 from uuid import UUID
 
 from src.domain.entity import UserAccount
@@ -25,3 +26,79 @@ class UserAccountRepository(ABC):
         """
 
         raise NotImplementedError
+
+    @abstractmethod
+    def get_many_by_ids(self, user_ids: Iterable[UUID]) -> List[UserAccount]:
+        """
+        Get the user accounts matching the given IDs.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_many(self, user_accounts: Iterable[UserAccount]) -> None:
+        """
+        Save several user accounts at once.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_many(self, user_accounts: Iterable[UserAccount]) -> None:
+        """
+        Update several user accounts at once.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[UserAccount]:
+        """
+        List user accounts ordered by creation date and ID.
+
+        When `after` is given, only user accounts whose (created_at, ID) key comes after
+        it are returned, which allows keyset pagination.
+        """
+
+        raise NotImplementedError
+
+
+class AsyncUserAccountRepository(ABC):
+    """
+    Abstract class for an asynchronous User Account Repository.
+    """
+
+    @abstractmethod
+    async def save(self, user_account: UserAccount) -> None:
+        """
+        Save a user account.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_id(self, user_id: UUID) -> Optional[UserAccount]:
+        """
+        Get a user account by its ID.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[UserAccount]:
+        """
+        List user accounts ordered by creation date and ID.
+
+        When `after` is given, only user accounts whose (created_at, ID) key comes after
+        it are returned, which allows keyset pagination.
+        """
+
+        raise NotImplementedError
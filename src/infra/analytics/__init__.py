@@ -0,0 +1,7 @@
+from .subscription_frame import UUID_DTYPE, PlanLifecycleCounts, SubscriptionFrame
+
+__all__ = [
+    "PlanLifecycleCounts",
+    "SubscriptionFrame",
+    "UUID_DTYPE",
+]
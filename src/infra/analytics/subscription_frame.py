@@ -0,0 +1,354 @@
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+from pydantic import BaseModel
+from sqlmodel import Session, select
+
+from src.domain.entity import Subscription, SubscriptionStatus
+from src.infra.db.models import SubscriptionModel
+
+UUID_DTYPE = np.dtype([("hi", ">u8"), ("lo", ">u8")])
+FROM_SESSION_CHUNK_SIZE = 10_000
+STATUS_CODES = {status: code for code, status in enumerate(SubscriptionStatus)}
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+SubscriptionRow = Tuple[UUID, UUID, UUID, datetime, datetime, str, bool]
+
+
+class PlanLifecycleCounts(BaseModel):
+    """
+    Subscription counts of a plan.
+
+    Attributes:
+        total (int): Every subscription of the plan.
+        active (int): Subscriptions neither expired nor cancelled.
+        trial (int): Active subscriptions that are trials.
+        expired (int): Subscriptions past their end date and not cancelled.
+        cancelled (int): Cancelled subscriptions.
+    """
+
+    total: int
+    active: int
+    trial: int
+    expired: int
+    cancelled: int
+
+
+def _uuid_column(values: Sequence[UUID]) -> np.ndarray:
+    """
+    Pack UUIDs into a column of (hi, lo) 64-bit halves.
+    """
+
+    packed = b"".join(value.bytes for value in values)
+    return np.frombuffer(packed, dtype=UUID_DTYPE).copy()
+
+
+def _datetime_column(values: Sequence[datetime]) -> np.ndarray:
+    """
+    Convert naive datetimes into a datetime64[us] column.
+
+    Going through integer microseconds is several times faster than letting
+    NumPy convert datetime objects one by one.
+    """
+
+    microseconds = np.fromiter(
+        ((value - _EPOCH) // _MICROSECOND for value in values),
+        dtype=np.int64,
+        count=len(values),
+    )
+    return microseconds.view("datetime64[us]")
+
+
+def _factorize(column: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return the distinct IDs of a column and the position of each row's ID
+    among them.
+
+    Sorting the two 64-bit halves with lexsort is much faster than np.unique
+    on the structured column.
+    """
+
+    hi, lo = column["hi"], column["lo"]
+    order = np.lexsort((lo, hi))
+    sorted_hi, sorted_lo = hi[order], lo[order]
+    starts = np.empty(len(column), dtype=bool)
+    starts[:1] = True
+    starts[1:] = (sorted_hi[1:] != sorted_hi[:-1]) | (sorted_lo[1:] != sorted_lo[:-1])
+
+    groups = np.empty(len(column), dtype=np.intp)
+    groups[order] = np.cumsum(starts) - 1
+    return column[order[starts]], groups
+
+
+def _to_uuid(value: np.void) -> UUID:
+    """
+    Unpack a (hi, lo) pair into a UUID.
+    """
+
+    return UUID(bytes=value.tobytes())
+
+
+def _day(moment: datetime) -> np.datetime64:
+    """
+    Return the calendar day of a moment.
+    """
+
+    return np.datetime64(moment.date(), "D")
+
+
+class SubscriptionFrame:
+    """
+    Columnar, NumPy-backed view of many subscriptions.
+
+    IDs are stored as 128-bit values split in two big-endian 64-bit halves, so
+    they sort and group like the UUIDs they come from. Lifecycle checks mirror
+    the properties of Subscription, but run over whole columns at once.
+
+    Attributes:
+        ids (np.ndarray): Subscription IDs.
+        user_ids (np.ndarray): User IDs.
+        plan_ids (np.ndarray): Plan IDs.
+        start_dates (np.ndarray): Start dates as datetime64[us].
+        end_dates (np.ndarray): End dates as datetime64[us].
+        statuses (np.ndarray): Status codes, see STATUS_CODES.
+        is_trial (np.ndarray): Trial mask.
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        user_ids: np.ndarray,
+        plan_ids: np.ndarray,
+        start_dates: np.ndarray,
+        end_dates: np.ndarray,
+        statuses: np.ndarray,
+        is_trial: np.ndarray,
+    ) -> None:
+        """
+        Initialize the frame from its columns.
+        """
+
+        self.ids = ids
+        self.user_ids = user_ids
+        self.plan_ids = plan_ids
+        self.start_dates = start_dates
+        self.end_dates = end_dates
+        self.statuses = statuses
+        self.is_trial = is_trial
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[SubscriptionRow]) -> "SubscriptionFrame":
+        """
+        Build a frame from (id, user_id, plan_id, start_date, end_date, status,
+        is_trial) rows.
+        """
+
+        columns = list(zip(*rows)) or [()] * 7
+        ids, user_ids, plan_ids, start_dates, end_dates, statuses, is_trial = columns
+
+        return cls(
+            ids=_uuid_column(ids),
+            user_ids=_uuid_column(user_ids),
+            plan_ids=_uuid_column(plan_ids),
+            start_dates=_datetime_column(start_dates),
+            end_dates=_datetime_column(end_dates),
+            statuses=np.fromiter(
+                map(STATUS_CODES.__getitem__, statuses),
+                dtype=np.int8,
+                count=len(statuses),
+            ),
+            is_trial=np.array(is_trial, dtype=bool),
+        )
+
+    @classmethod
+    def from_subscriptions(
+        cls, subscriptions: Iterable[Subscription]
+    ) -> "SubscriptionFrame":
+        """
+        Build a frame from subscription entities.
+        """
+
+        return cls.from_rows(
+            (
+                subscription.id,
+                subscription.user_id,
+                subscription.plan_id,
+                subscription.start_date,
+                subscription.end_date,
+                subscription.status,
+                subscription.is_trial,
+            )
+            for subscription in subscriptions
+        )
+
+    @classmethod
+    def from_session(
+        cls,
+        session: Session,
+        plan_id: Optional[UUID] = None,
+    ) -> "SubscriptionFrame":
+        """
+        Build a frame straight from the subscriptions table, without creating
+        an entity per row.
+
+        Rows are fetched `FROM_SESSION_CHUNK_SIZE` at a time and packed into
+        columns chunk by chunk, so the table is never held as Python tuples.
+        """
+
+        statement = select(
+            SubscriptionModel.id,
+            SubscriptionModel.user_id,
+            SubscriptionModel.plan_id,
+            SubscriptionModel.start_date,
+            SubscriptionModel.end_date,
+            SubscriptionModel.status,
+            SubscriptionModel.is_trial,
+        )
+        if plan_id is not None:
+            statement = statement.where(SubscriptionModel.plan_id == plan_id)
+
+        result = session.exec(
+            statement.execution_options(yield_per=FROM_SESSION_CHUNK_SIZE)
+        )
+        return cls.concat([cls.from_rows(rows) for rows in result.partitions()])
+
+    @classmethod
+    def concat(cls, frames: Sequence["SubscriptionFrame"]) -> "SubscriptionFrame":
+        """
+        Build a frame holding the subscriptions of several frames, in order.
+
+        The ID columns are concatenated as UUID_DTYPE explicitly, since NumPy
+        would otherwise convert their big-endian halves to the native order.
+        """
+
+        if not frames:
+            return cls.from_rows([])
+
+        return cls(
+            ids=np.concatenate([frame.ids for frame in frames], dtype=UUID_DTYPE),
+            user_ids=np.concatenate(
+                [frame.user_ids for frame in frames], dtype=UUID_DTYPE
+            ),
+            plan_ids=np.concatenate(
+                [frame.plan_ids for frame in frames], dtype=UUID_DTYPE
+            ),
+            start_dates=np.concatenate([frame.start_dates for frame in frames]),
+            end_dates=np.concatenate([frame.end_dates for frame in frames]),
+            statuses=np.concatenate([frame.statuses for frame in frames]),
+            is_trial=np.concatenate([frame.is_trial for frame in frames]),
+        )
+
+    def __len__(self) -> int:
+        """
+        Number of subscriptions in the frame.
+        """
+
+        return len(self.ids)
+
+    def __getitem__(self, selector) -> "SubscriptionFrame":
+        """
+        Select the subscriptions matching a mask, indexes or slice.
+        """
+
+        return SubscriptionFrame(
+            ids=self.ids[selector],
+            user_ids=self.user_ids[selector],
+            plan_ids=self.plan_ids[selector],
+            start_dates=self.start_dates[selector],
+            end_dates=self.end_dates[selector],
+            statuses=self.statuses[selector],
+            is_trial=self.is_trial[selector],
+        )
+
+    def is_expired(self, now: Optional[datetime] = None) -> np.ndarray:
+        """
+        Mask of the subscriptions whose end date is before today.
+        """
+
+        today = _day(now or datetime.now())
+        return self.end_dates.astype("datetime64[D]") < today
+
+    def is_cancelled(self) -> np.ndarray:
+        """
+        Mask of the cancelled subscriptions.
+        """
+
+        return self.statuses == STATUS_CODES[SubscriptionStatus.CANCELLED]
+
+    def is_entitled(self, now: Optional[datetime] = None) -> np.ndarray:
+        """
+        Mask of the subscriptions neither expired nor cancelled.
+        """
+
+        return ~self.is_expired(now) & ~self.is_cancelled()
+
+    def expiring_within(
+        self,
+        days: int,
+        now: Optional[datetime] = None,
+    ) -> "SubscriptionFrame":
+        """
+        Select the entitled subscriptions whose end date falls in the next
+        given number of days, today included.
+        """
+
+        now = now or datetime.now()
+        last_day = _day(now + timedelta(days=days))
+        mask = self.is_entitled(now) & (
+            self.end_dates.astype("datetime64[D]") <= last_day
+        )
+        return self[mask]
+
+    def count_by_plan(
+        self, now: Optional[datetime] = None
+    ) -> Dict[UUID, PlanLifecycleCounts]:
+        """
+        Count the subscriptions of every plan by lifecycle state.
+        """
+
+        if not len(self):
+            return {}
+
+        plan_ids, groups = _factorize(self.plan_ids)
+        cancelled = self.is_cancelled()
+        expired = self.is_expired(now) & ~cancelled
+        active = ~expired & ~cancelled
+
+        def count(mask: np.ndarray) -> np.ndarray:
+            return np.bincount(groups, weights=mask, minlength=len(plan_ids))
+
+        totals = np.bincount(groups, minlength=len(plan_ids))
+        columns = zip(
+            totals,
+            count(active),
+            count(active & self.is_trial),
+            count(expired),
+            count(cancelled),
+        )
+        return {
+            _to_uuid(plan_id): PlanLifecycleCounts(
+                total=int(total),
+                active=int(active_count),
+                trial=int(trial_count),
+                expired=int(expired_count),
+                cancelled=int(cancelled_count),
+            )
+            for plan_id, (
+                total,
+                active_count,
+                trial_count,
+                expired_count,
+                cancelled_count,
+            ) in zip(plan_ids, columns)
+        }
+
+    def subscription_ids(self) -> List[UUID]:
+        """
+        Return the IDs of the subscriptions in the frame.
+        """
+
+        return [_to_uuid(value) for value in self.ids]
@@ -1,19 +1,40 @@
-from .app import app
+from .app import app, create_app
 from .dependencies import (
+    AsyncCreatePlanUseCaseDep,
+    AsyncCreateUserAccountUseCaseDep,
+    AsyncGetEntitlementUseCaseDep,
+    AsyncListPlansUseCaseDep,
+    AsyncListSubscriptionsUseCaseDep,
+    AsyncListUserAccountsUseCaseDep,
+    AsyncSubscribeToPlanUseCaseDep,
     CreatePlanUseCaseDep,
     CreateUserAccountUseCaseDep,
     SubscribeToPlanUseCaseDep,
+    get_admin_token,
     get_auth_service,
+    get_entitlement_cache,
     get_notification_service,
     get_payment_gateway,
+    get_plan_catalog_cache,
 )
 
 __all__ = [
     "app",
+    "AsyncCreatePlanUseCaseDep",
+    "AsyncCreateUserAccountUseCaseDep",
+    "AsyncGetEntitlementUseCaseDep",
+    "AsyncListPlansUseCaseDep",
+    "AsyncListSubscriptionsUseCaseDep",
+    "AsyncListUserAccountsUseCaseDep",
+    "AsyncSubscribeToPlanUseCaseDep",
+    "create_app",
     "CreatePlanUseCaseDep",
     "CreateUserAccountUseCaseDep",
+    "get_admin_token",
     "get_auth_service",
+    "get_entitlement_cache",
     "get_notification_service",
     "get_payment_gateway",
+    "get_plan_catalog_cache",
     "SubscribeToPlanUseCaseDep",
 ]
@@ -1,25 +1,68 @@
+from typing import Callable, Optional
+
 from fastapi import FastAPI
 from fastapi.concurrency import asynccontextmanager
+from sqlmodel import Session
 
-from src.infra.api.routes import PlansRouter, SubscriptionRouter, UserAccountRouter
-from src.infra.db import create_db_and_tables
+from src.infra.api.container import Container
+from src.infra.api.middleware import (
+    MetricsMiddleware,
+    QueryStatsMiddleware,
+    TracingMiddleware,
+)
+from src.infra.api.routes import (
+    AdminRouter,
+    MetricsRouter,
+    PlansRouter,
+    SubscriptionRouter,
+    UserAccountRouter,
+)
+from src.infra.db import create_db_and_tables, get_session_factory
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
+def create_app(
+    session_factory: Optional[Callable[[], Session]] = None,
+) -> FastAPI:
     """
-    Startup event.
+    Build the API application.
+
+    The container and its outbox dispatcher use the given session factory.
+    Without one, the tables are created on the configured database and its
+    sessions are used.
     """
 
-    create_db_and_tables()
-    yield
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        """
+        Startup and shutdown events.
+        """
+
+        factory = session_factory
+        if factory is None:
+            create_db_and_tables()
+            factory = get_session_factory()
+
+        container = Container.from_env(factory)
+        app.state.container = container
+        container.start()
+        yield
+        await container.aclose()
+
+    app = FastAPI(title="Subscription Service API", lifespan=lifespan)
+    app.add_middleware(MetricsMiddleware)
+    app.add_middleware(QueryStatsMiddleware)
+    app.add_middleware(TracingMiddleware)
+
+    app.include_router(PlansRouter)
+    app.include_router(UserAccountRouter)
+    app.include_router(SubscriptionRouter)
+    app.include_router(MetricsRouter)
+    app.include_router(AdminRouter)
 
+    return app
 
-app = FastAPI(title="Subscription Service API", lifespan=lifespan)
 
-app.include_router(PlansRouter)
-app.include_router(UserAccountRouter)
-app.include_router(SubscriptionRouter)
+app = create_app()
 
 if __name__ == "__main__":
     import uvicorn
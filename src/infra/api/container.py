@@ -0,0 +1,100 @@
+import os
+from typing import Callable, Mapping, Optional
+
+from sqlmodel import Session
+
+from src.infra.auth import AuthService, InMemoryAuthService
+from src.infra.cache import EntitlementCache, PlanCatalogCache
+from src.infra.notification import (
+    ConsoleNotificationService,
+    NotificationService,
+    OutboxDispatcher,
+)
+from src.infra.payment import (
+    FakePaymentGateway,
+    HttpPaymentGateway,
+    PaymentGateway,
+    PaymentGatewaySettings,
+)
+
+
+class Container:
+    """
+    Holds the long-lived objects of the application: external service clients,
+    caches and background workers.
+
+    It is built once in the lifespan of the API and shared by every request.
+    Use cases are not held here: they get their repositories, unit of work and
+    outbox notification service at construction, and all of those are bound
+    to the request's session. Building them per request only allocates a few
+    small objects around the shared services.
+    """
+
+    def __init__(
+        self,
+        auth_service: AuthService,
+        payment_gateway: PaymentGateway,
+        notification_service: NotificationService,
+        session_factory: Callable[[], Session],
+        async_payment_gateway: Optional[HttpPaymentGateway] = None,
+        plan_catalog_cache: Optional[PlanCatalogCache] = None,
+        entitlement_cache: Optional[EntitlementCache] = None,
+        admin_token: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the container.
+        """
+
+        self.auth_service = auth_service
+        self.payment_gateway = payment_gateway
+        self.async_payment_gateway = async_payment_gateway
+        self.notification_service = notification_service
+        self.plan_catalog_cache = plan_catalog_cache or PlanCatalogCache()
+        self.entitlement_cache = entitlement_cache or EntitlementCache()
+        self.admin_token = admin_token
+        self.outbox_dispatcher = OutboxDispatcher(session_factory, notification_service)
+
+    @classmethod
+    def from_env(
+        cls,
+        session_factory: Callable[[], Session],
+        environ: Mapping[str, str] = os.environ,
+    ) -> "Container":
+        """
+        Build the container configured from environment variables. The admin
+        routes are only served when ADMIN_TOKEN is set.
+        """
+
+        payment_gateway_settings = PaymentGatewaySettings.from_env(environ)
+
+        return cls(
+            # TODO: Replace with actual implementation (Keycloak)
+            auth_service=InMemoryAuthService(),
+            # TODO: Replace with actual implementation (Stripe)
+            payment_gateway=FakePaymentGateway(),
+            # TODO: Replace with actual implementation (Email)
+            notification_service=ConsoleNotificationService(),
+            session_factory=session_factory,
+            admin_token=environ.get("ADMIN_TOKEN") or None,
+            async_payment_gateway=(
+                HttpPaymentGateway(payment_gateway_settings)
+                if payment_gateway_settings.url
+                else None
+            ),
+        )
+
+    def start(self) -> None:
+        """
+        Start the background workers.
+        """
+
+        self.outbox_dispatcher.start()
+
+    async def aclose(self) -> None:
+        """
+        Stop the background workers and close the service clients.
+        """
+
+        self.outbox_dispatcher.stop()
+        if self.async_payment_gateway:
+            await self.async_payment_gateway.aclose()
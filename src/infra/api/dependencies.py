@@ -1,36 +1,167 @@
-from typing import Annotated
+import secrets
+from typing import Annotated, Callable, Optional, Union
 
-from fastapi import Depends
+from fastapi import Depends, Header, HTTPException, Request
 from sqlmodel import Session
-
-from src.application.use_case import CreatePlanUseCase, CreateUserAccountUseCase
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.application.use_case import (
+    AsyncCreatePlanUseCase,
+    AsyncCreateUserAccountUseCase,
+    AsyncGetEntitlementUseCase,
+    AsyncListPlansUseCase,
+    AsyncListSubscriptionsUseCase,
+    AsyncListUserAccountsUseCase,
+    AsyncSubscribeToPlanUseCase,
+    CreatePlanUseCase,
+    CreateUserAccountUseCase,
+)
 from src.application.use_case.subscribe_to_plan import SubscribeToPlanUseCase
 from src.domain.repository import (
+    AsyncPlanRepository,
+    AsyncSubscriptionRepository,
+    AsyncUnitOfWork,
+    AsyncUserAccountRepository,
     PlanRepository,
     SubscriptionRepository,
+    UnitOfWork,
     UserAccountRepository,
 )
-from src.infra.auth import AuthService, InMemoryAuthService
-from src.infra.db import get_session
+from src.infra.api.container import Container
+from src.infra.auth import AuthService
+from src.infra.cache import (
+    AsyncCachedPlanRepository,
+    CachedPlanRepository,
+    EntitlementCache,
+    PlanCatalogCache,
+)
+from src.infra.db import get_async_session, get_session, get_session_factory
 from src.infra.db.repository import (
+    AsyncSQLModelPlanRepository,
+    AsyncSQLModelSubscriptionRepository,
+    AsyncSQLModelUnitOfWork,
+    AsyncSQLModelUserAccountRepository,
     SQLModelPlanRepository,
     SQLModelSubscriptionRepository,
+    SQLModelUnitOfWork,
     SQLModelUserAccountRepository,
 )
-from src.infra.notification import ConsoleNotificationService, NotificationService
-from src.infra.payment import FakePaymentGateway, PaymentGateway
+from src.infra.notification import NotificationService, OutboxNotificationService
+from src.infra.payment import AsyncPaymentGateway, PaymentGateway
 
 SessionDep = Annotated[Session, Depends(get_session)]
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_session)]
+SessionFactoryDep = Annotated[Callable[[], Session], Depends(get_session_factory)]
+
+
+def get_container(request: Request) -> Container:
+    """
+    Application container dependency, built by the lifespan of the API.
+    """
+
+    return request.app.state.container
+
+
+ContainerDep = Annotated[Container, Depends(get_container)]
+
+### ADMIN ###
+
+
+def get_admin_token(container: ContainerDep) -> Optional[str]:
+    """
+    Token of the admin routes, None when they are disabled.
+    """
+
+    return container.admin_token
+
+
+def require_admin(
+    admin_token: Annotated[Optional[str], Depends(get_admin_token)],
+    x_admin_token: Annotated[Optional[str], Header()] = None,
+) -> None:
+    """
+    Admin route dependency. The routes do not exist unless an admin token is
+    configured, and then require it in the X-Admin-Token header.
+    """
+
+    if admin_token is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    if x_admin_token is None or not secrets.compare_digest(
+        x_admin_token.encode(), admin_token.encode()
+    ):
+        raise HTTPException(status_code=401, detail="Invalid admin token.")
+
+
+### CACHES ###
+
+
+def get_plan_catalog_cache(container: ContainerDep) -> PlanCatalogCache:
+    """
+    Plan catalog cache dependency, shared by every request of the process.
+    """
+
+    return container.plan_catalog_cache
+
+
+def get_entitlement_cache(container: ContainerDep) -> EntitlementCache:
+    """
+    Entitlement cache dependency, shared by every request of the process.
+    """
+
+    return container.entitlement_cache
+
+
+PlanCatalogCacheDep = Annotated[
+    PlanCatalogCache,
+    Depends(get_plan_catalog_cache),
+]
+EntitlementCacheDep = Annotated[
+    EntitlementCache,
+    Depends(get_entitlement_cache),
+]
+
+### UNITS OF WORK ###
+
+
+def get_unit_of_work(session: SessionDep) -> UnitOfWork:
+    """
+    Unit of work dependency.
+    """
+
+    return SQLModelUnitOfWork(session)
+
+
+def get_async_unit_of_work(session: AsyncSessionDep) -> AsyncUnitOfWork:
+    """
+    Async unit of work dependency.
+    """
+
+    return AsyncSQLModelUnitOfWork(session)
+
+
+UnitOfWorkDep = Annotated[
+    UnitOfWork,
+    Depends(get_unit_of_work),
+]
+AsyncUnitOfWorkDep = Annotated[
+    AsyncUnitOfWork,
+    Depends(get_async_unit_of_work),
+]
 
 ### REPOSITORIES ###
 
 
-def get_plan_repository(session: SessionDep) -> PlanRepository:
+def get_plan_repository(
+    session: SessionDep,
+    cache: PlanCatalogCacheDep,
+    unit_of_work: UnitOfWorkDep,
+) -> PlanRepository:
     """
     Plan repository dependency.
     """
 
-    return SQLModelPlanRepository(session)
+    return CachedPlanRepository(SQLModelPlanRepository(session), cache, unit_of_work)
 
 
 def get_user_account_repository(session: SessionDep) -> UserAccountRepository:
@@ -62,34 +193,88 @@ SubscriptionRepositoryDep = Annotated[
     Depends(get_subscription_repository),
 ]
 
+
+def get_async_plan_repository(
+    session: AsyncSessionDep,
+    cache: PlanCatalogCacheDep,
+    unit_of_work: AsyncUnitOfWorkDep,
+) -> AsyncPlanRepository:
+    """
+    Async plan repository dependency.
+    """
+
+    return AsyncCachedPlanRepository(
+        AsyncSQLModelPlanRepository(session), cache, unit_of_work
+    )
+
+
+def get_async_user_account_repository(
+    session: AsyncSessionDep,
+) -> AsyncUserAccountRepository:
+    """
+    Async user account repository dependency.
+    """
+
+    return AsyncSQLModelUserAccountRepository(session)
+
+
+def get_async_subscription_repository(
+    session: AsyncSessionDep,
+) -> AsyncSubscriptionRepository:
+    """
+    Async subscription repository dependency.
+    """
+
+    return AsyncSQLModelSubscriptionRepository(session)
+
+
+AsyncPlanRepositoryDep = Annotated[
+    AsyncPlanRepository,
+    Depends(get_async_plan_repository),
+]
+AsyncUserAccountRepositoryDep = Annotated[
+    AsyncUserAccountRepository,
+    Depends(get_async_user_account_repository),
+]
+AsyncSubscriptionRepositoryDep = Annotated[
+    AsyncSubscriptionRepository,
+    Depends(get_async_subscription_repository),
+]
+
 ### EXTERNAL SERVICES ###
 
 
-def get_auth_service() -> AuthService:
+def get_auth_service(container: ContainerDep) -> AuthService:
     """
     Auth service dependency.
     """
 
-    # TODO: Replace with actual implementation (Keycloak)
-    return InMemoryAuthService()
+    return container.auth_service
 
 
-def get_payment_gateway() -> PaymentGateway:
+def get_payment_gateway(container: ContainerDep) -> PaymentGateway:
     """
     Payment gateway dependency.
     """
 
-    # TODO: Replace with actual implementation (Stripe)
-    return FakePaymentGateway()
+    return container.payment_gateway
+
+
+def get_notification_service(session: SessionDep) -> NotificationService:
+    """
+    Notification service dependency. Notifications are written to the outbox
+    by the request's commit and delivered by the outbox dispatcher.
+    """
+
+    return OutboxNotificationService(session)
 
 
-def get_notification_service() -> NotificationService:
+def get_async_notification_service(session: AsyncSessionDep) -> NotificationService:
     """
-    Notification service dependency.
+    Async notification service dependency.
     """
 
-    # TODO: Replace with actual implementation (Email)
-    return ConsoleNotificationService()
+    return OutboxNotificationService(session)
 
 
 AuthServiceDep = Annotated[
@@ -100,31 +285,57 @@ PaymentGatewayDep = Annotated[
     PaymentGateway,
     Depends(get_payment_gateway),
 ]
+
+
+def get_async_payment_gateway(
+    container: ContainerDep,
+    payment_gateway: PaymentGatewayDep,
+) -> Union[PaymentGateway, AsyncPaymentGateway]:
+    """
+    Async payment gateway dependency. The HTTP gateway when PAYMENT_GATEWAY_URL
+    is set.
+    """
+
+    return container.async_payment_gateway or payment_gateway
+
+
+AsyncPaymentGatewayDep = Annotated[
+    Union[PaymentGateway, AsyncPaymentGateway],
+    Depends(get_async_payment_gateway),
+]
 NotificationServiceDep = Annotated[
     NotificationService,
     Depends(get_notification_service),
 ]
+AsyncNotificationServiceDep = Annotated[
+    NotificationService,
+    Depends(get_async_notification_service),
+]
 
 ### USE CASES ###
 
 
-def get_create_plan_use_case(repository: PlanRepositoryDep) -> CreatePlanUseCase:
+def get_create_plan_use_case(
+    repository: PlanRepositoryDep,
+    unit_of_work: UnitOfWorkDep,
+) -> CreatePlanUseCase:
     """
     Create plan use case dependency.
     """
 
-    return CreatePlanUseCase(repository)
+    return CreatePlanUseCase(repository, unit_of_work)
 
 
 def get_create_user_account_use_case(
     auth_service: AuthServiceDep,
     repository: UserAccountRepositoryDep,
+    unit_of_work: UnitOfWorkDep,
 ) -> CreateUserAccountUseCase:
     """
     Create userAccount use case dependency.
     """
 
-    return CreateUserAccountUseCase(auth_service, repository)
+    return CreateUserAccountUseCase(auth_service, repository, unit_of_work)
 
 
 def get_subscribe_to_plan_use_case(
@@ -133,6 +344,8 @@ def get_subscribe_to_plan_use_case(
     plan_repository: PlanRepositoryDep,
     payment_gateway: PaymentGatewayDep,
     notification_service: NotificationServiceDep,
+    unit_of_work: UnitOfWorkDep,
+    entitlement_cache: EntitlementCacheDep,
 ) -> SubscribeToPlanUseCase:
     """
     Subscribe to plan use case dependency.
@@ -144,6 +357,8 @@ def get_subscribe_to_plan_use_case(
         plan_repository=plan_repository,
         payment_gateway=payment_gateway,
         notification_service=notification_service,
+        unit_of_work=unit_of_work,
+        entitlement_cache=entitlement_cache,
     )
 
 
@@ -158,3 +373,121 @@ SubscribeToPlanUseCaseDep = Annotated[
     SubscribeToPlanUseCase,
     Depends(get_subscribe_to_plan_use_case),
 ]
+
+
+def get_async_create_plan_use_case(
+    repository: AsyncPlanRepositoryDep,
+    unit_of_work: AsyncUnitOfWorkDep,
+) -> AsyncCreatePlanUseCase:
+    """
+    Async create plan use case dependency.
+    """
+
+    return AsyncCreatePlanUseCase(repository, unit_of_work)
+
+
+def get_async_create_user_account_use_case(
+    auth_service: AuthServiceDep,
+    repository: AsyncUserAccountRepositoryDep,
+    unit_of_work: AsyncUnitOfWorkDep,
+) -> AsyncCreateUserAccountUseCase:
+    """
+    Async create userAccount use case dependency.
+    """
+
+    return AsyncCreateUserAccountUseCase(auth_service, repository, unit_of_work)
+
+
+def get_async_subscribe_to_plan_use_case(
+    subscription_repository: AsyncSubscriptionRepositoryDep,
+    user_repository: AsyncUserAccountRepositoryDep,
+    plan_repository: AsyncPlanRepositoryDep,
+    payment_gateway: AsyncPaymentGatewayDep,
+    notification_service: AsyncNotificationServiceDep,
+    unit_of_work: AsyncUnitOfWorkDep,
+    entitlement_cache: EntitlementCacheDep,
+) -> AsyncSubscribeToPlanUseCase:
+    """
+    Async subscribe to plan use case dependency.
+    """
+
+    return AsyncSubscribeToPlanUseCase(
+        subscription_repository=subscription_repository,
+        user_repository=user_repository,
+        plan_repository=plan_repository,
+        payment_gateway=payment_gateway,
+        notification_service=notification_service,
+        unit_of_work=unit_of_work,
+        entitlement_cache=entitlement_cache,
+    )
+
+
+def get_async_get_entitlement_use_case(
+    repository: AsyncSubscriptionRepositoryDep,
+    cache: EntitlementCacheDep,
+) -> AsyncGetEntitlementUseCase:
+    """
+    Async get entitlement use case dependency.
+    """
+
+    return AsyncGetEntitlementUseCase(repository, cache)
+
+
+def get_async_list_plans_use_case(
+    repository: AsyncPlanRepositoryDep,
+) -> AsyncListPlansUseCase:
+    """
+    Async list plans use case dependency.
+    """
+
+    return AsyncListPlansUseCase(repository)
+
+
+def get_async_list_user_accounts_use_case(
+    repository: AsyncUserAccountRepositoryDep,
+) -> AsyncListUserAccountsUseCase:
+    """
+    Async list userAccounts use case dependency.
+    """
+
+    return AsyncListUserAccountsUseCase(repository)
+
+
+def get_async_list_subscriptions_use_case(
+    repository: AsyncSubscriptionRepositoryDep,
+) -> AsyncListSubscriptionsUseCase:
+    """
+    Async list subscriptions use case dependency.
+    """
+
+    return AsyncListSubscriptionsUseCase(repository)
+
+
+AsyncCreatePlanUseCaseDep = Annotated[
+    AsyncCreatePlanUseCase,
+    Depends(get_async_create_plan_use_case),
+]
+AsyncCreateUserAccountUseCaseDep = Annotated[
+    AsyncCreateUserAccountUseCase,
+    Depends(get_async_create_user_account_use_case),
+]
+AsyncSubscribeToPlanUseCaseDep = Annotated[
+    AsyncSubscribeToPlanUseCase,
+    Depends(get_async_subscribe_to_plan_use_case),
+]
+AsyncGetEntitlementUseCaseDep = Annotated[
+    AsyncGetEntitlementUseCase,
+    Depends(get_async_get_entitlement_use_case),
+]
+AsyncListPlansUseCaseDep = Annotated[
+    AsyncListPlansUseCase,
+    Depends(get_async_list_plans_use_case),
+]
+AsyncListUserAccountsUseCaseDep = Annotated[
+    AsyncListUserAccountsUseCase,
+    Depends(get_async_list_user_accounts_use_case),
+]
+AsyncListSubscriptionsUseCaseDep = Annotated[
+    AsyncListSubscriptionsUseCase,
+    Depends(get_async_list_subscriptions_use_case),
+]
@@ -0,0 +1,167 @@
+from time import perf_counter
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infra.metrics import (
+    HTTP_REQUEST_DB_SECONDS,
+    HTTP_REQUEST_QUERIES,
+    HTTP_REQUEST_SECONDS,
+    QUERY_COUNT_BUCKETS,
+    metrics,
+    track_queries,
+)
+from src.infra.metrics.instrument import HELP
+from src.infra.tracing import tracer
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording the latency of every HTTP request, labelled with
+    its method, route template and status code.
+
+    Requests that match no route are recorded as "unmatched", so arbitrary
+    URLs cannot create new series.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Wrap the ASGI app.
+        """
+
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle a request, timing it when it is an HTTP one.
+        """
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started_at = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            metrics.histogram(
+                HTTP_REQUEST_SECONDS,
+                HELP[HTTP_REQUEST_SECONDS],
+                method=scope["method"],
+                route=getattr(route, "path", "unmatched"),
+                status=str(status_code),
+            ).observe(perf_counter() - started_at)
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware opening the root span of the trace of every sampled HTTP
+    request, so the use case, repository, query and external call spans made
+    while handling it are recorded under it.
+
+    The trace ID is returned in the X-Trace-Id response header.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Wrap the ASGI app.
+        """
+
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle a request, tracing it when it is a sampled HTTP one.
+        """
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        span = tracer.start_trace("HTTP", method=scope["method"], path=scope["path"])
+        if span is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                span.set("status", message["status"])
+                MutableHeaders(scope=message).append("X-Trace-Id", span.trace_id)
+            await send(message)
+
+        error = None
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+            span.name = f"{scope['method']} {route}"
+            tracer.end_span(span, error)
+
+
+class QueryStatsMiddleware:
+    """
+    ASGI middleware counting and timing the statements executed by every HTTP
+    request, recorded per method and route template.
+
+    The figures are also returned in a Server-Timing response header, so they
+    show up in the browser developer tools. The header is sent with the
+    response start, so statements run while streaming a body are only counted
+    in the metrics.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Wrap the ASGI app.
+        """
+
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle a request, counting its statements when it is an HTTP one.
+        """
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append(
+                        "Server-Timing",
+                        f'db;dur={stats.seconds * 1000:.3f};desc="queries={stats.count}"',
+                    )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                labels = {
+                    "method": scope["method"],
+                    "route": getattr(scope.get("route"), "path", "unmatched"),
+                }
+                metrics.histogram(
+                    HTTP_REQUEST_QUERIES,
+                    HELP[HTTP_REQUEST_QUERIES],
+                    buckets=QUERY_COUNT_BUCKETS,
+                    **labels,
+                ).observe(stats.count)
+                metrics.histogram(
+                    HTTP_REQUEST_DB_SECONDS,
+                    HELP[HTTP_REQUEST_DB_SECONDS],
+                    **labels,
+                ).observe(stats.seconds)
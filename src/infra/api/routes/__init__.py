@@ -1,8 +1,12 @@
+from .admin import router as AdminRouter
+from .metrics import router as MetricsRouter
 from .plans import router as PlansRouter
 from .subscription import router as SubscriptionRouter
 from .user_account import router as UserAccountRouter
 
 __all__ = [
+    "AdminRouter",
+    "MetricsRouter",
     "PlansRouter",
     "UserAccountRouter",
     "SubscriptionRouter",
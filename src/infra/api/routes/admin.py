@@ -0,0 +1,45 @@
+from typing import Any, Dict, List
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from src.infra.api.dependencies import require_admin
+from src.infra.tracing import tracer
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["observability"],
+    dependencies=[Depends(require_admin)],
+)
+
+
+@router.get("/traces")
+def list_traces(
+    limit: int = Query(default=20, gt=0, le=1000),
+) -> List[Dict[str, Any]]:
+    """
+    Route to dump the most recent traces held in memory, newest first.
+    """
+
+    traces: Dict[str, List[Dict[str, Any]]] = {}
+    for span in reversed(tracer.buffer.spans()):
+        if span.trace_id not in traces and len(traces) == limit:
+            continue
+        traces.setdefault(span.trace_id, []).append(span.to_dict())
+
+    return [
+        {"trace_id": trace_id, "spans": spans[::-1]}
+        for trace_id, spans in traces.items()
+    ]
+
+
+@router.get("/traces/{trace_id}")
+def get_trace(trace_id: str) -> Dict[str, Any]:
+    """
+    Route to dump the spans of a trace, in the order they ended.
+    """
+
+    spans = tracer.buffer.spans(trace_id)
+    if not spans:
+        raise HTTPException(status_code=404, detail=f"Trace '{trace_id}' not found.")
+
+    return {"trace_id": trace_id, "spans": [span.to_dict() for span in spans]}
@@ -1,15 +1,25 @@
-from fastapi import APIRouter, HTTPException
+from typing import Annotated
 
-from src.application.exceptions import DuplicatePlanError
-from src.application.use_case import CreatePlanInputDTO, CreatePlanOutputDTO
-from src.infra.api.dependencies import CreatePlanUseCaseDep
+from fastapi import APIRouter, HTTPException, Query
+
+from src.application.exceptions import DuplicatePlanError, InvalidCursorError
+from src.application.use_case import (
+    CreatePlanInputDTO,
+    CreatePlanOutputDTO,
+    ListPlansInputDTO,
+    ListPlansOutputDTO,
+)
+from src.infra.api.dependencies import (
+    AsyncCreatePlanUseCaseDep,
+    AsyncListPlansUseCaseDep,
+)
 
 router = APIRouter(prefix="/plans", tags=["plans"])
 
 
 @router.post("", response_model=CreatePlanOutputDTO, status_code=201)
-def create_plan(
-    use_case: CreatePlanUseCaseDep,
+async def create_plan(
+    use_case: AsyncCreatePlanUseCaseDep,
     payload: CreatePlanInputDTO,
 ) -> CreatePlanOutputDTO:
     """
@@ -17,8 +27,25 @@ def create_plan(
     """
 
     try:
-        return use_case.execute(payload)
+        return await use_case.execute(payload)
     except DuplicatePlanError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.get("", response_model=ListPlansOutputDTO)
+async def list_plans(
+    use_case: AsyncListPlansUseCaseDep,
+    query: Annotated[ListPlansInputDTO, Query()],
+) -> ListPlansOutputDTO:
+    """
+    Route to list plans, a page at a time.
+    """
+
+    try:
+        return await use_case.execute(query)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
@@ -1,19 +1,34 @@
-from fastapi import APIRouter, HTTPException
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 from src.application.exceptions import (
+    InvalidCursorError,
     PlanNotFoundError,
     SubscriptionConflictError,
     UserNotFoundError,
 )
-from src.application.use_case import SubscribeToPlanInputDTO, SubscribeToPlanOutputDTO
-from src.infra.api.dependencies import SubscribeToPlanUseCaseDep
+from src.application.use_case import (
+    ListSubscriptionsInputDTO,
+    ListSubscriptionsOutputDTO,
+    SubscribeToPlanInputDTO,
+    SubscribeToPlanOutputDTO,
+)
+from src.infra.api.dependencies import (
+    AsyncListSubscriptionsUseCaseDep,
+    AsyncSubscribeToPlanUseCaseDep,
+    SessionFactoryDep,
+)
+from src.infra.export import ExportFormat, stream_export
+from src.infra.payment import PaymentGatewayError
 
 router = APIRouter(prefix="/subscriptions", tags=["subscriptions"])
 
 
 @router.post("", response_model=SubscribeToPlanOutputDTO, status_code=201)
-def create_subscription(
-    use_case: SubscribeToPlanUseCaseDep,
+async def create_subscription(
+    use_case: AsyncSubscribeToPlanUseCaseDep,
     payload: SubscribeToPlanInputDTO,
 ) -> SubscribeToPlanOutputDTO:
     """
@@ -21,8 +36,46 @@ def create_subscription(
     """
 
     try:
-        return use_case.execute(payload)
+        return await use_case.execute(payload)
     except (UserNotFoundError, PlanNotFoundError, SubscriptionConflictError) as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
+    except PaymentGatewayError as e:
+        raise HTTPException(status_code=502, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.get("", response_model=ListSubscriptionsOutputDTO)
+async def list_subscriptions(
+    use_case: AsyncListSubscriptionsUseCaseDep,
+    query: Annotated[ListSubscriptionsInputDTO, Query()],
+) -> ListSubscriptionsOutputDTO:
+    """
+    Route to list subscriptions, a page at a time.
+    """
+
+    try:
+        return await use_case.execute(query)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_subscriptions(
+    session_factory: SessionFactoryDep,
+    format: ExportFormat = ExportFormat.NDJSON,
+    batch_size: Annotated[int, Query(gt=0, le=10_000)] = 1000,
+) -> StreamingResponse:
+    """
+    Route to stream every subscription, with its plan price and user email.
+    """
+
+    return StreamingResponse(
+        stream_export(session_factory, format, batch_size),
+        media_type=format.media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="subscriptions.{format}"'
+        },
+    )
@@ -1,26 +1,70 @@
-from fastapi import APIRouter, HTTPException
+from typing import Annotated
+from uuid import UUID
 
+from fastapi import APIRouter, HTTPException, Query
+
+from src.application.exceptions import InvalidCursorError
 from src.application.exceptions.user_account import UserAlreadyExistsError
 from src.application.use_case import (
     CreateUserAccountInputDTO,
     CreateUserAccountOutputDTO,
+    GetEntitlementInputDTO,
+    GetEntitlementOutputDTO,
+    ListUserAccountsInputDTO,
+    ListUserAccountsOutputDTO,
+)
+from src.infra.api.dependencies import (
+    AsyncCreateUserAccountUseCaseDep,
+    AsyncGetEntitlementUseCaseDep,
+    AsyncListUserAccountsUseCaseDep,
 )
-from src.infra.api.dependencies import CreateUserAccountUseCaseDep
 
 router = APIRouter(prefix="/accounts", tags=["accounts"])
 
 
 @router.post("", response_model=CreateUserAccountOutputDTO, status_code=201)
-def create_user_account(
-    use_case: CreateUserAccountUseCaseDep,
+async def create_user_account(
+    use_case: AsyncCreateUserAccountUseCaseDep,
     payload: CreateUserAccountInputDTO,
 ) -> CreateUserAccountOutputDTO:
     """
     Route to create a new userAccount.
     """
     try:
-        return use_case.execute(payload)
+        return await use_case.execute(payload)
     except UserAlreadyExistsError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.get("", response_model=ListUserAccountsOutputDTO)
+async def list_user_accounts(
+    use_case: AsyncListUserAccountsUseCaseDep,
+    query: Annotated[ListUserAccountsInputDTO, Query()],
+) -> ListUserAccountsOutputDTO:
+    """
+    Route to list userAccounts, a page at a time.
+    """
+
+    try:
+        return await use_case.execute(query)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.get("/{user_id}/entitlement", response_model=GetEntitlementOutputDTO)
+async def get_entitlement(
+    use_case: AsyncGetEntitlementUseCaseDep,
+    user_id: UUID,
+) -> GetEntitlementOutputDTO:
+    """
+    Route to check if a userAccount is entitled to stream.
+    """
+
+    try:
+        return await use_case.execute(GetEntitlementInputDTO(user_id=user_id))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
@@ -4,8 +4,10 @@ from uuid import uuid4
 from pydantic import EmailStr
 
 from src.infra.auth import AuthService
+from src.infra.metrics import instrument_client
 
 
+@instrument_client("auth")
 class InMemoryAuthService(AuthService):
     """
     In-memory authentication service for testing purposes.
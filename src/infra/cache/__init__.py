@@ -0,0 +1,10 @@
+from .cached_plan_repository import AsyncCachedPlanRepository, CachedPlanRepository
+from .entitlement_cache import EntitlementCache
+from .plan_catalog_cache import PlanCatalogCache
+
+__all__ = [
+    "AsyncCachedPlanRepository",
+    "CachedPlanRepository",
+    "EntitlementCache",
+    "PlanCatalogCache",
+]
@@ -0,0 +1,191 @@
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from src.domain.entity import Plan
+from src.domain.repository import (
+    AsyncPlanRepository,
+    AsyncUnitOfWork,
+    PlanRepository,
+    UnitOfWork,
+)
+from src.infra.cache.plan_catalog_cache import PlanCatalog, PlanCatalogCache
+from src.infra.metrics import instrument_repository
+
+CATALOG_PAGE_SIZE = 500
+
+
+@instrument_repository
+class CachedPlanRepository(PlanRepository):
+    """
+    Plan repository that reads through a plan catalog cache.
+    It wraps any PlanRepository implementation. The whole catalog is loaded on
+    a miss, so lookups of plans that do not exist are answered by the cache
+    too. Writes invalidate the cache once the unit of work commits them.
+    """
+
+    def __init__(
+        self,
+        repository: PlanRepository,
+        cache: PlanCatalogCache,
+        unit_of_work: UnitOfWork,
+    ) -> None:
+        """
+        Constructor
+        """
+
+        self._repository = repository
+        self._cache = cache
+        self._unit_of_work = unit_of_work
+
+    def get_by_id(self, plan_id: UUID) -> Optional[Plan]:
+        """
+        Get a plan by ID.
+        """
+
+        return self._catalog().get_by_id(plan_id)
+
+    def get_by_name(self, plan_name: str) -> Optional[Plan]:
+        """
+        Get a plan by name.
+        """
+
+        return self._catalog().get_by_name(plan_name)
+
+    def save(self, plan: Plan) -> None:
+        """
+        Save a plan.
+        """
+
+        self._repository.save(plan)
+        self._unit_of_work.on_commit(self._cache.invalidate)
+
+    def save_many(self, plans: Iterable[Plan]) -> None:
+        """
+        Save several plans.
+        """
+
+        self._repository.save_many(plans)
+        self._unit_of_work.on_commit(self._cache.invalidate)
+
+    def get_many_by_ids(self, plan_ids: Iterable[UUID]) -> List[Plan]:
+        """
+        Get the plans matching the given IDs.
+        """
+
+        catalog = self._catalog()
+        plans = (catalog.get_by_id(plan_id) for plan_id in set(plan_ids))
+        return [plan for plan in plans if plan is not None]
+
+    def update_many(self, plans: Iterable[Plan]) -> None:
+        """
+        Update several plans.
+        """
+
+        self._repository.update_many(plans)
+        self._unit_of_work.on_commit(self._cache.invalidate)
+
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Plan]:
+        """
+        List plans ordered by creation date and ID.
+        """
+
+        return self._repository.list_page(limit, after)
+
+    def _catalog(self) -> PlanCatalog:
+        """
+        Return the cached catalog, loading every plan on a miss.
+        """
+
+        catalog = self._cache.get()
+        if catalog is not None:
+            return catalog
+
+        generation = self._cache.generation
+        plans: List[Plan] = []
+        after: Optional[Tuple[datetime, UUID]] = None
+        while True:
+            page = self._repository.list_page(CATALOG_PAGE_SIZE, after)
+            plans.extend(page)
+            if len(page) < CATALOG_PAGE_SIZE:
+                return self._cache.put(plans, generation)
+            after = (page[-1].created_at, page[-1].id)
+
+
+@instrument_repository
+class AsyncCachedPlanRepository(AsyncPlanRepository):
+    """
+    Asynchronous plan repository that reads through a plan catalog cache.
+    It wraps any AsyncPlanRepository implementation, and loads and invalidates
+    the cache like CachedPlanRepository.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncPlanRepository,
+        cache: PlanCatalogCache,
+        unit_of_work: AsyncUnitOfWork,
+    ) -> None:
+        """
+        Constructor
+        """
+
+        self._repository = repository
+        self._cache = cache
+        self._unit_of_work = unit_of_work
+
+    async def get_by_id(self, plan_id: UUID) -> Optional[Plan]:
+        """
+        Get a plan by ID.
+        """
+
+        return (await self._catalog()).get_by_id(plan_id)
+
+    async def get_by_name(self, plan_name: str) -> Optional[Plan]:
+        """
+        Get a plan by name.
+        """
+
+        return (await self._catalog()).get_by_name(plan_name)
+
+    async def save(self, plan: Plan) -> None:
+        """
+        Save a plan.
+        """
+
+        await self._repository.save(plan)
+        self._unit_of_work.on_commit(self._cache.invalidate)
+
+    async def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Plan]:
+        """
+        List plans ordered by creation date and ID.
+        """
+
+        return await self._repository.list_page(limit, after)
+
+    async def _catalog(self) -> PlanCatalog:
+        """
+        Return the cached catalog, loading every plan on a miss.
+        """
+
+        catalog = self._cache.get()
+        if catalog is not None:
+            return catalog
+
+        generation = self._cache.generation
+        plans: List[Plan] = []
+        after: Optional[Tuple[datetime, UUID]] = None
+        while True:
+            page = await self._repository.list_page(CATALOG_PAGE_SIZE, after)
+            plans.extend(page)
+            if len(page) < CATALOG_PAGE_SIZE:
+                return self._cache.put(plans, generation)
+            after = (page[-1].created_at, page[-1].id)
@@ -0,0 +1,116 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Callable, Optional, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class EntitlementCache:
+    """
+    Process-wide, bounded LRU cache of entitlement results keyed by user ID.
+
+    A result is kept until the entitlement it describes ends, but never longer
+    than `max_ttl_seconds`, so changes made by other processes (e.g. the batch
+    renewal CLI) are picked up. Results without an entitlement end (users that
+    are not entitled) are kept for `negative_ttl_seconds`.
+
+    Every invalidation bumps a generation number, so a result computed before
+    an invalidation is not cached after it.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 100_000,
+        max_ttl_seconds: float = 60.0,
+        negative_ttl_seconds: float = 5.0,
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        """
+        Initialize an empty cache.
+        """
+
+        self._max_size = max_size
+        self._max_ttl = timedelta(seconds=max_ttl_seconds)
+        self._negative_ttl = timedelta(seconds=negative_ttl_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[UUID, Tuple[BaseModel, datetime]]" = OrderedDict()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        Number of invalidations so far.
+        """
+
+        return self._generation
+
+    def get(self, user_id: UUID) -> Optional[BaseModel]:
+        """
+        Get the cached result of a user, if it has not expired.
+        """
+
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[1] <= self._clock():
+                del self._entries[user_id]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[0]
+
+    def put(
+        self,
+        user_id: UUID,
+        result: BaseModel,
+        valid_until: Optional[datetime],
+        generation: int,
+    ) -> None:
+        """
+        Cache the result of a user, computed while the cache was at the given
+        generation and valid until the given date.
+        """
+
+        now = self._clock()
+        expires_at = now + self._max_ttl
+        if valid_until is None:
+            expires_at = now + self._negative_ttl
+        elif valid_until < expires_at:
+            expires_at = valid_until
+
+        if expires_at <= now:
+            return
+
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            self._entries[user_id] = (result, expires_at)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UUID) -> None:
+        """
+        Drop the cached result of a user.
+        """
+
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(user_id, None)
+
+    def __len__(self) -> int:
+        """
+        Number of cached results, including expired ones not yet evicted.
+        """
+
+        return len(self._entries)
@@ -0,0 +1,135 @@
+import threading
+import time
+from types import MappingProxyType
+from typing import Callable, Iterable, Mapping, Optional
+from uuid import UUID
+
+from src.domain.entity import Plan
+
+
+class PlanCatalog:
+    """
+    Immutable snapshot of the whole plan catalog, indexed by ID and by name.
+
+    Since it holds every plan, a lookup that finds nothing means the plan does
+    not exist. Callers get copies, so they cannot change the cached plans.
+    """
+
+    def __init__(self, plans: Iterable[Plan]) -> None:
+        """
+        Build the snapshot from every plan of the catalog.
+        """
+
+        plans = [plan.model_copy() for plan in plans]
+        self._by_id: Mapping[UUID, Plan] = MappingProxyType(
+            {plan.id: plan for plan in plans}
+        )
+        self._by_name: Mapping[str, Plan] = MappingProxyType(
+            {plan.name: plan for plan in plans}
+        )
+
+    def __len__(self) -> int:
+        """
+        Return the number of plans in the catalog.
+        """
+
+        return len(self._by_id)
+
+    def get_by_id(self, plan_id: UUID) -> Optional[Plan]:
+        """
+        Get a plan by ID.
+        """
+
+        plan = self._by_id.get(plan_id)
+        return plan.model_copy() if plan is not None else None
+
+    def get_by_name(self, plan_name: str) -> Optional[Plan]:
+        """
+        Get a plan by name.
+        """
+
+        plan = self._by_name.get(plan_name)
+        return plan.model_copy() if plan is not None else None
+
+
+class PlanCatalogCache:
+    """
+    Process-wide cache of the plan catalog.
+
+    The catalog is small, so it is cached whole, in a single PlanCatalog
+    snapshot loaded on first use. Readers never take a lock: a load builds a
+    new snapshot and swaps it in. Every invalidation bumps a generation
+    number, so a catalog read from the database before an invalidation is not
+    cached after it.
+
+    The snapshot is dropped `ttl_seconds` after it was loaded, which bounds how
+    long changes made by other workers stay invisible.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize an empty cache.
+        """
+
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._catalog: Optional[PlanCatalog] = None
+        self._expires_at = 0.0
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        Number of invalidations so far.
+        """
+
+        return self._generation
+
+    def get(self) -> Optional[PlanCatalog]:
+        """
+        Get the cached catalog, or None when it has to be loaded, counting hits
+        and misses.
+        """
+
+        catalog = self._catalog
+        if catalog is not None and self._clock() >= self._expires_at:
+            self.invalidate()
+            catalog = None
+
+        if catalog is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return catalog
+
+    def put(self, plans: Iterable[Plan], generation: int) -> PlanCatalog:
+        """
+        Cache every plan of the catalog, read while the cache was at the given
+        generation, and return the snapshot. A stale snapshot is returned
+        without being cached.
+        """
+
+        catalog = PlanCatalog(plans)
+        with self._lock:
+            if generation == self._generation:
+                self._catalog = catalog
+                self._expires_at = self._clock() + self._ttl_seconds
+
+        return catalog
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached catalog.
+        """
+
+        with self._lock:
+            self._generation += 1
+            self._catalog = None
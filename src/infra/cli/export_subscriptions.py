@@ -0,0 +1,58 @@
+import argparse
+import sys
+from contextlib import nullcontext
+from functools import partial
+from typing import List, Optional
+
+from sqlmodel import Session
+
+from src.infra.db import create_db_and_tables, get_engine
+from src.infra.export import ExportFormat, stream_export
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Export every subscription with its plan price and user email."
+    )
+    parser.add_argument(
+        "--format",
+        type=ExportFormat,
+        choices=list(ExportFormat),
+        default=ExportFormat.NDJSON,
+    )
+    parser.add_argument(
+        "--output",
+        type=argparse.FileType("w", encoding="utf-8"),
+        default=sys.stdout,
+        help="File to write the export to (default: standard output).",
+    )
+    parser.add_argument("--batch-size", type=int, default=1000)
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Write the export to the output file. Standard output, the default or "-",
+    is left open.
+    """
+
+    args = parse_args(argv)
+    create_db_and_tables()
+
+    opened = args.output is not sys.stdout
+    with args.output if opened else nullcontext(args.output):
+        for chunk in stream_export(
+            partial(Session, get_engine()), args.format, args.batch_size
+        ):
+            args.output.write(chunk)
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,123 @@
+import argparse
+import sys
+import time
+from datetime import datetime
+from typing import List, Optional
+
+from src.infra.dataset import (
+    DatasetGenerator,
+    DatasetSpec,
+    load_in_memory,
+    load_sql,
+)
+from src.infra.db import DatabaseSettings, build_engine
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+    """
+
+    defaults = DatasetSpec()
+    parser = argparse.ArgumentParser(
+        description=(
+            "Generate a synthetic dataset of plans, user accounts and "
+            "subscriptions. The same seed and reference date always generate "
+            "the same dataset."
+        )
+    )
+    parser.add_argument(
+        "--target",
+        choices=["sql", "memory"],
+        default="sql",
+        help=(
+            "Write into the database, or build the in-memory repositories and "
+            "only report the throughput (default: sql)."
+        ),
+    )
+    parser.add_argument(
+        "--database-url",
+        help="Database to write into (default: DATABASE_URL or the local SQLite).",
+    )
+    parser.add_argument(
+        "--replace",
+        action="store_true",
+        help="Delete the existing plans, user accounts and subscriptions first.",
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--user-accounts", type=int, default=defaults.user_accounts)
+    parser.add_argument("--plans", type=int, default=defaults.plans)
+    parser.add_argument(
+        "--now",
+        type=datetime.fromisoformat,
+        help="ISO date the dataset is generated around (default: today).",
+    )
+    parser.add_argument("--history-days", type=int, default=defaults.history_days)
+    parser.add_argument(
+        "--subscriber-ratio", type=float, default=defaults.subscriber_ratio
+    )
+    parser.add_argument("--trial-ratio", type=float, default=defaults.trial_ratio)
+    parser.add_argument(
+        "--cancellation-rate", type=float, default=defaults.cancellation_rate
+    )
+    parser.add_argument("--overdue-ratio", type=float, default=defaults.overdue_ratio)
+    parser.add_argument(
+        "--past-subscriptions", type=float, default=defaults.past_subscriptions
+    )
+    parser.add_argument(
+        "--plan-popularity", type=float, default=defaults.plan_popularity
+    )
+
+    return parser.parse_args(argv)
+
+
+def build_spec(args: argparse.Namespace) -> DatasetSpec:
+    """
+    Build the dataset spec from the command line arguments.
+    """
+
+    fields = {
+        name: getattr(args, name)
+        for name in DatasetSpec.model_fields
+        if getattr(args, name, None) is not None
+    }
+    return DatasetSpec(**fields)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Generate the dataset and print a summary.
+    """
+
+    args = parse_args(argv)
+    generator = DatasetGenerator(build_spec(args))
+    started_at = time.perf_counter()
+
+    if args.target == "memory":
+        counts = load_in_memory(generator).counts
+    else:
+        settings = DatabaseSettings.from_env()
+        # Every batch is one large statement, not worth logging as slow.
+        settings = settings.model_copy(
+            update={
+                "url": args.database_url or settings.url,
+                "slow_query_threshold": float("inf"),
+            }
+        )
+        try:
+            counts = load_sql(build_engine(settings), generator, args.replace)
+        except ValueError as error:
+            print(f"{error} Use --replace to overwrite it.", file=sys.stderr)
+            return 1
+
+    elapsed_seconds = time.perf_counter() - started_at
+    print(
+        f"Generated {counts.plans} plans, {counts.user_accounts} user accounts "
+        f"and {counts.subscriptions} subscriptions ({args.target}) in "
+        f"{elapsed_seconds:.2f}s ({counts.total / elapsed_seconds:,.0f} rows/s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+import argparse
+from datetime import datetime, time
+from typing import List, Optional
+
+from sqlmodel import Session
+
+from src.application.use_case import (
+    RenewDueSubscriptionsInputDTO,
+    RenewDueSubscriptionsUseCase,
+)
+from src.infra.db import create_db_and_tables, get_engine
+from src.infra.db.repository import (
+    SQLModelSubscriptionRepository,
+    SQLModelUnitOfWork,
+    SQLModelUserAccountRepository,
+)
+from src.infra.notification import OutboxNotificationService
+from src.infra.payment import FakePaymentGateway, FakePaymentTokenProvider
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Renew every subscription due before a given date."
+    )
+    parser.add_argument(
+        "--before",
+        type=datetime.fromisoformat,
+        default=datetime.combine(datetime.now().date(), time.min),
+        help="Renew subscriptions ending before this ISO date (default: today).",
+    )
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--max-concurrency", type=int, default=16)
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run a batch renewal and print a summary.
+    """
+
+    args = parse_args(argv)
+    create_db_and_tables()
+
+    with Session(get_engine()) as session:
+        use_case = RenewDueSubscriptionsUseCase(
+            subscription_repository=SQLModelSubscriptionRepository(session),
+            user_account_repository=SQLModelUserAccountRepository(session),
+            # TODO: Replace with actual implementation (Stripe)
+            payment_gateway=FakePaymentGateway(),
+            payment_token_provider=FakePaymentTokenProvider(),
+            notification_service=OutboxNotificationService(session),
+            unit_of_work=SQLModelUnitOfWork(session),
+        )
+        output = use_case.execute(
+            RenewDueSubscriptionsInputDTO(
+                before=args.before,
+                page_size=args.page_size,
+                max_concurrency=args.max_concurrency,
+            )
+        )
+
+    print(
+        f"Processed {output.processed} subscriptions in "
+        f"{output.elapsed_seconds:.2f}s ({output.throughput:.1f}/s): "
+        f"{output.renewed} renewed, {output.payment_failed} payment failures, "
+        f"{output.failed} errors"
+    )
+    return 1 if output.failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,22 @@
+from .generator import (
+    BLOCK_SIZE,
+    DatasetBlock,
+    DatasetCounts,
+    DatasetGenerator,
+    DatasetSpec,
+    hex_ids,
+)
+from .in_memory_loader import InMemoryDataset, load_in_memory
+from .sql_loader import load_sql
+
+__all__ = [
+    "BLOCK_SIZE",
+    "DatasetBlock",
+    "DatasetCounts",
+    "DatasetGenerator",
+    "DatasetSpec",
+    "hex_ids",
+    "InMemoryDataset",
+    "load_in_memory",
+    "load_sql",
+]
@@ -0,0 +1,514 @@
+import gc
+from contextlib import contextmanager
+from datetime import datetime, time
+from decimal import Decimal
+from typing import Dict, Iterator, NamedTuple, Optional
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from src.domain._shared import Currency
+from src.domain.entity import SubscriptionStatus
+from src.infra.analytics import UUID_DTYPE
+
+BLOCK_SIZE = 10_000
+
+Columns = Dict[str, np.ndarray]
+
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8).astype(np.uint32)
+_DAY = np.timedelta64(86_400_000_000, "us")
+_TRIAL_PERIOD = 7 * _DAY
+_REGULAR_PERIOD = 30 * _DAY
+_MAX_GAP = 90 * _DAY
+
+_PLAN_TIERS = (
+    ("Standard", "39.90"),
+    ("Basic", "19.90"),
+    ("Premium", "59.90"),
+    ("Family", "69.90"),
+    ("Student", "14.90"),
+    ("Mobile", "9.90"),
+)
+_FIRST_NAMES = np.array(
+    [
+        "Ana", "Beatriz", "Bruno", "Camila", "Carlos", "Daniela", "Diego",
+        "Eduarda", "Felipe", "Fernanda", "Gabriel", "Helena", "Igor", "Isabela",
+        "João", "Julia", "Lucas", "Luiza", "Marcos", "Mariana", "Mateus",
+        "Natália", "Pedro", "Rafael", "Renata", "Rodrigo", "Sofia", "Thiago",
+        "Valentina", "Vinícius",
+    ]
+)  # fmt: skip
+_LAST_NAMES = np.array(
+    [
+        "Almeida", "Alves", "Araújo", "Barbosa", "Cardoso", "Carvalho", "Costa",
+        "Dias", "Fernandes", "Ferreira", "Gomes", "Lima", "Martins", "Melo",
+        "Oliveira", "Pereira", "Ribeiro", "Rocha", "Rodrigues", "Santos",
+        "Silva", "Souza",
+    ]
+)  # fmt: skip
+_STREETS = np.array(
+    [
+        "Rua das Flores", "Rua XV de Novembro", "Avenida Paulista",
+        "Rua Sete de Setembro", "Avenida Brasil", "Rua da Consolação",
+        "Rua Augusta", "Avenida Atlântica", "Rua Oscar Freire",
+        "Avenida Getúlio Vargas",
+    ]
+)  # fmt: skip
+# (city, state, relative population)
+_CITIES = (
+    ("São Paulo", "SP", 11.5),
+    ("Rio de Janeiro", "RJ", 6.2),
+    ("Brasília", "DF", 2.8),
+    ("Salvador", "BA", 2.4),
+    ("Fortaleza", "CE", 2.4),
+    ("Belo Horizonte", "MG", 2.3),
+    ("Manaus", "AM", 2.1),
+    ("Curitiba", "PR", 1.8),
+    ("Recife", "PE", 1.5),
+    ("Porto Alegre", "RS", 1.3),
+)
+
+
+class DatasetSpec(BaseModel):
+    """
+    Shape of a synthetic dataset.
+
+    Every random draw comes from generators seeded with `seed`, and every date
+    is relative to `now`, so the same spec always produces the same rows.
+
+    Attributes:
+        seed (int): Seed of the random generators.
+        user_accounts (int): Number of user accounts.
+        plans (int): Number of plans.
+        now (datetime): Reference date the dataset is generated around.
+        history_days (int): Days between the first signup and `now`. Signups
+            grow linearly over that period.
+        subscriber_ratio (float): Share of user accounts with a subscription.
+        trial_ratio (float): Share of current subscriptions that are trials.
+        cancellation_rate (float): Share of current subscriptions that are
+            cancelled.
+        overdue_ratio (float): Share of active subscriptions whose end date has
+            already passed, i.e. due for renewal.
+        past_subscriptions (float): Mean number of earlier, cancelled
+            subscriptions per subscriber.
+        plan_popularity (float): Zipf exponent of the plan choice. The first
+            plans are the most popular; 0 picks plans uniformly.
+    """
+
+    seed: int = Field(default=0, ge=0)
+    user_accounts: int = Field(default=100_000, ge=0)
+    plans: int = Field(default=12, gt=0)
+    now: datetime = Field(
+        default_factory=lambda: datetime.combine(datetime.now().date(), time.min)
+    )
+    history_days: int = Field(default=730, gt=0)
+    subscriber_ratio: float = Field(default=0.8, ge=0, le=1)
+    trial_ratio: float = Field(default=0.15, ge=0, le=1)
+    cancellation_rate: float = Field(default=0.2, ge=0, le=1)
+    overdue_ratio: float = Field(default=0.02, ge=0, le=1)
+    past_subscriptions: float = Field(default=0.4, ge=0)
+    plan_popularity: float = Field(default=1.1, ge=0)
+
+
+class DatasetBlock(NamedTuple):
+    """
+    User accounts generated together, with their subscriptions.
+    """
+
+    user_accounts: Columns
+    subscriptions: Columns
+
+
+class DatasetCounts(NamedTuple):
+    """
+    Rows written per table.
+    """
+
+    plans: int
+    user_accounts: int
+    subscriptions: int
+
+    @property
+    def total(self) -> int:
+        """
+        Return the rows written across all tables.
+        """
+
+        return self.plans + self.user_accounts + self.subscriptions
+
+
+class DatasetGenerator:
+    """
+    Generates plans, user accounts and subscriptions as NumPy columns.
+
+    Columns are named after the SQLModel columns. IDs are UUID_DTYPE arrays of
+    UUIDv7s derived from the creation date of their row, dates are
+    datetime64[us] arrays and text columns are arrays of str.
+
+    User accounts are generated in blocks of BLOCK_SIZE, in signup order, each
+    from its own seeded random generator, so a block does not depend on how
+    many blocks were generated before it.
+    """
+
+    def __init__(self, spec: DatasetSpec) -> None:
+        """
+        Initialize the generator from a spec.
+        """
+
+        self.spec = spec
+        self._now = np.datetime64(spec.now, "us")
+        self._history = spec.history_days * _DAY
+        self._started_at = self._now - self._history
+        self._plans = self._generate_plans()
+        ranks = np.arange(1, spec.plans + 1, dtype=np.float64)
+        weights = ranks**-spec.plan_popularity
+        self._plan_cdf = np.cumsum(weights / weights.sum())
+
+    def plans(self) -> Columns:
+        """
+        Return the plans.
+        """
+
+        return self._plans
+
+    def blocks(self) -> Iterator[DatasetBlock]:
+        """
+        Yield the user accounts and their subscriptions, block by block.
+        """
+
+        for index, start in enumerate(range(0, self.spec.user_accounts, BLOCK_SIZE)):
+            stop = min(start + BLOCK_SIZE, self.spec.user_accounts)
+            rng = self._rng(1, index)
+            user_accounts = self._generate_user_accounts(rng, start, stop)
+            yield DatasetBlock(
+                user_accounts=user_accounts,
+                subscriptions=self._generate_subscriptions(rng, user_accounts),
+            )
+
+    def _rng(self, *key: int) -> np.random.Generator:
+        """
+        Return a random generator seeded from the spec seed and a key.
+        """
+
+        return np.random.default_rng([self.spec.seed, *key])
+
+    def _generate_plans(self) -> Columns:
+        """
+        Generate the plan catalog, launched during the first half of the
+        history.
+        """
+
+        rng = self._rng(0)
+        count = self.spec.plans
+        created_at = self._started_at + (
+            np.arange(count) * (self._history // 2 // count)
+        ).astype("timedelta64[us]")
+        names, amounts = [], []
+        for i in range(count):
+            tier, amount = _PLAN_TIERS[i % len(_PLAN_TIERS)]
+            edition = i // len(_PLAN_TIERS)
+            names.append(f"{tier} {edition + 1}" if edition else tier)
+            amounts.append(Decimal(amount))
+
+        return {
+            "id": _uuid7(rng, created_at),
+            "name": np.array(names),
+            "price_amount": np.array(amounts, dtype=object),
+            "price_currency": np.full(count, str(Currency.BRL)),
+            "created_at": created_at,
+            "updated_at": created_at,
+            "is_active": np.ones(count, dtype=bool),
+        }
+
+    def _generate_user_accounts(
+        self, rng: np.random.Generator, start: int, stop: int
+    ) -> Columns:
+        """
+        Generate the user accounts from `start` to `stop`, in signup order.
+        """
+
+        count = stop - start
+        indexes = np.arange(start, stop)
+        # Signups grow linearly, so the signup CDF over the history is
+        # quadratic and the i-th signup lands at sqrt(i / N) of the history.
+        position = (indexes + rng.random(count)) / self.spec.user_accounts
+        created_at = self._started_at + (np.sqrt(position) * self._history).astype(
+            "timedelta64[us]"
+        )
+
+        first_names = _FIRST_NAMES[rng.integers(len(_FIRST_NAMES), size=count)]
+        last_names = _LAST_NAMES[rng.integers(len(_LAST_NAMES), size=count)]
+        cities = _choice(
+            rng, np.cumsum([population for _, _, population in _CITIES]), count
+        )
+        streets = _STREETS[rng.integers(len(_STREETS), size=count)]
+        numbers = rng.integers(1, 5_000, size=count)
+        zip_codes = rng.integers(1_000_000, 100_000_000, size=count)
+
+        seed = self.spec.seed
+        return {
+            "id": _uuid7(rng, created_at),
+            # The IAM assigns its user ID at signup too.
+            "iam_user_id": hex_ids(_uuid7(rng, created_at), canonical=True),
+            "name": np.strings.add(np.strings.add(first_names, " "), last_names),
+            "email": np.array(
+                [
+                    f"{first}.{last}.{seed}.{i}@example.com"
+                    for first, last, i in zip(
+                        _ascii_lower(first_names).tolist(),
+                        _ascii_lower(last_names).tolist(),
+                        indexes.tolist(),
+                    )
+                ]
+            ),
+            "billing_address_street": np.strings.add(
+                np.strings.add(streets, ", "), numbers.astype(str)
+            ),
+            "billing_address_city": np.array([city for city, _, _ in _CITIES])[cities],
+            "billing_address_state": np.array([state for _, state, _ in _CITIES])[
+                cities
+            ],
+            "billing_address_zip_code": np.array(
+                [f"{code // 1000:05d}-{code % 1000:03d}" for code in zip_codes.tolist()]
+            ),
+            "billing_address_country": np.full(count, "Brazil"),
+            "created_at": created_at,
+            "updated_at": created_at,
+            "is_active": rng.random(count) >= 0.01,
+        }
+
+    def _generate_subscriptions(
+        self, rng: np.random.Generator, user_accounts: Columns
+    ) -> Columns:
+        """
+        Generate the subscriptions of a block of user accounts.
+
+        Subscribers get one current subscription, active or cancelled, plus
+        a few earlier cancelled ones. Active subscriptions end around `now`,
+        spread over one period, so renewals are spread over the coming days;
+        cancelled ones ended anywhere since the user signed up.
+        """
+
+        spec = self.spec
+        subscribed = rng.random(len(user_accounts["id"])) < spec.subscriber_ratio
+        user_ids = user_accounts["id"][subscribed]
+        signed_up_at = user_accounts["created_at"][subscribed]
+        count = len(user_ids)
+
+        is_trial = rng.random(count) < spec.trial_ratio
+        cancelled = rng.random(count) < spec.cancellation_rate
+        overdue = rng.random(count) < spec.overdue_ratio
+        period = np.where(is_trial, _TRIAL_PERIOD, _REGULAR_PERIOD)
+
+        end_date = self._now + _scale(period, rng.random(count))
+        end_date = np.where(
+            overdue, self._now - _scale(_DAY * 3, rng.random(count)), end_date
+        )
+        # Cancelled subscriptions ended between the user's first period and now.
+        ended_at = (
+            signed_up_at
+            + period
+            + _scale(self._now - signed_up_at - period, rng.random(count))
+        )
+        end_date = np.where(cancelled, np.minimum(ended_at, self._now), end_date)
+
+        # Regular subscriptions renew by whole periods since they started.
+        renewals = (end_date - signed_up_at) // period
+        renewals = np.where(
+            is_trial,
+            1,
+            1 + (rng.random(count) * np.maximum(renewals - 1, 0)).astype(np.int64),
+        )
+        start_date = np.maximum(end_date - period * renewals, signed_up_at)
+        end_date = np.maximum(end_date, start_date + period)
+
+        updated_at = np.where(
+            cancelled,
+            np.minimum(end_date - _scale(period, rng.random(count)), self._now),
+            np.maximum(end_date - period, start_date),
+        )
+        updated_at = np.maximum(updated_at, start_date)
+
+        past = self._generate_past_subscriptions(
+            rng, user_ids, signed_up_at, start_date
+        )
+        statuses = np.where(
+            cancelled, SubscriptionStatus.CANCELLED, SubscriptionStatus.ACTIVE
+        )
+        return _concat(
+            {
+                "id": _uuid7(rng, start_date),
+                "user_id": user_ids,
+                "plan_id": self._pick_plans(rng, start_date),
+                "start_date": start_date,
+                "end_date": end_date,
+                "is_trial": is_trial,
+                "status": statuses.astype(str),
+                "created_at": start_date,
+                "updated_at": updated_at,
+                "is_active": np.ones(count, dtype=bool),
+            },
+            past,
+        )
+
+    def _generate_past_subscriptions(
+        self,
+        rng: np.random.Generator,
+        user_ids: np.ndarray,
+        signed_up_at: np.ndarray,
+        current_start_date: np.ndarray,
+    ) -> Columns:
+        """
+        Generate cancelled regular subscriptions that ended before the
+        current subscription of each subscriber, each one period long and
+        separated by random gaps. Those that would start before the user
+        signed up are dropped.
+        """
+
+        counts = rng.poisson(self.spec.past_subscriptions, size=len(user_ids))
+        owners = np.repeat(np.arange(len(user_ids)), counts)
+        gaps = _scale(_MAX_GAP, rng.random(len(owners)))
+        # Cumulated (gap + period) per owner, restarting at each owner.
+        steps = (gaps + _REGULAR_PERIOD).astype(np.int64)
+        totals = np.cumsum(steps)
+        firsts = np.repeat(np.cumsum(counts) - counts, counts)
+        offsets = totals - (totals[firsts] - steps[firsts])
+        end_date = current_start_date[owners] - (
+            offsets.astype("timedelta64[us]") - _REGULAR_PERIOD
+        )
+        start_date = end_date - _REGULAR_PERIOD
+        kept = start_date >= signed_up_at[owners]
+        owners, start_date, end_date = owners[kept], start_date[kept], end_date[kept]
+        count = len(owners)
+
+        return {
+            "id": _uuid7(rng, start_date),
+            "user_id": user_ids[owners],
+            "plan_id": self._pick_plans(rng, start_date),
+            "start_date": start_date,
+            "end_date": end_date,
+            "is_trial": np.zeros(count, dtype=bool),
+            "status": np.full(count, str(SubscriptionStatus.CANCELLED)),
+            "created_at": start_date,
+            "updated_at": end_date - _scale(_REGULAR_PERIOD, rng.random(count)),
+            "is_active": np.ones(count, dtype=bool),
+        }
+
+    def _pick_plans(
+        self, rng: np.random.Generator, start_date: np.ndarray
+    ) -> np.ndarray:
+        """
+        Pick plan IDs following the plan popularity, among the plans already
+        launched when each subscription starts.
+        """
+
+        launched = np.searchsorted(self._plans["created_at"], start_date, side="right")
+        choices = _choice(rng, self._plan_cdf, len(start_date), np.maximum(launched, 1))
+        return self._plans["id"][choices]
+
+
+def _choice(
+    rng: np.random.Generator,
+    cdf,
+    count: int,
+    options: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Draw indexes following an (unnormalized) cumulative distribution,
+    optionally restricted per draw to the first `options` indexes.
+
+    Searching the CDF is several times faster than Generator.choice with
+    probabilities, which rebuilds it on every call.
+    """
+
+    cdf = np.asarray(cdf, dtype=np.float64)
+    last = len(cdf) - 1 if options is None else options - 1
+    indexes = np.searchsorted(cdf, rng.random(count) * cdf[last], side="right")
+    return np.minimum(indexes, last)
+
+
+def _scale(duration, fraction: np.ndarray) -> np.ndarray:
+    """
+    Multiply durations by fractions in [0, 1).
+    """
+
+    return (np.asarray(duration).astype(np.int64) * fraction).astype("timedelta64[us]")
+
+
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    """
+    Pause the cyclic garbage collector.
+
+    Bulk loads allocate many long-lived objects, and every few hundred of them
+    trigger a collection that scans the ones already kept.
+    """
+
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def hex_ids(ids: np.ndarray, canonical: bool = False) -> np.ndarray:
+    """
+    Format UUID_DTYPE IDs as 32 hex digits, or in the canonical 8-4-4-4-12
+    form, without going through UUID objects.
+    """
+
+    data = np.frombuffer(ids.tobytes(), dtype=np.uint8).reshape(-1, 16)
+    digits = np.empty((len(data), 32), dtype=np.uint32)
+    digits[:, 0::2] = _HEX_DIGITS[data >> 4]
+    digits[:, 1::2] = _HEX_DIGITS[data & 0xF]
+    if canonical:
+        digits = np.insert(digits, [8, 12, 16, 20], ord("-"), axis=1)
+    return digits.view(f"<U{digits.shape[1]}").ravel()
+
+
+def _uuid7(rng: np.random.Generator, created_at: np.ndarray) -> np.ndarray:
+    """
+    Generate UUIDv7s carrying the given creation dates, so rows created later
+    sort after earlier ones, like IDs of the live service.
+    """
+
+    milliseconds = (
+        created_at.astype("datetime64[ms]").astype(np.int64).astype(np.uint64)
+    )
+    ids = np.empty(len(created_at), dtype=UUID_DTYPE)
+    ids["hi"] = (
+        (milliseconds << np.uint64(16))
+        | np.uint64(0x7000)
+        | rng.integers(0x1000, size=len(ids), dtype=np.uint64)
+    )
+    ids["lo"] = np.uint64(0x8000_0000_0000_0000) | rng.integers(
+        2**62, size=len(ids), dtype=np.uint64
+    )
+    return ids
+
+
+def _ascii_lower(names: np.ndarray) -> np.ndarray:
+    """
+    Lowercase names and strip their accents, for use in email addresses.
+    """
+
+    lowered = np.strings.lower(names)
+    for accented, plain in (("ã", "a"), ("á", "a"), ("ú", "u"), ("í", "i")):
+        lowered = np.strings.replace(lowered, accented, plain)
+    return lowered
+
+
+def _concat(*parts: Columns) -> Columns:
+    """
+    Concatenate columns with the same names.
+
+    The dtype is given explicitly, as NumPy would otherwise switch the ID
+    halves to native byte order.
+    """
+
+    return {
+        name: np.concatenate([part[name] for part in parts], dtype=values.dtype)
+        for name, values in parts[0].items()
+    }
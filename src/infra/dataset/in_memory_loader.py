@@ -0,0 +1,183 @@
+from typing import List, NamedTuple
+from uuid import UUID
+
+import numpy as np
+
+from src.domain._shared import Currency, MonetaryValue
+from src.domain.entity import (
+    Address,
+    Plan,
+    Subscription,
+    SubscriptionStatus,
+    UserAccount,
+)
+from src.infra.dataset.generator import (
+    Columns,
+    DatasetCounts,
+    DatasetGenerator,
+    paused_gc,
+)
+from src.infra.repository import (
+    InMemoryPlanRepository,
+    InMemorySubscriptionRepository,
+    InMemoryUserAccountRepository,
+)
+
+
+class InMemoryDataset(NamedTuple):
+    """
+    In-memory repositories holding a generated dataset.
+    """
+
+    plan_repository: InMemoryPlanRepository
+    user_account_repository: InMemoryUserAccountRepository
+    subscription_repository: InMemorySubscriptionRepository
+    counts: DatasetCounts
+
+
+def load_in_memory(generator: DatasetGenerator) -> InMemoryDataset:
+    """
+    Build in-memory repositories holding a generated dataset.
+    """
+
+    with paused_gc():
+        return _load(generator)
+
+
+def _load(generator: DatasetGenerator) -> InMemoryDataset:
+    """
+    Hydrate the entities of a generated dataset into in-memory repositories.
+
+    Entities are hydrated from the generated columns, and the subscription
+    repository is built from all of them at once so its due index is sorted
+    a single time. Each ID is turned into a UUID once: subscriptions share the
+    UUIDs of their user account and plan.
+    """
+
+    plans: List[Plan] = []
+    user_accounts: List[UserAccount] = []
+    subscriptions: List[Subscription] = []
+    statuses = {status.value: status for status in SubscriptionStatus}
+
+    columns = generator.plans()
+    plan_ids = _uuids(columns["id"])
+    plan_uuids = dict(zip(_keys(columns["id"]), plan_ids))
+    for plan_id, name, amount, currency, created_at, updated_at, is_active in zip(
+        plan_ids, *_lists(columns, "id")
+    ):
+        plans.append(
+            Plan.hydrate(
+                id=plan_id,
+                name=name,
+                price=MonetaryValue.hydrate(amount=amount, currency=Currency(currency)),
+                created_at=created_at,
+                updated_at=updated_at,
+                is_active=is_active,
+            )
+        )
+
+    for block in generator.blocks():
+        columns = block.user_accounts
+        user_ids = _uuids(columns["id"])
+        user_uuids = dict(zip(_keys(columns["id"]), user_ids))
+        for (
+            user_id,
+            iam_user_id,
+            name,
+            email,
+            street,
+            city,
+            state,
+            zip_code,
+            country,
+            created_at,
+            updated_at,
+            is_active,
+        ) in zip(user_ids, *_lists(columns, "id")):
+            user_accounts.append(
+                UserAccount.hydrate(
+                    id=user_id,
+                    iam_user_id=iam_user_id,
+                    name=name,
+                    email=email,
+                    billing_address=Address.hydrate(
+                        street=street,
+                        city=city,
+                        state=state,
+                        zip_code=zip_code,
+                        country=country,
+                    ),
+                    created_at=created_at,
+                    updated_at=updated_at,
+                    is_active=is_active,
+                )
+            )
+
+        columns = block.subscriptions
+        for (
+            subscription_id,
+            user_key,
+            plan_key,
+            start_date,
+            end_date,
+            is_trial,
+            status,
+            created_at,
+            updated_at,
+            is_active,
+        ) in zip(
+            _uuids(columns["id"]),
+            _keys(columns["user_id"]),
+            _keys(columns["plan_id"]),
+            *_lists(columns, "id", "user_id", "plan_id"),
+        ):
+            subscriptions.append(
+                Subscription.hydrate(
+                    id=subscription_id,
+                    user_id=user_uuids[user_key],
+                    plan_id=plan_uuids[plan_key],
+                    start_date=start_date,
+                    end_date=end_date,
+                    status=statuses[status],
+                    is_trial=is_trial,
+                    created_at=created_at,
+                    updated_at=updated_at,
+                    is_active=is_active,
+                )
+            )
+
+    return InMemoryDataset(
+        plan_repository=InMemoryPlanRepository(plans),
+        user_account_repository=InMemoryUserAccountRepository(user_accounts),
+        subscription_repository=InMemorySubscriptionRepository(subscriptions),
+        counts=DatasetCounts(
+            plans=len(plans),
+            user_accounts=len(user_accounts),
+            subscriptions=len(subscriptions),
+        ),
+    )
+
+
+def _keys(ids: np.ndarray) -> List[bytes]:
+    """
+    Return the 16 bytes of each ID, to look up UUIDs already built.
+    """
+
+    data = ids.tobytes()
+    return [data[i : i + 16] for i in range(0, len(data), 16)]
+
+
+def _uuids(ids: np.ndarray) -> List[UUID]:
+    """
+    Convert an ID column into UUIDs.
+    """
+
+    return [UUID(bytes=key) for key in _keys(ids)]
+
+
+def _lists(columns: Columns, *skipped: str) -> List[list]:
+    """
+    Return the columns as Python lists, in order, except the skipped ones.
+    """
+
+    return [values.tolist() for name, values in columns.items() if name not in skipped]
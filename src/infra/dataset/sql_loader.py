@@ -0,0 +1,185 @@
+from typing import Callable, Dict, List, Tuple
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import Column, Connection, Dialect, Engine, Index, Table, func, select
+from sqlmodel import SQLModel
+
+from src.infra.analytics import UUID_DTYPE
+from src.infra.dataset.generator import (
+    Columns,
+    DatasetCounts,
+    DatasetGenerator,
+    hex_ids,
+    paused_gc,
+)
+from src.infra.db.models import PlanModel, SubscriptionModel, UserAccountModel
+
+_TABLES: List[Table] = [
+    PlanModel.__table__,  # type: ignore[attr-defined]
+    UserAccountModel.__table__,  # type: ignore[attr-defined]
+    SubscriptionModel.__table__,  # type: ignore[attr-defined]
+]
+
+
+def load_sql(
+    engine: Engine, generator: DatasetGenerator, replace: bool = False
+) -> DatasetCounts:
+    """
+    Write a generated dataset into the plans, user_accounts and subscriptions
+    tables, in a single transaction.
+
+    The tables must be empty, unless `replace` is set, in which case their
+    rows are deleted first. Secondary indexes are dropped during the load and
+    rebuilt at the end, which is much cheaper than maintaining them row by
+    row. On SQLite, values are encoded the way SQLAlchemy stores them with
+    NumPy and sent with a plain executemany; other databases go through
+    SQLAlchemy's bulk insert. The garbage collector is paused meanwhile.
+
+    Raises:
+        ValueError: If a table already has rows and `replace` is not set.
+    """
+
+    with paused_gc(), engine.begin() as connection:
+        SQLModel.metadata.create_all(connection)
+        if replace:
+            for table in reversed(_TABLES):
+                connection.execute(table.delete())
+        else:
+            _check_empty(connection)
+
+        indexes = _drop_indexes(connection)
+        insert = _inserter(connection)
+        plans = insert(PlanModel.__table__, generator.plans())  # type: ignore
+        user_accounts = subscriptions = 0
+        for block in generator.blocks():
+            user_accounts += insert(
+                UserAccountModel.__table__, block.user_accounts  # type: ignore
+            )
+            subscriptions += insert(
+                SubscriptionModel.__table__, block.subscriptions  # type: ignore
+            )
+        for index in indexes:
+            index.create(connection)
+
+    return DatasetCounts(
+        plans=plans, user_accounts=user_accounts, subscriptions=subscriptions
+    )
+
+
+def _check_empty(connection: Connection) -> None:
+    """
+    Raise if one of the dataset tables already has rows.
+    """
+
+    for table in _TABLES:
+        if connection.scalar(select(func.count()).select_from(table)):
+            raise ValueError(
+                f"Table '{table.name}' is not empty, refusing to add a dataset to it."
+            )
+
+
+def _drop_indexes(connection: Connection) -> List[Index]:
+    """
+    Drop the secondary indexes of the dataset tables and return them.
+    """
+
+    indexes = [index for table in _TABLES for index in table.indexes]
+    for index in indexes:
+        index.drop(connection)
+    return indexes
+
+
+def _inserter(connection: Connection) -> Callable[[Table, Columns], int]:
+    """
+    Return a function inserting columns into a table with the fastest
+    method available for the connection's dialect.
+    """
+
+    if connection.dialect.name != "sqlite":
+
+        def insert(table: Table, columns: Columns) -> int:
+            names = list(columns)
+            values = [_python_values(columns[name]) for name in names]
+            rows = [dict(zip(names, row)) for row in zip(*values)]
+            if rows:
+                connection.execute(table.insert(), rows)
+            return len(rows)
+
+        return insert
+
+    statements: Dict[str, str] = {}
+
+    def insert_sqlite(table: Table, columns: Columns) -> int:
+        if table.name not in statements:
+            statements[table.name] = str(
+                table.insert()
+                .values({name: None for name in columns})
+                .compile(dialect=connection.dialect)
+            )
+        rows = _sqlite_rows(connection.dialect, table, columns)
+        if rows:
+            connection.exec_driver_sql(statements[table.name], rows)
+        return len(rows)
+
+    return insert_sqlite
+
+
+def _python_values(values: np.ndarray) -> list:
+    """
+    Convert a column into the Python objects the models use.
+    """
+
+    if values.dtype == UUID_DTYPE:
+        data = values.tobytes()
+        return [UUID(bytes=data[i : i + 16]) for i in range(0, len(data), 16)]
+
+    return values.tolist()
+
+
+def _sqlite_rows(dialect: Dialect, table: Table, columns: Columns) -> List[tuple]:
+    """
+    Encode columns into rows of SQLite values.
+
+    Dates are the costliest values to encode and date columns often hold the
+    same values, such as created_at and start_date, so those are encoded once.
+    """
+
+    encoded: List[list] = []
+    dates: List[Tuple[np.ndarray, list]] = []
+    for name, values in columns.items():
+        if values.dtype.kind != "M":
+            encoded.append(_sqlite_values(dialect, table.c[name], values))
+            continue
+
+        strings = next(
+            (strings for other, strings in dates if np.array_equal(other, values)),
+            None,
+        )
+        if strings is None:
+            strings = _sqlite_values(dialect, table.c[name], values)
+            dates.append((values, strings))
+        encoded.append(strings)
+
+    return list(zip(*encoded))
+
+
+def _sqlite_values(dialect: Dialect, column: Column, values: np.ndarray) -> list:
+    """
+    Encode a column the way SQLAlchemy stores it in SQLite: UUIDs as 32 hex
+    digits, dates as 'YYYY-MM-DD HH:MM:SS.ffffff'. Other Python objects, like
+    decimals, go through the column type's own bind processor.
+    """
+
+    if values.dtype == UUID_DTYPE:
+        return hex_ids(values).tolist()
+
+    if values.dtype.kind == "M":
+        iso = np.datetime_as_string(values.astype("datetime64[us]"), unit="us")
+        return np.strings.replace(iso, "T", " ").tolist()
+
+    process = values.dtype.kind == "O" and column.type.bind_processor(dialect)
+    if process:
+        return [process(value) for value in values.tolist()]
+
+    return values.tolist()
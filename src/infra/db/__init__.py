@@ -1,8 +1,37 @@
-from sqlmodel import Session, SQLModel, create_engine
+from functools import cache, partial
+from typing import Callable
 
+from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import Session, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-DATABASE_URL = "sqlite:///./subscription_service.db"
-engine = create_engine(DATABASE_URL)
+from src.infra.metrics import QueryStats, instrument_queries, track_queries
+
+from .engine import DatabaseSettings, build_async_engine, build_engine
+
+settings = DatabaseSettings.from_env()
+DATABASE_URL = settings.url
+
+
+@cache
+def get_engine() -> Engine:
+    """
+    Returns the engine of the configured database. It is built on first use,
+    so importing the models or the application layer sets up no database.
+    """
+
+    return build_engine(settings)
+
+
+@cache
+def get_async_engine() -> AsyncEngine:
+    """
+    Returns the asynchronous engine of the configured database, built on first
+    use.
+    """
+
+    return build_async_engine(settings)
 
 
 def create_db_and_tables() -> None:
@@ -10,7 +39,7 @@ def create_db_and_tables() -> None:
     Create database and tables.
     """
 
-    SQLModel.metadata.create_all(engine)
+    SQLModel.metadata.create_all(get_engine())
 
 
 def get_session():
@@ -18,11 +47,39 @@ def get_session():
     Returns a database session.
     """
 
-    with Session(engine) as session:
+    with Session(get_engine()) as session:
+        yield session
+
+
+def get_session_factory() -> Callable[[], Session]:
+    """
+    Returns a factory of database sessions, for work that outlives a request
+    such as streaming a response.
+    """
+
+    return partial(Session, get_engine())
+
+
+async def get_async_session():
+    """
+    Returns an asynchronous database session.
+    """
+
+    async with AsyncSession(get_async_engine(), expire_on_commit=False) as session:
         yield session
 
 
 __all__ = [
+    "build_async_engine",
+    "build_engine",
     "create_db_and_tables",
+    "DatabaseSettings",
+    "get_async_engine",
+    "get_async_session",
+    "get_engine",
     "get_session",
+    "get_session_factory",
+    "instrument_queries",
+    "QueryStats",
+    "track_queries",
 ]
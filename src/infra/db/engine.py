@@ -0,0 +1,153 @@
+import os
+from typing import Mapping, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import URL, Engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import create_engine
+
+from src.infra.metrics import instrument_queries
+from src.infra.tracing import trace_engine
+
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+
+class DatabaseSettings(BaseModel):
+    """
+    Database engine settings.
+
+    Attributes:
+        url (str): SQLAlchemy database URL.
+        async_url (Optional[str]): SQLAlchemy database URL for the async engine.
+            Derived from `url` with the backend's async driver when not set.
+        pool_size (int): Connections kept open in the pool.
+        max_overflow (int): Extra connections allowed above pool_size.
+        pool_recycle (int): Seconds after which a pooled connection is replaced.
+        sqlite_busy_timeout (int): Milliseconds SQLite waits on a locked database.
+        sqlite_mmap_size (int): Bytes of the database file SQLite memory-maps.
+        sqlite_cache_size (int): SQLite page cache size (negative values are KiB).
+        slow_query_threshold (float): Seconds from which a statement is logged
+            as slow, with its parameters.
+    """
+
+    url: str = "sqlite:///./subscription_service.db"
+    async_url: Optional[str] = None
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_recycle: int = 1800
+    sqlite_busy_timeout: int = 5000
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_cache_size: int = -64 * 1024
+    slow_query_threshold: float = 0.1
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> "DatabaseSettings":
+        """
+        Build the settings from environment variables, falling back to defaults.
+        """
+
+        variables = {
+            "url": "DATABASE_URL",
+            "async_url": "ASYNC_DATABASE_URL",
+            "pool_size": "DATABASE_POOL_SIZE",
+            "max_overflow": "DATABASE_MAX_OVERFLOW",
+            "pool_recycle": "DATABASE_POOL_RECYCLE",
+            "sqlite_busy_timeout": "SQLITE_BUSY_TIMEOUT",
+            "sqlite_mmap_size": "SQLITE_MMAP_SIZE",
+            "sqlite_cache_size": "SQLITE_CACHE_SIZE",
+            "slow_query_threshold": "SLOW_QUERY_THRESHOLD",
+        }
+
+        return cls(
+            **{
+                field: environ[variable]
+                for field, variable in variables.items()
+                if variable in environ
+            }
+        )
+
+
+def build_engine(settings: DatabaseSettings) -> Engine:
+    """
+    Create an engine from the settings.
+
+    File-based SQLite databases get WAL journaling and the tuning pragmas below
+    applied to every new connection, so concurrent workers do not serialize on
+    the rollback journal.
+    """
+
+    url = make_url(settings.url)
+    engine = create_engine(url, **_pool_options(url, settings))
+    _configure_sqlite(engine, url, settings)
+    instrument_queries(engine, settings.slow_query_threshold)
+    trace_engine(engine)
+
+    return engine
+
+
+def build_async_engine(settings: DatabaseSettings) -> AsyncEngine:
+    """
+    Create an asynchronous engine from the settings.
+    """
+
+    url = make_url(settings.async_url or settings.url)
+    backend = url.get_backend_name()
+    if settings.async_url is None and backend in ASYNC_DRIVERS:
+        url = url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+
+    engine = create_async_engine(url, **_pool_options(url, settings))
+    _configure_sqlite(engine.sync_engine, url, settings)
+    instrument_queries(engine.sync_engine, settings.slow_query_threshold)
+    trace_engine(engine.sync_engine)
+
+    return engine
+
+
+def _is_sqlite_memory(url: URL) -> bool:
+    """
+    Check if the URL points to an in-memory SQLite database.
+    """
+
+    return url.get_backend_name() == "sqlite" and url.database in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def _pool_options(url: URL, settings: DatabaseSettings) -> dict:
+    """
+    Return the pool options accepted by the engine of the given URL.
+    """
+
+    if _is_sqlite_memory(url):
+        return {}
+
+    return {
+        "pool_size": settings.pool_size,
+        "max_overflow": settings.max_overflow,
+        "pool_recycle": settings.pool_recycle,
+    }
+
+
+def _configure_sqlite(engine: Engine, url: URL, settings: DatabaseSettings) -> None:
+    """
+    Apply the SQLite pragmas to every new connection of a file-based database.
+    """
+
+    if url.get_backend_name() != "sqlite" or _is_sqlite_memory(url):
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={settings.sqlite_busy_timeout:d}")
+        cursor.execute(f"PRAGMA mmap_size={settings.sqlite_mmap_size:d}")
+        cursor.execute(f"PRAGMA cache_size={settings.sqlite_cache_size:d}")
+        cursor.close()
@@ -1,3 +1,4 @@
+from .notification_outbox import NotificationOutboxModel, OutboxStatus
 from .plan import PlanModel
 from .subscription import SubscriptionModel
 from .user_account import UserAccountModel
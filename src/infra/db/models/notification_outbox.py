@@ -0,0 +1,48 @@
+from datetime import datetime
+from enum import StrEnum
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import Index
+from sqlmodel import Field, SQLModel
+
+from src.domain._shared import uuid7
+
+
+class OutboxStatus(StrEnum):
+    """
+    Enum representing the delivery status of an outbox notification.
+
+    Attributes:
+        PENDING (str): Waiting to be delivered, possibly after a failed attempt.
+        DELIVERED (str): Delivered.
+        FAILED (str): Every delivery attempt failed.
+    """
+
+    PENDING = "PENDING"
+    DELIVERED = "DELIVERED"
+    FAILED = "FAILED"
+
+
+class NotificationOutboxModel(SQLModel, table=True):
+    """
+    Defines a model that represents a notification waiting in the outbox
+
+    The (status, available_at) index lets the dispatcher find the pending
+    notifications that are due without scanning delivered ones.
+    """
+
+    __tablename__ = "notification_outbox"  # type: ignore
+    __table_args__ = (
+        Index("ix_notification_outbox_status_available_at", "status", "available_at"),
+    )
+
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    message: str
+    recipient: Optional[str] = None
+    status: str = Field(default=OutboxStatus.PENDING)
+    attempts: int = Field(default=0)
+    last_error: Optional[str] = None
+    available_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=datetime.now)
+    delivered_at: Optional[datetime] = None
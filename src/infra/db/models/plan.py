@@ -2,6 +2,7 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 from src.domain._shared import Currency, MonetaryValue
@@ -14,6 +15,7 @@ class PlanModel(SQLModel, table=True):
     """
 
     __tablename__ = "plans"  # type: ignore
+    __table_args__ = (Index("ix_plans_created_at_id", "created_at", "id"),)
 
     id: UUID = Field(primary_key=True)
     name: str = Field(index=True, unique=True)
@@ -45,10 +47,10 @@ class PlanModel(SQLModel, table=True):
         Transform a Plan Model in a Plan Entity
         """
 
-        return Plan(
+        return Plan.hydrate(
             id=plan_model.id,
             name=plan_model.name,
-            price=MonetaryValue(
+            price=MonetaryValue.hydrate(
                 amount=plan_model.price_amount,
                 currency=Currency(plan_model.price_currency),
             ),
@@ -1,6 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, SQLModel
 
 from src.domain.entity import SubscriptionStatus
@@ -10,15 +11,37 @@ from src.domain.entity.subscription import Subscription
 class SubscriptionModel(SQLModel, table=True):
     """
     Defines a model that represents a subscription
+
+    The (user_id, status, end_date) index serves every per-user lookup, and the
+    partial unique index lets the database reject a second ACTIVE subscription
+    for the same user. The (created_at, id) indexes back the keyset-paginated
+    listings, with and without a plan filter.
     """
 
     __tablename__ = "subscriptions"  # type: ignore
+    __table_args__ = (
+        Index("ix_subscriptions_created_at_id", "created_at", "id"),
+        Index("ix_subscriptions_plan_id_created_at_id", "plan_id", "created_at", "id"),
+        Index(
+            "ix_subscriptions_user_id_status_end_date",
+            "user_id",
+            "status",
+            "end_date",
+        ),
+        Index(
+            "uq_subscriptions_active_user_id",
+            "user_id",
+            unique=True,
+            sqlite_where=text(f"status = '{SubscriptionStatus.ACTIVE}'"),
+            postgresql_where=text(f"status = '{SubscriptionStatus.ACTIVE}'"),
+        ),
+    )
 
     id: UUID = Field(primary_key=True)
-    user_id: UUID = Field(foreign_key="user_accounts.id", index=True)
-    plan_id: UUID = Field(foreign_key="plans.id", index=True)
+    user_id: UUID = Field(foreign_key="user_accounts.id")
+    plan_id: UUID = Field(foreign_key="plans.id")
     start_date: datetime
-    end_date: datetime
+    end_date: datetime = Field(index=True)
     is_trial: bool = Field(default=False)
     status: str = Field(default=SubscriptionStatus.ACTIVE)
     created_at: datetime = Field(default_factory=datetime.now)
@@ -49,7 +72,7 @@ class SubscriptionModel(SQLModel, table=True):
         Transform a Subscription Model in a Subscription Entity
         """
 
-        return Subscription(
+        return Subscription.hydrate(
             id=subscription_model.id,
             user_id=subscription_model.user_id,
             plan_id=subscription_model.plan_id,
@@ -59,4 +82,5 @@ class SubscriptionModel(SQLModel, table=True):
             is_trial=subscription_model.is_trial,
             created_at=subscription_model.created_at,
             updated_at=subscription_model.updated_at,
+            is_active=subscription_model.is_active,
         )
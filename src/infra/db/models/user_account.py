@@ -1,6 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 from src.domain.entity.user_account import Address, UserAccount
@@ -12,6 +13,7 @@ class UserAccountModel(SQLModel, table=True):
     """
 
     __tablename__ = "user_accounts"  # type: ignore
+    __table_args__ = (Index("ix_user_accounts_created_at_id", "created_at", "id"),)
 
     id: UUID = Field(primary_key=True)
     iam_user_id: str = Field(unique=True)
@@ -53,12 +55,12 @@ class UserAccountModel(SQLModel, table=True):
         Transform a User Account Model in a User Account Entity
         """
 
-        return UserAccount(
+        return UserAccount.hydrate(
             id=user_model.id,
             iam_user_id=user_model.iam_user_id,
             name=user_model.name,
             email=user_model.email,
-            billing_address=Address(
+            billing_address=Address.hydrate(
                 street=user_model.billing_address_street,
                 city=user_model.billing_address_city,
                 state=user_model.billing_address_state,
@@ -1,9 +1,24 @@
-from .sql_model_plan_repository import SQLModelPlanRepository
-from .sql_model_subscription_repository import SQLModelSubscriptionRepository
-from .sql_model_user_account_repository import SQLModelUserAccountRepository
+from .sql_model_plan_repository import (
+    AsyncSQLModelPlanRepository,
+    SQLModelPlanRepository,
+)
+from .sql_model_subscription_repository import (
+    AsyncSQLModelSubscriptionRepository,
+    SQLModelSubscriptionRepository,
+)
+from .sql_model_unit_of_work import AsyncSQLModelUnitOfWork, SQLModelUnitOfWork
+from .sql_model_user_account_repository import (
+    AsyncSQLModelUserAccountRepository,
+    SQLModelUserAccountRepository,
+)
 
 __all__ = [
+    "AsyncSQLModelPlanRepository",
+    "AsyncSQLModelSubscriptionRepository",
+    "AsyncSQLModelUnitOfWork",
+    "AsyncSQLModelUserAccountRepository",
     "SQLModelPlanRepository",
     "SQLModelUserAccountRepository",
     "SQLModelSubscriptionRepository",
+    "SQLModelUnitOfWork",
 ]
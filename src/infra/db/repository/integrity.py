@@ -0,0 +1,38 @@
+from typing import Any, Optional
+
+from sqlalchemy.exc import IntegrityError
+
+
+def _constraint_name(driver_error: Any) -> Optional[str]:
+    """
+    Get the name of the constraint a driver error reports, if any.
+    """
+
+    diag = getattr(driver_error, "diag", None)
+    if diag is not None and getattr(diag, "constraint_name", None):
+        return diag.constraint_name
+
+    for error in (driver_error, getattr(driver_error, "__cause__", None)):
+        name = getattr(error, "constraint_name", None)
+        if isinstance(name, str) and name:
+            return name
+
+    return None
+
+
+def is_unique_violation(error: IntegrityError, index: str, columns: str) -> bool:
+    """
+    Check if an integrity error comes from the given unique index, whose
+    columns are given as "table.column".
+
+    The index name is read from the driver's error details: psycopg exposes
+    it as `diag.constraint_name`, asyncpg as `constraint_name` on the error
+    SQLAlchemy's adapter wraps. SQLite reports neither, only a message naming
+    the index's columns, so that message is matched as a fallback.
+    """
+
+    constraint_name = _constraint_name(error.orig)
+    if constraint_name is not None:
+        return constraint_name == index
+
+    return f"UNIQUE constraint failed: {columns}" in str(error.orig)
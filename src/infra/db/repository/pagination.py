@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import Optional, Tuple, Type
+from uuid import UUID
+
+from sqlmodel import SQLModel, and_, col, or_, select
+from sqlmodel.sql.expression import SelectOfScalar
+
+
+def page_statement(
+    model: Type[SQLModel],
+    limit: int,
+    after: Optional[Tuple[datetime, UUID]] = None,
+    *filters,
+) -> SelectOfScalar:
+    """
+    Build a keyset-paginated query over a table ordered by (created_at, id).
+
+    Rows are located by seeking past the last key of the previous page instead
+    of skipping an offset, so every page costs the same whatever its depth.
+    """
+
+    created_at = col(getattr(model, "created_at"))
+    id_ = col(getattr(model, "id"))
+
+    statement = select(model).where(*filters)
+    if after is not None:
+        after_created_at, after_id = after
+        statement = statement.where(
+            or_(
+                created_at > after_created_at,
+                and_(created_at == after_created_at, id_ > after_id),
+            )
+        )
+
+    return statement.order_by(created_at, id_).limit(limit)
@@ -1,19 +1,43 @@
-from typing import Optional
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlalchemy import insert, update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.application.exceptions import DuplicatePlanError
 from src.domain.entity import Plan
-from src.domain.repository.plan import PlanRepository
+from src.domain.repository.plan import AsyncPlanRepository, PlanRepository
 from src.infra.db.models import PlanModel
+from src.infra.db.repository.integrity import is_unique_violation
+from src.infra.db.repository.pagination import page_statement
+from src.infra.metrics import instrument_repository
 
+PLAN_NAME_INDEX = "ix_plans_name"
 
+
+def _raise_if_duplicate_name(error: IntegrityError, plan: Plan) -> None:
+    """
+    Turn a violation of the unique plan name index into a DuplicatePlanError.
+    """
+
+    if is_unique_violation(error, PLAN_NAME_INDEX, "plans.name"):
+        raise DuplicatePlanError(
+            f"Plan with name '{plan.name}' already exists."
+        ) from error
+
+
+@instrument_repository
 class SQLModelPlanRepository(PlanRepository):
     """
     Class that represents a repository for plans.
     It implements the PlanRepository interface.
     """
 
+    IN_CLAUSE_CHUNK_SIZE = 500
+
     def __init__(self, session: Session):
         """
         Constructor
@@ -41,10 +65,124 @@ class SQLModelPlanRepository(PlanRepository):
 
     def save(self, plan: Plan) -> None:
         """
-        Save a plan.
+        Save a plan, flushing it so a name already taken is rejected here even
+        when a stale cache let it through.
         """
 
         model = PlanModel.from_entity(plan)
         self.session.add(model)
-        self.session.commit()
-        self.session.refresh(model)
+        try:
+            self.session.flush()
+        except IntegrityError as e:
+            _raise_if_duplicate_name(e, plan)
+            raise
+
+    def save_many(self, plans: Iterable[Plan]) -> None:
+        """
+        Save several plans with a single executemany INSERT.
+        """
+
+        rows = [PlanModel.from_entity(plan).model_dump() for plan in plans]
+        if rows:
+            self.session.exec(insert(PlanModel), params=rows)  # type: ignore
+
+    def get_many_by_ids(self, plan_ids: Iterable[UUID]) -> List[Plan]:
+        """
+        Get the plans matching the given IDs.
+        """
+
+        ids = list(set(plan_ids))
+        plans = []
+        for start in range(0, len(ids), self.IN_CLAUSE_CHUNK_SIZE):
+            chunk = ids[start : start + self.IN_CLAUSE_CHUNK_SIZE]
+            statement = select(PlanModel).where(col(PlanModel.id).in_(chunk))
+            plans.extend(
+                PlanModel.to_entity(result) for result in self.session.exec(statement)
+            )
+
+        return plans
+
+    def update_many(self, plans: Iterable[Plan]) -> None:
+        """
+        Update several plans with a single executemany UPDATE.
+        """
+
+        now = datetime.now()
+        rows = []
+        for plan in plans:
+            plan.updated_at = now
+            rows.append(PlanModel.from_entity(plan).model_dump(exclude={"created_at"}))
+
+        if rows:
+            self.session.exec(update(PlanModel), params=rows)  # type: ignore
+
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Plan]:
+        """
+        List plans ordered by creation date and ID.
+        """
+
+        statement = page_statement(PlanModel, limit, after)
+        return [PlanModel.to_entity(result) for result in self.session.exec(statement)]
+
+
+@instrument_repository
+class AsyncSQLModelPlanRepository(AsyncPlanRepository):
+    """
+    Class that represents an asynchronous repository for plans.
+    It implements the AsyncPlanRepository interface.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Constructor
+        """
+
+        self.session = session
+
+    async def get_by_id(self, plan_id: UUID) -> Optional[Plan]:
+        """
+        Get a plan by ID.
+        """
+
+        statement = select(PlanModel).where(PlanModel.id == plan_id)
+        result = (await self.session.exec(statement)).first()
+        return PlanModel.to_entity(result) if result else None
+
+    async def get_by_name(self, plan_name: str) -> Optional[Plan]:
+        """
+        Get a plan by name.
+        """
+
+        statement = select(PlanModel).where(PlanModel.name == plan_name)
+        result = (await self.session.exec(statement)).first()
+        return PlanModel.to_entity(result) if result else None
+
+    async def save(self, plan: Plan) -> None:
+        """
+        Save a plan, flushing it so a name already taken is rejected here.
+        """
+
+        model = PlanModel.from_entity(plan)
+        self.session.add(model)
+        try:
+            await self.session.flush()
+        except IntegrityError as e:
+            _raise_if_duplicate_name(e, plan)
+            raise
+
+    async def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Plan]:
+        """
+        List plans ordered by creation date and ID.
+        """
+
+        statement = page_statement(PlanModel, limit, after)
+        results = await self.session.exec(statement)
+        return [PlanModel.to_entity(result) for result in results]
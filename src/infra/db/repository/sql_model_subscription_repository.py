@@ -1,26 +1,217 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlalchemy import Update, event, insert, update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, and_, col, or_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.domain.entity import Subscription
-from src.domain.repository import SubscriptionRepository
-from src.infra.db.models import SubscriptionModel
+from src.application.exceptions import SubscriptionConflictError
+from src.domain.entity import Subscription, SubscriptionStatus
+from src.domain.repository import (
+    AsyncSubscribeContextLoader,
+    AsyncSubscriptionRepository,
+    SubscribeContext,
+    SubscribeContextLoader,
+    SubscriptionRepository,
+)
+from src.infra.db.models import SubscriptionModel, UserAccountModel
+from src.infra.db.repository.integrity import is_unique_violation
+from src.infra.db.repository.pagination import page_statement
+from src.infra.metrics import instrument_repository
 
+ACTIVE_SUBSCRIPTION_INDEX = "uq_subscriptions_active_user_id"
 
-class SQLModelSubscriptionRepository(SubscriptionRepository):
+
+class SubscriptionChangeTracker:
+    """
+    Remembers the mutable columns of every subscription a repository loads or
+    saves, so updates only write the columns that changed since.
+
+    Snapshots describe the rows as the current transaction sees them, so they
+    are all forgotten when the session's transaction ends: after a commit the
+    written rows no longer need tracking, and after a rollback, retrying an
+    update writes every mutable column again instead of being skipped as
+    unchanged. They are kept in the session's `info`, shared by every
+    repository of the session.
+    """
+
+    MUTABLE_COLUMNS = ("start_date", "end_date", "status", "is_trial", "is_active")
+    SNAPSHOTS_KEY = "subscription_snapshots"
+
+    _snapshots: Dict[UUID, Dict[str, Any]]
+
+    def _track_transactions(self, session: Session) -> None:
+        """
+        Use the snapshots of the session, and forget them whenever a
+        transaction or a savepoint of the session ends. The internal
+        subtransactions of a flush are ignored.
+
+        The listener is registered by the first repository of the session
+        only, and holds the snapshots rather than the repository.
+        """
+
+        snapshots = session.info.get(self.SNAPSHOTS_KEY)
+        if snapshots is None:
+            snapshots = session.info[self.SNAPSHOTS_KEY] = {}
+
+            def forget(session, transaction) -> None:
+                if transaction.parent is None or transaction.nested:
+                    snapshots.clear()
+
+            event.listen(session, "after_transaction_end", forget)
+
+        self._snapshots = snapshots
+
+    def _track(self, model: SubscriptionModel) -> Subscription:
+        """
+        Transform a model in an entity, remembering its mutable columns.
+        """
+
+        subscription = SubscriptionModel.to_entity(model)
+        self._snapshots[subscription.id] = self._snapshot(subscription)
+        return subscription
+
+    def _snapshot(self, subscription: Subscription) -> Dict[str, Any]:
+        """
+        Return the mutable column values of a subscription.
+        """
+
+        return {
+            column: getattr(subscription, column) for column in self.MUTABLE_COLUMNS
+        }
+
+    @staticmethod
+    def _active_by_user_id(user_id: UUID):
+        """
+        Build the query for the active subscription of a user.
+        """
+
+        return select(SubscriptionModel).where(
+            SubscriptionModel.user_id == user_id,
+            SubscriptionModel.status == SubscriptionStatus.ACTIVE,
+        )
+
+    @staticmethod
+    def _subscribe_context(user_id: UUID):
+        """
+        Build the query reading a user and the user's active subscription at
+        once.
+
+        The join is an outer join, so the user row comes back even when the
+        user has no active subscription.
+        """
+
+        return (
+            select(UserAccountModel, SubscriptionModel)
+            .select_from(UserAccountModel)
+            .outerjoin(
+                SubscriptionModel,
+                and_(
+                    col(SubscriptionModel.user_id) == col(UserAccountModel.id),
+                    col(SubscriptionModel.status) == SubscriptionStatus.ACTIVE,
+                ),
+            )
+            .where(UserAccountModel.id == user_id)
+        )
+
+    def _to_subscribe_context(self, row: Optional[Tuple]) -> SubscribeContext:
+        """
+        Build the subscribe context from a row of the subscribe context query.
+        """
+
+        if row is None:
+            return SubscribeContext()
+
+        user, subscription = row
+        return SubscribeContext(
+            user=UserAccountModel.to_entity(user),
+            active_subscription=self._track(subscription) if subscription else None,
+        )
+
+    @staticmethod
+    def _page(
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]],
+        user_id: Optional[UUID],
+        plan_id: Optional[UUID],
+        status: Optional[SubscriptionStatus],
+    ):
+        """
+        Build the keyset-paginated query for a page of subscriptions.
+        """
+
+        filters = []
+        if user_id is not None:
+            filters.append(SubscriptionModel.user_id == user_id)
+        if plan_id is not None:
+            filters.append(SubscriptionModel.plan_id == plan_id)
+        if status is not None:
+            filters.append(SubscriptionModel.status == status)
+
+        return page_statement(SubscriptionModel, limit, after, *filters)
+
+    @staticmethod
+    def _is_active_conflict(error: IntegrityError) -> bool:
+        """
+        Check if an integrity error comes from the one-active-subscription-per-
+        user index.
+        """
+
+        return is_unique_violation(
+            error, ACTIVE_SUBSCRIPTION_INDEX, "subscriptions.user_id"
+        )
+
+    def _update_statement(self, subscription: Subscription) -> Optional[Update]:
+        """
+        Build an UPDATE of the columns changed since the subscription was
+        tracked, or None when nothing changed.
+
+        Subscriptions that are not tracked have every mutable column written.
+        """
+
+        values = self._snapshot(subscription)
+        previous = self._snapshots.get(subscription.id)
+        if previous is not None:
+            values = {
+                column: value
+                for column, value in values.items()
+                if previous[column] != value
+            }
+            if not values:
+                return None
+
+        subscription.updated_at = datetime.now()
+        self._snapshots[subscription.id] = self._snapshot(subscription)
+        return (
+            update(SubscriptionModel)
+            .where(col(SubscriptionModel.id) == subscription.id)
+            .values(**values, updated_at=subscription.updated_at)
+        )
+
+
+@instrument_repository
+class SQLModelSubscriptionRepository(
+    SubscriptionChangeTracker,
+    SubscriptionRepository,
+    SubscribeContextLoader,
+):
     """
     Class that represents a repository for subscriptions.
-    It implements the SubscriptionRepository interface.
+    It implements the SubscriptionRepository and SubscribeContextLoader
+    interfaces.
     """
 
+    IN_CLAUSE_CHUNK_SIZE = 500
+
     def __init__(self, session: Session):
         """
         Constructor
         """
 
         self.session = session
+        self._track_transactions(session)
 
     def get_by_id(self, subscription_id: UUID) -> Optional[Subscription]:
         """
@@ -31,7 +222,7 @@ class SQLModelSubscriptionRepository(SubscriptionRepository):
             SubscriptionModel.id == subscription_id
         )
         result = self.session.exec(statement).first()
-        return SubscriptionModel.to_entity(result) if result else None
+        return self._track(result) if result else None
 
     def get_by_user_id(self, user_id: UUID) -> Optional[Subscription]:
         """
@@ -42,7 +233,23 @@ class SQLModelSubscriptionRepository(SubscriptionRepository):
             SubscriptionModel.user_id == user_id
         )
         result = self.session.exec(statement).first()
-        return SubscriptionModel.to_entity(result) if result else None
+        return self._track(result) if result else None
+
+    def get_active_by_user_id(self, user_id: UUID) -> Optional[Subscription]:
+        """
+        Get the active subscription of a user with a single index probe.
+        """
+
+        result = self.session.exec(self._active_by_user_id(user_id)).first()
+        return self._track(result) if result else None
+
+    def load_subscribe_context(self, user_id: UUID) -> SubscribeContext:
+        """
+        Load the user and the user's active subscription with a single query.
+        """
+
+        statement = self._subscribe_context(user_id)
+        return self._to_subscribe_context(self.session.exec(statement).first())
 
     def get_by_plan_id(self, plan_id: UUID) -> Optional[Subscription]:
         """
@@ -53,7 +260,7 @@ class SQLModelSubscriptionRepository(SubscriptionRepository):
             SubscriptionModel.plan_id == plan_id
         )
         result = self.session.exec(statement).first()
-        return SubscriptionModel.to_entity(result) if result else None
+        return self._track(result) if result else None
 
     def get_by_user_id_and_plan_id(
         self,
@@ -69,22 +276,269 @@ class SQLModelSubscriptionRepository(SubscriptionRepository):
             SubscriptionModel.user_id == user_id,
         )
         result = self.session.exec(statement).first()
-        return SubscriptionModel.to_entity(result) if result else None
+        return self._track(result) if result else None
+
+    def iter_due(
+        self,
+        before: datetime,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> Iterator[Subscription]:
+        """
+        Iterate over active subscriptions ending before the given date,
+        ordered by end date and ID.
+        """
+
+        statement = (
+            select(SubscriptionModel)
+            .where(
+                SubscriptionModel.end_date < before,
+                SubscriptionModel.status == SubscriptionStatus.ACTIVE,
+            )
+            .order_by(col(SubscriptionModel.end_date), col(SubscriptionModel.id))
+            .limit(limit)
+        )
+        if after is not None:
+            after_end_date, after_id = after
+            statement = statement.where(
+                or_(
+                    SubscriptionModel.end_date > after_end_date,
+                    and_(
+                        SubscriptionModel.end_date == after_end_date,
+                        col(SubscriptionModel.id) > after_id,
+                    ),
+                )
+            )
+        for result in self.session.exec(statement):
+            yield self._track(result)
 
     def save(self, subscription: Subscription) -> None:
         """
-        Save a subscription.
+        Save a subscription, flushing it so a second active subscription for
+        the same user is rejected here rather than at commit.
         """
 
         subscription.updated_at = datetime.now()
         model = SubscriptionModel.from_entity(subscription)
         self.session.add(model)
-        self.session.commit()
-        self.session.refresh(model)
+        try:
+            self.session.flush()
+        except IntegrityError as e:
+            if self._is_active_conflict(e):
+                raise SubscriptionConflictError(
+                    "User already has active subscription"
+                ) from e
+            raise
+
+        self._snapshots[subscription.id] = self._snapshot(subscription)
+
+    def save_many(self, subscriptions: Iterable[Subscription]) -> None:
+        """
+        Save several subscriptions with a single executemany INSERT.
+        """
+
+        now = datetime.now()
+        rows = []
+        for subscription in subscriptions:
+            subscription.updated_at = now
+            rows.append(SubscriptionModel.from_entity(subscription).model_dump())
+
+        if rows:
+            self.session.exec(insert(SubscriptionModel), params=rows)  # type: ignore
+
+    def get_many_by_ids(self, subscription_ids: Iterable[UUID]) -> List[Subscription]:
+        """
+        Get the subscriptions matching the given IDs.
+        """
+
+        ids = list(set(subscription_ids))
+        subscriptions = []
+        for start in range(0, len(ids), self.IN_CLAUSE_CHUNK_SIZE):
+            chunk = ids[start : start + self.IN_CLAUSE_CHUNK_SIZE]
+            statement = select(SubscriptionModel).where(
+                col(SubscriptionModel.id).in_(chunk)
+            )
+            subscriptions.extend(
+                self._track(result) for result in self.session.exec(statement)
+            )
+
+        return subscriptions
 
     def update(self, subscription: Subscription):
         """
-        Update a subscription.
+        Update a subscription with a single UPDATE of its changed columns.
+        """
+
+        statement = self._update_statement(subscription)
+        if statement is not None:
+            self.session.exec(statement)  # type: ignore
+
+    def update_many(self, subscriptions: Iterable[Subscription]) -> None:
+        """
+        Update several subscriptions with a single executemany UPDATE.
+        """
+
+        now = datetime.now()
+        rows = []
+        for subscription in subscriptions:
+            subscription.updated_at = now
+            self._snapshots.pop(subscription.id, None)
+            rows.append(
+                {
+                    "id": subscription.id,
+                    **self._snapshot(subscription),
+                    "updated_at": subscription.updated_at,
+                }
+            )
+
+        if not rows:
+            return
+
+        self.session.exec(update(SubscriptionModel), params=rows)  # type: ignore
+
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        user_id: Optional[UUID] = None,
+        plan_id: Optional[UUID] = None,
+        status: Optional[SubscriptionStatus] = None,
+    ) -> List[Subscription]:
+        """
+        List subscriptions ordered by creation date and ID.
+        """
+
+        statement = self._page(limit, after, user_id, plan_id, status)
+        return [self._track(result) for result in self.session.exec(statement)]
+
+
+@instrument_repository
+class AsyncSQLModelSubscriptionRepository(
+    SubscriptionChangeTracker,
+    AsyncSubscriptionRepository,
+    AsyncSubscribeContextLoader,
+):
+    """
+    Class that represents an asynchronous repository for subscriptions.
+    It implements the AsyncSubscriptionRepository and
+    AsyncSubscribeContextLoader interfaces.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Constructor
+        """
+
+        self.session = session
+        self._track_transactions(session.sync_session)
+
+    async def get_by_id(self, subscription_id: UUID) -> Optional[Subscription]:
+        """
+        Get a subscription by ID.
+        """
+
+        statement = select(SubscriptionModel).where(
+            SubscriptionModel.id == subscription_id
+        )
+        result = (await self.session.exec(statement)).first()
+        return self._track(result) if result else None
+
+    async def get_by_user_id(self, user_id: UUID) -> Optional[Subscription]:
+        """
+        Get a subscription by user ID.
+        """
+
+        statement = select(SubscriptionModel).where(
+            SubscriptionModel.user_id == user_id
+        )
+        result = (await self.session.exec(statement)).first()
+        return self._track(result) if result else None
+
+    async def get_active_by_user_id(self, user_id: UUID) -> Optional[Subscription]:
+        """
+        Get the active subscription of a user with a single index probe.
+        """
+
+        result = (await self.session.exec(self._active_by_user_id(user_id))).first()
+        return self._track(result) if result else None
+
+    async def load_subscribe_context(self, user_id: UUID) -> SubscribeContext:
+        """
+        Load the user and the user's active subscription with a single query.
+        """
+
+        statement = self._subscribe_context(user_id)
+        result = await self.session.exec(statement)
+        return self._to_subscribe_context(result.first())
+
+    async def get_by_plan_id(self, plan_id: UUID) -> Optional[Subscription]:
+        """
+        Get a subscription by plan ID.
+        """
+
+        statement = select(SubscriptionModel).where(
+            SubscriptionModel.plan_id == plan_id
+        )
+        result = (await self.session.exec(statement)).first()
+        return self._track(result) if result else None
+
+    async def get_by_user_id_and_plan_id(
+        self,
+        user_id: UUID,
+        plan_id: UUID,
+    ) -> Optional[Subscription]:
+        """
+        Get a subscription by user ID and plan ID.
+        """
+
+        statement = select(SubscriptionModel).where(
+            SubscriptionModel.plan_id == plan_id,
+            SubscriptionModel.user_id == user_id,
+        )
+        result = (await self.session.exec(statement)).first()
+        return self._track(result) if result else None
+
+    async def save(self, subscription: Subscription) -> None:
+        """
+        Save a subscription, flushing it so a second active subscription for
+        the same user is rejected here rather than at commit.
+        """
+
+        subscription.updated_at = datetime.now()
+        model = SubscriptionModel.from_entity(subscription)
+        self.session.add(model)
+        try:
+            await self.session.flush()
+        except IntegrityError as e:
+            if self._is_active_conflict(e):
+                raise SubscriptionConflictError(
+                    "User already has active subscription"
+                ) from e
+            raise
+
+        self._snapshots[subscription.id] = self._snapshot(subscription)
+
+    async def update(self, subscription: Subscription):
+        """
+        Update a subscription with a single UPDATE of its changed columns.
+        """
+
+        statement = self._update_statement(subscription)
+        if statement is not None:
+            await self.session.exec(statement)  # type: ignore
+
+    async def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        user_id: Optional[UUID] = None,
+        plan_id: Optional[UUID] = None,
+        status: Optional[SubscriptionStatus] = None,
+    ) -> List[Subscription]:
+        """
+        List subscriptions ordered by creation date and ID.
         """
 
-        raise NotImplementedError
+        statement = self._page(limit, after, user_id, plan_id, status)
+        results = await self.session.exec(statement)
+        return [self._track(result) for result in results]
@@ -0,0 +1,69 @@
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.domain.repository import AsyncUnitOfWork, UnitOfWork
+from src.infra.metrics import instrument_repository
+
+
+@instrument_repository
+class SQLModelUnitOfWork(UnitOfWork):
+    """
+    Class that represents a unit of work over a SQLModel session.
+    It implements the UnitOfWork interface.
+    """
+
+    def __init__(self, session: Session):
+        """
+        Constructor
+        """
+
+        super().__init__()
+        self.session = session
+
+    def commit(self) -> None:
+        """
+        Commit the session transaction.
+        """
+
+        self.session.commit()
+        self._committed()
+
+    def rollback(self) -> None:
+        """
+        Roll back the session transaction.
+        """
+
+        self.session.rollback()
+        self._rolled_back()
+
+
+@instrument_repository
+class AsyncSQLModelUnitOfWork(AsyncUnitOfWork):
+    """
+    Class that represents a unit of work over an asynchronous SQLModel session.
+    It implements the AsyncUnitOfWork interface.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Constructor
+        """
+
+        super().__init__()
+        self.session = session
+
+    async def commit(self) -> None:
+        """
+        Commit the session transaction.
+        """
+
+        await self.session.commit()
+        self._committed()
+
+    async def rollback(self) -> None:
+        """
+        Roll back the session transaction.
+        """
+
+        await self.session.rollback()
+        self._rolled_back()
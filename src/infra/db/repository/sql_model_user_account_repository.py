@@ -1,19 +1,27 @@
-from typing import Optional
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlalchemy import insert, update
+from sqlmodel import Session, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.domain.entity import UserAccount
-from src.domain.repository import UserAccountRepository
+from src.domain.repository import AsyncUserAccountRepository, UserAccountRepository
 from src.infra.db.models import UserAccountModel
+from src.infra.db.repository.pagination import page_statement
+from src.infra.metrics import instrument_repository
 
 
+@instrument_repository
 class SQLModelUserAccountRepository(UserAccountRepository):
     """
     Class that represents a repository for user accounts.
     It implements the UserAccountRepository interface.
     """
 
+    IN_CLAUSE_CHUNK_SIZE = 500
+
     def __init__(self, session: Session):
         """
         Constructor
@@ -39,6 +47,25 @@ class SQLModelUserAccountRepository(UserAccountRepository):
         result = self.session.exec(statement).first()
         return UserAccountModel.to_entity(result) if result else None
 
+    def get_many_by_ids(self, user_ids: Iterable[UUID]) -> List[UserAccount]:
+        """
+        Get the user accounts matching the given IDs.
+        """
+
+        ids = list(set(user_ids))
+        user_accounts = []
+        for start in range(0, len(ids), self.IN_CLAUSE_CHUNK_SIZE):
+            chunk = ids[start : start + self.IN_CLAUSE_CHUNK_SIZE]
+            statement = select(UserAccountModel).where(
+                col(UserAccountModel.id).in_(chunk)
+            )
+            user_accounts.extend(
+                UserAccountModel.to_entity(result)
+                for result in self.session.exec(statement)
+            )
+
+        return user_accounts
+
     def save(self, user_account: UserAccount) -> None:
         """
         Save a user account.
@@ -46,5 +73,93 @@ class SQLModelUserAccountRepository(UserAccountRepository):
 
         model = UserAccountModel.from_entity(user_account)
         self.session.add(model)
-        self.session.commit()
-        self.session.refresh(model)
+
+    def save_many(self, user_accounts: Iterable[UserAccount]) -> None:
+        """
+        Save several user accounts with a single executemany INSERT.
+        """
+
+        rows = [
+            UserAccountModel.from_entity(user_account).model_dump()
+            for user_account in user_accounts
+        ]
+        if rows:
+            self.session.exec(insert(UserAccountModel), params=rows)  # type: ignore
+
+    def update_many(self, user_accounts: Iterable[UserAccount]) -> None:
+        """
+        Update several user accounts with a single executemany UPDATE.
+        """
+
+        now = datetime.now()
+        rows = []
+        for user_account in user_accounts:
+            user_account.updated_at = now
+            rows.append(
+                UserAccountModel.from_entity(user_account).model_dump(
+                    exclude={"created_at"}
+                )
+            )
+
+        if rows:
+            self.session.exec(update(UserAccountModel), params=rows)  # type: ignore
+
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[UserAccount]:
+        """
+        List user accounts ordered by creation date and ID.
+        """
+
+        statement = page_statement(UserAccountModel, limit, after)
+        return [
+            UserAccountModel.to_entity(result)
+            for result in self.session.exec(statement)
+        ]
+
+
+@instrument_repository
+class AsyncSQLModelUserAccountRepository(AsyncUserAccountRepository):
+    """
+    Class that represents an asynchronous repository for user accounts.
+    It implements the AsyncUserAccountRepository interface.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Constructor
+        """
+
+        self.session = session
+
+    async def get_by_id(self, user_id: UUID) -> Optional[UserAccount]:
+        """
+        Get a user account by ID.
+        """
+
+        statement = select(UserAccountModel).where(UserAccountModel.id == user_id)
+        result = (await self.session.exec(statement)).first()
+        return UserAccountModel.to_entity(result) if result else None
+
+    async def save(self, user_account: UserAccount) -> None:
+        """
+        Save a user account.
+        """
+
+        model = UserAccountModel.from_entity(user_account)
+        self.session.add(model)
+
+    async def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[UserAccount]:
+        """
+        List user accounts ordered by creation date and ID.
+        """
+
+        statement = page_statement(UserAccountModel, limit, after)
+        results = await self.session.exec(statement)
+        return [UserAccountModel.to_entity(result) for result in results]
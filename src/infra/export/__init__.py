@@ -0,0 +1,19 @@
+from .subscription_export import (
+    EXPORT_COLUMNS,
+    ExportFormat,
+    export_statement,
+    iter_csv,
+    iter_export_rows,
+    iter_ndjson,
+    stream_export,
+)
+
+__all__ = [
+    "EXPORT_COLUMNS",
+    "ExportFormat",
+    "export_statement",
+    "iter_csv",
+    "iter_export_rows",
+    "iter_ndjson",
+    "stream_export",
+]
@@ -0,0 +1,177 @@
+import csv
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+from enum import StrEnum
+from typing import Any, Callable, Iterable, Iterator, Sequence, Tuple
+
+from sqlmodel import Session, col, select
+from sqlmodel.sql.expression import SelectOfScalar
+
+from src.infra.db.models import PlanModel, SubscriptionModel, UserAccountModel
+
+CENT = Decimal("0.01")
+
+EXPORT_COLUMNS: Tuple[str, ...] = (
+    "subscription_id",
+    "user_id",
+    "user_email",
+    "plan_id",
+    "plan_name",
+    "price_amount",
+    "price_currency",
+    "status",
+    "is_trial",
+    "start_date",
+    "end_date",
+    "created_at",
+    "updated_at",
+)
+
+
+class ExportFormat(StrEnum):
+    """
+    Enum representing the formats a subscription export can be written in.
+
+    Attributes:
+        NDJSON (str): One JSON object per line.
+        CSV (str): Comma-separated values with a header row.
+    """
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        """
+        Return the media type of the format.
+        """
+
+        return {
+            ExportFormat.NDJSON: "application/x-ndjson",
+            ExportFormat.CSV: "text/csv",
+        }[self]
+
+
+def export_statement() -> SelectOfScalar:
+    """
+    Build the query of the export: every subscription with the price of its
+    plan and the email of its user, in (created_at, id) order.
+
+    Outer joins keep subscriptions whose plan or user account is missing.
+    """
+
+    return (
+        select(
+            SubscriptionModel.id,
+            SubscriptionModel.user_id,
+            UserAccountModel.email,
+            SubscriptionModel.plan_id,
+            PlanModel.name,
+            PlanModel.price_amount,
+            PlanModel.price_currency,
+            SubscriptionModel.status,
+            SubscriptionModel.is_trial,
+            SubscriptionModel.start_date,
+            SubscriptionModel.end_date,
+            SubscriptionModel.created_at,
+            SubscriptionModel.updated_at,
+        )
+        .outerjoin(PlanModel, col(PlanModel.id) == col(SubscriptionModel.plan_id))
+        .outerjoin(
+            UserAccountModel,
+            col(UserAccountModel.id) == col(SubscriptionModel.user_id),
+        )
+        .order_by(col(SubscriptionModel.created_at), col(SubscriptionModel.id))
+    )
+
+
+def iter_export_rows(
+    session: Session,
+    batch_size: int = 1000,
+) -> Iterator[Sequence[Any]]:
+    """
+    Iterate over the rows of the export.
+
+    Rows are fetched through a server-side cursor `batch_size` at a time, so
+    only one batch is held in memory whatever the size of the table.
+    """
+
+    statement = export_statement().execution_options(yield_per=batch_size)
+    yield from session.exec(statement)  # type: ignore
+
+
+def _serialize(value: Any) -> Any:
+    """
+    Convert a column value to its JSON/CSV representation.
+    """
+
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        # Amounts come back padded to the column scale; keep at least cents.
+        value = value.normalize()
+        return str(value.quantize(CENT) if value.as_tuple().exponent > -2 else value)
+
+    return str(value)
+
+
+def iter_ndjson(rows: Iterable[Sequence[Any]], batch_size: int = 1000) -> Iterator[str]:
+    """
+    Encode rows as NDJSON, yielding one chunk per `batch_size` rows.
+    """
+
+    lines = []
+    for row in rows:
+        record = dict(zip(EXPORT_COLUMNS, map(_serialize, row)))
+        lines.append(json.dumps(record, separators=(",", ":")) + "\n")
+        if len(lines) >= batch_size:
+            yield "".join(lines)
+            lines.clear()
+
+    if lines:
+        yield "".join(lines)
+
+
+def iter_csv(rows: Iterable[Sequence[Any]], batch_size: int = 1000) -> Iterator[str]:
+    """
+    Encode rows as CSV with a header row, yielding one chunk per `batch_size`
+    rows.
+    """
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+
+    pending = 0
+    for row in rows:
+        writer.writerow(map(_serialize, row))
+        pending += 1
+        if pending >= batch_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    yield buffer.getvalue()
+
+
+def stream_export(
+    session_factory: Callable[[], Session],
+    export_format: ExportFormat,
+    batch_size: int = 1000,
+) -> Iterator[str]:
+    """
+    Stream the export in the given format.
+
+    The session is opened when iteration starts and closed when it ends, so
+    the generator can outlive the request that created it.
+    """
+
+    encoders = {ExportFormat.NDJSON: iter_ndjson, ExportFormat.CSV: iter_csv}
+    with session_factory() as session:
+        rows = iter_export_rows(session, batch_size)
+        yield from encoders[export_format](rows, batch_size)
@@ -0,0 +1,49 @@
+from .instrument import (
+    EXTERNAL_CALL_SECONDS,
+    HTTP_REQUEST_DB_SECONDS,
+    HTTP_REQUEST_QUERIES,
+    HTTP_REQUEST_SECONDS,
+    REPOSITORY_SECONDS,
+    USE_CASE_DB_SECONDS,
+    USE_CASE_QUERIES,
+    USE_CASE_SECONDS,
+    counted,
+    instrument_client,
+    instrument_repository,
+    instrument_use_case,
+    instrumented,
+    metrics,
+    timed,
+)
+from .query_stats import QueryStats, instrument_queries, track_queries
+from .registry import (
+    DEFAULT_BUCKETS,
+    QUERY_COUNT_BUCKETS,
+    Histogram,
+    MetricsRegistry,
+)
+
+__all__ = [
+    "counted",
+    "DEFAULT_BUCKETS",
+    "EXTERNAL_CALL_SECONDS",
+    "Histogram",
+    "HTTP_REQUEST_DB_SECONDS",
+    "HTTP_REQUEST_QUERIES",
+    "HTTP_REQUEST_SECONDS",
+    "instrument_client",
+    "instrument_queries",
+    "instrument_repository",
+    "instrument_use_case",
+    "instrumented",
+    "metrics",
+    "MetricsRegistry",
+    "QUERY_COUNT_BUCKETS",
+    "QueryStats",
+    "REPOSITORY_SECONDS",
+    "timed",
+    "track_queries",
+    "USE_CASE_DB_SECONDS",
+    "USE_CASE_QUERIES",
+    "USE_CASE_SECONDS",
+]
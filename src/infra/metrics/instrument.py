@@ -0,0 +1,217 @@
+import functools
+import inspect
+from time import perf_counter
+from typing import Callable, Iterable, Optional, TypeVar
+
+from src.infra.metrics.query_stats import QueryStats, track_queries
+from src.infra.metrics.registry import QUERY_COUNT_BUCKETS, Histogram, MetricsRegistry
+from src.infra.tracing import Span, tracer
+
+ClassType = TypeVar("ClassType", bound=type)
+
+metrics = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = "http_request_duration_seconds"
+USE_CASE_SECONDS = "use_case_duration_seconds"
+REPOSITORY_SECONDS = "repository_call_duration_seconds"
+EXTERNAL_CALL_SECONDS = "external_call_duration_seconds"
+HTTP_REQUEST_QUERIES = "http_request_queries"
+HTTP_REQUEST_DB_SECONDS = "http_request_db_duration_seconds"
+USE_CASE_QUERIES = "use_case_queries"
+USE_CASE_DB_SECONDS = "use_case_db_duration_seconds"
+
+HELP = {
+    HTTP_REQUEST_SECONDS: "Latency of the HTTP requests, per route.",
+    USE_CASE_SECONDS: "Latency of the use case executions.",
+    REPOSITORY_SECONDS: "Latency of the repository and unit of work methods.",
+    EXTERNAL_CALL_SECONDS: "Latency of the calls to external services.",
+    HTTP_REQUEST_QUERIES: "Statements executed per HTTP request, per route.",
+    HTTP_REQUEST_DB_SECONDS: "Time spent in the database per HTTP request.",
+    USE_CASE_QUERIES: "Statements executed per use case execution.",
+    USE_CASE_DB_SECONDS: "Time spent in the database per use case execution.",
+}
+
+
+def timed(
+    func: Callable,
+    histogram: Histogram,
+    span_name: Optional[str] = None,
+) -> Callable:
+    """
+    Wrap a function or coroutine function so every call is recorded in the
+    histogram, whether it returns or raises.
+
+    With a span name, calls made inside a trace are also recorded as spans.
+    """
+
+    observe = histogram.observe
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            span = tracer.start_span(span_name) if span_name else None
+            started_at = perf_counter()
+            error = None
+            try:
+                result = await func(*args, **kwargs)
+                if span is not None:
+                    _record_result(span, result)
+                return result
+            except BaseException as exc:
+                error = exc
+                raise
+            finally:
+                observe(perf_counter() - started_at)
+                if span is not None:
+                    tracer.end_span(span, error)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        span = tracer.start_span(span_name) if span_name else None
+        started_at = perf_counter()
+        error = None
+        try:
+            result = func(*args, **kwargs)
+            if span is not None:
+                _record_result(span, result)
+            return result
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            observe(perf_counter() - started_at)
+            if span is not None:
+                tracer.end_span(span, error)
+
+    return wrapper
+
+
+def _record_result(span: Span, result) -> None:
+    """
+    Record the number of rows returned by a call that returns a list.
+    """
+
+    if isinstance(result, list):
+        span.set("rows", len(result))
+
+
+def instrumented(
+    metric: str,
+    methods: Optional[Iterable[str]] = None,
+    **labels: str,
+) -> Callable[[ClassType], ClassType]:
+    """
+    Class decorator recording the latency of the methods of a class, and
+    tracing their calls as "<Class>.<method>" spans.
+
+    Only the given methods are timed, or every public method defined by the
+    class itself when none are given. Generator methods are left alone, since
+    their call returns before any work is done. Each method gets its own
+    histogram, labelled with the class and method names, resolved once here so
+    a call only pays for the observation.
+    """
+
+    def decorate(cls: ClassType) -> ClassType:
+        names = methods or [
+            name
+            for name, value in vars(cls).items()
+            if not name.startswith("_")
+            and inspect.isfunction(value)
+            and not inspect.isgeneratorfunction(value)
+        ]
+        for name in names:
+            histogram = metrics.histogram(
+                metric,
+                HELP.get(metric, ""),
+                **labels,
+                **{"class": cls.__name__, "method": name},
+            )
+            setattr(
+                cls,
+                name,
+                timed(vars(cls)[name], histogram, f"{cls.__name__}.{name}"),
+            )
+
+        return cls
+
+    return decorate
+
+
+def counted(func: Callable, queries: Histogram, db_seconds: Histogram) -> Callable:
+    """
+    Wrap a function or coroutine function so the statements executed by every
+    call are counted and timed, and recorded on the active span.
+    """
+
+    def record(stats: QueryStats) -> None:
+        queries.observe(stats.count)
+        db_seconds.observe(stats.seconds)
+        span = tracer.current_span()
+        if span is not None:
+            span.set("db.queries", stats.count)
+            span.set("db.seconds", stats.seconds)
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with track_queries() as stats:
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    record(stats)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with track_queries() as stats:
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(stats)
+
+    return wrapper
+
+
+def instrument_use_case(cls: ClassType) -> ClassType:
+    """
+    Record the latency of the `execute` method of a use case, and the number
+    of statements it executes.
+    """
+
+    labels = {"class": cls.__name__}
+    cls.execute = counted(
+        vars(cls)["execute"],
+        metrics.histogram(
+            USE_CASE_QUERIES,
+            HELP[USE_CASE_QUERIES],
+            buckets=QUERY_COUNT_BUCKETS,
+            **labels,
+        ),
+        metrics.histogram(USE_CASE_DB_SECONDS, HELP[USE_CASE_DB_SECONDS], **labels),
+    )
+    return instrumented(USE_CASE_SECONDS, methods=["execute"])(cls)
+
+
+def instrument_repository(cls: ClassType) -> ClassType:
+    """
+    Record the latency of the public methods of a repository or unit of work.
+
+    Generator methods, such as `iter_due`, are not instrumented: their call
+    returns before any query runs, and the rows are read as the caller
+    iterates.
+    """
+
+    return instrumented(REPOSITORY_SECONDS)(cls)
+
+
+def instrument_client(service: str) -> Callable[[ClassType], ClassType]:
+    """
+    Record the latency of the public methods of an external service client.
+    """
+
+    return instrumented(EXTERNAL_CALL_SECONDS, service=service)
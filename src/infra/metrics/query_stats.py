@@ -0,0 +1,115 @@
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Iterator, Optional
+
+from sqlalchemy import Engine, event
+
+logger = logging.getLogger(__name__)
+
+_STARTED_AT_KEY = "query_started_at"
+
+
+class QueryStats:
+    """
+    Number of statements executed, and time spent in the database, during a
+    unit of work such as a request or a use case execution.
+
+    Attributes:
+        count (int): Statements executed.
+        seconds (float): Total execution time of the statements.
+        parent (Optional[QueryStats]): Stats of the enclosing unit of work, to
+            which every statement is also counted.
+    """
+
+    __slots__ = ("count", "seconds", "parent")
+
+    def __init__(self, parent: Optional["QueryStats"] = None) -> None:
+        """
+        Initialize empty stats.
+        """
+
+        self.count = 0
+        self.seconds = 0.0
+        self.parent = parent
+
+    def record(self, seconds: float) -> None:
+        """
+        Count a statement here and in every enclosing stats.
+        """
+
+        stats: Optional[QueryStats] = self
+        while stats is not None:
+            stats.count += 1
+            stats.seconds += seconds
+            stats = stats.parent
+
+
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Count the statements executed inside the block, including those of the
+    threads it starts with asyncio.to_thread.
+    """
+
+    stats = QueryStats(_query_stats.get())
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+def instrument_queries(engine: Engine, slow_query_threshold: float) -> None:
+    """
+    Time every statement executed by the engine, counting it in the active
+    query stats and logging it with its parameters when it takes at least
+    `slow_query_threshold` seconds.
+
+    Async engines are instrumented through their `sync_engine`.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_STARTED_AT_KEY, []).append(perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def stop_timer(conn, cursor, statement, parameters, context, executemany):
+        started_at = conn.info.get(_STARTED_AT_KEY)
+        if not started_at:
+            return
+
+        elapsed = perf_counter() - started_at.pop()
+        stats = _query_stats.get()
+        if stats is not None:
+            stats.record(elapsed)
+        if elapsed >= slow_query_threshold:
+            logger.warning(
+                "Slow query (%.1f ms): %s; parameters: %s",
+                elapsed * 1000,
+                statement,
+                _format_parameters(parameters, executemany),
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def discard_timer(exception_context):
+        connection = exception_context.connection
+        started_at = connection.info.get(_STARTED_AT_KEY) if connection else None
+        if started_at:
+            started_at.pop()
+
+
+def _format_parameters(parameters, executemany: bool) -> str:
+    """
+    Format the parameters of a statement for the log, keeping only the first
+    set of an executemany batch.
+    """
+
+    if executemany and len(parameters) > 1:
+        return f"{parameters[0]!r} (and {len(parameters) - 1} more sets)"
+
+    return repr(parameters)
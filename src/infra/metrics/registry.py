@@ -0,0 +1,208 @@
+import threading
+import weakref
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+QUERY_COUNT_BUCKETS: Tuple[float, ...] = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """
+    Histogram with fixed bucket upper bounds, in seconds for latencies.
+
+    Every thread records into its own shard of counters, so observations need
+    no lock: one costs a binary search and two additions. Shards are summed,
+    and counts made cumulative, only when the histogram is read.
+
+    Short-lived worker threads would otherwise leave a shard each behind, so
+    the shards of threads that have ended are folded into a single retired
+    shard whenever a shard is added or the histogram is read.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """
+        Initialize an empty histogram.
+        """
+
+        self.buckets = tuple(buckets)
+        self._local = threading.local()
+        self._shards: List[Tuple[weakref.ref, List]] = []
+        self._retired: List = [[0] * (len(self.buckets) + 1), 0.0]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """
+        Record an observation.
+        """
+
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+
+        shard[0][bisect_left(self.buckets, value)] += 1
+        shard[1] += value
+
+    def _new_shard(self) -> List:
+        """
+        Create the shard of the calling thread.
+        """
+
+        shard = [[0] * (len(self.buckets) + 1), 0.0]
+        with self._lock:
+            self._retire_dead_shards()
+            self._shards.append((weakref.ref(threading.current_thread()), shard))
+        self._local.shard = shard
+        return shard
+
+    def _retire_dead_shards(self) -> None:
+        """
+        Fold the shards of ended threads into the retired shard. A thread that
+        has ended cannot record into its shard any more, so nothing is lost.
+        Must be called with the lock held.
+        """
+
+        alive = []
+        for thread_ref, shard in self._shards:
+            thread = thread_ref()
+            if thread is not None and thread.is_alive():
+                alive.append((thread_ref, shard))
+                continue
+
+            for i, count in enumerate(shard[0]):
+                self._retired[0][i] += count
+            self._retired[1] += shard[1]
+
+        self._shards = alive
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        """
+        Return the per-bucket counts (the last one being +Inf) and the sum of
+        the observations.
+        """
+
+        with self._lock:
+            self._retire_dead_shards()
+            counts = list(self._retired[0])
+            total = self._retired[1]
+            shards = [shard for _, shard in self._shards]
+
+        for shard_counts, shard_total in shards:
+            for i, count in enumerate(shard_counts):
+                counts[i] += count
+            total += shard_total
+
+        return counts, total
+
+
+class MetricsRegistry:
+    """
+    Registry of the latency histograms of the process, keyed by metric name and
+    labels.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty registry.
+        """
+
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self._help: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def histogram(
+        self,
+        name: str,
+        help: str = "",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        **labels: str,
+    ) -> Histogram:
+        """
+        Return the histogram of the given name and labels, creating it on first
+        use with the given bucket upper bounds.
+        """
+
+        key = tuple(sorted(labels.items()))
+        histogram = self._histograms.get(name, {}).get(key)
+        if histogram is not None:
+            return histogram
+
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            self._help.setdefault(name, help)
+            return series.setdefault(key, Histogram(buckets))
+
+    def clear(self) -> None:
+        """
+        Drop every histogram.
+        """
+
+        with self._lock:
+            self._histograms.clear()
+            self._help.clear()
+
+    def render(self) -> str:
+        """
+        Render every histogram in the Prometheus text exposition format.
+        """
+
+        lines: List[str] = []
+        with self._lock:
+            histograms = {
+                name: dict(series) for name, series in self._histograms.items()
+            }
+
+        for name in sorted(histograms):
+            if self._help.get(name):
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, histogram in sorted(histograms[name].items()):
+                counts, total = histogram.snapshot()
+                cumulative = 0
+                for bound, count in zip(histogram.buckets + (float("inf"),), counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(
+                        f"{name}_bucket{_format_labels(labels + (('le', le),))} "
+                        f"{cumulative}"
+                    )
+                lines.append(f"{name}_sum{_format_labels(labels)} {total!r}")
+                lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels: Labels) -> str:
+    """
+    Format labels as a Prometheus label set.
+    """
+
+    if not labels:
+        return ""
+
+    escaped = (
+        (key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
@@ -1,7 +1,11 @@
 from .notification_service import NotificationService
 from .console_notification_service import ConsoleNotificationService
+from .outbox_notification_service import OutboxNotificationService
+from .outbox_dispatcher import OutboxDispatcher
 
 __all__ = [
     "NotificationService",
     "ConsoleNotificationService",
+    "OutboxDispatcher",
+    "OutboxNotificationService",
 ]
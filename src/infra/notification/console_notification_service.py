@@ -1,8 +1,10 @@
 from typing import Optional
 
+from src.infra.metrics import instrument_client
 from src.infra.notification import NotificationService
 
 
+@instrument_client("notification")
 class ConsoleNotificationService(NotificationService):
     """
     A simple notification service that just prints to console
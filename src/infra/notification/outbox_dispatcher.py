@@ -0,0 +1,174 @@
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import update
+from sqlmodel import Session, col, select
+
+from src.infra.db.models import NotificationOutboxModel, OutboxStatus
+from src.infra.notification.notification_service import NotificationService
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxDispatcher:
+    """
+    Background worker that delivers the notifications of the outbox.
+
+    Due notifications are claimed in batches, handed to the delivery service
+    one by one, and the outcome of the whole batch is committed at once. A
+    failed delivery is retried with exponential backoff until `max_attempts`
+    is reached, after which the notification is marked as failed.
+
+    Several dispatchers can drain the same outbox, one per API worker, on
+    SQLite as well as on PostgreSQL. A notification is claimed by a
+    conditional UPDATE that pushes its `available_at` past `claim_timeout`,
+    and only the dispatcher whose UPDATE matched the row delivers it. Claims
+    are committed before delivery, so a dispatcher that dies mid-batch only
+    delays its notifications until the claim times out.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        notification_service: NotificationService,
+        batch_size: int = 100,
+        max_attempts: int = 5,
+        retry_delay: timedelta = timedelta(seconds=30),
+        poll_interval: float = 1.0,
+        claim_timeout: timedelta = timedelta(minutes=5),
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        """
+        Initialize the dispatcher.
+        """
+
+        self._session_factory = session_factory
+        self._notification_service = notification_service
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+        self._poll_interval = poll_interval
+        self._claim_timeout = claim_timeout
+        self._clock = clock
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def dispatch_once(self) -> int:
+        """
+        Deliver one batch of due notifications, and return its size.
+        """
+
+        now = self._clock()
+        statement = (
+            select(NotificationOutboxModel)
+            .where(
+                NotificationOutboxModel.status == OutboxStatus.PENDING,
+                col(NotificationOutboxModel.available_at) <= now,
+            )
+            .order_by(
+                col(NotificationOutboxModel.available_at),
+                col(NotificationOutboxModel.id),
+            )
+            .limit(self._batch_size)
+        )
+
+        with self._session_factory() as session:
+            notifications = [
+                notification
+                for notification in session.exec(statement).all()
+                if self._claim(session, notification, now)
+            ]
+            session.commit()
+
+            for notification in notifications:
+                self._deliver(notification, now)
+            session.commit()
+
+        return len(notifications)
+
+    def _claim(
+        self,
+        session: Session,
+        notification: NotificationOutboxModel,
+        now: datetime,
+    ) -> bool:
+        """
+        Claim a due notification, and return whether this dispatcher got it.
+        The UPDATE only matches a row still pending and due, so it matches
+        nothing once another dispatcher has claimed or delivered it.
+        """
+
+        statement = (
+            update(NotificationOutboxModel)
+            .where(
+                col(NotificationOutboxModel.id) == notification.id,
+                col(NotificationOutboxModel.status) == OutboxStatus.PENDING,
+                col(NotificationOutboxModel.available_at) <= now,
+            )
+            .values(available_at=now + self._claim_timeout)
+        )
+        return session.exec(statement).rowcount == 1  # type: ignore
+
+    def _deliver(self, notification: NotificationOutboxModel, now: datetime) -> None:
+        """
+        Deliver a notification and record the outcome of the attempt.
+        """
+
+        notification.attempts += 1
+        try:
+            self._notification_service.notify(
+                message=notification.message,
+                recipient=notification.recipient,
+            )
+        except Exception as e:
+            notification.last_error = str(e)
+            if notification.attempts >= self._max_attempts:
+                notification.status = OutboxStatus.FAILED
+            else:
+                backoff = self._retry_delay * 2 ** (notification.attempts - 1)
+                notification.available_at = now + backoff
+            return
+
+        notification.status = OutboxStatus.DELIVERED
+        notification.delivered_at = now
+
+    def run(self) -> None:
+        """
+        Deliver notifications until stopped, waiting for the poll interval
+        whenever the outbox is drained.
+        """
+
+        while not self._stop.is_set():
+            try:
+                delivered = self.dispatch_once()
+            except Exception:
+                logger.exception("Failed to dispatch the notification outbox")
+                delivered = 0
+
+            if delivered < self._batch_size:
+                self._stop.wait(self._poll_interval)
+
+    def start(self) -> None:
+        """
+        Start delivering notifications in a background thread.
+        """
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self.run,
+            name="outbox-dispatcher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the background thread, letting the current batch finish.
+        """
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
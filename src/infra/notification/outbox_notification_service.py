@@ -0,0 +1,38 @@
+from typing import Optional, Union
+
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.infra.db.models import NotificationOutboxModel
+from src.infra.metrics import instrument_client
+from src.infra.notification.notification_service import NotificationService
+
+
+@instrument_client("notification")
+class OutboxNotificationService(NotificationService):
+    """
+    A notification service that appends notifications to the outbox table.
+
+    Notifications are staged in the caller's session, so they are written by
+    the same commit as the change that triggered them and discarded with it
+    on rollback. Nothing is written if the session is never committed. An
+    OutboxDispatcher delivers them later, off the request path.
+    """
+
+    def __init__(self, session: Union[Session, AsyncSession]) -> None:
+        """
+        Initialize the service with the session notifications are staged in.
+        """
+
+        self.session = session
+
+    def notify(self, message: str, recipient: Optional[str] = None) -> None:
+        """
+        Stage a notification for delivery.
+
+        Args:
+            message: The notification message
+            recipient: Optional recipient identifier (email, phone, etc.)
+        """
+
+        self.session.add(NotificationOutboxModel(message=message, recipient=recipient))
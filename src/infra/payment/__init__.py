@@ -1,8 +1,30 @@
-from .payment_gateway import Payment, PaymentGateway
+from .payment_gateway import (
+    AsyncPaymentGateway,
+    Payment,
+    PaymentGateway,
+    PaymentGatewayError,
+)
 from .fake_payment_gateway import FakePaymentGateway
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from .http_payment_gateway import HttpPaymentGateway, PaymentGatewaySettings
+from .payment_token_provider import (
+    FakePaymentTokenProvider,
+    InMemoryPaymentTokenProvider,
+    PaymentTokenProvider,
+)
 
 __all__ = [
+    "AsyncPaymentGateway",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
     "PaymentGateway",
+    "PaymentGatewayError",
+    "PaymentGatewaySettings",
     "Payment",
+    "PaymentTokenProvider",
     "FakePaymentGateway",
+    "FakePaymentTokenProvider",
+    "HttpPaymentGateway",
+    "InMemoryPaymentTokenProvider",
 ]
@@ -0,0 +1,106 @@
+import threading
+import time
+from enum import StrEnum
+from typing import Callable
+
+
+class CircuitState(StrEnum):
+    """
+    Enum representing the states of a circuit breaker.
+
+    Attributes:
+        CLOSED (str): Calls go through.
+        OPEN (str): Calls are rejected until the reset timeout elapses.
+        HALF_OPEN (str): A single trial call is let through.
+    """
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
+class CircuitOpenError(Exception):
+    """
+    Exception raised when a call is rejected by an open circuit breaker.
+    """
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker guarding calls to a remote service.
+
+    The circuit opens after `failure_threshold` consecutive failures and
+    rejects calls for `reset_timeout` seconds. It then lets one trial call
+    through: a success closes it again, a failure reopens it. A trial call that
+    never reports back is replaced by a new one after another `reset_timeout`.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the circuit breaker, closed.
+        """
+
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        """
+        Return the current state of the circuit.
+        """
+
+        return self._state
+
+    def before_call(self) -> None:
+        """
+        Check that a call may go through.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with its trial
+                call still in flight.
+        """
+
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return
+
+            now = self._clock()
+            if now - self._opened_at < self._reset_timeout:
+                raise CircuitOpenError("Circuit breaker is open")
+
+            self._state = CircuitState.HALF_OPEN
+            self._opened_at = now
+
+    def record_success(self) -> None:
+        """
+        Record a successful call, closing the circuit.
+        """
+
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """
+        Record a failed call, opening the circuit if the threshold is reached or
+        the trial call failed.
+        """
+
+        with self._lock:
+            self._failures += 1
+            if (
+                self._state == CircuitState.HALF_OPEN
+                or self._failures >= self._failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
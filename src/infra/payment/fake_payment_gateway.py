@@ -7,6 +7,7 @@ from typing import Optional
 from pydantic import BaseModel
 
 from src.domain.entity import Address
+from src.infra.metrics import instrument_client
 from src.infra.payment import Payment, PaymentGateway
 
 
@@ -44,6 +45,7 @@ class PaymentDetails(BaseModel):
     payment_method: PaymentMethod
 
 
+@instrument_client("payment")
 class FakePaymentGateway(PaymentGateway):
     """
     Fake payment gateway for testing purposes.
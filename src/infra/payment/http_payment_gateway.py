@@ -0,0 +1,203 @@
+import asyncio
+import os
+import random
+import uuid
+from typing import Mapping, Optional
+
+import httpx
+from pydantic import BaseModel
+
+from src.domain.entity import Address
+from src.infra.metrics import instrument_client
+from src.infra.payment.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.infra.payment.payment_gateway import (
+    AsyncPaymentGateway,
+    Payment,
+    PaymentGatewayError,
+)
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class PaymentGatewaySettings(BaseModel):
+    """
+    HTTP payment gateway settings.
+
+    Attributes:
+        url (Optional[str]): Base URL of the payment API. The fake gateway is
+            used when not set.
+        timeout (float): Seconds a call may take, per attempt.
+        connect_timeout (float): Seconds to wait for a connection.
+        max_connections (int): Connections kept in the shared pool.
+        max_retries (int): Attempts after the first one.
+        backoff_base (float): Seconds of the first retry delay, doubled on every
+            retry and randomized with full jitter.
+        backoff_max (float): Upper bound of a retry delay in seconds.
+        failure_threshold (int): Consecutive failures that open the circuit.
+        reset_timeout (float): Seconds the circuit stays open.
+    """
+
+    url: Optional[str] = None
+    timeout: float = 5.0
+    connect_timeout: float = 1.0
+    max_connections: int = 100
+    max_retries: int = 2
+    backoff_base: float = 0.1
+    backoff_max: float = 2.0
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+
+    @classmethod
+    def from_env(
+        cls, environ: Mapping[str, str] = os.environ
+    ) -> "PaymentGatewaySettings":
+        """
+        Build the settings from environment variables, falling back to defaults.
+        """
+
+        variables = {
+            "url": "PAYMENT_GATEWAY_URL",
+            "timeout": "PAYMENT_GATEWAY_TIMEOUT",
+            "connect_timeout": "PAYMENT_GATEWAY_CONNECT_TIMEOUT",
+            "max_connections": "PAYMENT_GATEWAY_MAX_CONNECTIONS",
+            "max_retries": "PAYMENT_GATEWAY_MAX_RETRIES",
+            "backoff_base": "PAYMENT_GATEWAY_BACKOFF_BASE",
+            "backoff_max": "PAYMENT_GATEWAY_BACKOFF_MAX",
+            "failure_threshold": "PAYMENT_GATEWAY_FAILURE_THRESHOLD",
+            "reset_timeout": "PAYMENT_GATEWAY_RESET_TIMEOUT",
+        }
+
+        return cls(
+            **{
+                field: environ[variable]
+                for field, variable in variables.items()
+                if variable in environ
+            }
+        )
+
+
+@instrument_client("payment")
+class HttpPaymentGateway(AsyncPaymentGateway):
+    """
+    Payment gateway calling a payment API over HTTP.
+
+    Every call goes through one pooled AsyncClient, so connections are reused
+    across requests and concurrent payments overlap. Transport errors,
+    timeouts and 429/5xx responses are retried with exponential backoff and
+    full jitter, sending the same idempotency key on every attempt. A circuit
+    breaker fails calls fast while the API keeps failing.
+    """
+
+    def __init__(
+        self,
+        settings: PaymentGatewaySettings,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
+        """
+        Initialize the gateway and its connection pool.
+        """
+
+        self._settings = settings
+        self._client = httpx.AsyncClient(
+            base_url=settings.url or "",
+            timeout=httpx.Timeout(settings.timeout, connect=settings.connect_timeout),
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_connections,
+            ),
+            transport=transport,
+        )
+        self._circuit_breaker = circuit_breaker or CircuitBreaker(
+            failure_threshold=settings.failure_threshold,
+            reset_timeout=settings.reset_timeout,
+        )
+
+    async def process_payment(
+        self, payment_token: str, billing_address: Address
+    ) -> Payment:
+        """
+        Process a payment with the given token.
+
+        Raises:
+            PaymentGatewayError: If the circuit is open, the API rejected the
+                request or answered with a malformed body, or every attempt
+                failed.
+        """
+
+        idempotency_key = str(uuid.uuid4())
+        payload = {
+            "payment_token": payment_token,
+            "billing_address": billing_address.model_dump(),
+        }
+
+        for attempt in range(self._settings.max_retries + 1):
+            try:
+                self._circuit_breaker.before_call()
+            except CircuitOpenError as e:
+                raise PaymentGatewayError(str(e)) from e
+
+            try:
+                response = await self._client.post(
+                    "/payments",
+                    json=payload,
+                    headers={"Idempotency-Key": idempotency_key},
+                )
+            except httpx.TransportError as e:
+                error: Exception = e
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    return self._to_payment(response)
+                error = PaymentGatewayError(
+                    f"Payment API responded with {response.status_code}"
+                )
+
+            self._circuit_breaker.record_failure()
+            if attempt < self._settings.max_retries:
+                await asyncio.sleep(self._backoff(attempt))
+
+        raise PaymentGatewayError("Payment API is unavailable") from error
+
+    def _to_payment(self, response: httpx.Response) -> Payment:
+        """
+        Build the payment from a non-retryable response. A successful response
+        whose body is not a payment counts as a failure of the API.
+        """
+
+        if response.is_error:
+            if response.is_server_error:
+                self._circuit_breaker.record_failure()
+            else:
+                self._circuit_breaker.record_success()
+            raise PaymentGatewayError(
+                f"Payment API responded with {response.status_code}"
+            )
+
+        try:
+            payment = Payment.model_validate(response.json())
+        except ValueError as e:
+            self._circuit_breaker.record_failure()
+            raise PaymentGatewayError(
+                "Payment API responded with a malformed payment"
+            ) from e
+
+        self._circuit_breaker.record_success()
+        return payment
+
+    def _backoff(self, attempt: int) -> float:
+        """
+        Return the delay before the retry following the given attempt.
+        """
+
+        ceiling = min(
+            self._settings.backoff_max,
+            self._settings.backoff_base * 2**attempt,
+        )
+        return random.uniform(0, ceiling)
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled connections.
+        """
+
+        await self._client.aclose()
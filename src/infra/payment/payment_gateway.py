@@ -30,3 +30,25 @@ class PaymentGateway(ABC):
         """
 
         raise NotImplementedError
+
+
+class AsyncPaymentGateway(ABC):
+    """
+    Abstract base class for asynchronous payment gateways.
+    """
+
+    @abstractmethod
+    async def process_payment(
+        self, payment_token: str, billing_address: Address
+    ) -> Payment:
+        """
+        Process a payment with the given token.
+        """
+
+        raise NotImplementedError
+
+
+class PaymentGatewayError(Exception):
+    """
+    Exception raised when the payment gateway cannot process a payment.
+    """
@@ -0,0 +1,68 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Optional
+from uuid import UUID
+
+from src.domain.entity import UserAccount
+
+
+class PaymentTokenProvider(ABC):
+    """
+    Abstract base class for providers of the payment tokens stored for user
+    accounts, used to charge them without their interaction.
+    """
+
+    @abstractmethod
+    def get_payment_tokens(
+        self, user_accounts: Iterable[UserAccount]
+    ) -> Dict[UUID, str]:
+        """
+        Return the payment tokens of the given user accounts, by user account id.
+        User accounts without a stored payment token are left out.
+        """
+
+        raise NotImplementedError
+
+
+class InMemoryPaymentTokenProvider(PaymentTokenProvider):
+    """
+    Payment token provider backed by a dictionary.
+    """
+
+    def __init__(self, tokens: Optional[Dict[UUID, str]] = None) -> None:
+        """
+        Constructor
+        """
+
+        self.tokens = dict(tokens or {})
+
+    def get_payment_tokens(
+        self, user_accounts: Iterable[UserAccount]
+    ) -> Dict[UUID, str]:
+        """
+        Return the payment tokens of the given user accounts, by user account id.
+        """
+
+        return {
+            user_account.id: self.tokens[user_account.id]
+            for user_account in user_accounts
+            if user_account.id in self.tokens
+        }
+
+
+class FakePaymentTokenProvider(PaymentTokenProvider):
+    """
+    Fake payment token provider for testing purposes, to go with the
+    FakePaymentGateway. Every user account gets a token of its own.
+    """
+
+    def get_payment_tokens(
+        self, user_accounts: Iterable[UserAccount]
+    ) -> Dict[UUID, str]:
+        """
+        Return a fake payment token for each of the given user accounts.
+        """
+
+        return {
+            user_account.id: f"tok_{user_account.id.hex}"
+            for user_account in user_accounts
+        }
@@ -0,0 +1,94 @@
+import argparse
+import asyncio
+import random
+import uuid
+from typing import Dict, List, Optional
+
+from fastapi import FastAPI, Header
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from src.domain.entity import Address
+from src.infra.payment.payment_gateway import Payment
+
+DECLINED_TOKENS = frozenset({"tok_declined", "tok_chargeDeclined"})
+
+
+class StubPaymentRequest(BaseModel):
+    """
+    Request body of the stub payment API.
+    """
+
+    payment_token: str
+    billing_address: Address
+
+
+def create_stub_payment_app(
+    latency_seconds: float = 0.0,
+    error_rate: float = 0.0,
+    seed: Optional[int] = None,
+) -> FastAPI:
+    """
+    Create a stub of the payment API for tests and benchmarks.
+
+    Payments are approved unless their token is one of DECLINED_TOKENS. Every
+    call waits `latency_seconds`, and a share `error_rate` of them fails with a
+    503. Responses are remembered by idempotency key, so a retried payment is
+    charged once.
+    """
+
+    app = FastAPI(title="Stub Payment API")
+    rng = random.Random(seed)
+    payments: Dict[str, Payment] = {}
+    app.state.requests = []
+
+    @app.post("/payments", response_model=Payment)
+    async def create_payment(
+        request: StubPaymentRequest,
+        idempotency_key: Optional[str] = Header(default=None),
+    ):
+        requests: List[Optional[str]] = app.state.requests
+        requests.append(idempotency_key)
+
+        if latency_seconds:
+            await asyncio.sleep(latency_seconds)
+        if error_rate and rng.random() < error_rate:
+            return JSONResponse({"detail": "Service unavailable"}, status_code=503)
+
+        if idempotency_key in payments:
+            return payments[idempotency_key]
+
+        payment = Payment(
+            success=request.payment_token not in DECLINED_TOKENS,
+            transaction_id=uuid.uuid4(),
+        )
+        if idempotency_key:
+            payments[idempotency_key] = payment
+
+        return payment
+
+    return app
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Serve the stub payment API.
+    """
+
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve a stub payment API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    app = create_stub_payment_app(args.latency, args.error_rate, args.seed)
+    uvicorn.run(app, host=args.host, port=args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,9 +1,11 @@
 from .in_memory_plan_repository import InMemoryPlanRepository
 from .in_memory_subscription_repository import InMemorySubscriptionRepository
+from .in_memory_unit_of_work import InMemoryUnitOfWork
 from .in_memory_user_account_repository import InMemoryUserAccountRepository
 
 __all__ = [
     "InMemoryPlanRepository",
     "InMemorySubscriptionRepository",
+    "InMemoryUnitOfWork",
     "InMemoryUserAccountRepository",
 ]
@@ -1,8 +1,10 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
 from uuid import UUID
 
 from src.domain.entity import Plan
 from src.domain.repository import PlanRepository
+from src.infra.repository.pagination import page
 
 
 class InMemoryPlanRepository(PlanRepository):
@@ -48,3 +50,41 @@ class InMemoryPlanRepository(PlanRepository):
                 return plan
 
         return None
+
+    def save_many(self, plans: Iterable[Plan]) -> None:
+        """
+        Save several plans.
+        """
+
+        for plan in plans:
+            self.save(plan)
+
+    def get_many_by_ids(self, plan_ids: Iterable[UUID]) -> List[Plan]:
+        """
+        Get the plans matching the given IDs.
+        """
+
+        wanted = set(plan_ids)
+        return [plan for plan in self.plans if plan.id in wanted]
+
+    def update_many(self, plans: Iterable[Plan]) -> None:
+        """
+        Update several plans.
+        """
+
+        positions = {plan.id: i for i, plan in enumerate(self.plans)}
+        for plan in plans:
+            position = positions.get(plan.id)
+            if position is not None:
+                self.plans[position] = plan
+
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Plan]:
+        """
+        List plans ordered by creation date and ID.
+        """
+
+        return page(self.plans, limit, after)
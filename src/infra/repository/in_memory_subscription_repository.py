@@ -1,14 +1,29 @@
-from typing import List, Optional
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from uuid import UUID
 
 from src.application.exceptions import SubscriptionAlreadyExistsError
-from src.domain.entity import Subscription
+from src.domain.entity import Subscription, SubscriptionStatus
 from src.domain.repository import SubscriptionRepository
+from src.infra.repository.pagination import page
+
+_BULK_SORT_THRESHOLD = 1024
 
 
 class InMemorySubscriptionRepository(SubscriptionRepository):
     """
     In-memory repository for managing subscriptions.
+
+    Subscriptions are stored in a primary index keyed by ID, plus secondary
+    indexes keyed by user ID, plan ID and the (user ID, plan ID) pair. Secondary
+    indexes map to insertion-ordered dicts of subscriptions, so every lookup
+    returns the same subscription a linear scan in insertion order would.
+
+    Active subscriptions are also kept in a list sorted by (end date, ID), so
+    due subscriptions are found with a binary search instead of a full scan.
+    Bulk loads append to that list and sort it once, instead of inserting every
+    subscription in place.
     """
 
     def __init__(self, subscriptions: Optional[List[Subscription]] = None) -> None:
@@ -16,40 +31,85 @@ class InMemorySubscriptionRepository(SubscriptionRepository):
         Initialize the repository with an optional list of subscriptions.
         """
 
-        self._subscriptions = subscriptions or []
+        self._subscriptions: Dict[UUID, Subscription] = {}
+        self._keys: Dict[UUID, Tuple[UUID, UUID]] = {}
+        self._by_user_id: Dict[UUID, Dict[UUID, Subscription]] = {}
+        self._by_plan_id: Dict[UUID, Dict[UUID, Subscription]] = {}
+        self._by_user_id_and_plan_id: Dict[
+            Tuple[UUID, UUID], Dict[UUID, Subscription]
+        ] = {}
+        self._due: List[Tuple[datetime, UUID]] = []
+        self._due_keys: Dict[UUID, Tuple[datetime, UUID]] = {}
+
+        self._index_many(subscriptions or [])
 
     def get_by_id(self, subscription_id: UUID) -> Optional[Subscription]:
         """
         Get a subscription by its ID.
         """
 
-        for subscription in self._subscriptions:
-            if subscription.id == subscription_id:
-                return subscription
-
-        return None
+        return self._subscriptions.get(subscription_id)
 
     def save(self, subscription: Subscription):
         """
         Save a subscription.
         """
 
-        if self.get_by_id(subscription.id):
+        if subscription.id in self._subscriptions:
             raise SubscriptionAlreadyExistsError(
                 f"Subscription with id '{subscription.id}' already exists."
             )
 
-        self._subscriptions.append(subscription)
+        self._index(subscription)
+
+    def save_many(self, subscriptions: Iterable[Subscription]) -> None:
+        """
+        Save several subscriptions.
+        """
+
+        subscriptions = list(subscriptions)
+        seen = set()
+        for subscription in subscriptions:
+            if subscription.id in self._subscriptions or subscription.id in seen:
+                raise SubscriptionAlreadyExistsError(
+                    f"Subscription with id '{subscription.id}' already exists."
+                )
+            seen.add(subscription.id)
+
+        self._index_many(subscriptions)
+
+    def get_many_by_ids(self, subscription_ids: Iterable[UUID]) -> List[Subscription]:
+        """
+        Get the subscriptions matching the given IDs.
+        """
+
+        return [
+            self._subscriptions[subscription_id]
+            for subscription_id in set(subscription_ids)
+            if subscription_id in self._subscriptions
+        ]
 
     def update(self, subscription: Subscription):
         """
         Update a subscription.
         """
 
-        for i, s in enumerate(self._subscriptions):
-            if s.id == subscription.id:
-                self._subscriptions[i] = subscription
-                break
+        keys = self._keys.get(subscription.id)
+        if keys is None:
+            return
+
+        if keys != (subscription.user_id, subscription.plan_id):
+            self._unindex(subscription.id)
+
+        self._index(subscription)
+
+    def update_many(self, subscriptions: Iterable[Subscription]) -> None:
+        """
+        Update several subscriptions at once.
+        """
+
+        for subscription in subscriptions:
+            self.update(subscription)
 
     def get_by_user_id_and_plan_id(
         self,
@@ -60,19 +120,22 @@ class InMemorySubscriptionRepository(SubscriptionRepository):
         Get a subscription by user ID and plan ID.
         """
 
-        for subscription in self._subscriptions:
-            if subscription.user_id == user_id and subscription.plan_id == plan_id:
-                return subscription
-
-        return None
+        return self._first(self._by_user_id_and_plan_id.get((user_id, plan_id)))
 
     def get_by_user_id(self, user_id: UUID) -> Optional[Subscription]:
         """
         Get all subscriptions by user ID.
         """
 
-        for subscription in self._subscriptions:
-            if subscription.user_id == user_id:
+        return self._first(self._by_user_id.get(user_id))
+
+    def get_active_by_user_id(self, user_id: UUID) -> Optional[Subscription]:
+        """
+        Get the active subscription of a user, if any.
+        """
+
+        for subscription in self._by_user_id.get(user_id, {}).values():
+            if subscription.status == SubscriptionStatus.ACTIVE:
                 return subscription
 
         return None
@@ -82,8 +145,165 @@ class InMemorySubscriptionRepository(SubscriptionRepository):
         Get all subscriptions by plan ID.
         """
 
-        for subscription in self._subscriptions:
-            if subscription.plan_id == plan_id:
-                return subscription
+        return self._first(self._by_plan_id.get(plan_id))
 
-        return None
+    def iter_due(
+        self,
+        before: datetime,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> Iterator[Subscription]:
+        """
+        Iterate over active subscriptions ending before the given date,
+        ordered by end date and ID.
+        """
+
+        start = bisect_right(self._due, after) if after is not None else 0
+        end = bisect_left(self._due, (before,))
+        if limit is not None:
+            end = min(end, start + limit)
+
+        for _, subscription_id in self._due[start:end]:
+            yield self._subscriptions[subscription_id]
+
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        user_id: Optional[UUID] = None,
+        plan_id: Optional[UUID] = None,
+        status: Optional[SubscriptionStatus] = None,
+    ) -> List[Subscription]:
+        """
+        List subscriptions ordered by creation date and ID.
+        """
+
+        if user_id is not None:
+            candidates = self._by_user_id.get(user_id, {}).values()
+        elif plan_id is not None:
+            candidates = self._by_plan_id.get(plan_id, {}).values()
+        else:
+            candidates = self._subscriptions.values()
+
+        return page(
+            (
+                subscription
+                for subscription in candidates
+                if (plan_id is None or subscription.plan_id == plan_id)
+                and (status is None or subscription.status == status)
+            ),
+            limit,
+            after,
+        )
+
+    def _index(self, subscription: Subscription) -> None:
+        """
+        Add a subscription to the primary and secondary indexes.
+
+        Re-indexing a subscription under the same keys replaces it in place, so
+        its position in the secondary indexes is kept.
+        """
+
+        self._index_keys(subscription)
+        self._discard_due(subscription.id)
+        if subscription.status == SubscriptionStatus.ACTIVE:
+            due_key = (subscription.end_date, subscription.id)
+            insort(self._due, due_key)
+            self._due_keys[subscription.id] = due_key
+
+    def _index_many(self, subscriptions: Iterable[Subscription]) -> None:
+        """
+        Add new subscriptions to the indexes.
+
+        Large batches are appended to the due index, which is then sorted once:
+        the existing entries form a single sorted run, so this costs about one
+        pass over the index instead of one insertion per subscription.
+        """
+
+        due_keys: Dict[UUID, Tuple[datetime, UUID]] = {}
+        for subscription in subscriptions:
+            self._index_keys(subscription)
+            if subscription.status == SubscriptionStatus.ACTIVE:
+                due_keys[subscription.id] = (subscription.end_date, subscription.id)
+            else:
+                due_keys.pop(subscription.id, None)
+
+        self._due_keys.update(due_keys)
+        if len(due_keys) < _BULK_SORT_THRESHOLD:
+            for due_key in due_keys.values():
+                insort(self._due, due_key)
+        else:
+            self._due.extend(due_keys.values())
+            self._due.sort()
+
+    def _index_keys(self, subscription: Subscription) -> None:
+        """
+        Add a subscription to the primary and secondary indexes, leaving the
+        due index to the caller.
+        """
+
+        self._subscriptions[subscription.id] = subscription
+        self._keys[subscription.id] = (subscription.user_id, subscription.plan_id)
+        self._by_user_id.setdefault(subscription.user_id, {})[
+            subscription.id
+        ] = subscription
+        self._by_plan_id.setdefault(subscription.plan_id, {})[
+            subscription.id
+        ] = subscription
+        self._by_user_id_and_plan_id.setdefault(
+            (subscription.user_id, subscription.plan_id), {}
+        )[subscription.id] = subscription
+
+    def _unindex(self, subscription_id: UUID) -> None:
+        """
+        Remove a subscription from the primary and secondary indexes.
+        """
+
+        del self._subscriptions[subscription_id]
+        user_id, plan_id = self._keys.pop(subscription_id)
+        self._discard(self._by_user_id, user_id, subscription_id)
+        self._discard(self._by_plan_id, plan_id, subscription_id)
+        self._discard(
+            self._by_user_id_and_plan_id,
+            (user_id, plan_id),
+            subscription_id,
+        )
+        self._discard_due(subscription_id)
+
+    def _discard_due(self, subscription_id: UUID) -> None:
+        """
+        Remove a subscription from the due index.
+        """
+
+        due_key = self._due_keys.pop(subscription_id, None)
+        if due_key is None:
+            return
+
+        del self._due[bisect_left(self._due, due_key)]
+
+    @staticmethod
+    def _discard(index: Dict, key, subscription_id: UUID) -> None:
+        """
+        Remove a subscription from a secondary index bucket.
+        """
+
+        bucket = index.get(key)
+        if bucket is None:
+            return
+
+        bucket.pop(subscription_id, None)
+        if not bucket:
+            del index[key]
+
+    @staticmethod
+    def _first(
+        bucket: Optional[Dict[UUID, Subscription]],
+    ) -> Optional[Subscription]:
+        """
+        Return the first subscription of a secondary index bucket.
+        """
+
+        if not bucket:
+            return None
+
+        return next(iter(bucket.values()))
@@ -0,0 +1,33 @@
+from src.domain.repository import UnitOfWork
+
+
+class InMemoryUnitOfWork(UnitOfWork):
+    """
+    In-memory unit of work. In-memory repositories apply changes immediately,
+    so it only keeps track of commits and rollbacks.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the unit of work.
+        """
+
+        super().__init__()
+        self.commits = 0
+        self.rollbacks = 0
+
+    def commit(self) -> None:
+        """
+        Persist every staged change.
+        """
+
+        self.commits += 1
+        self._committed()
+
+    def rollback(self) -> None:
+        """
+        Discard every staged change.
+        """
+
+        self.rollbacks += 1
+        self._rolled_back()
@@ -1,8 +1,10 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
 from uuid import UUID
 
 from src.domain.entity import UserAccount
 from src.domain.repository import UserAccountRepository
+from src.infra.repository.pagination import page
 
 
 class InMemoryUserAccountRepository(UserAccountRepository):
@@ -34,3 +36,46 @@ class InMemoryUserAccountRepository(UserAccountRepository):
                 return user_account
 
         return None
+
+    def get_many_by_ids(self, user_ids: Iterable[UUID]) -> List[UserAccount]:
+        """
+        Get the user accounts matching the given IDs.
+        """
+
+        wanted = set(user_ids)
+        return [
+            user_account
+            for user_account in self._user_accounts
+            if user_account.id in wanted
+        ]
+
+    def save_many(self, user_accounts: Iterable[UserAccount]) -> None:
+        """
+        Save several user accounts.
+        """
+
+        self._user_accounts.extend(user_accounts)
+
+    def update_many(self, user_accounts: Iterable[UserAccount]) -> None:
+        """
+        Update several user accounts.
+        """
+
+        positions = {
+            user_account.id: i for i, user_account in enumerate(self._user_accounts)
+        }
+        for user_account in user_accounts:
+            position = positions.get(user_account.id)
+            if position is not None:
+                self._user_accounts[position] = user_account
+
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[UserAccount]:
+        """
+        List user accounts ordered by creation date and ID.
+        """
+
+        return page(self._user_accounts, limit, after)
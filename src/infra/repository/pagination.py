@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple, TypeVar
+from uuid import UUID
+
+from src.domain._shared import Entity
+
+EntityType = TypeVar("EntityType", bound=Entity)
+
+
+def page(
+    entities: Iterable[EntityType],
+    limit: int,
+    after: Optional[Tuple[datetime, UUID]] = None,
+) -> List[EntityType]:
+    """
+    Return a page of entities ordered by (created_at, id), starting after the
+    given key.
+    """
+
+    ordered = sorted(entities, key=lambda entity: (entity.created_at, entity.id))
+    if after is not None:
+        ordered = [e for e in ordered if (e.created_at, e.id) > after]
+
+    return ordered[:limit]
@@ -0,0 +1,19 @@
+from .db import trace_engine
+from .tracer import (
+    JsonlFileExporter,
+    RingBufferExporter,
+    Span,
+    Tracer,
+    TracingSettings,
+    tracer,
+)
+
+__all__ = [
+    "JsonlFileExporter",
+    "RingBufferExporter",
+    "Span",
+    "trace_engine",
+    "Tracer",
+    "tracer",
+    "TracingSettings",
+]
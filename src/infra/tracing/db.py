@@ -0,0 +1,43 @@
+from sqlalchemy import Engine, event
+
+from src.infra.tracing.tracer import tracer
+
+_SPANS_KEY = "tracing_spans"
+
+
+def trace_engine(engine: Engine) -> None:
+    """
+    Record every statement executed by the engine as a span of the active
+    trace, carrying its SQL text and, for writes, the affected row count.
+
+    Bound parameters are left out, so traces never hold user data. Async
+    engines are traced through their `sync_engine`.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_query_span(conn, cursor, statement, parameters, context, executemany):
+        span = tracer.start_span("db.query", statement=statement)
+        if span is not None:
+            if executemany:
+                span.set("executemany", True)
+            conn.info.setdefault(_SPANS_KEY, []).append(span)
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def end_query_span(conn, cursor, statement, parameters, context, executemany):
+        spans = conn.info.get(_SPANS_KEY)
+        if not spans:
+            return
+
+        span = spans.pop()
+        # DBAPIs report -1 for SELECTs, whose rows are counted by the
+        # repository span around them.
+        if cursor.rowcount >= 0:
+            span.set("rowcount", cursor.rowcount)
+        tracer.end_span(span)
+
+    @event.listens_for(engine, "handle_error")
+    def end_failed_query_span(exception_context):
+        connection = exception_context.connection
+        spans = connection.info.get(_SPANS_KEY) if connection is not None else None
+        if spans:
+            tracer.end_span(spans.pop(), exception_context.original_exception)
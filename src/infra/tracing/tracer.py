@@ -0,0 +1,287 @@
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar, Token
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Mapping, Optional, Sequence, Union
+
+from pydantic import BaseModel, Field
+
+
+class Span:
+    """
+    A timed operation of a trace.
+
+    Attributes:
+        trace_id (str): ID of the trace the span belongs to.
+        span_id (str): ID of the span.
+        parent_id (Optional[str]): ID of the enclosing span, None for the root.
+        name (str): Name of the operation.
+        start_time (float): Epoch seconds at which the span started.
+        duration (Optional[float]): Seconds the span lasted, once ended.
+        attributes (Dict[str, Any]): Details of the operation, such as SQL text.
+        error (Optional[str]): The exception that ended the span, if any.
+    """
+
+    __slots__ = (
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "name",
+        "start_time",
+        "duration",
+        "attributes",
+        "error",
+        "_started_at",
+        "_token",
+    )
+
+    def __init__(
+        self,
+        trace_id: str,
+        parent_id: Optional[str],
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Start a span.
+        """
+
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.name = name
+        self.start_time = time.time()
+        self.duration: Optional[float] = None
+        self.attributes = attributes or {}
+        self.error: Optional[str] = None
+        self._started_at = time.perf_counter()
+        self._token: Optional[Token] = None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Set an attribute of the span.
+        """
+
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the span as a JSON-serializable dict.
+        """
+
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class RingBufferExporter:
+    """
+    Keeps the most recently ended spans in memory.
+    """
+
+    def __init__(self, capacity: int = 10_000) -> None:
+        """
+        Initialize an empty buffer holding at most `capacity` spans.
+        """
+
+        self._spans: Deque[Span] = deque(maxlen=capacity)
+
+    def export(self, span: Span) -> None:
+        """
+        Add an ended span, evicting the oldest one when full.
+        """
+
+        self._spans.append(span)
+
+    def spans(self, trace_id: Optional[str] = None) -> List[Span]:
+        """
+        Return the buffered spans, oldest first, optionally of a single trace.
+        """
+
+        spans = list(self._spans)
+        if trace_id is None:
+            return spans
+
+        return [span for span in spans if span.trace_id == trace_id]
+
+    def clear(self) -> None:
+        """
+        Drop every buffered span.
+        """
+
+        self._spans.clear()
+
+
+class JsonlFileExporter:
+    """
+    Appends ended spans to a file, one JSON object per line.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Initialize the exporter, opening the file for appending.
+        """
+
+        self._file = open(path, "a", encoding="utf-8", buffering=1)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """
+        Write an ended span.
+        """
+
+        line = json.dumps(span.to_dict(), default=str) + "\n"
+        with self._lock:
+            self._file.write(line)
+
+    def close(self) -> None:
+        """
+        Close the file.
+        """
+
+        self._file.close()
+
+
+Exporter = Union[RingBufferExporter, JsonlFileExporter]
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class TracingSettings(BaseModel):
+    """
+    Tracing settings.
+
+    Attributes:
+        sample_rate (float): Share of the requests that are traced. Tracing a
+            request makes every instrumented call open a span, so only a
+            small share is traced unless TRACE_SAMPLE_RATE raises it.
+        buffer_size (int): Ended spans kept in memory for the admin endpoint.
+        file (Optional[str]): JSONL file the ended spans are also appended to.
+    """
+
+    sample_rate: float = Field(default=0.01, ge=0.0, le=1.0)
+    buffer_size: int = Field(default=10_000, gt=0)
+    file: Optional[str] = None
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> "TracingSettings":
+        """
+        Build the settings from environment variables, falling back to defaults.
+        """
+
+        variables = {
+            "sample_rate": "TRACE_SAMPLE_RATE",
+            "buffer_size": "TRACE_BUFFER_SIZE",
+            "file": "TRACE_FILE",
+        }
+
+        return cls(
+            **{
+                field: environ[variable]
+                for field, variable in variables.items()
+                if variable in environ
+            }
+        )
+
+
+class Tracer:
+    """
+    Creates spans and hands them to its exporters when they end.
+
+    The active span is kept in a context variable, so it follows a request
+    across awaits and into the threads started with asyncio.to_thread. Child
+    spans are only created inside a trace: outside one, `start_span` returns
+    None and instrumented code pays for a single context variable lookup.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.01,
+        buffer_size: int = 10_000,
+        exporters: Sequence[Exporter] = (),
+    ) -> None:
+        """
+        Initialize the tracer. Ended spans always go to an in-memory ring
+        buffer, and to the given exporters.
+        """
+
+        self.sample_rate = sample_rate
+        self.buffer = RingBufferExporter(buffer_size)
+        self.exporters: List[Exporter] = [self.buffer, *exporters]
+
+    @classmethod
+    def from_settings(cls, settings: TracingSettings) -> "Tracer":
+        """
+        Create a tracer from the settings.
+        """
+
+        exporters = [JsonlFileExporter(settings.file)] if settings.file else []
+        return cls(settings.sample_rate, settings.buffer_size, exporters)
+
+    def start_trace(self, name: str, **attributes: Any) -> Optional[Span]:
+        """
+        Start the root span of a new trace and make it the active span, unless
+        the trace is sampled out.
+        """
+
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return None
+
+        span = Span(f"{random.getrandbits(128):032x}", None, name, attributes)
+        span._token = _current_span.set(span)
+        return span
+
+    def start_span(self, name: str, **attributes: Any) -> Optional[Span]:
+        """
+        Start a child of the active span and make it the active span, or do
+        nothing outside a trace.
+        """
+
+        parent = _current_span.get()
+        if parent is None:
+            return None
+
+        span = Span(parent.trace_id, parent.span_id, name, attributes)
+        span._token = _current_span.set(span)
+        return span
+
+    def end_span(self, span: Span, error: Optional[BaseException] = None) -> None:
+        """
+        End a span, restore its parent as the active span, and export it.
+        """
+
+        span.duration = time.perf_counter() - span._started_at
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        if span._token is not None:
+            try:
+                _current_span.reset(span._token)
+            except ValueError:
+                # Ended in another context than the one it started in.
+                pass
+            span._token = None
+
+        for exporter in self.exporters:
+            exporter.export(span)
+
+    @staticmethod
+    def current_span() -> Optional[Span]:
+        """
+        Return the active span, if any.
+        """
+
+        return _current_span.get()
+
+
+tracer = Tracer.from_settings(TracingSettings.from_env())
@@ -9,7 +9,7 @@ from src.application.use_case import (
     CancelSubscriptionUseCase,
 )
 from src.domain.entity import Subscription
-from src.infra.repository import InMemorySubscriptionRepository
+from src.infra.repository import InMemorySubscriptionRepository, InMemoryUnitOfWork
 
 valid_subscription = Subscription.create_regular(
     user_id=uuid.uuid4(),
@@ -28,7 +28,9 @@ class TestCancelSubscription:
         """
 
         repo = InMemorySubscriptionRepository()
-        use_case = CancelSubscriptionUseCase(repository=repo)
+        use_case = CancelSubscriptionUseCase(
+            repository=repo, unit_of_work=InMemoryUnitOfWork()
+        )
 
         with pytest.raises(SubscriptionNotFoundError, match="Subscription not found"):
             use_case.execute(input_dto=CancelSubscriptionInputDTO(id=uuid4()))
@@ -39,7 +41,9 @@ class TestCancelSubscription:
         """
 
         repo = InMemorySubscriptionRepository([valid_subscription])
-        use_case = CancelSubscriptionUseCase(repository=repo)
+        use_case = CancelSubscriptionUseCase(
+            repository=repo, unit_of_work=InMemoryUnitOfWork()
+        )
         use_case.execute(input_dto=CancelSubscriptionInputDTO(id=valid_subscription.id))
 
         found_subscription = repo.get_by_id(valid_subscription.id)
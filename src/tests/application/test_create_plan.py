@@ -1,3 +1,5 @@
+import pytest
+
 from src.application.exceptions import DuplicatePlanError
 from src.application.use_case import (
     CreatePlanInputDTO,
@@ -6,7 +8,7 @@ from src.application.use_case import (
 )
 from src.domain._shared import Currency, MonetaryValue
 from src.domain.entity import Plan
-from src.infra.repository import InMemoryPlanRepository
+from src.infra.repository import InMemoryPlanRepository, InMemoryUnitOfWork
 
 
 class TestCreatePlan:
@@ -31,7 +33,9 @@ class TestCreatePlan:
         repo.save(basic_plan)
 
         try:
-            use_case = CreatePlanUseCase(repository=repo)
+            use_case = CreatePlanUseCase(
+                repository=repo, unit_of_work=InMemoryUnitOfWork()
+            )
             use_case.execute(
                 CreatePlanInputDTO(
                     name="Basic",
@@ -61,7 +65,9 @@ class TestCreatePlan:
         repo.save(basic_plan)
 
         try:
-            use_case = CreatePlanUseCase(repository=repo)
+            use_case = CreatePlanUseCase(
+                repository=repo, unit_of_work=InMemoryUnitOfWork()
+            )
             use_case.execute(
                 CreatePlanInputDTO(
                     name="Plus",
@@ -81,7 +87,7 @@ class TestCreatePlan:
 
         repo = InMemoryPlanRepository()
 
-        use_case = CreatePlanUseCase(repository=repo)
+        use_case = CreatePlanUseCase(repository=repo, unit_of_work=InMemoryUnitOfWork())
         output: CreatePlanOutputDTO = use_case.execute(
             CreatePlanInputDTO(
                 name="Plus",
@@ -101,3 +107,56 @@ class TestCreatePlan:
             amount=59.90,  # type: ignore
             currency=Currency.BRL,
         )
+
+    def test_create_plan_commits_unit_of_work_once(self):
+        """
+        Test that creating a plan commits the unit of work exactly once.
+        """
+
+        repo = InMemoryPlanRepository()
+        unit_of_work = InMemoryUnitOfWork()
+        use_case = CreatePlanUseCase(repository=repo, unit_of_work=unit_of_work)
+        use_case.execute(
+            CreatePlanInputDTO(
+                name="Basic",
+                price=MonetaryValue(
+                    amount=29.90,  # type: ignore
+                    currency=Currency.BRL,
+                ),
+            )
+        )
+
+        assert unit_of_work.commits == 1
+        assert unit_of_work.rollbacks == 0
+
+    def test_duplicate_plan_rolls_back_unit_of_work(self):
+        """
+        Test that a rejected plan rolls the unit of work back.
+        """
+
+        repo = InMemoryPlanRepository()
+        repo.save(
+            Plan(
+                name="Basic",
+                price=MonetaryValue(
+                    amount=29.90,  # type: ignore
+                    currency=Currency.BRL,
+                ),
+            )
+        )
+        unit_of_work = InMemoryUnitOfWork()
+        use_case = CreatePlanUseCase(repository=repo, unit_of_work=unit_of_work)
+
+        with pytest.raises(DuplicatePlanError):
+            use_case.execute(
+                CreatePlanInputDTO(
+                    name="Basic",
+                    price=MonetaryValue(
+                        amount=29.90,  # type: ignore
+                        currency=Currency.BRL,
+                    ),
+                )
+            )
+
+        assert unit_of_work.commits == 0
+        assert unit_of_work.rollbacks == 1
@@ -6,7 +6,7 @@ from src.application.exceptions import UserAlreadyExistsError
 from src.application.use_case import CreateUserAccountInputDTO, CreateUserAccountUseCase
 from src.domain.entity import Address
 from src.infra.auth import AuthService
-from src.infra.repository import InMemoryUserAccountRepository
+from src.infra.repository import InMemoryUnitOfWork, InMemoryUserAccountRepository
 
 account_input = CreateUserAccountInputDTO(
     name="John McLean",
@@ -40,6 +40,7 @@ class TestCreateUserAccount:
         use_case = CreateUserAccountUseCase(
             auth_service=mock_auth_service,
             repository=None,  # Repository is not needed for this test
+            unit_of_work=InMemoryUnitOfWork(),
         )
 
         with pytest.raises(UserAlreadyExistsError):
@@ -61,6 +62,7 @@ class TestCreateUserAccount:
         use_case = CreateUserAccountUseCase(
             auth_service=mock_auth_service,
             repository=repo,
+            unit_of_work=InMemoryUnitOfWork(),
         )
 
         output = use_case.execute(input_dto=account_input)
@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta
+from unittest.mock import create_autospec
+from uuid import uuid4
+
+import pytest
+
+from src.application.use_case import (
+    CancelSubscriptionInputDTO,
+    CancelSubscriptionUseCase,
+    GetEntitlementInputDTO,
+    GetEntitlementUseCase,
+)
+from src.domain.entity import Subscription
+from src.domain.repository import SubscriptionRepository
+from src.infra.cache import EntitlementCache
+from src.infra.repository import InMemorySubscriptionRepository, InMemoryUnitOfWork
+
+
+@pytest.fixture
+def subscription() -> Subscription:
+    """
+    Fixture for creating a regular subscription.
+    """
+
+    return Subscription.create_regular(user_id=uuid4(), plan_id=uuid4())
+
+
+class TestGetEntitlementUseCase:
+    """
+    Test class for GetEntitlementUseCase.
+    """
+
+    def test_active_subscription_is_entitled_until_end_of_end_date(
+        self, subscription: Subscription
+    ):
+        """
+        Test that an active subscription entitles its user through its end date.
+        """
+
+        use_case = GetEntitlementUseCase(InMemorySubscriptionRepository([subscription]))
+
+        output = use_case.execute(GetEntitlementInputDTO(user_id=subscription.user_id))
+
+        assert output.entitled is True
+        assert output.subscription_id == subscription.id
+        assert output.entitled_until == datetime.combine(
+            subscription.end_date.date() + timedelta(days=1), datetime.min.time()
+        )
+
+    def test_expired_subscription_is_not_entitled(self, subscription: Subscription):
+        """
+        Test that an expired subscription does not entitle its user.
+        """
+
+        subscription.end_date = datetime.now() - timedelta(days=1)
+        use_case = GetEntitlementUseCase(InMemorySubscriptionRepository([subscription]))
+
+        output = use_case.execute(GetEntitlementInputDTO(user_id=subscription.user_id))
+
+        assert output.entitled is False
+        assert output.entitled_until is None
+
+    def test_user_without_subscription_is_not_entitled(self):
+        """
+        Test that a user without a subscription is not entitled.
+        """
+
+        use_case = GetEntitlementUseCase(InMemorySubscriptionRepository())
+
+        output = use_case.execute(GetEntitlementInputDTO(user_id=uuid4()))
+
+        assert output.entitled is False
+        assert output.subscription_id is None
+
+    def test_cached_result_skips_repository(self, subscription: Subscription):
+        """
+        Test that a cached entitlement is served without querying the repository.
+        """
+
+        repository = create_autospec(SubscriptionRepository, instance=True)
+        repository.get_active_by_user_id.return_value = subscription
+        use_case = GetEntitlementUseCase(repository, EntitlementCache())
+        input_dto = GetEntitlementInputDTO(user_id=subscription.user_id)
+
+        assert use_case.execute(input_dto) == use_case.execute(input_dto)
+        repository.get_active_by_user_id.assert_called_once_with(subscription.user_id)
+
+    def test_cancel_invalidates_cached_result(self, subscription: Subscription):
+        """
+        Test that cancelling a subscription drops the cached entitlement.
+        """
+
+        repository = InMemorySubscriptionRepository([subscription])
+        cache = EntitlementCache()
+        use_case = GetEntitlementUseCase(repository, cache)
+        input_dto = GetEntitlementInputDTO(user_id=subscription.user_id)
+        assert use_case.execute(input_dto).entitled is True
+
+        CancelSubscriptionUseCase(
+            repository, InMemoryUnitOfWork(), entitlement_cache=cache
+        ).execute(CancelSubscriptionInputDTO(id=subscription.id))
+
+        assert use_case.execute(input_dto).entitled is False
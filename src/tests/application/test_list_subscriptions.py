@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.application.exceptions import InvalidCursorError
+from src.application.use_case import (
+    ListSubscriptionsInputDTO,
+    ListSubscriptionsUseCase,
+)
+from src.domain.entity import Subscription, SubscriptionStatus
+from src.infra.repository import InMemorySubscriptionRepository
+
+
+@pytest.fixture
+def subscriptions() -> list[Subscription]:
+    """
+    Fixture for creating subscriptions of a single plan, oldest first.
+    """
+
+    plan_id = uuid4()
+    created_at = datetime.now()
+    subscriptions = []
+    for i in range(5):
+        subscription = Subscription.create_regular(user_id=uuid4(), plan_id=plan_id)
+        subscription.created_at = created_at + timedelta(seconds=i)
+        subscriptions.append(subscription)
+
+    return subscriptions
+
+
+class TestListSubscriptionsUseCase:
+    """
+    Test class for ListSubscriptionsUseCase.
+    """
+
+    def test_follows_cursor_until_last_page(self, subscriptions: list[Subscription]):
+        """
+        Test that following the cursors walks every subscription exactly once.
+        """
+
+        use_case = ListSubscriptionsUseCase(
+            InMemorySubscriptionRepository(list(reversed(subscriptions)))
+        )
+
+        first = use_case.execute(ListSubscriptionsInputDTO(limit=2))
+        second = use_case.execute(
+            ListSubscriptionsInputDTO(limit=2, cursor=first.next_cursor)
+        )
+        last = use_case.execute(
+            ListSubscriptionsInputDTO(limit=2, cursor=second.next_cursor)
+        )
+
+        pages = [first, second, last]
+        assert [item.id for page in pages for item in page.items] == [
+            subscription.id for subscription in subscriptions
+        ]
+        assert first.next_cursor is not None
+        assert last.next_cursor is None
+
+    def test_filters_by_plan_and_status(self, subscriptions: list[Subscription]):
+        """
+        Test that only subscriptions matching every filter are listed.
+        """
+
+        subscriptions[1].cancel()
+        other_plan = Subscription.create_regular(user_id=uuid4(), plan_id=uuid4())
+        use_case = ListSubscriptionsUseCase(
+            InMemorySubscriptionRepository(subscriptions + [other_plan])
+        )
+
+        output = use_case.execute(
+            ListSubscriptionsInputDTO(
+                plan_id=subscriptions[0].plan_id,
+                status=SubscriptionStatus.CANCELLED,
+            )
+        )
+
+        assert [item.id for item in output.items] == [subscriptions[1].id]
+        assert output.next_cursor is None
+
+    def test_invalid_cursor_raises_error(self):
+        """
+        Test that a cursor that was not issued by a listing is rejected.
+        """
+
+        use_case = ListSubscriptionsUseCase(InMemorySubscriptionRepository())
+
+        with pytest.raises(InvalidCursorError):
+            use_case.execute(ListSubscriptionsInputDTO(cursor="not-a-cursor"))
@@ -0,0 +1,247 @@
+from datetime import datetime
+from unittest.mock import create_autospec, patch
+from uuid import uuid4
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from src.application.use_case import (
+    RenewDueSubscriptionsInputDTO,
+    RenewDueSubscriptionsUseCase,
+)
+from src.domain.entity import Address, Subscription, UserAccount
+from src.infra.notification import NotificationService
+from src.infra.payment import (
+    FakePaymentTokenProvider,
+    InMemoryPaymentTokenProvider,
+    Payment,
+    PaymentGateway,
+)
+from src.infra.repository import (
+    InMemorySubscriptionRepository,
+    InMemoryUnitOfWork,
+    InMemoryUserAccountRepository,
+)
+
+
+@pytest.fixture
+def user_account() -> UserAccount:
+    """Fixture for creating a user account."""
+    return UserAccount(
+        name="John Doe",
+        email="john.doe@example.com",
+        iam_user_id="iam_123",
+        billing_address=Address(
+            street="123 Main St",
+            city="Anytown",
+            state="CA",
+            zip_code="12345",
+            country="USA",
+        ),
+    )
+
+
+def due_subscription(user_account: UserAccount, trial: bool = False) -> Subscription:
+    """Create a subscription that ended yesterday."""
+    if trial:
+        subscription = Subscription.create_trial(user_account.id, uuid4())
+    else:
+        subscription = Subscription.create_regular(user_account.id, uuid4())
+    subscription.end_date = datetime.now() - relativedelta(days=1)
+    return subscription
+
+
+class TestRenewDueSubscriptionsUseCase:
+    """Test cases for renewing due subscriptions in batch."""
+
+    def test_renews_every_due_subscription_across_pages(
+        self, user_account: UserAccount
+    ):
+        """Test that every due subscription is charged once and renewed."""
+        subscriptions = [due_subscription(user_account) for _ in range(5)]
+        not_due = Subscription.create_regular(user_account.id, uuid4())
+        subscription_repo = InMemorySubscriptionRepository(subscriptions + [not_due])
+        user_account_repo = InMemoryUserAccountRepository([user_account])
+        payment_gateway = create_autospec(PaymentGateway)
+        payment_gateway.process_payment.return_value = Payment(success=True)
+        notification_service = create_autospec(NotificationService)
+
+        use_case = RenewDueSubscriptionsUseCase(
+            subscription_repository=subscription_repo,
+            user_account_repository=user_account_repo,
+            payment_gateway=payment_gateway,
+            payment_token_provider=FakePaymentTokenProvider(),
+            notification_service=notification_service,
+            unit_of_work=InMemoryUnitOfWork(),
+        )
+        output = use_case.execute(
+            RenewDueSubscriptionsInputDTO(
+                before=datetime.now(),
+                page_size=2,
+                max_concurrency=3,
+            )
+        )
+
+        assert output.processed == 5
+        assert output.renewed == 5
+        assert output.payment_failed == 0
+        assert output.failed == 0
+        assert payment_gateway.process_payment.call_count == 5
+        assert list(subscription_repo.iter_due(before=datetime.now())) == []
+        notification_service.notify.assert_not_called()
+
+    def test_failed_payments_downgrade_or_cancel(self, user_account: UserAccount):
+        """Test that failed payments follow the single renewal rules."""
+        regular = due_subscription(user_account)
+        trial = due_subscription(user_account, trial=True)
+        subscription_repo = InMemorySubscriptionRepository([regular, trial])
+        user_account_repo = InMemoryUserAccountRepository([user_account])
+        payment_gateway = create_autospec(PaymentGateway)
+        payment_gateway.process_payment.return_value = Payment(success=False)
+        notification_service = create_autospec(NotificationService)
+
+        use_case = RenewDueSubscriptionsUseCase(
+            subscription_repository=subscription_repo,
+            user_account_repository=user_account_repo,
+            payment_gateway=payment_gateway,
+            payment_token_provider=FakePaymentTokenProvider(),
+            notification_service=notification_service,
+            unit_of_work=InMemoryUnitOfWork(),
+        )
+        output = use_case.execute(
+            RenewDueSubscriptionsInputDTO(
+                before=datetime.now(),
+            )
+        )
+
+        assert output.processed == 2
+        assert output.payment_failed == 2
+        assert subscription_repo.get_by_id(regular.id).is_trial is True  # type: ignore
+        assert subscription_repo.get_by_id(trial.id).is_cancelled is True  # type: ignore
+        assert notification_service.notify.call_count == 2
+
+    def test_no_notification_when_the_downgrade_fails(self, user_account: UserAccount):
+        """Test that a failed payment is only notified once the change is applied."""
+        subscription = due_subscription(user_account)
+        subscription_repo = InMemorySubscriptionRepository([subscription])
+        user_account_repo = InMemoryUserAccountRepository([user_account])
+        payment_gateway = create_autospec(PaymentGateway)
+        payment_gateway.process_payment.return_value = Payment(success=False)
+        notification_service = create_autospec(NotificationService)
+
+        use_case = RenewDueSubscriptionsUseCase(
+            subscription_repository=subscription_repo,
+            user_account_repository=user_account_repo,
+            payment_gateway=payment_gateway,
+            payment_token_provider=FakePaymentTokenProvider(),
+            notification_service=notification_service,
+            unit_of_work=InMemoryUnitOfWork(),
+        )
+        with patch.object(Subscription, "convert_to_trial", side_effect=ValueError):
+            output = use_case.execute(
+                RenewDueSubscriptionsInputDTO(before=datetime.now())
+            )
+
+        assert output.failed == 1
+        assert output.payment_failed == 0
+        notification_service.notify.assert_not_called()
+
+    def test_errors_are_counted_and_do_not_stop_the_run(
+        self, user_account: UserAccount
+    ):
+        """Test that missing accounts and gateway errors are reported as failures."""
+        orphan = Subscription.create_regular(user_id=uuid4(), plan_id=uuid4())
+        orphan.end_date = datetime.now() - relativedelta(days=2)
+        broken = due_subscription(user_account)
+        subscription_repo = InMemorySubscriptionRepository([orphan, broken])
+        user_account_repo = InMemoryUserAccountRepository([user_account])
+        payment_gateway = create_autospec(PaymentGateway)
+        payment_gateway.process_payment.side_effect = TimeoutError
+        notification_service = create_autospec(NotificationService)
+
+        use_case = RenewDueSubscriptionsUseCase(
+            subscription_repository=subscription_repo,
+            user_account_repository=user_account_repo,
+            payment_gateway=payment_gateway,
+            payment_token_provider=FakePaymentTokenProvider(),
+            notification_service=notification_service,
+            unit_of_work=InMemoryUnitOfWork(),
+        )
+        output = use_case.execute(
+            RenewDueSubscriptionsInputDTO(
+                before=datetime.now(),
+                page_size=1,
+            )
+        )
+
+        assert output.processed == 2
+        assert output.renewed == 0
+        assert output.failed == 2
+
+    def test_overdue_subscription_is_charged_once_per_run(
+        self, user_account: UserAccount
+    ):
+        """Test that a subscription still due after renewal is not charged again."""
+        overdue = Subscription.create_regular(user_account.id, uuid4())
+        overdue.end_date = datetime.now() - relativedelta(days=90)
+        subscription_repo = InMemorySubscriptionRepository([overdue])
+        user_account_repo = InMemoryUserAccountRepository([user_account])
+        payment_gateway = create_autospec(PaymentGateway)
+        payment_gateway.process_payment.return_value = Payment(success=True)
+        notification_service = create_autospec(NotificationService)
+
+        use_case = RenewDueSubscriptionsUseCase(
+            subscription_repository=subscription_repo,
+            user_account_repository=user_account_repo,
+            payment_gateway=payment_gateway,
+            payment_token_provider=FakePaymentTokenProvider(),
+            notification_service=notification_service,
+            unit_of_work=InMemoryUnitOfWork(),
+        )
+        output = use_case.execute(
+            RenewDueSubscriptionsInputDTO(
+                before=datetime.now(),
+                page_size=1,
+            )
+        )
+
+        assert output.processed == 1
+        assert payment_gateway.process_payment.call_count == 1
+
+    def test_each_user_is_charged_with_its_own_payment_token(
+        self, user_account: UserAccount
+    ):
+        """Test that payment tokens are resolved per user account."""
+        other_account = user_account.model_copy(update={"id": uuid4()})
+        no_token_account = user_account.model_copy(update={"id": uuid4()})
+        subscriptions = [
+            due_subscription(account)
+            for account in (user_account, other_account, no_token_account)
+        ]
+        subscription_repo = InMemorySubscriptionRepository(subscriptions)
+        user_account_repo = InMemoryUserAccountRepository(
+            [user_account, other_account, no_token_account]
+        )
+        payment_gateway = create_autospec(PaymentGateway)
+        payment_gateway.process_payment.return_value = Payment(success=True)
+
+        use_case = RenewDueSubscriptionsUseCase(
+            subscription_repository=subscription_repo,
+            user_account_repository=user_account_repo,
+            payment_gateway=payment_gateway,
+            payment_token_provider=InMemoryPaymentTokenProvider(
+                {user_account.id: "tok_first", other_account.id: "tok_second"}
+            ),
+            notification_service=create_autospec(NotificationService),
+            unit_of_work=InMemoryUnitOfWork(),
+        )
+        output = use_case.execute(RenewDueSubscriptionsInputDTO(before=datetime.now()))
+
+        assert output.renewed == 2
+        assert output.failed == 1
+        assert sorted(
+            call.kwargs["payment_token"]
+            for call in payment_gateway.process_payment.call_args_list
+        ) == ["tok_first", "tok_second"]
+        unpaid = subscription_repo.get_by_id(subscriptions[2].id)
+        assert unpaid.end_date < datetime.now()  # type: ignore
@@ -9,6 +9,7 @@ from src.infra.notification import NotificationService
 from src.infra.payment import Payment, PaymentGateway
 from src.infra.repository import (
     InMemorySubscriptionRepository,
+    InMemoryUnitOfWork,
     InMemoryUserAccountRepository,
 )
 
@@ -59,12 +60,14 @@ class TestRenewSubscriptionUseCase:
         user_account_repo = InMemoryUserAccountRepository(user_accounts=[user_account])
         payment_gateway = create_autospec(PaymentGateway)
         notification_service = create_autospec(NotificationService)
+        unit_of_work = InMemoryUnitOfWork()
 
         use_case = RenewSubscriptionUseCase(
             subscription_repository=subscription_repo,
             user_account_repository=user_account_repo,
             payment_gateway=payment_gateway,
             notification_service=notification_service,
+            unit_of_work=unit_of_work,
         )
 
         input_dto = RenewSubscriptionInputDTO(
@@ -79,6 +82,7 @@ class TestRenewSubscriptionUseCase:
             message="Subscription not found",
             recipient=None,
         )
+        assert unit_of_work.commits == 1
 
     def test_when_payment_succeeds_and_subscription_is_regular_then_renew(
         self,
@@ -99,6 +103,7 @@ class TestRenewSubscriptionUseCase:
             user_account_repository=user_account_repo,
             payment_gateway=payment_gateway,
             notification_service=notification_service,
+            unit_of_work=InMemoryUnitOfWork(),
         )
 
         input_dto = RenewSubscriptionInputDTO(
@@ -140,6 +145,7 @@ class TestRenewSubscriptionUseCase:
             user_account_repository=user_account_repo,
             payment_gateway=payment_gateway,
             notification_service=notification_service,
+            unit_of_work=InMemoryUnitOfWork(),
         )
 
         input_dto = RenewSubscriptionInputDTO(
@@ -176,6 +182,7 @@ class TestRenewSubscriptionUseCase:
             user_account_repository=user_account_repo,
             payment_gateway=payment_gateway,
             notification_service=notification_service,
+            unit_of_work=InMemoryUnitOfWork(),
         )
 
         input_dto = RenewSubscriptionInputDTO(
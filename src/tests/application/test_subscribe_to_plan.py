@@ -11,11 +11,18 @@ from src.application.exceptions import (
 from src.application.use_case import SubscribeToPlanInputDTO, SubscribeToPlanUseCase
 from src.domain._shared import Currency, MonetaryValue
 from src.domain.entity import Address, Plan, Subscription, UserAccount
+from src.domain.repository import (
+    PlanRepository,
+    SubscribeContext,
+    SubscribeContextLoader,
+    UserAccountRepository,
+)
 from src.infra.notification.notification_service import NotificationService
 from src.infra.payment import Payment, PaymentGateway
 from src.infra.repository import (
     InMemoryPlanRepository,
     InMemorySubscriptionRepository,
+    InMemoryUnitOfWork,
     InMemoryUserAccountRepository,
 )
 
@@ -111,6 +118,7 @@ class TestSubscribeToPlanUseCase:
             plan_repository=plan_repo,
             payment_gateway=payment_gateway,
             notification_service=None,
+            unit_of_work=InMemoryUnitOfWork(),
         )
         input_dto = SubscribeToPlanInputDTO(
             user_id=user_account.id,
@@ -151,6 +159,7 @@ class TestSubscribeToPlanUseCase:
             plan_repository=plan_repo,
             payment_gateway=payment_gateway,
             notification_service=notification_service,
+            unit_of_work=InMemoryUnitOfWork(),
         )
         input_dto = SubscribeToPlanInputDTO(
             user_id=user_account.id,
@@ -189,6 +198,7 @@ class TestSubscribeToPlanUseCase:
             plan_repository=plan_repo,
             payment_gateway=payment_gateway,
             notification_service=None,
+            unit_of_work=InMemoryUnitOfWork(),
         )
         input_dto = SubscribeToPlanInputDTO(
             user_id=uuid4(),
@@ -223,6 +233,7 @@ class TestSubscribeToPlanUseCase:
             plan_repository=plan_repo,
             payment_gateway=payment_gateway,
             notification_service=None,
+            unit_of_work=InMemoryUnitOfWork(),
         )
         input_dto = SubscribeToPlanInputDTO(
             user_id=user_account.id,
@@ -258,6 +269,7 @@ class TestSubscribeToPlanUseCase:
             plan_repository=plan_repo,
             payment_gateway=payment_gateway,
             notification_service=None,
+            unit_of_work=InMemoryUnitOfWork(),
         )
         input_dto = SubscribeToPlanInputDTO(
             user_id=user_account.id,
@@ -270,3 +282,82 @@ class TestSubscribeToPlanUseCase:
             match="User already has active subscription",
         ):
             use_case.execute(input_dto=input_dto)
+
+    def test_when_user_only_has_cancelled_subscription_then_subscribe(
+        self,
+        user_account,
+        plan,
+        regular_subscription,
+    ):
+        """
+        Test that a cancelled subscription does not block a new one.
+        """
+
+        regular_subscription.cancel()
+        subs_repo = InMemorySubscriptionRepository(subscriptions=[regular_subscription])
+        payment_gateway = create_autospec(PaymentGateway)
+        payment_gateway.process_payment.return_value = Payment(success=True)
+
+        use_case = SubscribeToPlanUseCase(
+            subscription_repository=subs_repo,
+            user_repository=InMemoryUserAccountRepository(user_accounts=[user_account]),
+            plan_repository=InMemoryPlanRepository(plans=[plan]),
+            payment_gateway=payment_gateway,
+            notification_service=None,
+            unit_of_work=InMemoryUnitOfWork(),
+        )
+        output = use_case.execute(
+            SubscribeToPlanInputDTO(
+                user_id=user_account.id,
+                plan_id=plan.id,
+                payment_token="payment_token_for_test",
+            )
+        )
+
+        active = subs_repo.get_active_by_user_id(user_account.id)
+        assert active is not None
+        assert active.id == output.subscription_id
+
+    def test_when_repository_loads_context_then_skip_individual_lookups(
+        self,
+        user_account,
+        plan,
+    ):
+        """
+        Test that a repository able to load the subscribe context is used
+        instead of the individual user lookup, while the plan still comes from
+        the plan repository.
+        """
+
+        class ContextLoadingRepository(
+            InMemorySubscriptionRepository, SubscribeContextLoader
+        ):
+            def load_subscribe_context(self, user_id):
+                return SubscribeContext(user=user_account)
+
+        user_repo = create_autospec(UserAccountRepository)
+        plan_repo = create_autospec(PlanRepository)
+        plan_repo.get_by_id.return_value = plan
+        subs_repo = ContextLoadingRepository()
+        payment_gateway = create_autospec(PaymentGateway)
+        payment_gateway.process_payment.return_value = Payment(success=True)
+
+        use_case = SubscribeToPlanUseCase(
+            subscription_repository=subs_repo,
+            user_repository=user_repo,
+            plan_repository=plan_repo,
+            payment_gateway=payment_gateway,
+            notification_service=None,
+            unit_of_work=InMemoryUnitOfWork(),
+        )
+        output = use_case.execute(
+            SubscribeToPlanInputDTO(
+                user_id=user_account.id,
+                plan_id=plan.id,
+                payment_token="payment_token_for_test",
+            )
+        )
+
+        assert subs_repo.get_by_id(output.subscription_id) is not None
+        user_repo.get_by_id.assert_not_called()
+        plan_repo.get_by_id.assert_called_once_with(plan.id)
@@ -0,0 +1,117 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from src.domain._shared import Currency, MonetaryValue
+from src.domain.entity import Address, Subscription, SubscriptionStatus, UserAccount
+from src.infra.db.models import SubscriptionModel, UserAccountModel
+
+
+def test_hydrate_matches_validated_entity():
+    now = datetime.now()
+    data = {
+        "id": uuid4(),
+        "user_id": uuid4(),
+        "plan_id": uuid4(),
+        "start_date": now,
+        "end_date": now,
+        "status": SubscriptionStatus.ACTIVE,
+        "is_trial": False,
+        "created_at": now,
+        "updated_at": now,
+        "is_active": True,
+    }
+
+    hydrated = Subscription.hydrate(**data)
+
+    assert hydrated.model_dump() == Subscription(**data).model_dump()
+    assert hydrated.model_fields_set == set(data)
+
+
+def test_hydrate_fills_missing_fields_with_defaults():
+    subscription = Subscription.hydrate(
+        user_id=uuid4(),
+        plan_id=uuid4(),
+        start_date=datetime.now(),
+        end_date=datetime.now(),
+    )
+
+    assert subscription.status == SubscriptionStatus.ACTIVE
+    assert subscription.is_active is True
+    assert subscription.id is not None
+
+
+def test_hydrate_with_a_misspelled_field_falls_back_to_defaults():
+    now = datetime.now()
+    subscription = Subscription.hydrate(
+        id=uuid4(),
+        user_id=uuid4(),
+        plan_id=uuid4(),
+        start_date=now,
+        end_date=now,
+        status=SubscriptionStatus.ACTIVE,
+        is_trial=False,
+        created_at=now,
+        updated_at=now,
+        is_actve=False,
+    )
+
+    assert subscription.is_active is True
+    assert "is_actve" not in subscription.__dict__
+
+
+def test_hydrate_skips_validation():
+    user_account = UserAccount.hydrate(
+        id=uuid4(),
+        iam_user_id="iam_123",
+        name="John Doe",
+        email="not-an-email",
+        billing_address=Address.hydrate(
+            street="123 Main St",
+            city="Anytown",
+            state="CA",
+            zip_code="12345",
+            country="USA",
+        ),
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+        is_active=True,
+    )
+
+    assert user_account.email == "not-an-email"
+
+
+def test_hydrated_entities_still_validate_assignment():
+    subscription = Subscription.create_regular(user_id=uuid4(), plan_id=uuid4())
+    hydrated = SubscriptionModel.to_entity(SubscriptionModel.from_entity(subscription))
+
+    with pytest.raises(ValidationError):
+        hydrated.end_date = "not-a-date"  # type: ignore
+
+
+def test_hydrated_value_objects_stay_frozen():
+    price = MonetaryValue.hydrate(amount=10, currency=Currency.USD)
+
+    with pytest.raises(ValidationError, match="Instance is frozen"):
+        price.amount = 20  # type: ignore
+
+
+def test_to_entity_round_trip():
+    user_account = UserAccount(
+        name="John Doe",
+        email="john.doe@example.com",
+        iam_user_id="iam_123",
+        billing_address=Address(
+            street="123 Main St",
+            city="Anytown",
+            state="CA",
+            zip_code="12345",
+            country="USA",
+        ),
+    )
+
+    hydrated = UserAccountModel.to_entity(UserAccountModel.from_entity(user_account))
+
+    assert hydrated.model_dump() == user_account.model_dump()
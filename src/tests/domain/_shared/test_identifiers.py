@@ -0,0 +1,72 @@
+import time
+from datetime import datetime
+from uuid import uuid4
+
+from src.domain._shared import Entity, uuid7
+from src.domain.entity import Plan, Subscription, UserAccount
+
+
+def test_uuid7_has_version_and_variant():
+    value = uuid7()
+
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+
+
+def test_uuid7_starts_with_unix_timestamp_in_milliseconds():
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+
+    assert before <= value.int >> 80 <= after + 1
+
+
+def test_uuid7_is_strictly_increasing():
+    values = [uuid7() for _ in range(10_000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+
+def test_id_factory_is_configurable_per_entity_type():
+    class Counter(Entity):
+        id_factory = staticmethod(uuid7)
+
+    assert Counter().id.version == 7
+    assert Entity().id.version == 4
+
+
+def test_subscriptions_and_user_accounts_use_uuid7():
+    assert Subscription.create_trial(user_id=uuid4(), plan_id=uuid4()).id.version == 7
+    assert UserAccount.id_factory is uuid7
+    assert Plan.id_factory is not uuid7
+
+
+def test_explicit_id_is_kept():
+    value = uuid4()
+    now = datetime.now()
+
+    subscription = Subscription(
+        id=value,
+        user_id=uuid4(),
+        plan_id=uuid4(),
+        start_date=now,
+        end_date=now,
+    )
+
+    assert subscription.id == value
+
+
+def test_model_construct_uses_the_id_factory():
+    now = datetime.now()
+
+    subscription = Subscription.model_construct(
+        user_id=uuid4(), plan_id=uuid4(), start_date=now, end_date=now
+    )
+    hydrated = Subscription.hydrate(
+        user_id=uuid4(), plan_id=uuid4(), start_date=now, end_date=now
+    )
+
+    assert subscription.id.version == 7
+    assert hydrated.id.version == 7
+    assert Entity.model_construct().id.version == 4
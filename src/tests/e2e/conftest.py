@@ -1,27 +1,72 @@
+import asyncio
+from functools import partial
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, SQLModel, StaticPool, create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.infra.api import app, get_auth_service
+from src.infra.api import (
+    create_app,
+    get_auth_service,
+    get_entitlement_cache,
+    get_plan_catalog_cache,
+)
 from src.infra.auth import InMemoryAuthService
-from src.infra.db import get_session
+from src.infra.cache import EntitlementCache, PlanCatalogCache
+from src.infra.db import (
+    get_async_session,
+    get_session,
+    get_session_factory,
+    instrument_queries,
+)
+from src.infra.tracing import trace_engine
+
+
+@pytest.fixture(scope="function")
+def database_path(tmp_path):
+    """
+    Fixture for the path of a database file shared by the sync and async engines.
+    """
+
+    return tmp_path / "subscription_service.db"
 
 
 @pytest.fixture(scope="function")
-def session():
+def session(database_path):
     """
     Fixture for creating a database session.
     """
 
     engine = create_engine(
-        "sqlite:///:memory:",
+        f"sqlite:///{database_path}",
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
     )
+    instrument_queries(engine, slow_query_threshold=1.0)
+    trace_engine(engine)
 
     SQLModel.metadata.create_all(engine)
     with Session(engine) as s:
         yield s
+    engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def async_engine(database_path, session):
+    """
+    Fixture for creating an asynchronous engine on the session database.
+    """
+
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{database_path}",
+        poolclass=NullPool,
+    )
+    instrument_queries(engine.sync_engine, slow_query_threshold=1.0)
+    trace_engine(engine.sync_engine)
+    yield engine
+    asyncio.run(engine.dispose())
 
 
 @pytest.fixture(scope="function")
@@ -34,19 +79,31 @@ def auth_service():
 
 
 @pytest.fixture
-def client(session, auth_service):
+def client(session, async_engine, auth_service):
     """
     Fixture for creating a test client.
     """
 
+    plan_catalog_cache = PlanCatalogCache()
+    entitlement_cache = EntitlementCache()
+
     def get_session_override():
         return session
 
+    async def get_async_session_override():
+        async with AsyncSession(async_engine, expire_on_commit=False) as s:
+            yield s
+
     def get_auth_service_override():
         return auth_service
 
+    session_factory = partial(Session, session.get_bind())
+    app = create_app(session_factory=session_factory)
     app.dependency_overrides[get_session] = get_session_override
+    app.dependency_overrides[get_async_session] = get_async_session_override
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
     app.dependency_overrides[get_auth_service] = get_auth_service_override
+    app.dependency_overrides[get_plan_catalog_cache] = lambda: plan_catalog_cache
+    app.dependency_overrides[get_entitlement_cache] = lambda: entitlement_cache
     with TestClient(app) as c:
         yield c
-    app.dependency_overrides.clear()
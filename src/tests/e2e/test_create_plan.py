@@ -1,4 +1,9 @@
 from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from src.domain._shared.value_objects import MonetaryValue
+from src.domain.entity import Plan
+from src.infra.db.repository import SQLModelPlanRepository
 
 
 class TestCreatePlanAPIRoute:
@@ -66,6 +71,31 @@ class TestCreatePlanAPIRoute:
         data = response.json()
         assert data["detail"] == "Plan with name 'Standard' already exists."
 
+    def test_create_plan_duplicate_of_a_plan_the_cache_missed(
+        self, client: TestClient, session: Session
+    ) -> None:
+        """
+        Try to create a plan whose name was taken after the catalog was cached,
+        as another worker would
+        """
+
+        payload = {"price": {"amount": "10.00", "currency": "USD"}}
+        assert (
+            client.post("/plans", json={"name": "Basic", **payload}).status_code == 201
+        )
+        assert (
+            client.post("/plans", json={"name": "Basic", **payload}).status_code == 400
+        )
+        SQLModelPlanRepository(session).save(
+            Plan(name="Premium", price=MonetaryValue(amount=20, currency="USD"))
+        )
+        session.commit()
+
+        response = client.post("/plans", json={"name": "Premium", **payload})
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Plan with name 'Premium' already exists."
+
     def test_create_plan_invalid_data(self, client: TestClient) -> None:
         """
         Try to create a new plan with invalid data
@@ -0,0 +1,55 @@
+from fastapi.testclient import TestClient
+
+
+class TestListPlansAPIRoute:
+    """
+    Test for API Route
+    """
+
+    def test_list_plans_pages(self, client: TestClient) -> None:
+        """
+        Test listing plans a page at a time
+        """
+
+        names = ["Basic", "Standard", "Premium"]
+        for name in names:
+            response = client.post(
+                "/plans",
+                json={"name": name, "price": {"amount": "10.00", "currency": "USD"}},
+            )
+            assert response.status_code == 201
+
+        response = client.get("/plans", params={"limit": 2})
+        assert response.status_code == 200
+        first = response.json()
+        assert len(first["items"]) == 2
+        assert first["next_cursor"] is not None
+
+        response = client.get(
+            "/plans", params={"limit": 2, "cursor": first["next_cursor"]}
+        )
+        assert response.status_code == 200
+        last = response.json()
+        assert last["next_cursor"] is None
+
+        listed = [plan["name"] for plan in first["items"] + last["items"]]
+        assert listed == names
+
+    def test_list_plans_invalid_cursor(self, client: TestClient) -> None:
+        """
+        Try to list plans with a cursor that was never issued
+        """
+
+        response = client.get("/plans", params={"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor 'not-a-cursor'."
+
+    def test_list_plans_limit_too_large(self, client: TestClient) -> None:
+        """
+        Try to list plans with a page size above the maximum
+        """
+
+        response = client.get("/plans", params={"limit": 501})
+
+        assert response.status_code == 422
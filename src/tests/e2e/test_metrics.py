@@ -0,0 +1,61 @@
+from fastapi.testclient import TestClient
+
+
+class TestMetricsAPIRoute:
+    """
+    Test for API Route
+    """
+
+    def test_metrics_expose_route_use_case_and_repository_latency(
+        self, client: TestClient
+    ) -> None:
+        """
+        Test that a request is recorded at every layer it goes through
+        """
+
+        response = client.post(
+            "/plans",
+            json={"name": "Metered", "price": {"amount": "10.00", "currency": "USD"}},
+        )
+        assert response.status_code == 201
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert (
+            'http_request_duration_seconds_count{method="POST",route="/plans",'
+            'status="201"}'
+        ) in response.text
+        assert (
+            'use_case_duration_seconds_count{class="AsyncCreatePlanUseCase",'
+            'method="execute"}'
+        ) in response.text
+        assert (
+            'repository_call_duration_seconds_count{class="AsyncSQLModelPlanRepository",'
+            'method="save"}'
+        ) in response.text
+
+    def test_request_queries_are_counted(self, client: TestClient) -> None:
+        """
+        Test that the statements of a request are reported and recorded
+        """
+
+        response = client.post(
+            "/plans",
+            json={"name": "Counted", "price": {"amount": "10.00", "currency": "USD"}},
+        )
+        assert response.status_code == 201
+        server_timing = response.headers["Server-Timing"]
+        assert server_timing.startswith("db;dur=")
+        assert 'desc="queries=' in server_timing
+        assert 'desc="queries=0"' not in server_timing
+
+        response = client.get("/metrics")
+
+        assert 'http_request_queries_count{method="POST",route="/plans"}' in (
+            response.text
+        )
+        assert 'use_case_queries_count{class="AsyncCreatePlanUseCase"}' in (
+            response.text
+        )
@@ -1,13 +1,20 @@
+import json
 from typing import Dict
+from unittest.mock import create_autospec
 from uuid import UUID
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from sqlmodel import Session, select
 
-from src.infra.api import app, get_payment_gateway
+from src.infra.api import get_payment_gateway
+from src.infra.db.models import NotificationOutboxModel
 from src.infra.db.repository import SQLModelSubscriptionRepository
-from src.infra.payment import FakePaymentGateway
+from src.infra.payment import (
+    FakePaymentGateway,
+    PaymentGateway,
+    PaymentGatewayError,
+)
 
 
 @pytest.fixture
@@ -118,14 +125,15 @@ class TestSubscribeToPlanAPIRoute:
         self,
         client: TestClient,
         subscription_payload: Dict,
+        account_payload: Dict,
         session: Session,
     ) -> None:
         """
         Test subscribe to a plan
         """
 
-        app.dependency_overrides[get_payment_gateway] = lambda: FakePaymentGateway(
-            success=False
+        client.app.dependency_overrides[get_payment_gateway] = (
+            lambda: FakePaymentGateway(success=False)
         )
 
         response = client.post(
@@ -146,6 +154,9 @@ class TestSubscribeToPlanAPIRoute:
         assert subscription.is_trial is True
         assert subscription.status == "ACTIVE"
 
+        notifications = session.exec(select(NotificationOutboxModel)).all()
+        assert [n.recipient for n in notifications] == [account_payload["email"]]
+
     def test_subscribe_to_plan_already_subscribed(
         self,
         client: TestClient,
@@ -170,6 +181,31 @@ class TestSubscribeToPlanAPIRoute:
         assert response.status_code == 400
         assert response.json()["detail"] == "User already has active subscription"
 
+    def test_subscribe_to_plan_payment_gateway_error(
+        self,
+        client: TestClient,
+        subscription_payload: Dict,
+    ) -> None:
+        """
+        Test subscribe to a plan when the payment gateway fails
+        """
+
+        payment_gateway = create_autospec(PaymentGateway)
+        payment_gateway.process_payment.side_effect = PaymentGatewayError(
+            "Payment API responded with a malformed payment"
+        )
+        client.app.dependency_overrides[get_payment_gateway] = lambda: payment_gateway
+
+        response = client.post(
+            "/subscriptions",
+            json=subscription_payload,
+        )
+
+        assert response.status_code == 502
+        assert response.json()["detail"] == (
+            "Payment API responded with a malformed payment"
+        )
+
     def test_subscribe_to_plan_invalid_user_id(
         self,
         client: TestClient,
@@ -188,3 +224,77 @@ class TestSubscribeToPlanAPIRoute:
 
         assert response.status_code == 422
         assert "invalid character" in response.json()["detail"][0]["msg"]
+
+    def test_subscribe_to_plan_grants_entitlement(
+        self,
+        client: TestClient,
+        subscription_payload: Dict,
+    ) -> None:
+        """
+        Test that subscribing to a plan entitles the user to stream
+        """
+
+        user_id = subscription_payload["user_id"]
+        response = client.get(f"/accounts/{user_id}/entitlement")
+
+        assert response.status_code == 200
+        assert response.json()["entitled"] is False
+
+        response = client.post(
+            "/subscriptions",
+            json=subscription_payload,
+        )
+        subscription_id = response.json()["subscription_id"]
+
+        response = client.get(f"/accounts/{user_id}/entitlement")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["entitled"] is True
+        assert data["subscription_id"] == subscription_id
+        assert data["entitled_until"] is not None
+
+    def test_export_subscriptions(
+        self,
+        client: TestClient,
+        subscription_payload: Dict,
+        account_payload: Dict,
+    ) -> None:
+        """
+        Test exporting subscriptions joined with plan price and user email
+        """
+
+        response = client.post("/subscriptions", json=subscription_payload)
+        assert response.status_code == 201
+        subscription_id = response.json()["subscription_id"]
+
+        response = client.get("/subscriptions/export")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert len(rows) == 1
+        assert rows[0]["subscription_id"] == subscription_id
+        assert rows[0]["user_email"] == account_payload["email"]
+        assert rows[0]["price_amount"] == "10.00"
+
+        response = client.get("/subscriptions/export", params={"format": "csv"})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        header, row = response.text.splitlines()
+        assert header.startswith("subscription_id,user_id,user_email")
+        assert account_payload["email"] in row
+
+    def test_subscribe_to_plan_uses_shared_payment_gateway(
+        self,
+        client: TestClient,
+        subscription_payload: Dict,
+    ) -> None:
+        """
+        Test that payments go through the payment gateway of the app container
+        """
+
+        response = client.post("/subscriptions", json=subscription_payload)
+        assert response.status_code == 201
+
+        payment_gateway = client.app.state.container.payment_gateway
+        assert len(payment_gateway.payments) == 1
@@ -0,0 +1,102 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src.infra.api import get_admin_token
+from src.infra.tracing import tracer
+
+ADMIN_HEADERS = {"X-Admin-Token": "admin-secret"}
+
+
+@pytest.fixture(autouse=True)
+def traced(client: TestClient, monkeypatch):
+    """
+    Fixture tracing every request, with the admin routes enabled.
+    """
+
+    monkeypatch.setattr(tracer, "sample_rate", 1.0)
+    client.app.dependency_overrides[get_admin_token] = lambda: "admin-secret"
+
+
+class TestTracesAPIRoute:
+    """
+    Test for API Route
+    """
+
+    def test_request_trace_spans_route_use_case_repository_and_query(
+        self, client: TestClient
+    ) -> None:
+        """
+        Test that a request is traced through every layer it goes through
+        """
+
+        response = client.post(
+            "/plans",
+            json={"name": "Traced", "price": {"amount": "10.00", "currency": "USD"}},
+        )
+        assert response.status_code == 201
+        trace_id = response.headers["X-Trace-Id"]
+
+        response = client.get(f"/admin/traces/{trace_id}", headers=ADMIN_HEADERS)
+
+        assert response.status_code == 200
+        spans = {span["span_id"]: span for span in response.json()["spans"]}
+        by_name = {span["name"]: span for span in spans.values()}
+        root = by_name["POST /plans"]
+        use_case = by_name["AsyncCreatePlanUseCase.execute"]
+        cached_save = by_name["AsyncCachedPlanRepository.save"]
+        save = by_name["AsyncSQLModelPlanRepository.save"]
+        queries = [span for span in spans.values() if span["name"] == "db.query"]
+        assert root["parent_id"] is None
+        assert root["attributes"]["status"] == 201
+        assert spans[use_case["parent_id"]] == root
+        assert spans[cached_save["parent_id"]] == use_case
+        assert spans[save["parent_id"]] == cached_save
+        assert any(
+            query["attributes"]["statement"].startswith("INSERT INTO plans")
+            and query["attributes"]["rowcount"] == 1
+            for query in queries
+        )
+
+    def test_list_traces_returns_recent_traces(self, client: TestClient) -> None:
+        """
+        Test that the most recent traces are listed newest first
+        """
+
+        first = client.get("/plans").headers["X-Trace-Id"]
+        second = client.get("/plans").headers["X-Trace-Id"]
+
+        response = client.get(
+            "/admin/traces", params={"limit": 2}, headers=ADMIN_HEADERS
+        )
+
+        assert response.status_code == 200
+        assert [trace["trace_id"] for trace in response.json()] == [second, first]
+
+    def test_unknown_trace_is_not_found(self, client: TestClient) -> None:
+        """
+        Test that an unknown trace ID is rejected
+        """
+
+        response = client.get("/admin/traces/unknown", headers=ADMIN_HEADERS)
+
+        assert response.status_code == 404
+
+    def test_traces_require_the_admin_token(self, client: TestClient) -> None:
+        """
+        Test that the traces are not served without the admin token
+        """
+
+        response = client.get("/admin/traces", headers={"X-Admin-Token": "wrong"})
+
+        assert response.status_code == 401
+
+    def test_traces_are_hidden_without_an_admin_token(self, client: TestClient) -> None:
+        """
+        Test that the admin routes do not exist when no token is configured
+        """
+
+        client.app.dependency_overrides[get_admin_token] = lambda: None
+
+        response = client.get("/admin/traces", headers=ADMIN_HEADERS)
+
+        assert response.status_code == 404
@@ -0,0 +1,141 @@
+from datetime import datetime, timedelta
+from typing import List
+from uuid import uuid4
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.domain.entity import Subscription
+from src.infra.analytics import UUID_DTYPE, PlanLifecycleCounts, SubscriptionFrame
+from src.infra.analytics import subscription_frame
+from src.infra.db.repository import SQLModelSubscriptionRepository
+
+NOW = datetime(2025, 6, 15, 12)
+
+
+@pytest.fixture
+def subscriptions() -> List[Subscription]:
+    """
+    Fixture for subscriptions of two plans in every lifecycle state.
+    """
+
+    basic, premium = uuid4(), uuid4()
+    subscriptions = []
+    for plan_id, end_offset, cancelled, trial in [
+        (basic, timedelta(days=10), False, False),
+        (basic, timedelta(days=2), False, True),
+        (basic, -timedelta(days=1), False, False),
+        (basic, timedelta(hours=-11), False, False),
+        (premium, timedelta(days=30), True, False),
+        (premium, timedelta(days=5), False, False),
+    ]:
+        subscription = Subscription(
+            user_id=uuid4(),
+            plan_id=plan_id,
+            start_date=NOW - timedelta(days=30),
+            end_date=NOW + end_offset,
+            is_trial=trial,
+        )
+        if cancelled:
+            subscription.cancel()
+        subscriptions.append(subscription)
+
+    return subscriptions
+
+
+class TestSubscriptionFrame:
+    """
+    Test class for SubscriptionFrame.
+    """
+
+    def test_masks_match_entity_properties(self, subscriptions):
+        """
+        Test that the vectorized checks agree with the entity properties.
+        """
+
+        frame = SubscriptionFrame.from_subscriptions(subscriptions)
+
+        expired = [s.end_date.date() < NOW.date() for s in subscriptions]
+        assert frame.is_expired(NOW).tolist() == expired
+        assert frame.is_cancelled().tolist() == [s.is_cancelled for s in subscriptions]
+        assert frame.subscription_ids() == [s.id for s in subscriptions]
+
+    def test_count_by_plan(self, subscriptions):
+        """
+        Test the lifecycle counts of every plan.
+        """
+
+        counts = SubscriptionFrame.from_subscriptions(subscriptions).count_by_plan(NOW)
+
+        assert counts == {
+            subscriptions[0].plan_id: PlanLifecycleCounts(
+                total=4, active=3, trial=1, expired=1, cancelled=0
+            ),
+            subscriptions[4].plan_id: PlanLifecycleCounts(
+                total=2, active=1, trial=0, expired=0, cancelled=1
+            ),
+        }
+
+    def test_expiring_within(self, subscriptions):
+        """
+        Test that only entitled subscriptions ending in the window are selected.
+        """
+
+        frame = SubscriptionFrame.from_subscriptions(subscriptions)
+
+        expiring = frame.expiring_within(5, now=NOW)
+
+        assert expiring.subscription_ids() == [
+            subscriptions[1].id,
+            subscriptions[3].id,
+            subscriptions[5].id,
+        ]
+
+    def test_empty_frame(self):
+        """
+        Test that an empty frame has no counts.
+        """
+
+        frame = SubscriptionFrame.from_rows([])
+
+        assert len(frame) == 0
+        assert frame.count_by_plan(NOW) == {}
+
+    def test_from_session(self, subscriptions):
+        """
+        Test that a frame read from the database matches one built from entities.
+        """
+
+        engine = create_engine("sqlite://")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            SQLModelSubscriptionRepository(session).save_many(subscriptions)
+            session.commit()
+
+            frame = SubscriptionFrame.from_session(session)
+            premium = SubscriptionFrame.from_session(
+                session, plan_id=subscriptions[4].plan_id
+            )
+
+        assert sorted(frame.subscription_ids()) == sorted(s.id for s in subscriptions)
+        assert frame.count_by_plan(NOW) == SubscriptionFrame.from_subscriptions(
+            subscriptions
+        ).count_by_plan(NOW)
+        assert len(premium) == 2
+
+    def test_from_session_reads_the_table_in_chunks(self, subscriptions, monkeypatch):
+        """
+        Test that a table larger than a chunk is read whole, IDs included.
+        """
+
+        monkeypatch.setattr(subscription_frame, "FROM_SESSION_CHUNK_SIZE", 4)
+        engine = create_engine("sqlite://")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            SQLModelSubscriptionRepository(session).save_many(subscriptions)
+            session.commit()
+
+            frame = SubscriptionFrame.from_session(session)
+
+        assert frame.ids.dtype == UUID_DTYPE
+        assert sorted(frame.subscription_ids()) == sorted(s.id for s in subscriptions)
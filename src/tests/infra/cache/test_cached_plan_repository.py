@@ -0,0 +1,223 @@
+from unittest.mock import create_autospec
+
+import pytest
+
+from src.domain._shared.value_objects import Currency, MonetaryValue
+from src.domain.entity import Plan
+from src.domain.repository import PlanRepository
+from src.infra.cache import CachedPlanRepository, PlanCatalogCache
+from src.infra.repository import InMemoryPlanRepository, InMemoryUnitOfWork
+
+
+class FakeClock:
+    """
+    Clock that only moves when told to.
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def plan() -> Plan:
+    """
+    Fixture for creating a plan.
+    """
+
+    return Plan(
+        name="Basic",
+        price=MonetaryValue(
+            amount=10.0,  # type: ignore
+            currency=Currency.BRL,
+        ),
+    )
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """
+    Fixture for creating a fake clock.
+    """
+
+    return FakeClock()
+
+
+@pytest.fixture
+def inner(plan: Plan) -> PlanRepository:
+    """
+    Fixture for the wrapped repository, spying on its calls.
+    """
+
+    repository = create_autospec(PlanRepository, instance=True)
+    in_memory = InMemoryPlanRepository([plan])
+    repository.get_by_id.side_effect = in_memory.get_by_id
+    repository.get_by_name.side_effect = in_memory.get_by_name
+    repository.list_page.side_effect = in_memory.list_page
+    repository.save.side_effect = in_memory.save
+    return repository
+
+
+@pytest.fixture
+def unit_of_work() -> InMemoryUnitOfWork:
+    """
+    Fixture for creating a unit of work.
+    """
+
+    return InMemoryUnitOfWork()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> PlanCatalogCache:
+    """
+    Fixture for creating a plan catalog cache.
+    """
+
+    return PlanCatalogCache(ttl_seconds=60, clock=clock)
+
+
+def premium() -> Plan:
+    """
+    Create a plan that is not in the wrapped repository yet.
+    """
+
+    return Plan(
+        name="Premium",
+        price=MonetaryValue(amount=20.0, currency=Currency.BRL),  # type: ignore
+    )
+
+
+class TestCachedPlanRepository:
+    """
+    Test class for CachedPlanRepository.
+    """
+
+    def test_loads_the_catalog_once(self, inner, cache, unit_of_work, plan):
+        """
+        Test that lookups by ID and name are answered by a single load of the
+        catalog.
+        """
+
+        repo = CachedPlanRepository(inner, cache, unit_of_work)
+
+        assert repo.get_by_id(plan.id) == plan
+        assert repo.get_by_id(plan.id) == plan
+        assert repo.get_by_name(plan.name) == plan
+        assert repo.get_many_by_ids([plan.id]) == [plan]
+
+        inner.list_page.assert_called_once()
+        inner.get_by_id.assert_not_called()
+        inner.get_by_name.assert_not_called()
+        assert (cache.hits, cache.misses) == (3, 1)
+
+    def test_missing_plans_are_answered_by_the_catalog(
+        self, inner, cache, unit_of_work
+    ):
+        """
+        Test that looking up a plan that does not exist does not reach the
+        wrapped repository once the catalog is loaded.
+        """
+
+        repo = CachedPlanRepository(inner, cache, unit_of_work)
+
+        assert repo.get_by_name("Premium") is None
+        assert repo.get_by_name("Premium") is None
+
+        inner.list_page.assert_called_once()
+        inner.get_by_name.assert_not_called()
+
+    def test_catalog_is_loaded_page_by_page(self, cache, unit_of_work, monkeypatch):
+        """
+        Test that a catalog larger than a page is loaded whole.
+        """
+
+        monkeypatch.setattr(
+            "src.infra.cache.cached_plan_repository.CATALOG_PAGE_SIZE", 2
+        )
+        plans = [
+            Plan(
+                name=f"Plan {index}",
+                price=MonetaryValue(amount=10.0, currency=Currency.BRL),  # type: ignore
+            )
+            for index in range(5)
+        ]
+        repo = CachedPlanRepository(InMemoryPlanRepository(plans), cache, unit_of_work)
+
+        assert all(repo.get_by_name(plan.name) == plan for plan in plans)
+        assert len(cache.get()) == 5  # type: ignore
+
+    def test_save_invalidates_after_commit(self, inner, cache, unit_of_work, plan):
+        """
+        Test that saving a plan drops the cached catalog once committed, and
+        not when the save is only staged.
+        """
+
+        repo = CachedPlanRepository(inner, cache, unit_of_work)
+        repo.get_by_id(plan.id)
+
+        new_plan = premium()
+        with unit_of_work:
+            repo.save(new_plan)
+            assert repo.get_by_name("Premium") is None
+            unit_of_work.commit()
+
+        assert repo.get_by_name("Premium") == new_plan
+        assert inner.list_page.call_count == 2
+
+    def test_rolled_back_save_keeps_the_catalog(self, inner, cache, unit_of_work, plan):
+        """
+        Test that a save rolled back does not invalidate the cached catalog.
+        """
+
+        repo = CachedPlanRepository(inner, cache, unit_of_work)
+        repo.get_by_id(plan.id)
+
+        with pytest.raises(RuntimeError):
+            with unit_of_work:
+                repo.save(premium())
+                raise RuntimeError("boom")
+        unit_of_work.commit()
+        repo.get_by_id(plan.id)
+
+        inner.list_page.assert_called_once()
+
+    def test_snapshot_expires_after_ttl(self, inner, cache, unit_of_work, clock, plan):
+        """
+        Test that the cached catalog is dropped once its TTL elapses.
+        """
+
+        repo = CachedPlanRepository(inner, cache, unit_of_work)
+        repo.get_by_id(plan.id)
+
+        clock.now = 59
+        repo.get_by_id(plan.id)
+        clock.now = 60
+        repo.get_by_id(plan.id)
+
+        assert inner.list_page.call_count == 2
+
+    def test_stale_read_is_not_cached_after_invalidation(self, cache, plan):
+        """
+        Test that a catalog read before an invalidation is not cached after it.
+        """
+
+        generation = cache.generation
+        cache.invalidate()
+        catalog = cache.put([plan], generation)
+
+        assert catalog.get_by_id(plan.id) == plan
+        assert cache.get() is None
+
+    def test_cached_plans_cannot_be_changed_by_callers(
+        self, inner, cache, unit_of_work, plan
+    ):
+        """
+        Test that changing a returned plan does not change the cached one.
+        """
+
+        repo = CachedPlanRepository(inner, cache, unit_of_work)
+        repo.get_by_id(plan.id).name = "Changed"
+
+        assert repo.get_by_id(plan.id).name == "Basic"
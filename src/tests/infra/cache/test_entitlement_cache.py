@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from pydantic import BaseModel
+
+from src.infra.cache import EntitlementCache
+
+
+class Result(BaseModel):
+    """
+    Cached result.
+    """
+
+    entitled: bool
+
+
+class FakeClock:
+    """
+    Clock that only moves when told to.
+    """
+
+    def __init__(self) -> None:
+        self.now = datetime(2025, 1, 1, 12)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """
+    Fixture for creating a fake clock.
+    """
+
+    return FakeClock()
+
+
+class TestEntitlementCache:
+    """
+    Test class for EntitlementCache.
+    """
+
+    def test_entry_expires_at_valid_until(self, clock):
+        """
+        Test that a result is dropped when its entitlement ends.
+        """
+
+        cache = EntitlementCache(max_ttl_seconds=3600, clock=clock)
+        user_id = uuid4()
+        cache.put(user_id, Result(entitled=True), clock.now + timedelta(minutes=5), 0)
+
+        clock.now += timedelta(minutes=4)
+        assert cache.get(user_id) == Result(entitled=True)
+        clock.now += timedelta(minutes=1)
+        assert cache.get(user_id) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_entry_expires_at_max_ttl(self, clock):
+        """
+        Test that a result is never kept longer than the maximum TTL.
+        """
+
+        cache = EntitlementCache(max_ttl_seconds=60, clock=clock)
+        user_id = uuid4()
+        cache.put(user_id, Result(entitled=True), clock.now + timedelta(days=30), 0)
+
+        clock.now += timedelta(seconds=60)
+        assert cache.get(user_id) is None
+
+    def test_negative_result_uses_negative_ttl(self, clock):
+        """
+        Test that a result without an entitlement end uses the negative TTL.
+        """
+
+        cache = EntitlementCache(negative_ttl_seconds=5, clock=clock)
+        user_id = uuid4()
+        cache.put(user_id, Result(entitled=False), None, 0)
+
+        clock.now += timedelta(seconds=4)
+        assert cache.get(user_id) == Result(entitled=False)
+        clock.now += timedelta(seconds=1)
+        assert cache.get(user_id) is None
+
+    def test_least_recently_used_entry_is_evicted(self, clock):
+        """
+        Test that the least recently used result is evicted when full.
+        """
+
+        cache = EntitlementCache(max_size=2, clock=clock)
+        first, second, third = uuid4(), uuid4(), uuid4()
+        cache.put(first, Result(entitled=True), None, 0)
+        cache.put(second, Result(entitled=True), None, 0)
+        cache.get(first)
+
+        cache.put(third, Result(entitled=True), None, 0)
+
+        assert len(cache) == 2
+        assert cache.get(second) is None
+        assert cache.get(first) is not None
+
+    def test_stale_result_is_not_cached_after_invalidation(self, clock):
+        """
+        Test that a result computed before an invalidation is not cached after it.
+        """
+
+        cache = EntitlementCache(clock=clock)
+        user_id = uuid4()
+        generation = cache.generation
+        cache.invalidate(user_id)
+
+        cache.put(user_id, Result(entitled=True), None, generation)
+
+        assert cache.get(user_id) is None
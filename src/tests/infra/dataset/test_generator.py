@@ -0,0 +1,122 @@
+from collections import Counter
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.domain.entity import SubscriptionStatus
+from src.infra.dataset import DatasetGenerator, DatasetSpec, hex_ids
+
+NOW = datetime(2026, 1, 1)
+
+
+def generate(**spec):
+    """
+    Generate a dataset and return its plans, user accounts and subscriptions
+    as single sets of columns.
+    """
+
+    generator = DatasetGenerator(DatasetSpec(now=NOW, **spec))
+    blocks = list(generator.blocks())
+    return (
+        generator.plans(),
+        concat([block.user_accounts for block in blocks]),
+        concat([block.subscriptions for block in blocks]),
+    )
+
+
+def concat(parts):
+    """
+    Concatenate blocks of columns, keeping the byte order of the IDs.
+    """
+
+    return {
+        name: np.concatenate([part[name] for part in parts], dtype=values.dtype)
+        for name, values in parts[0].items()
+    }
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    """
+    Fixture for a dataset spanning several blocks.
+    """
+
+    return generate(user_accounts=25_000)
+
+
+class TestDatasetGenerator:
+    """
+    Test class for DatasetGenerator.
+    """
+
+    def test_same_seed_generates_same_dataset(self):
+        """
+        Test that generating twice from the same spec gives the same rows, and
+        that another seed gives other rows.
+        """
+
+        first, second, other = (
+            generate(user_accounts=1_000, seed=seed) for seed in (7, 7, 8)
+        )
+
+        for table, same in zip(first, second):
+            for name, values in table.items():
+                assert np.array_equal(values, same[name])
+        assert not np.array_equal(first[1]["id"], other[1]["id"])
+        assert not np.array_equal(first[2]["end_date"], other[2]["end_date"])
+
+    def test_rows_are_consistent(self, dataset):
+        """
+        Test that the generated rows satisfy the schema and domain rules.
+        """
+
+        plans, user_accounts, subscriptions = dataset
+
+        for column in ("id", "iam_user_id", "email"):
+            assert len(np.unique(user_accounts[column])) == 25_000
+        assert len(np.unique(subscriptions["id"])) == len(subscriptions["id"])
+        assert len(np.unique(plans["name"])) == len(plans["name"])
+        assert np.all(np.diff(user_accounts["created_at"]) >= np.timedelta64(0))
+
+        active = subscriptions["status"] == SubscriptionStatus.ACTIVE
+        assert max(Counter(hex_ids(subscriptions["user_id"][active])).values()) == 1
+
+        signed_up_at = dict(
+            zip(hex_ids(user_accounts["id"]), user_accounts["created_at"])
+        )
+        launched_at = dict(zip(hex_ids(plans["id"]), plans["created_at"]))
+        now = np.datetime64(NOW)
+        for user_id, plan_id, start_date, end_date, updated_at in zip(
+            hex_ids(subscriptions["user_id"]),
+            hex_ids(subscriptions["plan_id"]),
+            subscriptions["start_date"],
+            subscriptions["end_date"],
+            subscriptions["updated_at"],
+        ):
+            assert signed_up_at[user_id] <= start_date < end_date
+            assert launched_at[plan_id] <= start_date
+            assert start_date <= updated_at <= now
+
+    def test_distributions_follow_the_spec(self, dataset):
+        """
+        Test that ratios and plan popularity match the default spec.
+        """
+
+        spec = DatasetSpec()
+        plans, user_accounts, subscriptions = dataset
+        subscribers = len(np.unique(subscriptions["user_id"]))
+        active = subscriptions["status"] == SubscriptionStatus.ACTIVE
+
+        assert subscribers / 25_000 == pytest.approx(spec.subscriber_ratio, abs=0.02)
+        assert subscriptions["is_trial"].sum() / subscribers == pytest.approx(
+            spec.trial_ratio, abs=0.02
+        )
+        assert 1 - active.sum() / subscribers == pytest.approx(
+            spec.cancellation_rate, abs=0.02
+        )
+        overdue = subscriptions["end_date"][active] < np.datetime64(NOW)
+        assert overdue.mean() == pytest.approx(spec.overdue_ratio, abs=0.01)
+
+        popularity = Counter(hex_ids(subscriptions["plan_id"]))
+        assert popularity.most_common(1)[0][0] == hex_ids(plans["id"])[0]
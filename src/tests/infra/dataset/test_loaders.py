@@ -0,0 +1,132 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import inspect
+from sqlmodel import Session
+
+from src.infra.dataset import (
+    DatasetGenerator,
+    DatasetSpec,
+    load_in_memory,
+    load_sql,
+)
+from src.infra.db import DatabaseSettings, build_engine
+from src.infra.db.models import PlanModel, SubscriptionModel, UserAccountModel
+from src.infra.db.repository import (
+    SQLModelPlanRepository,
+    SQLModelSubscriptionRepository,
+    SQLModelUserAccountRepository,
+)
+
+NOW = datetime(2026, 1, 1)
+
+
+@pytest.fixture
+def generator():
+    """
+    Fixture for a generator of a small dataset.
+    """
+
+    return DatasetGenerator(DatasetSpec(user_accounts=3_000, now=NOW, seed=3))
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """
+    Fixture for an engine on an empty SQLite file.
+    """
+
+    engine = build_engine(DatabaseSettings(url=f"sqlite:///{tmp_path / 'test.db'}"))
+    yield engine
+    engine.dispose()
+
+
+class TestLoadInMemory:
+    """
+    Test class for load_in_memory.
+    """
+
+    def test_repositories_hold_the_dataset(self, generator):
+        """
+        Test that every generated row ends up in the repositories.
+        """
+
+        dataset = load_in_memory(generator)
+        subscriptions = dataset.subscription_repository
+
+        assert dataset.counts.plans == 12
+        assert dataset.counts.user_accounts == 3_000
+        assert len(subscriptions.list_page(limit=10_000)) == (
+            dataset.counts.subscriptions
+        )
+        for subscription in subscriptions.list_page(limit=100):
+            assert dataset.plan_repository.get_by_id(subscription.plan_id)
+            assert dataset.user_account_repository.get_by_id(subscription.user_id)
+
+        due = list(subscriptions.iter_due(before=NOW))
+        assert due
+        assert all(not s.is_cancelled and s.end_date < NOW for s in due)
+
+
+class TestLoadSQL:
+    """
+    Test class for load_sql.
+    """
+
+    def test_rows_read_back_as_the_in_memory_entities(self, engine, generator):
+        """
+        Test that the repositories read the loaded rows back as the same
+        entities load_in_memory builds.
+        """
+
+        counts = load_sql(engine, generator)
+        dataset = load_in_memory(generator)
+
+        assert counts == dataset.counts
+        with Session(engine) as session:
+            plans = SQLModelPlanRepository(session)
+            user_accounts = SQLModelUserAccountRepository(session)
+            subscriptions = SQLModelSubscriptionRepository(session)
+            for expected in dataset.subscription_repository.list_page(limit=200):
+                subscription = subscriptions.get_by_id(expected.id)
+                assert subscription.model_dump() == expected.model_dump()
+
+                user_account = user_accounts.get_by_id(expected.user_id)
+                assert user_account.model_dump() == (
+                    dataset.user_account_repository.get_by_id(
+                        expected.user_id
+                    ).model_dump()
+                )
+
+                plan = plans.get_by_id(expected.plan_id)
+                assert plan.model_dump() == (
+                    dataset.plan_repository.get_by_id(expected.plan_id).model_dump()
+                )
+
+    def test_indexes_are_rebuilt(self, engine, generator):
+        """
+        Test that the indexes dropped during the load exist afterwards.
+        """
+
+        load_sql(engine, generator)
+
+        inspector = inspect(engine)
+        for model in (PlanModel, UserAccountModel, SubscriptionModel):
+            table = model.__table__  # type: ignore[attr-defined]
+            names = {index["name"] for index in inspector.get_indexes(table.name)}
+            assert {index.name for index in table.indexes} <= names
+
+    def test_refuses_non_empty_tables_unless_replacing(self, engine, generator):
+        """
+        Test that loading twice fails, unless the existing rows are replaced.
+        """
+
+        counts = load_sql(engine, generator)
+
+        with pytest.raises(ValueError):
+            load_sql(engine, generator)
+        assert load_sql(engine, generator, replace=True) == counts
+        with Session(engine) as session:
+            assert len(
+                SQLModelSubscriptionRepository(session).list_page(limit=10_000)
+            ) == (counts.subscriptions)
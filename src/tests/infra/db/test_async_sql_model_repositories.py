@@ -0,0 +1,319 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.application.use_case import (
+    AsyncCancelSubscriptionUseCase,
+    AsyncRenewSubscriptionUseCase,
+    AsyncSubscribeToPlanUseCase,
+    CancelSubscriptionInputDTO,
+    RenewSubscriptionInputDTO,
+    SubscribeToPlanInputDTO,
+)
+from src.domain._shared.value_objects import Currency, MonetaryValue
+from src.domain.entity import Address, Plan, Subscription, UserAccount
+from src.infra.db.models import NotificationOutboxModel
+from src.infra.db.repository import (
+    AsyncSQLModelPlanRepository,
+    AsyncSQLModelSubscriptionRepository,
+    AsyncSQLModelUnitOfWork,
+    AsyncSQLModelUserAccountRepository,
+)
+from src.infra.notification import (
+    ConsoleNotificationService,
+    OutboxNotificationService,
+)
+from src.infra.payment import FakePaymentGateway
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """
+    Returns an aiosqlite engine with a fresh schema.
+    """
+
+    async def create():
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'async.db'}",
+            poolclass=NullPool,
+        )
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+        return engine
+
+    engine = asyncio.run(create())
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+def make_plan(name: str = "Basic") -> Plan:
+    """
+    Create a plan with the given name.
+    """
+
+    return Plan(
+        name=name,
+        price=MonetaryValue(
+            amount=10.0,  # type: ignore
+            currency=Currency.BRL,
+        ),
+    )
+
+
+def make_user_account() -> UserAccount:
+    """
+    Create a user account.
+    """
+
+    return UserAccount(
+        name="John Doe",
+        email="john.doe@example.com",
+        iam_user_id="iam_123",
+        billing_address=Address(
+            street="123 Main St",
+            city="Anytown",
+            state="CA",
+            zip_code="12345",
+            country="USA",
+        ),
+    )
+
+
+class TestAsyncSQLModelRepositories:
+    """
+    Test class for the asynchronous SQLModel repositories.
+    """
+
+    def test_committed_entities_are_found(self, engine):
+        """
+        Test that entities saved in a committed unit of work are found again.
+        """
+
+        plan = make_plan()
+        user_account = make_user_account()
+        subscription = Subscription.create_regular(
+            user_id=user_account.id, plan_id=plan.id
+        )
+
+        async def scenario():
+            async with AsyncSession(engine) as session:
+                async with AsyncSQLModelUnitOfWork(session) as unit_of_work:
+                    await AsyncSQLModelPlanRepository(session).save(plan)
+                    await AsyncSQLModelUserAccountRepository(session).save(user_account)
+                    await AsyncSQLModelSubscriptionRepository(session).save(
+                        subscription
+                    )
+                    await unit_of_work.commit()
+
+            async with AsyncSession(engine) as session:
+                plans = AsyncSQLModelPlanRepository(session)
+                subscriptions = AsyncSQLModelSubscriptionRepository(session)
+                return (
+                    await plans.get_by_name(plan.name),
+                    await AsyncSQLModelUserAccountRepository(session).get_by_id(
+                        user_account.id
+                    ),
+                    await subscriptions.get_by_user_id_and_plan_id(
+                        user_account.id, plan.id
+                    ),
+                )
+
+        found_plan, found_user_account, found_subscription = asyncio.run(scenario())
+
+        assert found_plan == plan
+        assert found_user_account == user_account
+        assert found_subscription is not None
+        assert found_subscription.id == subscription.id
+
+    def test_exception_rolls_back_staged_changes(self, engine):
+        """
+        Test that leaving the unit of work with an exception discards changes.
+        """
+
+        plan = make_plan()
+
+        async def scenario():
+            async with AsyncSession(engine) as session:
+                with pytest.raises(RuntimeError):
+                    async with AsyncSQLModelUnitOfWork(session):
+                        await AsyncSQLModelPlanRepository(session).save(plan)
+                        await session.flush()
+                        raise RuntimeError("boom")
+
+            async with AsyncSession(engine) as session:
+                return await AsyncSQLModelPlanRepository(session).get_by_id(plan.id)
+
+        assert asyncio.run(scenario()) is None
+
+    def test_update_writes_changed_columns_only(self, engine):
+        """
+        Test that updating a loaded subscription only writes its changed columns.
+        """
+
+        subscription = Subscription.create_regular(
+            user_id=make_user_account().id, plan_id=make_plan().id
+        )
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        async def scenario():
+            async with AsyncSession(engine) as session:
+                await AsyncSQLModelSubscriptionRepository(session).save(subscription)
+                await session.commit()
+
+            event.listen(engine.sync_engine, "before_cursor_execute", record)
+            try:
+                async with AsyncSession(engine) as session:
+                    repo = AsyncSQLModelSubscriptionRepository(session)
+                    loaded = await repo.get_by_id(subscription.id)
+                    loaded.end_date = loaded.end_date + timedelta(days=30)
+                    await repo.update(loaded)
+                    await repo.update(loaded)
+                    await session.commit()
+            finally:
+                event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+            async with AsyncSession(engine) as session:
+                return await AsyncSQLModelSubscriptionRepository(session).get_by_id(
+                    subscription.id
+                )
+
+        reloaded = asyncio.run(scenario())
+
+        updates = [s for s in statements if s.startswith("UPDATE")]
+        assert len(updates) == 1
+        assert "end_date" in updates[0]
+        assert "status" not in updates[0]
+        assert reloaded.end_date == subscription.end_date + timedelta(days=30)
+
+    def test_subscribe_to_plan_use_case(self, engine):
+        """
+        Test that the async subscribe use case persists the subscription.
+        """
+
+        plan = make_plan()
+        user_account = make_user_account()
+
+        async def scenario():
+            async with AsyncSession(engine) as session:
+                await AsyncSQLModelPlanRepository(session).save(plan)
+                await AsyncSQLModelUserAccountRepository(session).save(user_account)
+                await session.commit()
+
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                use_case = AsyncSubscribeToPlanUseCase(
+                    subscription_repository=AsyncSQLModelSubscriptionRepository(
+                        session
+                    ),
+                    user_repository=AsyncSQLModelUserAccountRepository(session),
+                    plan_repository=AsyncSQLModelPlanRepository(session),
+                    payment_gateway=FakePaymentGateway(),
+                    notification_service=ConsoleNotificationService(),
+                    unit_of_work=AsyncSQLModelUnitOfWork(session),
+                )
+                output = await use_case.execute(
+                    SubscribeToPlanInputDTO(
+                        user_id=user_account.id,
+                        plan_id=plan.id,
+                        payment_token="tok_visa",
+                    )
+                )
+
+            async with AsyncSession(engine) as session:
+                return await AsyncSQLModelSubscriptionRepository(session).get_by_id(
+                    output.subscription_id
+                )
+
+        subscription = asyncio.run(scenario())
+
+        assert subscription is not None
+        assert subscription.user_id == user_account.id
+        assert subscription.is_trial is False
+        assert subscription.end_date > datetime.now()
+
+    def test_cancel_subscription_use_case(self, engine):
+        """
+        Test that the async cancel use case persists the cancellation.
+        """
+
+        subscription = Subscription.create_regular(
+            user_id=make_user_account().id, plan_id=make_plan().id
+        )
+
+        async def scenario():
+            async with AsyncSession(engine) as session:
+                await AsyncSQLModelSubscriptionRepository(session).save(subscription)
+                await session.commit()
+
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                await AsyncCancelSubscriptionUseCase(
+                    AsyncSQLModelSubscriptionRepository(session),
+                    AsyncSQLModelUnitOfWork(session),
+                ).execute(CancelSubscriptionInputDTO(id=subscription.id))
+
+            async with AsyncSession(engine) as session:
+                return await AsyncSQLModelSubscriptionRepository(session).get_by_id(
+                    subscription.id
+                )
+
+        cancelled = asyncio.run(scenario())
+
+        assert cancelled is not None
+        assert cancelled.is_cancelled
+
+    def test_renew_subscription_use_case(self, engine):
+        """
+        Test that the async renew use case downgrades a subscription whose
+        payment failed and stages the notification in the outbox.
+        """
+
+        user_account = make_user_account()
+        subscription = Subscription.create_regular(
+            user_id=user_account.id, plan_id=make_plan().id
+        )
+
+        async def scenario():
+            async with AsyncSession(engine) as session:
+                await AsyncSQLModelUserAccountRepository(session).save(user_account)
+                await AsyncSQLModelSubscriptionRepository(session).save(subscription)
+                await session.commit()
+
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                output = await AsyncRenewSubscriptionUseCase(
+                    subscription_repository=AsyncSQLModelSubscriptionRepository(
+                        session
+                    ),
+                    user_account_repository=AsyncSQLModelUserAccountRepository(session),
+                    payment_gateway=FakePaymentGateway(success=False),
+                    notification_service=OutboxNotificationService(session),
+                    unit_of_work=AsyncSQLModelUnitOfWork(session),
+                ).execute(
+                    RenewSubscriptionInputDTO(
+                        subscription_id=subscription.id, payment_token="tok_visa"
+                    )
+                )
+
+            async with AsyncSession(engine) as session:
+                notifications = (
+                    await session.exec(select(NotificationOutboxModel))
+                ).all()
+                renewed = await AsyncSQLModelSubscriptionRepository(session).get_by_id(
+                    subscription.id
+                )
+                return output, renewed, notifications
+
+        output, renewed, notifications = asyncio.run(scenario())
+
+        assert output is not None
+        assert output.subscription_id == subscription.id
+        assert renewed is not None
+        assert renewed.is_trial is True
+        assert [n.recipient for n in notifications] == [user_account.email]
@@ -0,0 +1,94 @@
+import subprocess
+import sys
+
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+
+from src.infra.db import DatabaseSettings, build_engine
+
+
+class TestDatabaseSettings:
+    """
+    Test class for DatabaseSettings.
+    """
+
+    def test_defaults_when_environment_is_empty(self):
+        """
+        Test that missing variables fall back to the defaults.
+        """
+
+        settings = DatabaseSettings.from_env({})
+
+        assert settings == DatabaseSettings()
+        assert settings.url == "sqlite:///./subscription_service.db"
+
+    def test_reads_environment_variables(self):
+        """
+        Test that settings are read and converted from the environment.
+        """
+
+        settings = DatabaseSettings.from_env(
+            {
+                "DATABASE_URL": "postgresql://user:pass@db/subscriptions",
+                "DATABASE_POOL_SIZE": "20",
+                "DATABASE_MAX_OVERFLOW": "5",
+                "DATABASE_POOL_RECYCLE": "300",
+            }
+        )
+
+        assert settings.url == "postgresql://user:pass@db/subscriptions"
+        assert settings.pool_size == 20
+        assert settings.max_overflow == 5
+        assert settings.pool_recycle == 300
+
+
+class TestBuildEngine:
+    """
+    Test class for build_engine.
+    """
+
+    def test_sqlite_file_gets_pool_and_pragmas(self, tmp_path):
+        """
+        Test that a file-based SQLite engine is pooled and tuned on connect.
+        """
+
+        settings = DatabaseSettings(
+            url=f"sqlite:///{tmp_path / 'test.db'}",
+            pool_size=3,
+            max_overflow=2,
+            sqlite_busy_timeout=1234,
+            sqlite_cache_size=-2000,
+        )
+        engine = build_engine(settings)
+
+        assert isinstance(engine.pool, QueuePool)
+        assert engine.pool.size() == 3
+        with engine.connect() as connection:
+            assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+            assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+            assert connection.execute(text("PRAGMA cache_size")).scalar() == -2000
+
+    def test_sqlite_memory_skips_pool_settings(self):
+        """
+        Test that an in-memory SQLite engine is created without pool settings.
+        """
+
+        engine = build_engine(DatabaseSettings(url="sqlite://"))
+
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT 1")).scalar() == 1
+
+    def test_application_import_builds_no_engine(self):
+        """
+        Test that importing the use cases leaves the configured engines unbuilt.
+        """
+
+        code = (
+            "import src.application.use_case\n"
+            "import src.infra.db as db\n"
+            "assert db.get_engine.cache_info().currsize == 0\n"
+            "assert db.get_async_engine.cache_info().currsize == 0\n"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)
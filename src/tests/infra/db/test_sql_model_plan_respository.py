@@ -41,3 +41,35 @@ class TestSQLModelPlanRepository:
 
         plan_from_db = repo.get_by_id(plan.id)
         assert plan_from_db
+
+    def test_save_many_get_many_and_update_many(self, session):
+        """
+        Test saving, retrieving and updating several plans at once.
+        """
+
+        repo = SQLModelPlanRepository(session)
+        repo.IN_CLAUSE_CHUNK_SIZE = 2
+        plans = [
+            Plan(
+                name=f"Bulk {i}",
+                price=MonetaryValue(
+                    amount=10.0,  # type: ignore
+                    currency=Currency.BRL,
+                ),
+            )
+            for i in range(3)
+        ]
+        repo.save_many(plans)
+
+        found = repo.get_many_by_ids([plan.id for plan in plans])
+        assert {plan.id for plan in found} == {plan.id for plan in plans}
+
+        plans[0].name = "Bulk renamed"
+        plans[1].is_active = False
+        repo.update_many(plans[:2])
+        session.commit()
+
+        renamed = repo.get_by_id(plans[0].id)
+        deactivated = repo.get_by_id(plans[1].id)
+        assert renamed and renamed.name == "Bulk renamed"
+        assert deactivated and deactivated.is_active is False
@@ -1,8 +1,22 @@
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
 import pytest
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, SQLModel, create_engine
 
+from src.application.exceptions import SubscriptionConflictError
 from src.domain._shared.value_objects import Currency, MonetaryValue
-from src.domain.entity import Address, Plan, Subscription, UserAccount
+from src.domain.entity import (
+    Address,
+    Plan,
+    Subscription,
+    SubscriptionStatus,
+    UserAccount,
+)
 from src.infra.db.repository import (
     SQLModelPlanRepository,
     SQLModelSubscriptionRepository,
@@ -12,6 +26,22 @@ from src.infra.db.repository import (
 engine = create_engine("sqlite:///:memory:")
 
 
+@pytest.fixture
+def statements():
+    """
+    Collects the SQL statements executed while the test runs.
+    """
+
+    executed = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield executed
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
 @pytest.fixture
 def session():
     """
@@ -78,3 +108,329 @@ class TestSQLModelSubscriptionRepository:
             plan_id=plan.id,
         )
         assert subscription_from_db_by_user_and_plan
+
+    def test_iter_due_subscriptions(self, session):
+        """
+        Test iterating over due subscriptions ordered by end date.
+        """
+
+        plan = Plan(
+            name="Due Plan",
+            price=MonetaryValue(
+                amount=10.0,  # type: ignore
+                currency=Currency.BRL,
+            ),
+        )
+        SQLModelPlanRepository(session).save(plan)
+
+        user = UserAccount(
+            iam_user_id="3f2b2a8e-4c1d-4b55-9c3e-0d9a7f1e2b6c",
+            name="Jane Doe",
+            email="jane.doe@email.com",
+            billing_address=Address(
+                street="123 Main St",
+                city="Anytown",
+                state="CA",
+                zip_code="12345",
+                country="USA",
+            ),
+        )
+        SQLModelUserAccountRepository(session).save(user)
+
+        now = datetime.now()
+        repo = SQLModelSubscriptionRepository(session)
+        later = Subscription.create_regular(user_id=user.id, plan_id=plan.id)
+        later.end_date = now - relativedelta(years=10, days=1)
+        earlier = Subscription.create_regular(user_id=uuid4(), plan_id=plan.id)
+        earlier.end_date = now - relativedelta(years=10, days=3)
+        cancelled = Subscription.create_regular(user_id=user.id, plan_id=plan.id)
+        cancelled.end_date = now - relativedelta(years=10, days=2)
+        cancelled.cancel()
+        for subscription in (later, earlier, cancelled):
+            repo.save(subscription)
+
+        before = now - relativedelta(years=10)
+        due = list(repo.iter_due(before=before))
+        assert [s.id for s in due] == [earlier.id, later.id]
+
+        due = list(repo.iter_due(before=before, limit=1))
+        assert [s.id for s in due] == [earlier.id]
+
+        due = list(repo.iter_due(before=before, after=(earlier.end_date, earlier.id)))
+        assert [s.id for s in due] == [later.id]
+
+        earlier.cancel()
+        later.end_date = now
+        repo.update_many([earlier, later])
+        assert list(repo.iter_due(before=before)) == []
+        assert repo.get_by_id(earlier.id).is_cancelled  # type: ignore
+
+    def test_update_writes_only_changed_columns(self, session, statements):
+        """
+        Test that update issues a single UPDATE with the changed columns only.
+        """
+
+        repo = SQLModelSubscriptionRepository(session)
+        subscription = Subscription.create_regular(user_id=uuid4(), plan_id=uuid4())
+        repo.save(subscription)
+        session.commit()
+
+        loaded = repo.get_by_id(subscription.id)
+        assert loaded
+        loaded.cancel()
+        statements.clear()
+        repo.update(loaded)
+        repo.update(loaded)
+        session.commit()
+
+        updates = [s for s in statements if s.startswith("UPDATE")]
+        assert len(updates) == 1
+        assert "SET status=?, updated_at=? WHERE" in updates[0]
+        assert not [s for s in statements if s.startswith("SELECT")]
+
+        with Session(engine) as other_session:
+            stored = SQLModelSubscriptionRepository(other_session).get_by_id(
+                subscription.id
+            )
+        assert stored
+        assert stored.is_cancelled
+
+    def test_update_untracked_subscription_writes_every_column(
+        self, session, statements
+    ):
+        """
+        Test that a subscription not loaded by the repository is fully written.
+        """
+
+        subscription = Subscription.create_trial(user_id=uuid4(), plan_id=uuid4())
+        SQLModelSubscriptionRepository(session).save(subscription)
+        session.commit()
+
+        subscription.renew()
+        repo = SQLModelSubscriptionRepository(session)
+        statements.clear()
+        repo.update(subscription)
+        session.commit()
+
+        updates = [s for s in statements if s.startswith("UPDATE")]
+        assert len(updates) == 1
+        for column in ("start_date", "end_date", "status", "is_trial", "updated_at"):
+            assert f"{column}=?" in updates[0]
+
+        stored = repo.get_by_id(subscription.id)
+        assert stored
+        assert stored.is_trial is False
+
+    def test_update_is_retried_after_a_rollback(self, session):
+        """
+        Test that an update rolled back is written again when retried, instead
+        of being skipped as unchanged.
+        """
+
+        repo = SQLModelSubscriptionRepository(session)
+        subscription = Subscription.create_regular(user_id=uuid4(), plan_id=uuid4())
+        repo.save(subscription)
+        session.commit()
+
+        loaded = repo.get_by_id(subscription.id)
+        assert loaded
+        loaded.cancel()
+        repo.update(loaded)
+        session.rollback()
+
+        repo.update(loaded)
+        session.commit()
+
+        stored = repo.get_by_id(subscription.id)
+        assert stored
+        assert stored.is_cancelled
+
+    def test_snapshots_are_forgotten_when_the_transaction_ends(self, session):
+        """
+        Test that the repository stops tracking subscriptions once committed.
+        """
+
+        repo = SQLModelSubscriptionRepository(session)
+        repo.save_many(
+            Subscription.create_regular(user_id=uuid4(), plan_id=uuid4())
+            for _ in range(3)
+        )
+        session.commit()
+
+        page = repo.list_page(limit=3)
+        assert len(page) == 3
+        assert repo._snapshots.keys() == {subscription.id for subscription in page}
+        session.commit()
+        assert repo._snapshots == {}
+
+    def test_repositories_of_a_session_share_one_listener(self, session):
+        """
+        Test that repositories sharing a session share its snapshots, and do
+        not each add a transaction listener to it.
+        """
+
+        first = SQLModelSubscriptionRepository(session)
+        listeners = len(session.dispatch.after_transaction_end)
+        others = [SQLModelSubscriptionRepository(session) for _ in range(3)]
+
+        assert len(session.dispatch.after_transaction_end) == listeners
+        assert all(other._snapshots is first._snapshots for other in others)
+
+    def test_save_many_and_get_many_by_ids(self, session):
+        """
+        Test saving and retrieving several subscriptions at once.
+        """
+
+        repo = SQLModelSubscriptionRepository(session)
+        repo.IN_CLAUSE_CHUNK_SIZE = 2
+        subscriptions = [
+            Subscription.create_regular(user_id=uuid4(), plan_id=uuid4())
+            for _ in range(3)
+        ]
+        repo.save_many(subscriptions)
+        session.commit()
+
+        found = repo.get_many_by_ids([s.id for s in subscriptions] + [uuid4()])
+        assert {s.id for s in found} == {s.id for s in subscriptions}
+
+    def test_get_active_by_user_id_skips_cancelled_history(self, session):
+        """
+        Test that only the active subscription of a user is returned.
+        """
+
+        repo = SQLModelSubscriptionRepository(session)
+        user_id = uuid4()
+        cancelled = Subscription.create_regular(user_id=user_id, plan_id=uuid4())
+        cancelled.cancel()
+        repo.save(cancelled)
+        assert repo.get_active_by_user_id(user_id) is None
+
+        active = Subscription.create_regular(user_id=user_id, plan_id=uuid4())
+        repo.save(active)
+        session.commit()
+
+        found = repo.get_active_by_user_id(user_id)
+        assert found is not None
+        assert found.id == active.id
+
+    def test_save_second_active_subscription_raises_conflict(self, session):
+        """
+        Test that the database rejects a second active subscription for a user.
+        """
+
+        repo = SQLModelSubscriptionRepository(session)
+        user_id = uuid4()
+        repo.save(Subscription.create_regular(user_id=user_id, plan_id=uuid4()))
+        session.commit()
+
+        with pytest.raises(
+            SubscriptionConflictError,
+            match="User already has active subscription",
+        ):
+            repo.save(Subscription.create_trial(user_id=user_id, plan_id=uuid4()))
+        session.rollback()
+
+        repo.save(Subscription.create_regular(user_id=uuid4(), plan_id=uuid4()))
+        session.commit()
+
+    @pytest.mark.parametrize(
+        "constraint_name, is_conflict",
+        [("uq_subscriptions_active_user_id", True), ("subscriptions_pkey", False)],
+    )
+    def test_conflict_is_detected_by_constraint_name(
+        self, constraint_name, is_conflict
+    ):
+        """
+        Test that a driver reporting the violated constraint is matched by its
+        name rather than by its message.
+        """
+
+        class DriverError(Exception):
+            diag = SimpleNamespace(constraint_name=constraint_name)
+
+        error = IntegrityError(
+            "INSERT", {}, DriverError("duplicate key on subscriptions.user_id")
+        )
+
+        assert SQLModelSubscriptionRepository._is_active_conflict(error) is (
+            is_conflict
+        )
+
+    def test_list_page_seeks_past_the_cursor(self, session):
+        """
+        Test listing subscriptions of a plan a page at a time.
+        """
+
+        repo = SQLModelSubscriptionRepository(session)
+        plan_id = uuid4()
+        created_at = datetime.now()
+        subscriptions = []
+        for _ in range(5):
+            subscription = Subscription.create_regular(user_id=uuid4(), plan_id=plan_id)
+            subscription.created_at = created_at
+            subscriptions.append(subscription)
+        subscriptions[0].cancel()
+        repo.save_many(subscriptions)
+        session.commit()
+
+        expected = sorted(s.id for s in subscriptions)
+        first = repo.list_page(limit=3, plan_id=plan_id)
+        assert [s.id for s in first] == expected[:3]
+
+        rest = repo.list_page(
+            limit=3,
+            after=(first[-1].created_at, first[-1].id),
+            plan_id=plan_id,
+        )
+        assert [s.id for s in rest] == expected[3:]
+
+        active = repo.list_page(
+            limit=10,
+            plan_id=plan_id,
+            status=SubscriptionStatus.ACTIVE,
+        )
+        assert subscriptions[0].id not in {s.id for s in active}
+        assert len(active) == 4
+
+    def test_load_subscribe_context_with_a_single_query(self, session, statements):
+        """
+        Test that the user and the active subscription are read at once.
+        """
+
+        plan = Plan(
+            name="Context Plan",
+            price=MonetaryValue(
+                amount=10.0,  # type: ignore
+                currency=Currency.BRL,
+            ),
+        )
+        user = UserAccount(
+            iam_user_id="8c0b7d4e-5a1f-4e2b-9d3c-6f7a8b9c0d1e",
+            name="Context User",
+            email="context.user@email.com",
+            billing_address=Address(
+                street="123 Main St",
+                city="Anytown",
+                state="CA",
+                zip_code="12345",
+                country="USA",
+            ),
+        )
+        SQLModelPlanRepository(session).save(plan)
+        SQLModelUserAccountRepository(session).save(user)
+        repo = SQLModelSubscriptionRepository(session)
+        subscription = Subscription.create_regular(user_id=user.id, plan_id=plan.id)
+        repo.save(subscription)
+        session.commit()
+        statements.clear()
+
+        context = repo.load_subscribe_context(user.id)
+
+        assert len(statements) == 1
+        assert context.user == user
+        assert context.plan is None
+        assert context.active_subscription is not None
+        assert context.active_subscription.id == subscription.id
+
+        context = repo.load_subscribe_context(uuid4())
+        assert context.user is None
@@ -0,0 +1,88 @@
+import pytest
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.domain._shared.value_objects import Currency, MonetaryValue
+from src.domain.entity import Plan
+from src.infra.db.repository import SQLModelPlanRepository, SQLModelUnitOfWork
+
+
+@pytest.fixture
+def engine():
+    """
+    Returns a database engine with a fresh schema.
+    """
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def make_plan(name: str) -> Plan:
+    """
+    Create a plan with the given name.
+    """
+
+    return Plan(
+        name=name,
+        price=MonetaryValue(
+            amount=10.0,  # type: ignore
+            currency=Currency.BRL,
+        ),
+    )
+
+
+class TestSQLModelUnitOfWork:
+    """
+    Test class for SQLModelUnitOfWork.
+    """
+
+    def test_commit_persists_staged_changes(self, engine):
+        """
+        Test that staged changes are visible to other sessions after commit.
+        """
+
+        plans = [make_plan("Basic"), make_plan("Premium")]
+        with Session(engine) as session:
+            repo = SQLModelPlanRepository(session)
+            with SQLModelUnitOfWork(session) as unit_of_work:
+                for plan in plans:
+                    repo.save(plan)
+                unit_of_work.commit()
+
+        with Session(engine) as session:
+            repo = SQLModelPlanRepository(session)
+            assert all(repo.get_by_id(plan.id) for plan in plans)
+
+    def test_exception_rolls_back_staged_changes(self, engine):
+        """
+        Test that leaving the unit of work with an exception discards changes.
+        """
+
+        plan = make_plan("Basic")
+        with Session(engine) as session:
+            repo = SQLModelPlanRepository(session)
+            with pytest.raises(RuntimeError):
+                with SQLModelUnitOfWork(session):
+                    repo.save(plan)
+                    raise RuntimeError("boom")
+
+            assert repo.get_by_id(plan.id) is None
+
+    def test_commit_callbacks_only_run_after_commit(self, engine):
+        """
+        Test that callbacks registered with on_commit run once the changes are
+        committed, and are dropped when they are rolled back.
+        """
+
+        calls = []
+        with Session(engine) as session:
+            unit_of_work = SQLModelUnitOfWork(session)
+            with unit_of_work:
+                unit_of_work.on_commit(lambda: calls.append("rolled back"))
+                unit_of_work.rollback()
+                unit_of_work.on_commit(lambda: calls.append("committed"))
+                assert calls == []
+                unit_of_work.commit()
+            unit_of_work.commit()
+
+        assert calls == ["committed"]
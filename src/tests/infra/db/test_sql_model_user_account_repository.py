@@ -1,3 +1,5 @@
+from uuid import uuid4
+
 import pytest
 from sqlmodel import Session, SQLModel, create_engine
 
@@ -45,3 +47,63 @@ class TestSQLModelUserAccountRepository:
 
         user_from_db = repo.get_by_id(user.id)
         assert user_from_db
+
+    def test_get_many_by_ids(self, session):
+        """
+        Test retrieving several user accounts across IN clause chunks.
+        """
+
+        repo = SQLModelUserAccountRepository(session)
+        repo.IN_CLAUSE_CHUNK_SIZE = 2
+        users = [
+            UserAccount(
+                iam_user_id=f"iam-many-{i}",
+                name=f"User {i}",
+                email=f"many{i}@email.com",
+                billing_address=Address(
+                    street="123 Main St",
+                    city="Anytown",
+                    state="CA",
+                    zip_code="12345",
+                    country="USA",
+                ),
+            )
+            for i in range(3)
+        ]
+        for user in users:
+            repo.save(user)
+
+        found = repo.get_many_by_ids([user.id for user in users] + [uuid4()])
+        assert {user.id for user in found} == {user.id for user in users}
+
+    def test_save_many_and_update_many(self, session):
+        """
+        Test saving and updating several user accounts at once.
+        """
+
+        repo = SQLModelUserAccountRepository(session)
+        users = [
+            UserAccount(
+                iam_user_id=f"iam-bulk-{i}",
+                name=f"User {i}",
+                email=f"bulk{i}@email.com",
+                billing_address=Address(
+                    street="123 Main St",
+                    city="Anytown",
+                    state="CA",
+                    zip_code="12345",
+                    country="USA",
+                ),
+            )
+            for i in range(2)
+        ]
+        repo.save_many(users)
+        session.commit()
+
+        users[1].name = "Renamed"
+        repo.update_many(users)
+        session.commit()
+
+        found = repo.get_by_id(users[1].id)
+        assert found
+        assert found.name == "Renamed"
@@ -0,0 +1,76 @@
+import csv
+import io
+import json
+from functools import partial
+from uuid import uuid4
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.domain._shared.value_objects import Currency, MonetaryValue
+from src.domain.entity import Plan, Subscription
+from src.infra.db.repository import (
+    SQLModelPlanRepository,
+    SQLModelSubscriptionRepository,
+)
+from src.infra.export import EXPORT_COLUMNS, ExportFormat, stream_export
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """
+    Returns a session factory on a database holding a few subscriptions.
+    """
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'export.db'}")
+    SQLModel.metadata.create_all(engine)
+
+    plan = Plan(
+        name="Basic",
+        price=MonetaryValue(amount=29.90, currency=Currency.BRL),  # type: ignore
+    )
+    with Session(engine) as session:
+        SQLModelPlanRepository(session).save(plan)
+        SQLModelSubscriptionRepository(session).save_many(
+            Subscription.create_regular(user_id=uuid4(), plan_id=plan.id)
+            for _ in range(5)
+        )
+        session.commit()
+
+    yield partial(Session, engine)
+    engine.dispose()
+
+
+class TestSubscriptionExport:
+    """
+    Test class for the subscription export.
+    """
+
+    def test_ndjson_export_is_chunked_by_batch(self, session_factory):
+        """
+        Test that every subscription is written, one chunk per batch.
+        """
+
+        chunks = list(stream_export(session_factory, ExportFormat.NDJSON, 2))
+
+        assert len(chunks) == 3
+        rows = [json.loads(line) for line in "".join(chunks).splitlines()]
+        assert len(rows) == 5
+        assert list(rows[0]) == list(EXPORT_COLUMNS)
+        assert rows[0]["plan_name"] == "Basic"
+        assert rows[0]["price_amount"] == "29.90"
+        assert rows[0]["user_email"] is None
+
+    def test_csv_export_has_header(self, session_factory):
+        """
+        Test that the CSV export starts with a header row.
+        """
+
+        export = "".join(stream_export(session_factory, ExportFormat.CSV, 2))
+
+        rows = list(csv.reader(io.StringIO(export)))
+        assert tuple(rows[0]) == EXPORT_COLUMNS
+        assert len(rows) == 6
+        assert {row[EXPORT_COLUMNS.index("price_currency")] for row in rows[1:]} == {
+            "BRL"
+        }
@@ -0,0 +1,91 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.infra.metrics import Histogram, MetricsRegistry, timed
+
+
+class TestHistogram:
+    """
+    Test class for Histogram.
+    """
+
+    def test_observations_land_in_their_bucket(self):
+        """
+        Test that each observation counts in the first bucket that bounds it.
+        """
+
+        histogram = Histogram(buckets=(0.1, 1.0))
+
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        counts, total = histogram.snapshot()
+        assert counts == [2, 1, 1]
+        assert total == pytest.approx(2.65)
+
+    def test_shards_of_ended_threads_are_retired(self):
+        """
+        Test that the shards of threads that have ended are dropped, and their
+        observations kept.
+        """
+
+        histogram = Histogram(buckets=(0.1, 1.0))
+
+        for _ in range(20):
+            thread = threading.Thread(target=histogram.observe, args=(0.5,))
+            thread.start()
+            thread.join()
+
+        histogram.observe(2.0)
+
+        counts, total = histogram.snapshot()
+        assert counts == [0, 20, 1]
+        assert total == pytest.approx(12.0)
+        assert len(histogram._shards) == 1
+
+
+class TestMetricsRegistry:
+    """
+    Test class for MetricsRegistry.
+    """
+
+    def test_render_prometheus_text_format(self):
+        """
+        Test that histograms render as cumulative buckets, sum and count.
+        """
+
+        registry = MetricsRegistry()
+        registry.histogram("latency_seconds", "Latency.", route="/plans").observe(0.2)
+
+        assert registry.histogram("latency_seconds", route="/plans") is (
+            registry.histogram("latency_seconds", route="/plans")
+        )
+        rendered = registry.render()
+        assert "# HELP latency_seconds Latency." in rendered
+        assert "# TYPE latency_seconds histogram" in rendered
+        assert 'latency_seconds_bucket{route="/plans",le="0.1"} 0' in rendered
+        assert 'latency_seconds_bucket{route="/plans",le="0.25"} 1' in rendered
+        assert 'latency_seconds_bucket{route="/plans",le="+Inf"} 1' in rendered
+        assert 'latency_seconds_count{route="/plans"} 1' in rendered
+
+    def test_timed_records_calls_that_raise(self):
+        """
+        Test that sync and async calls are recorded, even when they raise.
+        """
+
+        histogram = Histogram()
+
+        def fail():
+            raise ValueError("boom")
+
+        async def succeed():
+            return 42
+
+        with pytest.raises(ValueError):
+            timed(fail, histogram)()
+        assert asyncio.run(timed(succeed, histogram)()) == 42
+
+        counts, _ = histogram.snapshot()
+        assert sum(counts) == 2
@@ -0,0 +1,102 @@
+import logging
+
+from sqlalchemy import text
+from sqlmodel import Session, create_engine
+
+from src.infra.metrics import instrument_queries, track_queries
+
+
+def make_engine(slow_query_threshold: float = 1.0):
+    """
+    Create an in-memory engine with its statements instrumented.
+    """
+
+    engine = create_engine("sqlite://")
+    instrument_queries(engine, slow_query_threshold)
+    return engine
+
+
+class TestQueryStats:
+    """
+    Test class for the statement counters and the slow query log.
+    """
+
+    def test_statements_are_counted_in_every_enclosing_block(self):
+        """
+        Test that a statement counts for the block it runs in and its parents.
+        """
+
+        engine = make_engine()
+
+        with Session(engine) as session:
+            with track_queries() as request:
+                session.exec(text("SELECT 1"))
+                with track_queries() as use_case:
+                    session.exec(text("SELECT 2"))
+                    session.exec(text("SELECT 3"))
+
+        assert use_case.count == 2
+        assert request.count == 3
+        assert request.seconds >= use_case.seconds > 0
+
+    def test_statements_outside_a_block_are_not_counted(self):
+        """
+        Test that statements run outside any block do not leak into one.
+        """
+
+        engine = make_engine()
+
+        with Session(engine) as session:
+            session.exec(text("SELECT 1"))
+            with track_queries() as stats:
+                pass
+
+        assert stats.count == 0
+
+    def test_slow_statements_are_logged_with_their_parameters(self, caplog):
+        """
+        Test that statements over the threshold are logged with parameters.
+        """
+
+        engine = make_engine(slow_query_threshold=0.0)
+
+        with caplog.at_level(logging.WARNING, logger="src.infra.metrics.query_stats"):
+            with Session(engine) as session:
+                session.exec(text("SELECT :value"), params={"value": 42})
+
+        assert len(caplog.records) == 1
+        assert "SELECT ?" in caplog.records[0].getMessage()
+        assert "42" in caplog.records[0].getMessage()
+
+    def test_fast_statements_are_not_logged(self, caplog):
+        """
+        Test that statements under the threshold are not logged.
+        """
+
+        engine = make_engine(slow_query_threshold=10.0)
+
+        with caplog.at_level(logging.WARNING, logger="src.infra.metrics.query_stats"):
+            with Session(engine) as session:
+                session.exec(text("SELECT 1"))
+
+        assert caplog.records == []
+
+    def test_only_the_first_parameter_set_of_a_batch_is_logged(self, caplog):
+        """
+        Test that a slow executemany batch does not log every parameter set.
+        """
+
+        engine = make_engine(slow_query_threshold=0.0)
+
+        with caplog.at_level(logging.WARNING, logger="src.infra.metrics.query_stats"):
+            with Session(engine) as session:
+                session.exec(text("CREATE TABLE numbers (value INTEGER)"))
+                caplog.clear()
+                session.exec(
+                    text("INSERT INTO numbers VALUES (:value)"),
+                    params=[{"value": value} for value in range(1000)],
+                )
+
+        message = caplog.records[0].getMessage()
+        assert "(0,) (and 999 more sets)" in message
+        assert "(999,)" not in message
@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta
+from functools import partial
+from unittest.mock import create_autospec
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from src.infra.db.models import NotificationOutboxModel, OutboxStatus
+from src.infra.notification import (
+    NotificationService,
+    OutboxDispatcher,
+    OutboxNotificationService,
+)
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """
+    Returns a session factory on an empty database.
+    """
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'outbox.db'}")
+    SQLModel.metadata.create_all(engine)
+    yield partial(Session, engine)
+    engine.dispose()
+
+
+def outbox(session_factory):
+    """
+    Return every notification of the outbox.
+    """
+
+    with session_factory() as session:
+        return session.exec(select(NotificationOutboxModel)).all()
+
+
+class TestOutboxNotificationService:
+    """
+    Test class for OutboxNotificationService.
+    """
+
+    def test_notifications_are_written_by_the_caller_commit(self, session_factory):
+        """
+        Test that staged notifications are only written when the session commits.
+        """
+
+        with session_factory() as session:
+            service = OutboxNotificationService(session)
+            service.notify("Payment failed", recipient="john.doe@example.com")
+            session.rollback()
+            service.notify("Payment failed", recipient="jane.doe@example.com")
+            session.commit()
+
+        notifications = outbox(session_factory)
+        assert [n.recipient for n in notifications] == ["jane.doe@example.com"]
+        assert notifications[0].status == OutboxStatus.PENDING
+
+
+class TestOutboxDispatcher:
+    """
+    Test class for OutboxDispatcher.
+    """
+
+    def test_dispatch_delivers_due_notifications_in_batches(self, session_factory):
+        """
+        Test that a dispatch delivers at most one batch of notifications.
+        """
+
+        with session_factory() as session:
+            for i in range(3):
+                OutboxNotificationService(session).notify(f"Message {i}")
+            session.commit()
+        delivery = create_autospec(NotificationService)
+        dispatcher = OutboxDispatcher(session_factory, delivery, batch_size=2)
+
+        assert dispatcher.dispatch_once() == 2
+        assert dispatcher.dispatch_once() == 1
+        assert dispatcher.dispatch_once() == 0
+
+        assert delivery.notify.call_count == 3
+        assert {n.status for n in outbox(session_factory)} == {OutboxStatus.DELIVERED}
+
+    def test_claimed_notifications_are_not_delivered_twice(self, session_factory):
+        """
+        Test that a second dispatcher running during a delivery skips the
+        notifications the first one claimed.
+        """
+
+        with session_factory() as session:
+            OutboxNotificationService(session).notify("Payment failed")
+            session.commit()
+        other_delivery = create_autospec(NotificationService)
+        other = OutboxDispatcher(session_factory, other_delivery)
+        delivery = create_autospec(NotificationService)
+        delivery.notify.side_effect = lambda **_: other.dispatch_once()
+        dispatcher = OutboxDispatcher(session_factory, delivery)
+
+        assert dispatcher.dispatch_once() == 1
+
+        other_delivery.notify.assert_not_called()
+        [notification] = outbox(session_factory)
+        assert notification.status == OutboxStatus.DELIVERED
+
+    def test_failed_delivery_is_retried_with_backoff(self, session_factory):
+        """
+        Test that a failing delivery is retried later, then given up on.
+        """
+
+        with session_factory() as session:
+            OutboxNotificationService(session).notify("Payment failed")
+            session.commit()
+        delivery = create_autospec(NotificationService)
+        delivery.notify.side_effect = ConnectionError("SMTP server unavailable")
+        now = datetime.now() + timedelta(seconds=1)
+        dispatcher = OutboxDispatcher(
+            session_factory,
+            delivery,
+            max_attempts=2,
+            retry_delay=timedelta(seconds=30),
+            clock=lambda: now,
+        )
+
+        assert dispatcher.dispatch_once() == 1
+        [notification] = outbox(session_factory)
+        assert notification.status == OutboxStatus.PENDING
+        assert notification.available_at == now + timedelta(seconds=30)
+        assert notification.last_error == "SMTP server unavailable"
+        assert dispatcher.dispatch_once() == 0
+
+        now += timedelta(seconds=30)
+        assert dispatcher.dispatch_once() == 1
+        [notification] = outbox(session_factory)
+        assert notification.status == OutboxStatus.FAILED
+        assert notification.attempts == 2
@@ -0,0 +1,155 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.domain.entity import Address
+from src.infra.payment import (
+    CircuitBreaker,
+    CircuitState,
+    HttpPaymentGateway,
+    PaymentGatewayError,
+    PaymentGatewaySettings,
+)
+from src.infra.payment.stub_server import create_stub_payment_app
+
+
+@pytest.fixture
+def billing_address() -> Address:
+    """
+    Fixture for creating a billing address.
+    """
+
+    return Address(
+        street="123 Main St",
+        city="Anytown",
+        state="CA",
+        zip_code="12345",
+        country="USA",
+    )
+
+
+def make_gateway(app, **settings) -> HttpPaymentGateway:
+    """
+    Create a gateway calling the given ASGI app, without real network calls.
+    """
+
+    return HttpPaymentGateway(
+        PaymentGatewaySettings(url="http://payments", backoff_base=0, **settings),
+        transport=httpx.ASGITransport(app=app),
+    )
+
+
+class TestHttpPaymentGateway:
+    """
+    Test class for HttpPaymentGateway.
+    """
+
+    def test_concurrent_payments_overlap(self, billing_address):
+        """
+        Test that concurrent payments wait for the API latency once, not once
+        per payment.
+        """
+
+        gateway = make_gateway(create_stub_payment_app(latency_seconds=0.1))
+
+        async def scenario():
+            started_at = asyncio.get_running_loop().time()
+            payments = await asyncio.gather(
+                *(
+                    gateway.process_payment("tok_visa", billing_address)
+                    for _ in range(10)
+                )
+            )
+            elapsed = asyncio.get_running_loop().time() - started_at
+            declined = await gateway.process_payment("tok_declined", billing_address)
+            await gateway.aclose()
+            return payments, elapsed, declined
+
+        payments, elapsed, declined = asyncio.run(scenario())
+
+        assert all(payment.success for payment in payments)
+        assert len({payment.transaction_id for payment in payments}) == 10
+        assert elapsed < 0.5
+        assert declined.success is False
+
+    def test_unavailable_api_is_retried_with_the_same_idempotency_key(
+        self, billing_address
+    ):
+        """
+        Test that every attempt of a payment sends the same idempotency key.
+        """
+
+        app = create_stub_payment_app(error_rate=1.0)
+        gateway = make_gateway(app, max_retries=2, failure_threshold=10)
+
+        with pytest.raises(PaymentGatewayError, match="unavailable"):
+            asyncio.run(gateway.process_payment("tok_visa", billing_address))
+
+        assert len(app.state.requests) == 3
+        assert len(set(app.state.requests)) == 1
+
+    def test_open_circuit_fails_fast(self, billing_address):
+        """
+        Test that the gateway stops calling the API once the circuit opens.
+        """
+
+        app = create_stub_payment_app(error_rate=1.0)
+        gateway = make_gateway(app, max_retries=0, failure_threshold=2)
+
+        async def scenario():
+            for _ in range(4):
+                with pytest.raises(PaymentGatewayError):
+                    await gateway.process_payment("tok_visa", billing_address)
+
+        asyncio.run(scenario())
+
+        assert len(app.state.requests) == 2
+
+    @pytest.mark.parametrize("body", [b"not json", b'{"success": "maybe"}'])
+    def test_malformed_response_is_a_gateway_error(self, billing_address, body):
+        """
+        Test that a successful response without a valid payment is reported as
+        a gateway error, and counted as a failure by the circuit breaker.
+        """
+
+        circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        gateway = HttpPaymentGateway(
+            PaymentGatewaySettings(url="http://payments"),
+            transport=httpx.MockTransport(lambda _: httpx.Response(200, content=body)),
+            circuit_breaker=circuit_breaker,
+        )
+
+        with pytest.raises(PaymentGatewayError, match="malformed"):
+            asyncio.run(gateway.process_payment("tok_visa", billing_address))
+
+        assert circuit_breaker.state == CircuitState.OPEN
+
+
+class TestCircuitBreaker:
+    """
+    Test class for CircuitBreaker.
+    """
+
+    def test_half_open_trial_closes_or_reopens_the_circuit(self):
+        """
+        Test that the circuit lets a trial call through after the reset timeout.
+        """
+
+        now = 0.0
+        breaker = CircuitBreaker(
+            failure_threshold=1, reset_timeout=10, clock=lambda: now
+        )
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+        now = 10.0
+        breaker.before_call()
+        assert breaker.state == CircuitState.HALF_OPEN
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+        now = 20.0
+        breaker.before_call()
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
@@ -143,3 +143,30 @@ class TestInMemoryPlanRepository:
         repo = InMemoryPlanRepository()
         found_plan = repo.get_by_id(uuid4())
         assert found_plan is None
+
+    def test_save_many_get_many_and_update_many(self):
+        """
+        Test saving, retrieving and updating several plans at once.
+        """
+
+        repo = InMemoryPlanRepository()
+        plans = [
+            Plan(
+                name=name,
+                price=MonetaryValue(
+                    amount=29.90,  # type: ignore
+                    currency=Currency.BRL,
+                ),
+            )
+            for name in ("Basic", "Standard", "Premium")
+        ]
+        repo.save_many(plans)
+
+        found = repo.get_many_by_ids([plans[0].id, plans[2].id, uuid4()])
+        assert {plan.id for plan in found} == {plans[0].id, plans[2].id}
+
+        updated = plans[1].model_copy(update={"is_active": False})
+        repo.update_many([updated])
+        found_plan = repo.get_by_id(plans[1].id)
+        assert found_plan is not None
+        assert found_plan.is_active is False
@@ -1,6 +1,8 @@
+from datetime import datetime
 from uuid import uuid4
 
 import pytest
+from dateutil.relativedelta import relativedelta
 
 from src.application.exceptions import SubscriptionAlreadyExistsError
 from src.domain.entity import Subscription, SubscriptionStatus
@@ -147,3 +149,202 @@ class TestInMemorySubscriptionRepository:
         repo = InMemorySubscriptionRepository()
         found_subscription = repo.get_by_plan_id(plan_id=uuid4())
         assert found_subscription is None
+
+    def test_update_subscription(self):
+        """
+        Test updating a subscription replaces the stored one.
+        """
+
+        subscription = Subscription.create_regular(
+            user_id=uuid4(),
+            plan_id=uuid4(),
+        )
+        repo = InMemorySubscriptionRepository([subscription])
+
+        updated = subscription.model_copy()
+        updated.cancel()
+        repo.update(updated)
+
+        found_subscription = repo.get_by_id(subscription.id)
+        assert found_subscription is not None
+        assert found_subscription.is_cancelled
+        found_by_user = repo.get_by_user_id(subscription.user_id)
+        assert found_by_user is not None
+        assert found_by_user.is_cancelled
+
+    def test_update_unknown_subscription_is_ignored(self):
+        """
+        Test updating a subscription that was never saved does not store it.
+        """
+
+        repo = InMemorySubscriptionRepository()
+        subscription = Subscription.create_regular(
+            user_id=uuid4(),
+            plan_id=uuid4(),
+        )
+        repo.update(subscription)
+
+        assert repo.get_by_id(subscription.id) is None
+
+    def test_update_subscription_moves_secondary_indexes(self):
+        """
+        Test updating the plan of a subscription re-indexes it.
+        """
+
+        subscription = Subscription.create_regular(
+            user_id=uuid4(),
+            plan_id=uuid4(),
+        )
+        old_plan_id = subscription.plan_id
+        repo = InMemorySubscriptionRepository([subscription])
+
+        updated = subscription.model_copy()
+        updated.plan_id = uuid4()
+        repo.update(updated)
+
+        assert repo.get_by_plan_id(old_plan_id) is None
+        assert repo.get_by_plan_id(updated.plan_id) is not None
+        assert (
+            repo.get_by_user_id_and_plan_id(
+                user_id=subscription.user_id,
+                plan_id=old_plan_id,
+            )
+            is None
+        )
+        assert (
+            repo.get_by_user_id_and_plan_id(
+                user_id=subscription.user_id,
+                plan_id=updated.plan_id,
+            )
+            is not None
+        )
+
+    def test_get_by_user_id_returns_first_saved(self):
+        """
+        Test that lookups by user ID return subscriptions in insertion order.
+        """
+
+        user_id = uuid4()
+        first = Subscription.create_regular(user_id=user_id, plan_id=uuid4())
+        second = Subscription.create_regular(user_id=user_id, plan_id=uuid4())
+        repo = InMemorySubscriptionRepository()
+        repo.save(first)
+        repo.save(second)
+        repo.update(first)
+
+        found_subscription = repo.get_by_user_id(user_id)
+        assert found_subscription is not None
+        assert found_subscription.id == first.id
+
+    def test_iter_due_returns_active_subscriptions_ordered_by_end_date(self):
+        """
+        Test that due subscriptions are returned ordered by end date.
+        """
+
+        now = datetime.now()
+        later = Subscription.create_regular(user_id=uuid4(), plan_id=uuid4())
+        later.end_date = now - relativedelta(days=1)
+        earlier = Subscription.create_regular(user_id=uuid4(), plan_id=uuid4())
+        earlier.end_date = now - relativedelta(days=3)
+        cancelled = Subscription.create_regular(user_id=uuid4(), plan_id=uuid4())
+        cancelled.end_date = now - relativedelta(days=2)
+        cancelled.cancel()
+        not_due = Subscription.create_regular(user_id=uuid4(), plan_id=uuid4())
+
+        repo = InMemorySubscriptionRepository([later, earlier, cancelled, not_due])
+
+        due = list(repo.iter_due(before=now))
+        assert [s.id for s in due] == [earlier.id, later.id]
+
+        due = list(repo.iter_due(before=now, limit=1))
+        assert [s.id for s in due] == [earlier.id]
+
+    def test_iter_due_follows_updates(self):
+        """
+        Test that renewed and cancelled subscriptions leave the due index.
+        """
+
+        now = datetime.now()
+        renewed = Subscription.create_regular(user_id=uuid4(), plan_id=uuid4())
+        renewed.end_date = now - relativedelta(days=1)
+        cancelled = Subscription.create_regular(user_id=uuid4(), plan_id=uuid4())
+        cancelled.end_date = now - relativedelta(days=1)
+        repo = InMemorySubscriptionRepository([renewed, cancelled])
+
+        for subscription in repo.iter_due(before=now):
+            if subscription.id == renewed.id:
+                subscription.end_date = now + relativedelta(days=30)
+            else:
+                subscription.cancel()
+            repo.update(subscription)
+
+        assert list(repo.iter_due(before=now)) == []
+
+    def test_save_many_and_get_many_by_ids(self):
+        """
+        Test saving and retrieving several subscriptions at once.
+        """
+
+        subscriptions = [
+            Subscription.create_regular(user_id=uuid4(), plan_id=uuid4())
+            for _ in range(3)
+        ]
+        repo = InMemorySubscriptionRepository()
+        repo.save_many(subscriptions)
+
+        found = repo.get_many_by_ids(
+            [subscriptions[0].id, subscriptions[1].id, uuid4()]
+        )
+        assert {s.id for s in found} == {subscriptions[0].id, subscriptions[1].id}
+        assert repo.get_by_user_id(subscriptions[2].user_id) is not None
+
+    def test_save_many_large_batch_keeps_due_index_sorted(self):
+        """
+        Test that a bulk save merges into the due index in end date order.
+        """
+
+        now = datetime.now()
+        existing = Subscription.create_regular(user_id=uuid4(), plan_id=uuid4())
+        existing.end_date = now - relativedelta(days=500)
+        batch = []
+        for days in range(2000, 0, -1):
+            subscription = Subscription.create_regular(user_id=uuid4(), plan_id=uuid4())
+            subscription.end_date = now - relativedelta(days=days)
+            batch.append(subscription)
+        repo = InMemorySubscriptionRepository([existing])
+
+        repo.save_many(batch)
+
+        due = list(repo.iter_due(before=now))
+        assert len(due) == 2001
+        assert [s.end_date for s in due] == sorted(s.end_date for s in due)
+
+    def test_save_many_with_existing_id_saves_nothing(self):
+        """
+        Test that a bulk save with an already saved ID is rejected as a whole.
+        """
+
+        saved = Subscription.create_regular(user_id=uuid4(), plan_id=uuid4())
+        new = Subscription.create_regular(user_id=uuid4(), plan_id=uuid4())
+        repo = InMemorySubscriptionRepository([saved])
+
+        with pytest.raises(SubscriptionAlreadyExistsError):
+            repo.save_many([new, saved])
+
+        assert repo.get_by_id(new.id) is None
+
+    def test_get_active_by_user_id(self):
+        """
+        Test that only an active subscription of the user is returned.
+        """
+
+        user_id = uuid4()
+        cancelled = Subscription.create_regular(user_id=user_id, plan_id=uuid4())
+        cancelled.cancel()
+        repo = InMemorySubscriptionRepository([cancelled])
+        assert repo.get_active_by_user_id(user_id) is None
+
+        active = Subscription.create_trial(user_id=user_id, plan_id=uuid4())
+        repo.save(active)
+
+        assert repo.get_active_by_user_id(user_id) == active
@@ -66,3 +66,60 @@ class TestInMemoryUserAccountRepository:
 
         found_user_account = repo.get_by_id(user_account1.id)
         assert found_user_account is not None
+
+    def test_get_many_by_ids(self):
+        """
+        Test retrieving several user accounts at once.
+        """
+
+        user_accounts = [
+            UserAccount(
+                name=f"User {i}",
+                email=f"user{i}@example.com",
+                iam_user_id=f"iam_{i}",
+                billing_address=Address(
+                    street="123 Main St",
+                    city="Anytown",
+                    state="CA",
+                    zip_code="12345",
+                    country="USA",
+                ),
+            )
+            for i in range(3)
+        ]
+        repo = InMemoryUserAccountRepository(user_accounts)
+
+        found = repo.get_many_by_ids(
+            [user_accounts[0].id, user_accounts[2].id, uuid4()]
+        )
+        assert {u.id for u in found} == {user_accounts[0].id, user_accounts[2].id}
+
+    def test_save_many_and_update_many(self):
+        """
+        Test saving and updating several user accounts at once.
+        """
+
+        user_accounts = [
+            UserAccount(
+                name=f"User {i}",
+                email=f"user{i}@example.com",
+                iam_user_id=f"iam_{i}",
+                billing_address=Address(
+                    street="123 Main St",
+                    city="Anytown",
+                    state="CA",
+                    zip_code="12345",
+                    country="USA",
+                ),
+            )
+            for i in range(2)
+        ]
+        repo = InMemoryUserAccountRepository()
+        repo.save_many(user_accounts)
+        assert len(repo.get_many_by_ids(u.id for u in user_accounts)) == 2
+
+        renamed = user_accounts[0].model_copy(update={"name": "Renamed"})
+        repo.update_many([renamed])
+        found_user_account = repo.get_by_id(renamed.id)
+        assert found_user_account is not None
+        assert found_user_account.name == "Renamed"
@@ -0,0 +1,137 @@
+import asyncio
+import json
+
+from src.infra.tracing import JsonlFileExporter, Tracer, TracingSettings
+
+
+class TestTracer:
+    """
+    Test class for the tracer.
+    """
+
+    def test_child_spans_nest_under_the_active_span(self):
+        """
+        Test that spans started inside a trace are recorded as its children.
+        """
+
+        tracer = Tracer(sample_rate=1.0)
+
+        root = tracer.start_trace("request")
+        child = tracer.start_span("use_case")
+        grandchild = tracer.start_span("query", statement="SELECT 1")
+        tracer.end_span(grandchild)
+        tracer.end_span(child)
+        tracer.end_span(root)
+
+        assert [span.name for span in tracer.buffer.spans()] == [
+            "query",
+            "use_case",
+            "request",
+        ]
+        assert grandchild.parent_id == child.span_id
+        assert child.parent_id == root.span_id
+        assert {span.trace_id for span in tracer.buffer.spans()} == {root.trace_id}
+        assert grandchild.attributes == {"statement": "SELECT 1"}
+        assert tracer.current_span() is None
+
+    def test_no_span_is_started_outside_a_trace(self):
+        """
+        Test that starting a span without an active trace does nothing.
+        """
+
+        tracer = Tracer(sample_rate=1.0)
+
+        assert tracer.start_span("query") is None
+        assert tracer.buffer.spans() == []
+
+    def test_sampled_out_traces_are_not_started(self):
+        """
+        Test that a zero sample rate disables tracing.
+        """
+
+        tracer = Tracer(sample_rate=0.0)
+
+        assert tracer.start_trace("request") is None
+        assert tracer.start_span("query") is None
+
+    def test_error_is_recorded(self):
+        """
+        Test that the exception ending a span is recorded on it.
+        """
+
+        tracer = Tracer(sample_rate=1.0)
+
+        root = tracer.start_trace("request")
+        tracer.end_span(root, ValueError("boom"))
+
+        assert root.error == "ValueError: boom"
+        assert root.duration is not None
+
+    def test_span_follows_into_threads(self):
+        """
+        Test that spans started in a thread of asyncio.to_thread join the trace.
+        """
+
+        tracer = Tracer(sample_rate=1.0)
+
+        def process_payment():
+            tracer.end_span(tracer.start_span("process_payment"))
+
+        async def handle():
+            root = tracer.start_trace("request")
+            await asyncio.to_thread(process_payment)
+            tracer.end_span(root)
+            return root
+
+        root = asyncio.run(handle())
+
+        payment = tracer.buffer.spans()[0]
+        assert payment.name == "process_payment"
+        assert payment.parent_id == root.span_id
+
+    def test_ring_buffer_keeps_the_most_recent_spans(self):
+        """
+        Test that the oldest spans are evicted once the buffer is full.
+        """
+
+        tracer = Tracer(sample_rate=1.0, buffer_size=2)
+
+        for name in ("first", "second", "third"):
+            tracer.end_span(tracer.start_trace(name))
+
+        assert [span.name for span in tracer.buffer.spans()] == ["second", "third"]
+
+    def test_spans_are_appended_to_a_jsonl_file(self, tmp_path):
+        """
+        Test that the file exporter writes one JSON object per ended span.
+        """
+
+        path = tmp_path / "traces.jsonl"
+        tracer = Tracer.from_settings(TracingSettings(sample_rate=1.0, file=str(path)))
+
+        root = tracer.start_trace("request", method="GET")
+        tracer.end_span(tracer.start_span("query"))
+        tracer.end_span(root)
+        for exporter in tracer.exporters:
+            if isinstance(exporter, JsonlFileExporter):
+                exporter.close()
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["name"] for line in lines] == ["query", "request"]
+        assert lines[1]["attributes"] == {"method": "GET"}
+        assert lines[0]["parent_id"] == lines[1]["span_id"]
+
+
+class TestTracingSettings:
+    """
+    Test class for TracingSettings.
+    """
+
+    def test_only_a_small_share_is_sampled_by_default(self):
+        """
+        Test that the default sample rate is small, and raised by the
+        environment.
+        """
+
+        assert TracingSettings.from_env({}).sample_rate <= 0.01
+        assert TracingSettings.from_env({"TRACE_SAMPLE_RATE": "1"}).sample_rate == 1